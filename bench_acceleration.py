@@ -0,0 +1,42 @@
+import sys
+import time
+
+import numpy as np
+
+from gcode_forge.acceleration import SCurveAcceleration
+from tests.test_acceleration import iterative_calc_abs_delta
+
+# Times AccelerationProfile._calc_abs_delta() against the iterative clipping it replaced, over a
+# sweep of velocity deltas. That they give the same arrays is checked by tests/test_acceleration.py.
+#
+# Usage: python bench_acceleration.py [ramp_time_s max_accel_mmss dt_s accel_dy_mmss]
+
+if len(sys.argv) > 1:
+    ramp_time_s, max_accel_mmss, dt_s, accel_dy_mmss = map(float, sys.argv[1:5])
+else:
+    # The s_curve processor's profile.
+    ramp_time_s, max_accel_mmss, dt_s, accel_dy_mmss = 0.200, 3000, 0.010, 10.0
+
+profile = SCurveAcceleration(ramp_time_s, max_accel_mmss, dt_s, accel_dy_mmss)
+
+# Called directly rather than through the profile's cache, so that every call is timed.
+calc_abs_delta = SCurveAcceleration._calc_abs_delta
+
+deltas = np.r_[
+    np.linspace(0.001, 400, 2000),
+    np.round(np.random.default_rng(0).uniform(0, 300, 1000), 3),
+].tolist()
+
+start = time.perf_counter()
+for delta_mms in deltas:
+    iterative_calc_abs_delta(profile, delta_mms)
+iterative_s = time.perf_counter() - start
+
+start = time.perf_counter()
+for delta_mms in deltas:
+    calc_abs_delta(profile, delta_mms)
+solved_s = time.perf_counter() - start
+
+print(f'{len(deltas)} deltas')
+print(f'iterative: {iterative_s / len(deltas) * 1e6:.0f} us/delta')
+print(f'solved:    {solved_s / len(deltas) * 1e6:.0f} us/delta')
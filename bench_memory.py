@@ -0,0 +1,36 @@
+import sys
+import tracemalloc
+
+from gcode_forge import parser, annotator
+
+# Reports the memory used per line by a parsed and annotated gcode file.
+#
+# Usage: python bench_memory.py <path to .gcode>
+
+path = sys.argv[1]
+
+with open(path, encoding='UTF-8') as file:
+    text = file.read()
+
+tracemalloc.start()
+gcode = parser.parse(text)
+parsed = tracemalloc.get_traced_memory()[0]
+
+# Access params so that lazily parsed lines are included.
+for section in gcode.sections():
+    for line in section.lines():
+        line.params
+
+params = tracemalloc.get_traced_memory()[0]
+
+annotator.annotate(gcode.first_section.first_line)
+annotated = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+
+line_count = sum(1 for section in gcode.sections() for line in section.lines())
+move_count = sum(1 for section in gcode.sections() for line in section.lines() if line.is_move)
+
+print(f'{line_count} lines, {move_count} moves')
+print(f'parsed:    {parsed / line_count:.0f} bytes/line')
+print(f'params:    {params / line_count:.0f} bytes/line')
+print(f'annotated: {annotated / line_count:.0f} bytes/line')
@@ -1,3 +1,4 @@
+import os
 from time import time
 from pathlib import Path
 from importlib import import_module
@@ -7,6 +8,7 @@ import jinja2
 
 from . import parser
 from . import annotator
+from .cache import FileCache
 
 def expand_config_section(macros, config_section):
     jinja_env = jinja2.Environment(
@@ -28,6 +30,46 @@ def structure_map(structure, function):
 
     return function(structure)
 
+def needed_section_types(modules, processors) -> set[str] | None:
+    '''
+    Gets the section types that the processors need parsed, or None if any of them needs the whole
+    file. Processors declare theirs with a section_types(options) function.
+    '''
+    section_types = set()
+    for processor_name, options in processors.items():
+        get_section_types = getattr(modules[processor_name], 'section_types', None)
+        if get_section_types is None:
+            return None
+
+        section_types.update(get_section_types(options))
+
+    return section_types
+
+# Parsing in parallel is only used for files at least this large. Below it, starting the pool costs
+# more than it saves.
+MIN_PARALLEL_PARSE_BYTES = 32 * 1024 * 1024
+
+# Fewest workers that parsing in parallel pays off with. Rebuilding the lines from the records the
+# workers send back takes the main process about 60% as long as parsing the lines itself, and each
+# worker parses about as fast as the main process, measured on a ~400k line file.
+MIN_PARSE_WORKERS = 3
+
+def parse_workers(path: Path, workers: int | None) -> int | None:
+    '''
+    Gets the number of worker processes to parse the file with, or None to parse it in this process.
+
+    Workers are only used when the file is large enough and there are enough cores for them, leaving
+    one for this process to rebuild the lines on as they arrive.
+    '''
+    if workers is None:
+        return None
+
+    workers = min(workers, (os.cpu_count() or 1) - 1)
+    if workers < MIN_PARSE_WORKERS or path.stat().st_size < MIN_PARALLEL_PARSE_BYTES:
+        return None
+
+    return workers
+
 def main(args):
     start = time()
 
@@ -39,19 +81,56 @@ def main(args):
     processors = config['processors']
     processors = structure_map(processors, lambda x: expand_config_section(macros, x) if isinstance(x, str) else x)
 
-    # Load and process the gcode file.
+    modules = {
+        processor_name: import_module('.processors.' + processor_name, package='gcode_forge')
+        for processor_name in processors
+    }
+
     path = Path(args[2])
-    text = path.read_text()
-    gcode = parser.parse(text)
-    annotator.annotate(gcode.first_section.first_line)
+
+    # Optional cache of parsed and annotated files.
+    cache_config = config.get('cache')
+    cache = FileCache(**cache_config) if cache_config else None
+
+    # If every processor says which section types it needs, the rest of the file is kept unparsed.
+    # Not done when caching, as the cached file is shared by all configs.
+    section_types = None if cache else needed_section_types(modules, processors)
+
+    # If every processor only needs a bounded window of sections, stream the file through them
+    # instead of loading it all into memory. Not done when caching, as the whole file is cached, or
+    # when only some section types need parsing, which is faster.
+    if not cache and section_types is None and all(hasattr(module, 'apply_stream') for module in modules.values()):
+        sections = annotator.annotate_sections(parser.stream(path))
+        for processor_name, options in processors.items():
+            sections = modules[processor_name].apply_stream(sections, options)
+
+        parser.dump_sections(sections, path)
+
+        print(time() - start)
+        return
+
+    # Load and process the gcode file. Large files can be parsed using multiple processes when there
+    # are enough cores.
+    gcode = None
+    if cache:
+        cache_key = cache.key(path)
+        gcode = cache.load(cache_key)
+
+    if gcode is None:
+        gcode = parser.parse_file(path, section_types=section_types, workers=parse_workers(path, config.get('parse_workers')))
+        annotator.annotate(gcode.first_section.first_line)
+
+        if cache:
+            cache.store(cache_key, gcode)
 
     # Configuration defining what gcode processors will run and with what settings.
     # processors={
         # Note: speed based LUT is experimental. Also does not account for line width and acceleration.
-        # TODO: rewrite speed_lut_pa to use new linked list file representation
         # 'speed_lut_pa': {
         #     'speeds': [100, 150, 200, 250, 300],
-        #     'pa_values': [0.62, 0.48, 0.36, 0.292, 0.28]
+        #     'pa_values': [0.62, 0.48, 0.36, 0.292, 0.28],
+        #     # Speed step of the PA lookup table.
+        #     'lut_resolution_mms': 0.1
         # }
 
         # Experimental, incomplete hand has bugs
@@ -64,14 +143,12 @@ def main(args):
 
     # Run the processors.
     for processor_name, options in processors.items():
-        module = import_module('.processors.' + processor_name, package='gcode_forge')
-        module.apply(gcode, options)
+        modules[processor_name].apply(gcode, options)
 
 
     # Write the output.
-    output = str(gcode)
-    path.write_text(output, newline='\n', encoding='UTF-8')
-    # Path('out.gcode').write_text(output, newline='\n', encoding='UTF-8')
+    gcode.dump(path)
+    # gcode.dump('out.gcode')
 
     print(time() - start)
 
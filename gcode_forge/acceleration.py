@@ -1,5 +1,14 @@
 
-from functools import lru_cache
+import os
+import math
+import hashlib
+import tempfile
+import zipfile
+from bisect import bisect_right
+from os import PathLike
+from pathlib import Path
+from collections import OrderedDict
+from dataclasses import dataclass
 
 
 import numpy as np
@@ -9,11 +18,150 @@ import numpy.typing as npt
 import scipy as sp
 from scipy.integrate import cumulative_trapezoid
 
+from . import __version__
 
 
 
+
+# Tolerance in steps of accel_dy_mmss of the solved clip level.
+STEP_TOLERANCE = 1e-6
+
+DEFAULT_TABLE_RESOLUTION_MMS = 0.05
+
+DEFAULT_RAMP_CACHE_SIZE = 1024
+
+# Velocity deltas are rounded to whole mm/s by default for a better cache hit rate, for a slight loss
+# in accuracy.
+DEFAULT_DELTA_RESOLUTION_MMS = 1.0
+
+# Changed whenever the format of saved tables changes, in addition to the version.
+TABLE_FORMAT = 1
+
+@dataclass(slots=True)
+class DeltaTable:
+    '''
+    Precomputed results of AccelerationProfile._calc_abs_delta() for velocity deltas from 0 to
+    max_delta_mms in steps of resolution_mms.
+
+    The arrays of all of the deltas are stored end to end, with the arrays of the delta at index i
+    in the slice offsets[i]:offsets[i + 1].
+    '''
+    resolution_mms: float
+    max_delta_mms: float
+    offsets: npt.NDArray[np.int64]
+    accel: npt.NDArray[np.float64]
+    velocity: npt.NDArray[np.float64]
+    position: npt.NDArray[np.float64]
+
+    def entry(self, index: int) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        start = self.offsets[index]
+        end = self.offsets[index + 1]
+        return self.accel[start:end], self.velocity[start:end], self.position[start:end]
+
+    def lookup(self, delta_mms: float) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]] | None:
+        '''
+        Gets the arrays for the given positive delta, or None if it is past the end of the table.
+
+        Between deltas in the table, the arrays of the deltas either side are interpolated if they are
+        the same length. Otherwise the arrays of the delta below are used, which end just under the
+        given delta, as the calculated arrays do.
+        '''
+        if delta_mms > self.max_delta_mms:
+            return None
+
+        position = delta_mms / self.resolution_mms
+        index = int(position)
+        fraction = position - index
+        if not fraction or index + 2 >= len(self.offsets):
+            return self.entry(index)
+
+        start, middle, end = self.offsets[index:index + 3].tolist()
+        if middle - start != end - middle:
+            return self.entry(index)
+
+        # Interpolate each array between the two deltas.
+        low_weight = 1 - fraction
+        return (
+            self.accel[start:middle] * low_weight + self.accel[middle:end] * fraction,
+            self.velocity[start:middle] * low_weight + self.velocity[middle:end] * fraction,
+            self.position[start:middle] * low_weight + self.position[middle:end] * fraction,
+        )
+
+class RampCache:
+    '''
+    Least recently used cache of the ramps of an AccelerationProfile, by velocity delta.
+
+    Deltas are quantized to multiples of resolution_mms, so that deltas that are close share an entry
+    at a slight loss in accuracy. A resolution of None keeps deltas as they are.
+
+    Counts hits, misses and evictions, for tuning the resolution and size.
+    '''
+    def __init__(self, max_size: int=DEFAULT_RAMP_CACHE_SIZE, resolution_mms: float | None=DEFAULT_DELTA_RESOLUTION_MMS):
+        self.max_size = max_size
+        self.resolution_mms = resolution_mms
+        self._entries: OrderedDict[float, tuple] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def quantize(self, delta_mms: float) -> float:
+        '''
+        Rounds the given delta to the resolution of the cache.
+        '''
+        resolution_mms = self.resolution_mms
+        if resolution_mms is None:
+            return delta_mms
+
+        return round(delta_mms / resolution_mms) * resolution_mms
+
+    def get(self, delta_mms: float, calculate) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        '''
+        Gets the arrays for the given quantized delta, calling calculate(delta_mms) to get them if
+        they are not cached.
+        '''
+        entries = self._entries
+        arrays = entries.get(delta_mms)
+        if arrays is not None:
+            self.hits += 1
+            entries.move_to_end(delta_mms)
+            return arrays
+
+        self.misses += 1
+        arrays = entries[delta_mms] = calculate(delta_mms)
+        if len(entries) > self.max_size:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+        return arrays
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        '''
+        Drops the cached entries and resets the counters.
+        '''
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
 class AccelerationProfile:
-    def __init__(self, ramp_mmss: npt.NDArray[np.float64], dt_s: float, accel_dy_mmss: float, const_accel_mmss: float):
+    def __init__(
+        self,
+        ramp_mmss: npt.NDArray[np.float64],
+        dt_s: float,
+        accel_dy_mmss: float,
+        const_accel_mmss: float,
+        cache_size: int=DEFAULT_RAMP_CACHE_SIZE,
+        delta_resolution_mms: float | None=DEFAULT_DELTA_RESOLUTION_MMS
+    ):
         '''
         ramp_mmss
             Acceleration profile for ramping up acceleration from 0 to the constant acceleration value.
@@ -27,8 +175,9 @@ class AccelerationProfile:
         accel_dy_mmss
             This is used to tune max acceleration reached to more closely hit the target delta_mms.
 
-            The initially calculated acceleration profile will be clipped repeatedly by this amount until
-            the final velocity delta is just under the desired delta_mms.
+            The initially calculated acceleration profile will be clipped down in steps of this amount
+            until the final velocity delta is just under the desired delta_mms. The number of steps is
+            solved for rather than stepped through.
 
             This allows more accuracy than is allowed by the ramp/const_accel_mms values in the given dx_mm spacing.
             It is also used to hit the desired velocity when the acceleration distance is less than 2 * the
@@ -36,6 +185,13 @@ class AccelerationProfile:
 
         const_accel_mmss
             Constant acceleration that will be used between the acceleration ramp up and down.
+
+        cache_size
+            Maximum number of ramps kept in the cache of the profile.
+
+        delta_resolution_mms
+            Velocity deltas are rounded to multiples of this before they are calculated or looked
+            up, for a better cache hit rate at a slight loss in accuracy. None to not round them.
         '''
         self.ramp_mmss = ramp_mmss
         self.dt_s = dt_s
@@ -44,9 +200,11 @@ class AccelerationProfile:
         ramp_velocity = cumulative_trapezoid(ramp_mmss, dx=dt_s, initial=0)
         self.ramp_stop_now_velocity = ramp_velocity * 2
         self.final_velocity_after_ramps = self.ramp_stop_now_velocity[-1]
-        self.places = None
+        self.cache = RampCache(cache_size, delta_resolution_mms)
+
+        # Set by use_table().
+        self.table: DeltaTable = None
 
-    @lru_cache(1024)
     def _calc_abs_delta(self, delta_mms: float) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
         '''
         delta_mms
@@ -72,29 +230,166 @@ class AccelerationProfile:
 
             reached_accel = const_accel_mmss
 
-        # clip until the final velocity is just less than the target
-        # TODO: binary search across accel_dy sized chunks
+        # The acceleration is clipped to the highest level, stepping down from the reached
+        # acceleration by accel_dy_mmss, where the final velocity is just less than the target.
         # TODO: clip or scale?
+        steps = self._clip_steps(accel, reached_accel, delta_mms)
         while True:
-            velocity = cumulative_trapezoid(accel, dx=dt_s, initial=0)
-            final_velocity = velocity[-1]
-            if final_velocity <= delta_mms:
+            clipped = clip(accel, None, reached_accel - steps * accel_dy_mmss)
+            velocity = cumulative_trapezoid(clipped, dx=dt_s, initial=0)
+            if velocity[-1] <= delta_mms:
                 break
 
-            reached_accel -= accel_dy_mmss
-            accel = clip(accel, None, reached_accel)
+            # Only reached when the solved level is off by rounding.
+            steps += 1
 
+        accel = clipped
         position = cumulative_trapezoid(velocity, dx=dt_s, initial=0)
 
         return accel, velocity, position
 
+    def _clip_steps(self, accel: npt.NDArray[np.float64], reached_accel: float, delta_mms: float) -> int:
+        '''
+        Solves for the number of accel_dy_mmss steps that the acceleration needs clipping down from
+        reached_accel by for the final velocity to be at most delta_mms.
+
+        The final velocity is the trapezoidal integral of the clipped acceleration, which is
+        piecewise linear in the clip level with breaks at the acceleration values. It is evaluated at
+        each of them from prefix sums of the sorted values, then the segment that hits the target is
+        solved for the level.
+        '''
+        dt_s = self.dt_s
+        count = len(accel)
+
+        levels = np.sort(accel)
+        below = np.r_[0, np.cumsum(levels[:-1])]
+
+        # Sum of the values clipped to each level, less half of the clipped end values.
+        final_velocities = dt_s * (
+            below + levels * (count - np.arange(count))
+            - (np.minimum(accel[0], levels) + np.minimum(accel[-1], levels)) / 2
+        )
+
+        if final_velocities[-1] <= delta_mms:
+            return 0
+
+        index = np.searchsorted(final_velocities, delta_mms, side='right')
+        if index == 0:
+            # Below all of the values, everything is clipped.
+            level = delta_mms / (dt_s * (count - 1))
+        else:
+            low_level = levels[index - 1]
+            low_velocity = final_velocities[index - 1]
+            level = low_level + (delta_mms - low_velocity) * (levels[index] - low_level) / (final_velocities[index] - low_velocity)
+
+        # A level that hits the target exactly is kept rather than stepped past. If the tolerance
+        # keeps a level that is slightly over, the caller steps on from it.
+        return max(math.ceil((reached_accel - level) / self.accel_dy_mmss - STEP_TOLERANCE), 0)
+
+    def _table_key(self, max_delta_mms: float, resolution_mms: float) -> str:
+        '''
+        Gets the key of the table of this profile for the given range and resolution.
+        '''
+        digest = hashlib.sha256()
+        digest.update(repr((self.dt_s, self.accel_dy_mmss, self.const_accel_mmss, max_delta_mms, resolution_mms)).encode())
+        digest.update(np.ascontiguousarray(self.ramp_mmss, dtype=np.float64).tobytes())
+
+        return f'{__version__}-{TABLE_FORMAT}-{digest.hexdigest()}'
+
+    def build_table(self, max_delta_mms: float, resolution_mms: float=DEFAULT_TABLE_RESOLUTION_MMS) -> DeltaTable:
+        '''
+        Calculates the table of deltas from 0 to max_delta_mms in steps of resolution_mms.
+        '''
+        count = math.ceil(max_delta_mms / resolution_mms) + 1
+        entries = [self._calc_abs_delta(index * resolution_mms) for index in range(count)]
+
+        offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum([len(accel) for accel, _, _ in entries], out=offsets[1:])
+
+        return DeltaTable(
+            resolution_mms,
+            (count - 1) * resolution_mms,
+            offsets,
+            np.concatenate([accel for accel, _, _ in entries]),
+            np.concatenate([velocity for _, velocity, _ in entries]),
+            np.concatenate([position for _, _, position in entries]),
+        )
+
+    def use_table(self, max_delta_mms: float, resolution_mms: float=DEFAULT_TABLE_RESOLUTION_MMS, directory: str | PathLike=None):
+        '''
+        Makes calc() look deltas up in a precomputed table rather than calculating them. Deltas past
+        max_delta_mms are still calculated.
+
+        If a directory is given, the table is loaded from it if it has been saved there before, and
+        otherwise saved there once it is built. Tables are keyed by the profile, range and resolution,
+        so profiles that are the same across runs share them.
+        '''
+        if directory is None:
+            self.table = self.build_table(max_delta_mms, resolution_mms)
+            return
+
+        directory = Path(directory).expanduser()
+        table_path = directory / f'accel-{self._table_key(max_delta_mms, resolution_mms)}.npz'
+
+        try:
+            with np.load(table_path) as data:
+                self.table = DeltaTable(
+                    float(data['resolution_mms']),
+                    float(data['max_delta_mms']),
+                    data['offsets'],
+                    data['accel'],
+                    data['velocity'],
+                    data['position'],
+                )
+            return
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            # Unreadable, such as if it was only partially written. It will be replaced.
+            table_path.unlink(missing_ok=True)
+
+        table = self.build_table(max_delta_mms, resolution_mms)
+
+        # Written to a temporary file first so that a partial table is never loaded.
+        directory.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile('wb', dir=directory, suffix='.tmp', delete=False) as file:
+            try:
+                np.savez(
+                    file,
+                    resolution_mms=table.resolution_mms,
+                    max_delta_mms=table.max_delta_mms,
+                    offsets=table.offsets,
+                    accel=table.accel,
+                    velocity=table.velocity,
+                    position=table.position,
+                )
+            except BaseException:
+                file.close()
+                os.unlink(file.name)
+                raise
+
+        os.replace(file.name, table_path)
+
+        self.table = table
+
+    def _abs_delta_arrays(self, delta_mms: float) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        '''
+        Gets the arrays for the given positive delta from the table if there is one that covers it,
+        and otherwise from the cache.
+        '''
+        if self.table is not None:
+            arrays = self.table.lookup(delta_mms)
+            if arrays is not None:
+                return arrays
+
+        return self.cache.get(delta_mms, self._calc_abs_delta)
+
     def calc(self, from_mms: float, to_mms: float) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
         delta_mms = to_mms - from_mms
 
-        # Better lru_cache hit rate for slight loss in accuracy
-        delta_mms = round(delta_mms, self.places)
+        delta_mms = self.cache.quantize(delta_mms)
 
-        accel, velocity, position = self._calc_abs_delta(abs(delta_mms))
+        accel, velocity, position = self._abs_delta_arrays(abs(delta_mms))
 
         if delta_mms <= 0:
             velocity = velocity[::-1]
@@ -104,11 +399,105 @@ class AccelerationProfile:
 
         return accel, velocity, position
 
+    def calc_many(self, from_mms: npt.ArrayLike, to_mms: npt.ArrayLike) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.int64]]:
+        '''
+        Does calc() for many pairs of velocities at once.
+
+        Returns (accel, velocity, position, offsets), where the arrays of all of the pairs are stored
+        end to end, with the arrays of pair i in the slice offsets[i]:offsets[i + 1].
+        '''
+        from_mms = np.asarray(from_mms, dtype=np.float64)
+        to_mms = np.asarray(to_mms, dtype=np.float64)
+
+        # Quantized as calc() does, so that the results are the same.
+        quantize = self.cache.quantize
+        delta_mms = np.array([quantize(delta) for delta in (to_mms - from_mms).tolist()], dtype=np.float64)
+
+        # Each distinct delta is only looked up once.
+        abs_deltas, inverse = np.unique(np.abs(delta_mms), return_inverse=True)
+        entries = [self._abs_delta_arrays(abs_delta) for abs_delta in abs_deltas.tolist()]
+
+        entry_lengths = np.array([len(accel) for accel, _, _ in entries], dtype=np.int64)
+        entry_offsets = np.zeros(len(entries) + 1, dtype=np.int64)
+        np.cumsum(entry_lengths, out=entry_offsets[1:])
+
+        lengths = entry_lengths[inverse]
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+
+        # Index of each element of the output in the arrays of the distinct deltas.
+        local = np.arange(offsets[-1]) - np.repeat(offsets[:-1], lengths)
+        starts = np.repeat(entry_offsets[inverse], lengths)
+        index = starts + local
+
+        # Velocities are reversed for decelerations, and start from the lower velocity.
+        decelerating = delta_mms <= 0
+        reversed_index = starts + np.repeat(lengths - 1, lengths) - local
+        velocity_index = np.where(np.repeat(decelerating, lengths), reversed_index, index)
+        base_mms = np.repeat(np.where(decelerating, to_mms, from_mms), lengths)
+
+        if entries:
+            accel = np.concatenate([accel for accel, _, _ in entries])[index]
+            velocity = np.concatenate([velocity for _, velocity, _ in entries])[velocity_index] + base_mms
+            position = np.concatenate([position for _, _, position in entries])[index]
+        else:
+            accel = velocity = position = np.zeros(0)
+
+        return accel, velocity, position, offsets
+
+
+
+
+def resample_ramp(
+    velocity: npt.NDArray[np.float64],
+    position: npt.NDArray[np.float64],
+    max_velocity_error_mms: float,
+    max_segments: int=None
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    '''
+    Resamples a ramp from calc() in the distance domain, keeping as few of its samples as possible.
+
+    Each segment between kept samples is run at the velocity at its end, so it is taken as far as the
+    velocity stays within max_velocity_error_mms of the velocity at its start. Where the velocity
+    changes slowly, such as near the ends of an S-curve, many time steps become one segment. A step
+    that changes by more than the error on its own is kept as it is.
+
+    If that leaves more than max_segments segments, the error is raised to fit them, and if the steps
+    are still too coarse, samples are kept evenly.
+
+    Returns the (velocity, position) of the kept samples, which always include the first and last.
+    '''
+    last = len(velocity) - 1
+    if last <= 1:
+        return velocity, position
+
+    # The velocity change from the start, which only grows along a ramp either way.
+    change = np.abs(velocity - velocity[0]).tolist()
+
+    if max_segments is not None:
+        max_velocity_error_mms = max(max_velocity_error_mms, change[-1] / max_segments)
+
+    kept = [0]
+    index = 0
+    while index < last:
+        index = max(bisect_right(change, change[index] + max_velocity_error_mms, index + 1) - 1, index + 1)
+        kept.append(index)
 
+    if max_segments is not None and len(kept) - 1 > max_segments:
+        kept = np.unique(np.linspace(0, last, max_segments + 1).round().astype(np.intp))
 
+    return velocity[kept], position[kept]
 
 class SCurveAcceleration(AccelerationProfile):
-    def __init__(self, ramp_time_s: float, max_accel_mmss: float, dt_s: float, accel_dy_mmss: float):
+    def __init__(
+        self,
+        ramp_time_s: float,
+        max_accel_mmss: float,
+        dt_s: float,
+        accel_dy_mmss: float,
+        cache_size: int=DEFAULT_RAMP_CACHE_SIZE,
+        delta_resolution_mms: float | None=DEFAULT_DELTA_RESOLUTION_MMS
+    ):
         ramp_s = np.arange(0, ramp_time_s + dt_s, dt_s)
         ramp_mmss = np.interp(
             ramp_s,
@@ -121,7 +510,7 @@ class SCurveAcceleration(AccelerationProfile):
                 max_accel_mmss,
             ]
         )
-        super().__init__(ramp_mmss, dt_s, accel_dy_mmss, max_accel_mmss)
+        super().__init__(ramp_mmss, dt_s, accel_dy_mmss, max_accel_mmss, cache_size, delta_resolution_mms)
 
 # import matplotlib.pyplot as plt
 
@@ -1,7 +1,10 @@
 
 from math import sqrt
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Iterable, Iterator
 
-from .parser import Line
+from .parser import _gc_paused, Annotation, Line, RawLine, Section, NO_ANNOTATION, X_BIT, Y_BIT, Z_BIT, E_BIT, F_BIT
 
 # Assumes relative extrusion
 
@@ -9,44 +12,109 @@ from .parser import Line
 
 # Annotate linked list of continuous positive extrusion?
 
+NAN_POS = (float('NaN'), float('NaN'))
+
+# Marks state that has not been found yet.
+_NOT_FOUND = object()
+
+def restart_state(line: Line) -> tuple[Line, tuple]:
+    '''
+    Gets the line that annotation needs to start from in order to annotate the given line, along
+    with the annotator state to start with.
+
+    Rather than storing the state for every line, each annotated move acts as a checkpoint as the
+    state can be recovered from the annotations of the moves before the line. Any moves before the
+    line that have not been annotated yet are included.
+
+    This includes moves that processors insert without annotating them, such as the
+    `G1 F... ; restore` lines of pa_optimize and accel_experiment. Once annotation reaches them
+    they are 'set_feed' moves, which continuous move searches walk past as they did before, and
+    unless re-annotating their F sets the desired feed rate of the moves after them. Splits rely
+    on this, as the pieces of a split move are left unannotated until their range is re-annotated.
+    '''
+    start = line
+    desired_feed = _NOT_FOUND
+    current = line.prev
+    while current is not None and current.__class__ is not RawLine:
+        if current.is_move:
+            annotation = current.annotation
+            if annotation is NO_ANNOTATION:
+                # Not annotated yet, so it needs to be annotated as well.
+                start = current
+                desired_feed = _NOT_FOUND
+            else:
+                if desired_feed is _NOT_FOUND:
+                    desired_feed = annotation.desired_feed_mms
+
+                # The state only changes on moves that cover a distance.
+                if annotation.distance_mm is not None:
+                    return start, (
+                        annotation.start_pos,
+                        annotation.end_pos,
+                        annotation.distance_mm,
+                        desired_feed
+                    )
+
+        current = current.prev
+
+    return start, (
+        NAN_POS,
+        NAN_POS,
+        float('NaN'),
+        None if desired_feed is _NOT_FOUND else desired_feed
+    )
+
 # @profile
-def annotate(first: Line, last: Line=None, reannotate=False):
+def annotate(first: Line, last: Line=None, reannotate=False, state: tuple=None) -> tuple:
     '''
     Processes gcode lines and adds information about them to Line.annotation.
+
+    The annotator state to start with is recovered from the lines before `first` unless given.
+    Returns the annotator state after the last line, which can be passed to continue annotating
+    lines that follow.
     '''
     # filament_diameter = 1.75
 
-    if annotator_state := first.annotation._state:
-        # If the first line already has a state then use that.
-        previous_pos, current_pos, ba_norm, desired_feed = annotator_state
-    else:
-        # Initialize state tracked between lines.
-        previous_pos = (float('NaN'), float('NaN'))
-        current_pos = (float('NaN'), float('NaN'))
-        ba_norm = float('NaN')
-        desired_feed = None
+    if state is None:
+        first, state = restart_state(first)
+
+    # Annotating the rest of the file creates many annotations that stay alive, so collections would
+    # only rescan the lines. Edits annotate a few lines at a time, where pausing would cost more.
+    if last is None:
+        with _gc_paused():
+            return _annotate(first, last, reannotate, state)
+
+    return _annotate(first, last, reannotate, state)
+
+def _annotate(first: Line, last: Line, reannotate: bool, state: tuple) -> tuple:
+    previous_pos, current_pos, ba_norm, desired_feed = state
+
+    # Runs of continuous extrusion are invalidated when moves in or next to them change. The last
+    # run seen is invalidated along with a changed move, and the next one once it is seen.
+    last_run = _NOT_FOUND
+    pending = False
 
     line = first
     while True:
-        annotation = line.annotation
+        if line.is_move:
+            annotation = line.annotation
+            if annotation is NO_ANNOTATION:
+                annotation = line.annotation = Annotation()
+                old_key = None
+            else:
+                old_key = _run_key(annotation)
 
-        # Store annotator state at the start of annotating the line so that we can restart at this
-        # line and re-annotate it later.
-        annotation._state = (
-            previous_pos,
-            current_pos,
-            ba_norm,
-            desired_feed
-        )
+            # Moves always have MoveParams, so read their slots directly.
+            params = line.params
+            present = params.present
 
-        if line.is_move:
             # Annotate the desired feed rate
             if reannotate:
                 # If we are re-annotating, then ignore feed rate parameters so that the desired feed
                 # rate reflects the original gcode request rather than any modifications.
                 if annotation.desired_feed_mms is not None:
                     desired_feed = annotation.desired_feed_mms
-            elif (feed := line.params.get('F')) is not None:
+            elif present & F_BIT and (feed := params.F) is not None:
                 desired_feed = feed / 60
 
             annotation.desired_feed_mms = desired_feed
@@ -57,8 +125,8 @@ def annotate(first: Line, last: Line=None, reannotate=False):
             # between b->a and b->c: a<-b->c.
 
             new_pos = (
-                line.params.get('X', current_pos[0]),
-                line.params.get('Y', current_pos[1]),
+                params.X if present & X_BIT else current_pos[0],
+                params.Y if present & Y_BIT else current_pos[1],
             )
 
             # b->a vector = a - b
@@ -99,15 +167,24 @@ def annotate(first: Line, last: Line=None, reannotate=False):
                     # angle_rads = math.acos(cos_theta)
                     # angle_deg = angle_rads * 180 / math.pi
 
+                else:
+                    annotation.cos_theta = None
+
                 previous_pos = current_pos
                 current_pos = new_pos
                 ba_norm = bc_norm
-
+            else:
+                # Clear anything from a previous annotation of the line.
+                annotation.start_pos = None
+                annotation.end_pos = None
+                annotation.distance_mm = None
+                annotation.vector = None
+                annotation.cos_theta = None
 
             # Use the requested extrusion distance and the distance of the move to classify the type
             # of move.
 
-            extrude_distance = line.params.get('E', 0)
+            extrude_distance = params.E if present & E_BIT else 0
 
             # extrude_mm3 = extrude_distance * math.pi * (filament_diameter ** 2)
             # annotation.extrude_mm3 = extrude_mm3
@@ -117,10 +194,10 @@ def annotate(first: Line, last: Line=None, reannotate=False):
                     move_type = 'extrude'
                 elif extrude_distance < -0.000001:
                     move_type = 'retract'
-                elif 'Z' in line.params:
+                elif present & Z_BIT:
                     # TODO: track current z and set only if z changes?
                     move_type = 'z'
-                elif 'F' in line.params:
+                elif present & F_BIT:
                     move_type = 'set_feed'
                 else:
                     move_type = 'noop'
@@ -134,9 +211,295 @@ def annotate(first: Line, last: Line=None, reannotate=False):
 
             annotation.move_type = move_type
 
+            if move_type == 'moving_extrude':
+                new_key = bc_norm if bc_norm == bc_norm else _BREAK
+            elif move_type in RUN_BREAKS:
+                new_key = _BREAK
+            else:
+                new_key = None
+
+            run = annotation.run
+            if old_key is not new_key and not _same_run_key(old_key, new_key):
+                if run is not None:
+                    run.valid = False
+                if last_run is _NOT_FOUND:
+                    last_run = _adjacent_run(line, backward=True)
+                if last_run is not None:
+                    last_run.valid = False
+                pending = True
+            elif run is not None:
+                if pending:
+                    run.valid = False
+                    pending = False
+                last_run = run
+        elif line.__class__ is RawLine:
+            # Moves in unparsed lines are unknown, so start over.
+            previous_pos = NAN_POS
+            current_pos = NAN_POS
+            ba_norm = float('NaN')
+            desired_feed = None
+
         if last and line is last:
+            if pending and (run := _adjacent_run(line, backward=False)) is not None:
+                run.valid = False
             break
 
         line = line.next
         if not line:
             break
+
+    return previous_pos, current_pos, ba_norm, desired_feed
+
+# Session that re-annotation is deferred to, if any.
+_session: 'AnnotationSession' = None
+
+class AnnotationSession:
+    '''
+    Defers re-annotating edited lines so that lines that are edited repeatedly, such as by many
+    splits close together, are only re-annotated once.
+
+    While the session is active, reannotate() records the ranges of lines to re-annotate. They are
+    merged and re-annotated when the session is flushed, which happens when it closes. Edits must
+    keep the positions and distances of moves up to date themselves, as the split functions in
+    edit_utils do, so that only fields derived from neighbouring moves, such as cos_theta, are out
+    of date until then. Call flush() before reading those.
+    '''
+    def __init__(self):
+        self.ranges: list[tuple[Line, Line]] = []
+        self._outer: AnnotationSession = None
+
+    def __enter__(self) -> 'AnnotationSession':
+        global _session
+        self._outer = _session
+        _session = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        global _session
+        _session = self._outer
+        if exc_type is None:
+            self.flush()
+
+    def add(self, first: Line, last: Line=None):
+        '''
+        Records a range of lines to re-annotate. If last is None, the range goes to the end of the
+        file.
+        '''
+        self.ranges.append((first, last))
+
+    def flush(self):
+        '''
+        Re-annotates the recorded ranges, annotating lines that are in more than one range once.
+        '''
+        ranges = self.ranges
+        self.ranges = []
+
+        # Collect the lines in the ranges.
+        dirty = {}
+        for first, last in ranges:
+            line = _live_line(first)
+            last = _live_line(last)
+            while line is not None:
+                dirty[id(line)] = line
+                if line is last:
+                    break
+                line = line.next
+
+        # Annotate each run of consecutive lines once, merging ranges that overlap or touch.
+        # Positions and distances are kept up to date, so the runs can be annotated in any order.
+        for line in dirty.values():
+            if line.prev is not None and id(line.prev) in dirty:
+                continue
+
+            run_end = line
+            while run_end.next is not None and id(run_end.next) in dirty:
+                run_end = run_end.next
+
+            annotate(line, run_end, reannotate=True)
+
+def _live_line(line: Line) -> Line:
+    '''
+    Gets the given line, or if it has been removed, the first line after it that has not been.
+    Removed lines keep their links, which lead to the lines that replaced them.
+    '''
+    while line is not None and line.section is None:
+        line = line.next
+
+    return line
+
+def reannotate(first: Line, last: Line=None, needed: Line=None):
+    '''
+    Re-annotates the given range of edited lines, or if there is an active AnnotationSession, defers
+    it until the session is flushed.
+
+    If lines at the start of the range are needed right away, such as new moves whose distances are
+    read by further edits, `needed` is the last of them, and they are annotated immediately either
+    way.
+
+    As with annotate(reannotate=True), desired feed rates are kept rather than taken from the edited
+    lines.
+    '''
+    if _session is None:
+        annotate(first, last, reannotate=True)
+        return
+
+    if needed is not None:
+        annotate(first, needed, reannotate=True)
+        if needed is last:
+            return
+        first = needed
+
+    _session.add(first, last)
+
+def annotate_sections(sections: Iterable[Section]) -> Iterator[Section]:
+    '''
+    Annotates sections as they are consumed from the given iterable, such as parser.stream(),
+    carrying the annotator state across section boundaries.
+    '''
+    state = None
+    for section in sections:
+        if section.first_line:
+            state = annotate(section.first_line, section.last_line, state=state)
+
+        yield section
+
+# Move types that end a run of continuous extrusion.
+RUN_BREAKS = frozenset({
+    'extrude',
+    'retract',
+    'z',
+    'travel',
+    'moving_retract',
+})
+
+# Run key of moves that end a run.
+_BREAK = object()
+
+# Distances within this are considered unchanged, such as after a split.
+RUN_DISTANCE_EPSILON_MM = 1e-9
+
+@dataclass(slots=True)
+class ExtrusionRun:
+    '''
+    A run of continuous extrusion, which is the extruding moves between moves that break extrusion,
+    such as travels and retracts, along with the path length along the run to the end of each move.
+    Distances along the run can then be found with a binary search of `ends_mm` rather than a walk.
+
+    Runs are built by extrusion_run() when first needed. The annotator marks them as not valid
+    when the moves in or next to them change, after which they are built again. Splits patch the
+    run with split() instead, as the path length to the moves around the split does not change.
+    '''
+    lines: list[Line]
+    ends_mm: list[float]
+    valid: bool = True
+
+    def index(self, line: Line) -> int:
+        '''
+        Gets the index of the given move of the run.
+        '''
+        return bisect_right(self.ends_mm, line.annotation.run_start_mm)
+
+    def split(self, a: Line, b: Line, a_length: float, b_length: float):
+        '''
+        Updates the run for the move `a` being split into `a` and a new move `b` that follows it.
+
+        Replaces the annotations of both moves with ones that only have what the run needs, so they
+        still need annotating. As their distances are already up to date, annotating them does not
+        invalidate the run.
+        '''
+        index = self.index(a)
+        start = a.annotation.run_start_mm
+        a.annotation = Annotation(distance_mm=a_length, move_type='moving_extrude', run=self, run_start_mm=start)
+        b.annotation = Annotation(distance_mm=b_length, move_type='moving_extrude', run=self, run_start_mm=start + a_length)
+
+        self.ends_mm.insert(index, start + a_length)
+        self.lines.insert(index + 1, b)
+
+def _run_key(annotation: Annotation):
+    '''
+    Gets what a move contributes to a run: its distance if it is in a run, _BREAK if it ends one, or
+    None if it does neither.
+    '''
+    move_type = annotation.move_type
+    if move_type == 'moving_extrude':
+        distance = annotation.distance_mm
+        # Positions that are not known end the run.
+        return distance if distance == distance else _BREAK
+
+    if move_type in RUN_BREAKS:
+        return _BREAK
+
+    return None
+
+def _same_run_key(old, new) -> bool:
+    if old is new:
+        return True
+
+    if old is None or new is None or old is _BREAK or new is _BREAK:
+        return False
+
+    return abs(old - new) <= RUN_DISTANCE_EPSILON_MM
+
+def _adjacent_run(line: Line, backward: bool) -> 'ExtrusionRun | None':
+    '''
+    Gets the run of the nearest move in a run before or after the given line, unless the run is
+    broken before it is reached.
+    '''
+    while True:
+        line = line.prev if backward else line.next
+        if line is None or line.__class__ is RawLine:
+            return None
+
+        key = _run_key(line.annotation)
+        if key is _BREAK:
+            return None
+        if key is not None:
+            return line.annotation.run
+
+def extrusion_run(line: Line) -> ExtrusionRun | None:
+    '''
+    Gets the run of continuous extrusion that the given move is in, building it if needed.
+
+    Returns None if the line is not an annotated extruding move.
+    '''
+    annotation = line.annotation
+    run = annotation.run
+    if run is not None and run.valid:
+        return run
+
+    key = _run_key(annotation)
+    if key is None or key is _BREAK:
+        return None
+
+    # Find the first move of the run.
+    first = line
+    current = line.prev
+    while current is not None and current.__class__ is not RawLine:
+        key = _run_key(current.annotation)
+        if key is _BREAK:
+            break
+        if key is not None:
+            first = current
+
+        current = current.prev
+
+    run = ExtrusionRun([], [])
+    lines = run.lines
+    ends_mm = run.ends_mm
+    end_mm = 0.0
+    current = first
+    while current is not None and current.__class__ is not RawLine:
+        annotation = current.annotation
+        key = _run_key(annotation)
+        if key is _BREAK:
+            break
+        if key is not None:
+            annotation.run = run
+            annotation.run_start_mm = end_mm
+            end_mm += key
+            lines.append(current)
+            ends_mm.append(end_mm)
+
+        current = current.next
+
+    return run
@@ -0,0 +1,400 @@
+import os
+import hashlib
+import tempfile
+import zipfile
+from os import PathLike
+from pathlib import Path
+
+import numpy as np
+
+from . import __version__
+from .parser import (
+    _gc_paused,
+    _umask,
+    _link_lines,
+    _link_moves,
+    Annotation,
+    BlockLine,
+    GCodeFile,
+    Line,
+    MoveParams,
+    RawLine,
+    MOVE_CODES,
+    Section,
+    NO_ANNOTATION,
+    X_BIT,
+    Y_BIT,
+    Z_BIT,
+    E_BIT,
+    F_BIT,
+)
+
+# Changed whenever the format of the entries, or what the parser puts in them, changes, in addition
+# to the version.
+FORMAT = 3
+
+# Suffix of the cache entry files.
+ENTRY_SUFFIX = '.gcache'
+
+DEFAULT_MAX_SIZE_MB = 1024
+
+# Size of the chunks that input files are hashed in.
+HASH_CHUNK_BYTES = 1024 * 1024
+
+NAN = float('NaN')
+
+class FileCache:
+    '''
+    On-disk cache of parsed and annotated gcode files.
+
+    Entries are keyed by the contents of the gcode file and the gcode_forge version, so they are
+    never stale. Once the cache grows past its maximum size, the least recently used entries are
+    removed.
+    '''
+    def __init__(self, directory: str | PathLike, max_size_mb: float=DEFAULT_MAX_SIZE_MB):
+        self.directory = Path(directory).expanduser()
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+
+    def key(self, path: str | PathLike) -> str:
+        '''
+        Gets the key of the entry for the given gcode file.
+        '''
+        digest = hashlib.sha256()
+        with open(path, 'rb') as file:
+            while chunk := file.read(HASH_CHUNK_BYTES):
+                digest.update(chunk)
+
+        return f'{__version__}-{FORMAT}-{digest.hexdigest()}'
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / (key + ENTRY_SUFFIX)
+
+    def load(self, key: str) -> GCodeFile | None:
+        '''
+        Loads the file stored under the given key, or returns None if there is no entry for it.
+        '''
+        entry_path = self._entry_path(key)
+        with _gc_paused():
+            # Entries only hold arrays, so loading one never runs code from the cache directory.
+            try:
+                with np.load(entry_path, allow_pickle=False) as data:
+                    entry = {name: data[name] for name in data.files}
+            except FileNotFoundError:
+                return None
+            except (OSError, EOFError, ValueError, zipfile.BadZipFile):
+                # Unreadable, such as if it was only partially written. It will be replaced.
+                entry_path.unlink(missing_ok=True)
+                return None
+
+            # Mark the entry as recently used.
+            os.utime(entry_path)
+
+            try:
+                return _load_file(entry)
+            except (KeyError, ValueError, IndexError):
+                # From another format, or damaged.
+                entry_path.unlink(missing_ok=True)
+                return None
+
+    def store(self, key: str, gcode: GCodeFile):
+        '''
+        Stores the given file under the given key, then evicts entries if the cache is too large.
+        '''
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Written to a temporary file first so that a partial entry is never loaded.
+        with tempfile.NamedTemporaryFile('wb', dir=self.directory, suffix='.tmp', delete=False) as file:
+            try:
+                with _gc_paused():
+                    np.savez(file, **_dump_file(gcode))
+            except BaseException:
+                file.close()
+                os.unlink(file.name)
+                raise
+
+        # The temporary file is only readable by its owner, so it is given the mode a new file would
+        # get, which lets a cache directory be shared.
+        os.chmod(file.name, 0o666 & ~_umask())
+        os.replace(file.name, self._entry_path(key))
+
+        self.evict()
+
+    def evict(self):
+        '''
+        Removes the least recently used entries until the cache is within its maximum size.
+        '''
+        entries = []
+        total_size = 0
+        for entry_path in self.directory.glob('*' + ENTRY_SUFFIX):
+            try:
+                stat = entry_path.stat()
+            except FileNotFoundError:
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+            total_size += stat.st_size
+
+        entries.sort()
+        for _, size, entry_path in entries:
+            if total_size <= self.max_size_bytes:
+                break
+
+            entry_path.unlink(missing_ok=True)
+            total_size -= size
+
+def _pack_strings(strings: list[str | None]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    '''
+    Packs strings into one array of UTF-8 bytes, along with the offset of the end of each string in
+    it and whether each is not None.
+    '''
+    encoded = [b'' if string is None else string.encode('UTF-8') for string in strings]
+    ends = np.cumsum([len(string) for string in encoded], dtype=np.int64)
+    present = np.array([string is not None for string in strings], dtype=bool)
+    return np.frombuffer(b''.join(encoded), dtype=np.uint8), ends, present
+
+def _unpack_strings(data: np.ndarray, ends: np.ndarray, present: np.ndarray) -> list[str | None]:
+    '''
+    Unpacks strings packed by _pack_strings().
+    '''
+    data = data.tobytes()
+    strings = []
+    start = 0
+    for end, is_present in zip(ends.tolist(), present.tolist()):
+        strings.append(data[start:end].decode('UTF-8') if is_present else None)
+        start = end
+
+    return strings
+
+def _dump_file(gcode: GCodeFile) -> dict:
+    '''
+    Converts a file into the arrays of a cache entry.
+
+    Sections are stored as their type, layer and text. The parameters of parsed moves and the
+    fields set by the annotator are stored in columns so that rebuilding them does not need to
+    parse or annotate. Everything else is parsed again when it is used, as it would be otherwise.
+    '''
+    section_types = []
+    section_layers = []
+    section_texts = []
+    section_raw = []
+
+    # Parsed moves, by line number in the file.
+    move_lines = []
+    move_codes = []
+    move_comments = []
+    present = []
+    params = []
+
+    # Annotated lines, by line number in the file. None is stored as NaN, so whether fields are set
+    # is stored separately.
+    annotated_lines = []
+    has_distance = []
+    positions = []
+    has_feed = []
+    feeds = []
+    has_cos_theta = []
+    cos_thetas = []
+    move_types = []
+    move_type_codes = {}
+
+    number = 0
+    for section in gcode.sections():
+        section_types.append(section.section_type)
+        section_layers.append(-1 if section.layer is None else section.layer)
+
+        first_line = section.first_line
+        if first_line is None:
+            section_texts.append(None)
+            section_raw.append(False)
+            continue
+
+        if first_line.__class__ is RawLine:
+            section_texts.append(first_line._text)
+            section_raw.append(True)
+            number += 1
+            continue
+
+        texts = []
+        for line in section.lines():
+            texts.append(line._text)
+
+            # Blocks are loaded back as the lines they are made of.
+            if line.__class__ is BlockLine:
+                number += line._text.count('\n')
+
+            line_params = line._params
+            if (
+                line_params.__class__ is MoveParams
+                and not line._dirty
+                and line_params.extra is None
+                and line._eqparams is None
+            ):
+                bits = line_params.present
+                move_lines.append(number)
+                move_codes.append(MOVE_CODES.index(line._code))
+                move_comments.append(line._comment)
+                present.append(bits)
+                params.append((
+                    line_params.X if bits & X_BIT else NAN,
+                    line_params.Y if bits & Y_BIT else NAN,
+                    line_params.Z if bits & Z_BIT else NAN,
+                    line_params.E if bits & E_BIT else NAN,
+                    line_params.F if bits & F_BIT else NAN,
+                ))
+
+            annotation = line.annotation
+            if annotation is not NO_ANNOTATION:
+                annotated_lines.append(number)
+
+                has_distance.append(annotation.distance_mm is not None)
+                if annotation.distance_mm is None:
+                    positions.append((NAN,) * 7)
+                else:
+                    positions.append((
+                        *annotation.start_pos,
+                        *annotation.end_pos,
+                        annotation.distance_mm,
+                        *annotation.vector,
+                    ))
+
+                has_feed.append(annotation.desired_feed_mms is not None)
+                feeds.append(NAN if annotation.desired_feed_mms is None else annotation.desired_feed_mms)
+
+                has_cos_theta.append(annotation.cos_theta is not None)
+                cos_thetas.append(NAN if annotation.cos_theta is None else annotation.cos_theta)
+
+                move_types.append(move_type_codes.setdefault(annotation.move_type, len(move_type_codes)))
+
+            number += 1
+
+        section_texts.append('\n'.join(texts))
+        section_raw.append(False)
+
+    section_type_names, section_type_codes = np.unique(np.array(section_types, dtype=str), return_inverse=True)
+    section_text_data, section_text_ends, has_section_text = _pack_strings(section_texts)
+    comment_data, comment_ends, has_comment = _pack_strings(move_comments)
+    move_type_name_data, move_type_name_ends, _ = _pack_strings(list(move_type_codes))
+
+    return {
+        'section_type_names': section_type_names,
+        'section_types': section_type_codes.astype(np.int64),
+        'section_layers': np.array(section_layers, dtype=np.int64),
+        'section_text_data': section_text_data,
+        'section_text_ends': section_text_ends,
+        'has_section_text': has_section_text,
+        'section_raw': np.array(section_raw, dtype=bool),
+        'move_lines': np.array(move_lines, dtype=np.int64),
+        'move_codes': np.array(move_codes, dtype=np.uint8),
+        'comment_data': comment_data,
+        'comment_ends': comment_ends,
+        'has_comment': has_comment,
+        'present': np.array(present, dtype=np.uint8),
+        'params': np.array(params, dtype=np.float64).reshape(-1, 5),
+        'annotated_lines': np.array(annotated_lines, dtype=np.int64),
+        'has_distance': np.array(has_distance, dtype=bool),
+        'positions': np.array(positions, dtype=np.float64).reshape(-1, 7),
+        'has_feed': np.array(has_feed, dtype=bool),
+        'feeds': np.array(feeds, dtype=np.float64),
+        'has_cos_theta': np.array(has_cos_theta, dtype=bool),
+        'cos_thetas': np.array(cos_thetas, dtype=np.float64),
+        'move_types': np.array(move_types, dtype=np.uint8),
+        'move_type_name_data': move_type_name_data,
+        'move_type_name_ends': move_type_name_ends,
+    }
+
+def _load_file(entry: dict) -> GCodeFile:
+    '''
+    Rebuilds a file from entry data created by _dump_file().
+    '''
+    lines = []
+
+    first_section = None
+    current_section = None
+    last_line = None
+    section_type_names = entry['section_type_names'].tolist()
+    section_texts = _unpack_strings(entry['section_text_data'], entry['section_text_ends'], entry['has_section_text'])
+    for number, (section_type, layer, text, raw) in enumerate(zip(
+        entry['section_types'].tolist(),
+        entry['section_layers'].tolist(),
+        section_texts,
+        entry['section_raw'].tolist(),
+    )):
+        section = Section(section_type_names[section_type], number=number, layer=None if layer < 0 else layer)
+        if current_section:
+            section.prev = current_section
+            current_section.next = section
+        else:
+            first_section = section
+        current_section = section
+
+        if text is None:
+            continue
+
+        if raw:
+            section_lines = [RawLine(text)]
+        else:
+            section_lines = [Line(line_text) for line_text in text.split('\n')]
+
+        last_line = _link_lines(section, section_lines, last_line, link_moves=False)
+        lines += section_lines
+
+    for number, code, comment, bits, (x, y, z, e, f) in zip(
+        entry['move_lines'].tolist(),
+        entry['move_codes'].tolist(),
+        _unpack_strings(entry['comment_data'], entry['comment_ends'], entry['has_comment']),
+        entry['present'].tolist(),
+        entry['params'].tolist()
+    ):
+        line = lines[number]
+        line._code = MOVE_CODES[code]
+        line._comment = comment
+
+        params = MoveParams()
+        params.line = line
+        params.present = bits
+        if bits & X_BIT:
+            params.X = x
+        if bits & Y_BIT:
+            params.Y = y
+        if bits & Z_BIT:
+            params.Z = z
+        if bits & E_BIT:
+            params.E = e
+        if bits & F_BIT:
+            params.F = f
+        params.extra = None
+
+        line._args = None
+        line._params = params
+        line._eqparams = None
+
+    # Linked once the codes of the moves are set, so that they do not need parsing to find them.
+    _link_moves(lines)
+
+    move_type_ends = entry['move_type_name_ends']
+    move_type_names = _unpack_strings(entry['move_type_name_data'], move_type_ends, np.ones(len(move_type_ends), dtype=bool))
+    for number, has_distance, (start_x, start_y, end_x, end_y, distance, vector_x, vector_y), has_feed, feed, has_cos_theta, cos_theta, move_type in zip(
+        entry['annotated_lines'].tolist(),
+        entry['has_distance'].tolist(),
+        entry['positions'].tolist(),
+        entry['has_feed'].tolist(),
+        entry['feeds'].tolist(),
+        entry['has_cos_theta'].tolist(),
+        entry['cos_thetas'].tolist(),
+        entry['move_types'].tolist(),
+    ):
+        annotation = Annotation()
+        if has_distance:
+            annotation.start_pos = (start_x, start_y)
+            annotation.end_pos = (end_x, end_y)
+            annotation.distance_mm = distance
+            annotation.vector = (vector_x, vector_y)
+        if has_feed:
+            annotation.desired_feed_mms = feed
+        if has_cos_theta:
+            annotation.cos_theta = cos_theta
+        annotation.move_type = move_type_names[move_type]
+
+        lines[number].annotation = annotation
+
+    return GCodeFile(first_section)
@@ -1,13 +1,22 @@
+import math
 
-from .parser import Line
-from .annotator import annotate
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator
+
+from .parser import Line, RawLine, NO_ANNOTATION, X_BIT, Y_BIT
+from .annotator import AnnotationSession, annotate, reannotate, extrusion_run, RUN_BREAKS
+
+XY_BITS = X_BIT | Y_BIT
 
 def next_move(line, stop=None):
     '''
     Gets the first next move after the given line.
     '''
+    # Once on a move, other lines are skipped by following the links between moves, unless the
+    # stop is another line that they would skip.
+    skip = stop is None or stop.is_move
     while True:
-        line = line.next
+        line = line.next_move if skip and line.is_move else line.next
         if line is None:
             break
 
@@ -23,8 +32,9 @@ def prev_move(line, stop=None):
     '''
     Gets the first previous move after the given line.
     '''
+    skip = stop is None or stop.is_move
     while True:
-        line = line.prev
+        line = line.prev_move if skip and line.is_move else line.prev
         if line is None:
             break
 
@@ -42,17 +52,11 @@ def prev_continuous_move(move_type, line):
     extrusion that the given line belongs to.
     '''
     while True:
-        line = line.prev
+        line = line.prev_move if line.is_move else line.prev
         if line is None:
             break
 
-        if line.annotation.move_type in {
-            'extrude',
-            'retract',
-            'z',
-            'travel',
-            'moving_retract',
-        }:
+        if line.annotation.move_type in RUN_BREAKS:
             break
 
         if line.annotation.move_type == move_type:
@@ -66,17 +70,11 @@ def next_continuous_move(move_type, line):
     extrusion that the given line belongs to.
     '''
     while True:
-        line = line.next
+        line = line.next_move if line.is_move else line.next
         if line is None:
             break
 
-        if line.annotation.move_type in {
-            'extrude',
-            'retract',
-            'z',
-            'travel',
-            'moving_retract',
-        }:
+        if line.annotation.move_type in RUN_BREAKS:
             break
 
         if line.annotation.move_type == move_type:
@@ -124,6 +122,113 @@ def apply_forward(start, stop, func, *args):
 
     return should_stop
 
+def apply_moves_backward(start, stop, func, *args):
+    '''
+    Like apply_backward, but only calls func for moves. Other lines are skipped by following the
+    links between moves, unless the stop line is not a move.
+    '''
+    should_stop = False
+    current_line = start.prev
+    section = current_line.section
+    skip = stop.is_move
+    while True:
+        is_move = current_line.is_move
+        if is_move:
+            should_stop = func(current_line, *args)
+            if should_stop:
+                break
+
+        if current_line is stop:
+            break
+
+        if skip and is_move:
+            current_line = current_line.prev_move
+            if current_line is None or current_line.section is not section:
+                break
+            continue
+
+        if current_line is section.first_line:
+            break
+
+        current_line = current_line.prev
+        if not current_line:
+            raise Exception('Reached beginning of file')
+
+    return should_stop
+
+def apply_moves_forward(start, stop, func, *args):
+    '''
+    Like apply_forward, but only calls func for moves.
+    '''
+    should_stop = False
+    current_line = start
+    section = current_line.section
+    skip = stop.is_move
+    while True:
+        is_move = current_line.is_move
+        if is_move:
+            should_stop = func(current_line, *args)
+            if should_stop:
+                break
+
+        if current_line is stop:
+            break
+
+        if skip and is_move:
+            current_line = current_line.next_move
+            if current_line is None or current_line.section is not section:
+                break
+            continue
+
+        if current_line is section.last_line:
+            break
+
+        current_line = current_line.next
+        if not current_line:
+            raise Exception('Reached end of file')
+
+    return should_stop
+
+def split_move(current: Line, a_length: float, b_length: float) -> Line:
+    '''
+    Splits a move in two at the given distance from its start, in place.
+
+    The given line becomes the first segment, `a`, and a new line for the second segment, `b`, is
+    inserted after it and returned. As the given line stays in the file, outside references to it
+    stay valid. The caller is responsible for reannotating.
+    '''
+    current_length = a_length + b_length
+    b = current.copy()
+
+    # Determine the scaling of the new lines to the existing line.
+    a_factor = a_length / current_length
+    b_factor = b_length / current_length
+
+    # Only `a` needs new x and y parameters as `b` will have the same end point as the existing line.
+    # vector * a_factor + start_pos
+    annotation = current.annotation
+    vector = annotation.vector
+    start_pos = annotation.start_pos
+    current.params['X'] = vector[0] * a_factor + start_pos[0]
+    current.params['Y'] = vector[1] * a_factor + start_pos[1]
+
+    # Scale the extrusion amounts by the scale of the new lines to the existing line.
+    if current_e := b.params.get('E'):
+        current.params['E'] = current_e * a_factor
+        b.params['E'] = current_e * b_factor
+
+    current.section.insert_after(current, b)
+
+    # `a` is annotated as a new line, like `b`. If the run of the line has been built, it is patched
+    # rather than built again.
+    run = annotation.run
+    if run is not None and run.valid:
+        run.split(current, b, a_length, b_length)
+    else:
+        current.annotation = NO_ANNOTATION
+
+    return b
+
 def split_distance_back(line: Line, distance:float, min_segment_length:float):
     '''
     Splits a previous line segment at a given distance back from the start of the given line.
@@ -141,6 +246,23 @@ def split_distance_back(line: Line, distance:float, min_segment_length:float):
     current = line
     traveled = 0
     while traveled < distance:
+        # Within a run of extrusion, search the path lengths of the run rather than walking it.
+        annotation = current.annotation
+        if annotation.move_type == 'moving_extrude' and (
+            (run := annotation.run) is not None and run.valid or (run := extrusion_run(current))
+        ):
+            ends_mm = run.ends_mm
+            start_mm = annotation.run_start_mm
+            cut_mm = start_mm - (distance - traveled)
+            if cut_mm >= 0:
+                index = bisect_right(ends_mm, cut_mm)
+                current = run.lines[index]
+                traveled += start_mm - (ends_mm[index - 1] if index else 0)
+                break
+
+            traveled += start_mm
+            current = run.lines[0]
+
         current = current.prev
 
         if current is None:
@@ -165,36 +287,14 @@ def split_distance_back(line: Line, distance:float, min_segment_length:float):
                 return current
             return next_extrude
 
-    # Create the two new line segments to replace the existing line.
-    a = current.copy()
-    a.annotation._state = current.annotation._state
-
-    b = current.copy()
-
-    # Determine the scaling of the new lines to the existing line.
-    a_factor = a_length / current_length
-    b_factor = b_length / current_length
-
-    # Only `a` needs new x and y parameters as `b` will have the same end point as the existing line.
-    # vector * a_factor + start_pos
-    vector = current.annotation.vector
-    start_pos = current.annotation.start_pos
-    a.params['X'] = vector[0] * a_factor + start_pos[0]
-    a.params['Y'] = vector[1] * a_factor + start_pos[1]
+    # Split the line into `a` and `b`.
+    a = current
+    b = split_move(current, a_length, b_length)
 
-    # Scale the extrusion amounts by the scale of the new lines to the existing line.
-    if current_e := current.params.get('E'):
-        a.params['E'] = current_e * a_factor
-        b.params['E'] = current_e * b_factor
-
-    # Replace the existing line segment.
-    current_section = current.section
-    current_section.insert_after(current, a)
-    current_section.insert_after(a, b)
-    current_section.remove(current)
-
-    # Reannotate so that the annotations are correct.
-    annotate(a, line, reannotate=True)
+    # Reannotate so that the annotations are correct. The new segments are needed right away for
+    # further splits. The lines after them up to the given line only need updating for the new angle
+    # at `b`, which can be deferred.
+    reannotate(a, line, needed=b)
 
     return b
 
@@ -211,6 +311,23 @@ def split_distance_forward(line: Line, distance:float, min_segment_length:float)
     current = line
     traveled = current.annotation.distance_mm or 0
     while traveled < distance:
+        # Within a run of extrusion, search the path lengths of the run rather than walking it.
+        annotation = current.annotation
+        if annotation.move_type == 'moving_extrude' and (
+            (run := annotation.run) is not None and run.valid or (run := extrusion_run(current))
+        ):
+            ends_mm = run.ends_mm
+            index = run.index(current)
+            end_mm = ends_mm[index]
+            index = bisect_left(ends_mm, end_mm + (distance - traveled), index)
+            if index < len(ends_mm):
+                current = run.lines[index]
+                traveled += ends_mm[index] - end_mm
+                break
+
+            traveled += ends_mm[-1] - end_mm
+            current = run.lines[-1]
+
         current = current.next
 
         if current is None:
@@ -233,40 +350,222 @@ def split_distance_forward(line: Line, distance:float, min_segment_length:float)
         else:
             return line, current
 
-    # Create the two new line segments to replace the existing line.
-    a = current.copy()
-    a.annotation._state = current.annotation._state
+    # Split the line into `a` and `b`.
+    a = current
+    b = split_move(current, a_length, b_length)
 
-    b = current.copy()
+    # Reannotate so that the annotations are correct.
+    annotate(a, b, reannotate=True)
 
-    # Determine the scaling of the new lines to the existing line.
-    a_factor = a_length / current_length
-    b_factor = b_length / current_length
+    return line, a
 
-    # Only `a` needs new x and y parameters as `b` will have the same end point as the existing line.
-    # vector * a_factor + start_pos
-    vector = current.annotation.vector
-    start_pos = current.annotation.start_pos
-    a.params['X'] = vector[0] * a_factor + start_pos[0]
-    a.params['Y'] = vector[1] * a_factor + start_pos[1]
+def split_distances_back(line: Line, distances: Iterable[float], min_segment_length: float) -> Iterator[Line]:
+    '''
+    Makes a series of cuts going back from the start of the given line, in a single pass.
 
-    # Scale the extrusion amounts by the scale of the new lines to the existing line.
-    if current_e := current.params.get('E'):
-        a.params['E'] = current_e * a_factor
-        b.params['E'] = current_e * b_factor
+    Each distance is measured back from the previous cut, or from the line for the first one, such
+    as the differences between the positions of an acceleration profile. Cuts are made like
+    split_distance_back, and the line closest to each cut is yielded as it is made, so the caller can
+    stop at any point. Stops early if a break in the extrusion line is encountered.
+    '''
+    for distance in distances:
+        line = split_distance_back(line, distance, min_segment_length)
+        if line is None:
+            return
 
-    # Replace the existing line segment.
-    current_section = current.section
-    current_section.insert_after(current, a)
-    current_section.insert_after(a, b)
-    current_section.remove(current)
+        yield line
 
-    # If the line that was replaced was the line given as the starting point, we need to return `a`
-    # as what the caller should use going forward instead of the given line.
-    if current is line:
-        line = a
+def split_distances_forward(line: Line, distances: Iterable[float], min_segment_length: float) -> Iterator[tuple[Line, Line]]:
+    '''
+    Like split_distances_back but in the other direction.
 
-    # Reannotate so that the annotations are correct.
-    annotate(a, b, reannotate=True)
+    Each cut is measured from the start of the next moving extrusion after the previous cut. Yields
+    the starting line of each cut along with the last line before the cut. If the end of the file is
+    reached, the last line before the cut is None, as with split_distance_forward.
+    '''
+    for distance in distances:
+        line, cut = split_distance_forward(line, distance, min_segment_length)
 
-    return line, a
+        yield line, cut
+
+        if cut is None:
+            return
+
+        line = next_continuous_move('moving_extrude', cut)
+        if line is None:
+            return
+
+class EditBatch:
+    '''
+    Collects inserts, replacements and removals against lines of a file, then applies them in one
+    pass.
+
+    Lines are inserted and removed relative to anchors, which are lines already in the file, so the
+    edits do not change what later edits refer to. Nothing is changed until apply() is called, and
+    the batch is checked before anything is changed, so an invalid batch leaves the file as it was.
+    Lines inserted at the same place keep the order they were added in. Each group of lines inserted
+    at the same place is linked in at once, and the edited lines are re-annotated together once at
+    the end.
+
+    Used as a context manager, the batch is applied if the block exits normally and discarded if it
+    raises.
+    '''
+    def __init__(self, reannotate: bool=True):
+        self.reannotate = reannotate
+
+        # By the id of the anchor.
+        self._anchors: dict[int, Line] = {}
+        self._before: dict[int, list[Line]] = {}
+        self._after: dict[int, list[Line]] = {}
+        self._removed: set[int] = set()
+
+    def __enter__(self) -> 'EditBatch':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.apply()
+        else:
+            self.discard()
+
+    def __len__(self) -> int:
+        return len(self._anchors)
+
+    def _anchor(self, anchor: Line) -> int:
+        key = id(anchor)
+        self._anchors[key] = anchor
+        return key
+
+    def insert_before(self, anchor: Line, line: Line):
+        '''
+        Inserts the given line before the anchor.
+        '''
+        self._before.setdefault(self._anchor(anchor), []).append(line)
+
+    def insert_after(self, anchor: Line, line: Line):
+        '''
+        Inserts the given line after the anchor. Lines inserted after the same anchor are inserted
+        in the order they were added, each after the one before.
+        '''
+        self._after.setdefault(self._anchor(anchor), []).append(line)
+
+    def replace(self, line: Line, *lines: Line):
+        '''
+        Replaces the given line with the given lines.
+        '''
+        key = self._anchor(line)
+        self._before.setdefault(key, []).extend(lines)
+        self._removed.add(key)
+
+    def remove(self, line: Line):
+        '''
+        Removes the given line.
+        '''
+        self._removed.add(self._anchor(line))
+
+    def discard(self):
+        '''
+        Drops all of the edits in the batch.
+        '''
+        self._anchors.clear()
+        self._before.clear()
+        self._after.clear()
+        self._removed.clear()
+
+    def _check(self):
+        inserted = set()
+        for key, anchor in self._anchors.items():
+            if not _in_file(anchor):
+                raise ValueError(f'Anchor is not in a file: {anchor}')
+
+            for line in (*self._before.get(key, ()), *self._after.get(key, ())):
+                if _in_file(line):
+                    raise ValueError(f'Line is already in a file: {line}')
+
+                if id(line) in inserted:
+                    raise ValueError(f'Line is inserted more than once: {line}')
+                inserted.add(id(line))
+
+    def apply(self):
+        '''
+        Applies the edits in the batch, then clears it.
+
+        Raises ValueError without changing anything if an anchor is not in a file, or if a line to
+        insert is already in a file or is inserted more than once.
+        '''
+        self._check()
+
+        # The edited ranges that need re-annotating.
+        ranges = []
+
+        for key, anchor in self._anchors.items():
+            section = anchor.section
+            before = self._before.get(key)
+            after = self._after.get(key)
+            removed = key in self._removed
+
+            first = anchor.prev
+            if before:
+                section.splice(None if anchor is section.first_line else anchor.prev, before)
+            if after:
+                section.splice(anchor, after)
+            last = anchor if not after else after[-1]
+
+            if removed:
+                if last is anchor:
+                    last = anchor.next
+                section.remove(anchor)
+
+            if not self.reannotate:
+                continue
+
+            # Only edits that add or remove moves, or lines that may hold moves, change annotations.
+            if not (
+                removed and _changes_moves(anchor)
+                or before and any(_changes_moves(line) for line in before)
+                or after and any(_changes_moves(line) for line in after)
+            ):
+                continue
+
+            first = first.next if first is not None else before[0] if before else anchor.next if removed else anchor
+            if first is None:
+                continue
+
+            # Moves after the edit are affected until both X and Y have been set since, whether by
+            # one move or two, after which positions are as they were, and then up to the next move
+            # with a known distance, as its corner depends on the start of the move before. Moves
+            # whose start was unknown have a distance of NaN, and may gain one from the edit. If X
+            # and Y are not both set again, the rest of the file is affected.
+            pinned = 0
+            line = last
+            while line is not None:
+                line = line.next_move if line.is_move else line.next
+                if line is None or not line.is_move:
+                    continue
+
+                if pinned == XY_BITS and not math.isnan(line.annotation.distance_mm or math.nan):
+                    break
+
+                pinned |= line.params.present & XY_BITS
+
+            ranges.append((first, line))
+
+        self.discard()
+
+        if ranges:
+            with AnnotationSession():
+                for first, last in ranges:
+                    reannotate(first, last)
+
+def _in_file(line: Line) -> bool:
+    # Copies of lines keep the links of the original, so the links are checked from both sides.
+    if line.section is None:
+        return False
+
+    if line.prev is None:
+        return line.section.first_line is line
+
+    return line.prev.next is line
+
+def _changes_moves(line: Line) -> bool:
+    return line.__class__ is RawLine or line.is_move
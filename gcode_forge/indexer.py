@@ -0,0 +1,87 @@
+import os
+import re
+import mmap
+from os import PathLike
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+
+# Matches the lines that the parser starts new sections at.
+SECTION_MARKER = re.compile(rb'^[ \t\f\v]*;(?:TYPE:([^\r\n]*)|LAYER_CHANGE)', re.MULTILINE)
+
+@dataclass(slots=True)
+class SectionSpan:
+    '''
+    Location of a section in a gcode file.
+    '''
+    section_type: str
+
+    # Byte offsets of the section. `start` is the start of the line that begins the section.
+    start: int
+    end: int
+
+    # Number of the layer the section is in, counting from 0 at the first layer change. None for
+    # sections before the first layer change.
+    layer: int = None
+
+def section_type_name(text: str) -> str:
+    '''
+    Gets the section type from the text after `;TYPE:`, ignoring case and surrounding whitespace.
+    '''
+    return text.strip().lower()
+
+def scan_sections(data: bytes | mmap.mmap) -> Iterator[SectionSpan]:
+    '''
+    Scans the given gcode bytes for section markers without parsing any lines.
+    '''
+    section_type = 'start'
+    start = 0
+    layer = None
+    for match in SECTION_MARKER.finditer(data):
+        yield SectionSpan(section_type, start, match.start(), layer)
+
+        if match.group(1) is None:
+            section_type = 'layer_change'
+            layer = 0 if layer is None else layer + 1
+        else:
+            section_type = section_type_name(match.group(1).decode('UTF-8'))
+
+        start = match.start()
+
+    yield SectionSpan(section_type, start, len(data), layer)
+
+@contextmanager
+def map_file(path: str | PathLike) -> Iterator[bytes | mmap.mmap]:
+    '''
+    Memory maps the given file for reading.
+    '''
+    with open(path, 'rb') as file:
+        # Empty files cannot be mapped.
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b''
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+def index_sections(path: str | PathLike) -> list[SectionSpan]:
+    '''
+    Builds an index of the sections in the given gcode file by memory mapping it and scanning the
+    raw bytes.
+    '''
+    with map_file(path) as data:
+        return list(scan_sections(data))
+
+def read_span(data: bytes | mmap.mmap, span: SectionSpan) -> str:
+    '''
+    Decodes the text of the given section, without the final line ending.
+    '''
+    text = data[span.start:span.end].decode('UTF-8')
+
+    if '\r' in text:
+        text = text.replace('\r\n', '\n')
+
+    if text.endswith('\n'):
+        text = text[:-1]
+
+    return text
@@ -0,0 +1,106 @@
+import math
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+import numpy.typing as npt
+
+from .parser import Line
+
+NAN = float('NaN')
+
+def calc_junction_deviation(square_corner_velocity_mms: float, max_accel_mmss: float) -> float:
+    '''
+    Gets the junction deviation that gives the given speed through a 90 deg corner.
+    '''
+    return (square_corner_velocity_mms**2) * (math.sqrt(2) - 1) / max_accel_mmss
+
+def calc_junction_speed(max_accel_mmss: float, deviation: float, cos_theta: float, desired_feed_mms: float) -> float:
+    # https://onehossshay.wordpress.com/2011/09/24/improving_grbl_cornering_algorithm/
+
+    # If cos_theta is -1 then the angle of the junction is 180 deg and the following math would
+    # divide by zero.
+    if cos_theta <= math.nextafter(-1, 0):
+        return desired_feed_mms
+
+    sin_half_theta = math.sqrt((1 - cos_theta) / 2)
+    r = deviation * (sin_half_theta / (1 - sin_half_theta))
+    v_junction = math.sqrt(max_accel_mmss * r)
+
+    return min(v_junction, desired_feed_mms)
+
+def junction_speeds(max_accel_mmss: float, deviation: float, cos_theta: npt.NDArray[np.float64], desired_feed_mms: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    '''
+    Vectorized calc_junction_speed(). NaN in either input gives NaN.
+    '''
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sin_half_theta = np.sqrt((1 - cos_theta) / 2)
+        r = deviation * (sin_half_theta / (1 - sin_half_theta))
+        v_junction = np.sqrt(max_accel_mmss * r)
+
+    # If cos_theta is -1 then the angle of the junction is 180 deg and the math above divides by zero.
+    return np.where(cos_theta <= math.nextafter(-1, 0), desired_feed_mms, np.minimum(v_junction, desired_feed_mms))
+
+@dataclass(slots=True)
+class JunctionTable:
+    '''
+    Struct-of-arrays view of the junctions at the start of annotated moves.
+
+    Only moves with a move type, a desired feed rate and a known junction angle are included.
+    `lines` maps each row back to its Line. The values are those of the annotations when the table
+    was built, so they are not updated by later edits.
+    '''
+    cos_theta: npt.NDArray[np.float64]
+    desired_feed_mms: npt.NDArray[np.float64]
+    lines: npt.NDArray[np.object_]
+
+    def __len__(self):
+        return len(self.lines)
+
+    @staticmethod
+    def from_lines(lines: Iterable[Line]) -> 'JunctionTable':
+        '''
+        Builds a table from the junctions of the given moves.
+        '''
+        moves = []
+        cos_theta = []
+        desired_feed_mms = []
+        for line in lines:
+            annotation = line.annotation
+            if annotation.move_type is None or annotation.desired_feed_mms is None or annotation.cos_theta is None:
+                continue
+
+            moves.append(line)
+            cos_theta.append(annotation.cos_theta)
+            desired_feed_mms.append(annotation.desired_feed_mms)
+
+        table_lines = np.empty(len(moves), dtype=object)
+        table_lines[:] = moves
+
+        cos_theta = np.array(cos_theta, dtype=np.float64)
+        desired_feed_mms = np.array(desired_feed_mms, dtype=np.float64)
+
+        # A NaN cos_theta is a junction whose angle is not known, such as after a move of no distance.
+        known = ~np.isnan(cos_theta)
+        if not known.all():
+            return JunctionTable(cos_theta[known], desired_feed_mms[known], table_lines[known])
+
+        return JunctionTable(cos_theta, desired_feed_mms, table_lines)
+
+    def speeds(self, max_accel_mmss: float, deviation: float) -> npt.NDArray[np.float64]:
+        '''
+        Gets the speed that each junction can be taken at, capped at the desired feed rate.
+        '''
+        return junction_speeds(max_accel_mmss, deviation, self.cos_theta, self.desired_feed_mms)
+
+    def angles_deg(self) -> npt.NDArray[np.float64]:
+        '''
+        Gets the angle between each move and the one before it, in degrees. A straight line is 180 deg.
+        '''
+        return np.arccos(self.cos_theta) * 180 / math.pi
+
+    def corners(self, threshold_angle: float) -> npt.NDArray[np.bool_]:
+        '''
+        Gets a mask of the junctions that are corners at least as sharp as the given angle in degrees.
+        '''
+        return self.angles_deg() <= threshold_angle
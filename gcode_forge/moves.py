@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+NAN = float('NaN')
+
+@dataclass(slots=True)
+class MoveTable:
+    '''
+    Struct-of-arrays view of G0/G1 moves.
+
+    Parameters a move does not specify are NaN. `lines` maps each row back to its Line, and
+    `section_offsets[i]` is the row of the first move of the i-th section in the table.
+    '''
+    x: npt.NDArray[np.float64]
+    y: npt.NDArray[np.float64]
+    z: npt.NDArray[np.float64]
+    e: npt.NDArray[np.float64]
+    f: npt.NDArray[np.float64]
+    lines: npt.NDArray[np.object_]
+    section_offsets: npt.NDArray[np.intp]
+
+    def __len__(self):
+        return len(self.lines)
+
+    @staticmethod
+    def from_lines(lines) -> 'MoveTable':
+        '''
+        Builds a table from the moves in the given lines.
+        '''
+        moves = []
+        x = []
+        y = []
+        z = []
+        e = []
+        f = []
+        for line in lines:
+            if not line.is_move:
+                continue
+
+            params = line.params
+            moves.append(line)
+            x.append(params.get('X', NAN))
+            y.append(params.get('Y', NAN))
+            z.append(params.get('Z', NAN))
+            e.append(params.get('E', NAN))
+            f.append(params.get('F', NAN))
+
+        table_lines = np.empty(len(moves), dtype=object)
+        table_lines[:] = moves
+
+        return MoveTable(
+            # None values come from parameters without a value, which are treated as missing.
+            np.array(x, dtype=np.float64),
+            np.array(y, dtype=np.float64),
+            np.array(z, dtype=np.float64),
+            np.array(e, dtype=np.float64),
+            np.array(f, dtype=np.float64),
+            table_lines,
+            np.zeros(1, dtype=np.intp),
+        )
+
+    @staticmethod
+    def concatenate(tables: list['MoveTable']) -> 'MoveTable':
+        '''
+        Joins per-section tables into one table, recording where each section starts.
+        '''
+        if not tables:
+            return MoveTable.from_lines(())
+
+        return MoveTable(
+            np.concatenate([table.x for table in tables]),
+            np.concatenate([table.y for table in tables]),
+            np.concatenate([table.z for table in tables]),
+            np.concatenate([table.e for table in tables]),
+            np.concatenate([table.f for table in tables]),
+            np.concatenate([table.lines for table in tables]),
+            np.cumsum([0] + [len(table) for table in tables[:-1]], dtype=np.intp),
+        )
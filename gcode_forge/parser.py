@@ -1,6 +1,19 @@
 
-from dataclasses import dataclass
-from typing import TypeAlias
+import gc
+import os
+import shutil
+import tempfile
+from os import PathLike
+from pathlib import Path
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from collections.abc import Mapping, MutableMapping
+from typing import TypeAlias, Iterable, Iterator, TextIO
+
+from .moves import MoveTable
+from .indexer import SectionSpan, map_file, scan_sections, section_type_name, read_span
+from .section_index import SectionIndex
 
 Point2D: TypeAlias = tuple[float, float]
 Vector2D: TypeAlias = tuple[float, float]
@@ -10,7 +23,6 @@ class Annotation:
     '''
     Stores information added by the annotator.
     '''
-    _state: list = None
     start_pos: Point2D = None
     end_pos: Point2D = None
     distance_mm: float = None
@@ -21,6 +33,25 @@ class Annotation:
     desired_feed_mms: float = None
     cos_theta: float = None
 
+    # Run of continuous extrusion that the move is in, and the path length along the run to the start
+    # of the move. Set by annotator.extrusion_run() when the run is built.
+    run: 'ExtrusionRun' = None
+    run_start_mm: float = None
+
+class _NoAnnotation(Annotation):
+    '''
+    Annotation shared by all lines that have not been annotated, to avoid one per line. The
+    annotator only creates annotations for moves.
+    '''
+    __slots__ = []
+
+    def __setattr__(self, name, value):
+        raise TypeError('The line has not been annotated, assign line.annotation instead.')
+
+NO_ANNOTATION = object.__new__(_NoAnnotation)
+for annotation_field in fields(Annotation):
+    object.__setattr__(NO_ANNOTATION, annotation_field.name, annotation_field.default)
+
 MOVE_PARAM_PRECISION = {
     'X': 3,
     'Y': 3,
@@ -33,20 +64,314 @@ PARAM_PRECISION = {
     'G1': MOVE_PARAM_PRECISION
 }
 
+MOVE_CODES = ('G1', 'G0')
+
+# Starts of the text of move lines, used to find them without parsing.
+_MOVE_PREFIXES = tuple(
+    code_case + end
+    for code in MOVE_CODES
+    for code_case in (code, code.lower())
+    for end in (' ', '\t', ';')
+)
+
+# Marks fields of a Line that have not been parsed from its text yet.
+_UNPARSED = object()
+
+# Marks parameters that are not given.
+_MISSING = object()
+
+class Params(dict):
+    '''
+    Parameters of a line. Changing them marks the owning line as modified.
+    '''
+    __slots__ = ['line']
+
+    @staticmethod
+    def owned_by(line: 'Line', params: Mapping=()) -> 'Params':
+        '''
+        Creates parameters belonging to the given line.
+        '''
+        owned = Params(params)
+        owned.line = line
+        return owned
+
+    def copy_for(self, line: 'Line') -> 'Params':
+        '''
+        Copies the parameters for the given line.
+        '''
+        return Params.owned_by(line, self)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.line._modified()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.line._modified()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def pop(self, *args):
+        self.line._modified()
+        return super().pop(*args)
+
+    def popitem(self):
+        self.line._modified()
+        return super().popitem()
+
+    def clear(self):
+        self.line._modified()
+        super().clear()
+
+    def update(self, *args, **kwargs):
+        self.line._modified()
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        self.line._modified()
+        return super().setdefault(key, default)
+
+class _NoParams(Params):
+    '''
+    Parameters shared by all non-move lines that have none, to avoid a dict per line. Line.params
+    hands out an _EmptyParams in its place.
+    '''
+    __slots__ = []
+
+    def copy_for(self, line: 'Line') -> Params:
+        return self
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError('NO_PARAMS is shared and cannot be changed.')
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __ior__ = _immutable
+    pop = _immutable
+    popitem = _immutable
+    clear = _immutable
+    update = _immutable
+    setdefault = _immutable
+
+class _EmptyParams(Params):
+    '''
+    Parameters of a line that shares NO_PARAMS. The first change makes them the line's own, so
+    lines only get a dict once they are given parameters.
+    '''
+    __slots__ = []
+
+    def _own(self):
+        line = self.line
+        params = line._params
+        if params is NO_PARAMS:
+            line._params = self
+        elif params is not self:
+            # Another view was changed first, so this one catches up with it before changing it.
+            dict.clear(self)
+            dict.update(self, params)
+            line._params = self
+
+    def __setitem__(self, key, value):
+        self._own()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._own()
+        super().__delitem__(key)
+
+    def pop(self, *args):
+        self._own()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._own()
+        return super().popitem()
+
+    def clear(self):
+        self._own()
+        super().clear()
+
+    def update(self, *args, **kwargs):
+        self._own()
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        self._own()
+        return super().setdefault(key, default)
+
+NO_PARAMS = _NoParams()
+
+# Bit in MoveParams.present for each parameter stored in a fixed slot.
+X_BIT = 1
+Y_BIT = 2
+Z_BIT = 4
+E_BIT = 8
+F_BIT = 16
+
+MOVE_PARAM_BITS = {
+    'X': X_BIT,
+    'Y': Y_BIT,
+    'Z': Z_BIT,
+    'E': E_BIT,
+    'F': F_BIT,
+}
+
+class MoveParams(MutableMapping):
+    '''
+    Parameters of a G0/G1 line.
+
+    Rather than a dict, X, Y, Z, E and F are stored in fixed slots, with `present` being a bitmask
+    of which of them are set. Any other parameters are kept in `extra`. Changing them marks the
+    owning line as modified.
+    '''
+    __slots__ = [
+        'line',
+        'present',
+        'X',
+        'Y',
+        'Z',
+        'E',
+        'F',
+        'extra',
+    ]
+
+    @staticmethod
+    def owned_by(line: 'Line', params: Mapping=()) -> 'MoveParams':
+        '''
+        Creates parameters belonging to the given line.
+        '''
+        owned = MoveParams()
+        owned.line = line
+
+        if not isinstance(params, dict):
+            params = dict(params)
+
+        # Unrolled as this is done for every move that is parsed.
+        present = 0
+        get = params.get
+        if (value := get('X', _MISSING)) is not _MISSING:
+            owned.X = value
+            present |= X_BIT
+        if (value := get('Y', _MISSING)) is not _MISSING:
+            owned.Y = value
+            present |= Y_BIT
+        if (value := get('Z', _MISSING)) is not _MISSING:
+            owned.Z = value
+            present |= Z_BIT
+        if (value := get('E', _MISSING)) is not _MISSING:
+            owned.E = value
+            present |= E_BIT
+        if (value := get('F', _MISSING)) is not _MISSING:
+            owned.F = value
+            present |= F_BIT
+        owned.present = present
+
+        if len(params) == present.bit_count():
+            owned.extra = None
+        else:
+            owned.extra = {k: v for k, v in params.items() if k not in MOVE_PARAM_BITS}
+
+        return owned
+
+    def copy_for(self, line: 'Line') -> 'MoveParams':
+        '''
+        Copies the parameters for the given line.
+        '''
+        owned = MoveParams()
+        owned.line = line
+        owned.present = present = self.present
+        owned.extra = self.extra.copy() if self.extra else None
+
+        for key, bit in MOVE_PARAM_BITS.items():
+            if present & bit:
+                setattr(owned, key, getattr(self, key))
+
+        return owned
+
+    def get(self, key, default=None):
+        if bit := MOVE_PARAM_BITS.get(key):
+            return getattr(self, key) if self.present & bit else default
+
+        return self.extra.get(key, default) if self.extra else default
+
+    def __getitem__(self, key):
+        if bit := MOVE_PARAM_BITS.get(key):
+            if self.present & bit:
+                return getattr(self, key)
+            raise KeyError(key)
+
+        if self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        if bit := MOVE_PARAM_BITS.get(key):
+            return bool(self.present & bit)
+
+        return bool(self.extra) and key in self.extra
+
+    def __setitem__(self, key, value):
+        if bit := MOVE_PARAM_BITS.get(key):
+            setattr(self, key, value)
+            self.present |= bit
+        elif self.extra is None:
+            self.extra = {key: value}
+        else:
+            self.extra[key] = value
+
+        self.line._modified()
+
+    def __delitem__(self, key):
+        if bit := MOVE_PARAM_BITS.get(key):
+            if not self.present & bit:
+                raise KeyError(key)
+            delattr(self, key)
+            self.present &= ~bit
+        elif self.extra:
+            del self.extra[key]
+        else:
+            raise KeyError(key)
+
+        self.line._modified()
+
+    def __iter__(self):
+        present = self.present
+        for key, bit in MOVE_PARAM_BITS.items():
+            if present & bit:
+                yield key
+
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self):
+        return self.present.bit_count() + (len(self.extra) if self.extra else 0)
+
+    def __repr__(self):
+        return f'<MoveParams {dict(self)}>'
+
 class Line:
     '''
     Represents a file line.
+
+    The original text is kept and only parsed when its fields are first accessed. Lines that are
+    never modified are output as their original text.
     '''
     __slots__ = [
         'section',
         'annotation',
         'prev',
         'next',
-        'comment',
-        'code',
-        'params',
-        'eqparams',
-        'is_move',
+        'prev_move',
+        'next_move',
+        '_text',
+        '_dirty',
+        '_code',
+        '_comment',
+        '_args',
+        '_params',
+        '_eqparams',
     ]
 
     def __init__(self, text):
@@ -57,39 +382,52 @@ class Line:
         # What section the line belongs to
         self.section = None
 
-        # For tracking info about the line.
-        self.annotation = Annotation()
+        # For tracking info about the line. Set by the annotator for moves.
+        self.annotation = NO_ANNOTATION
 
         # Linked list
         self.prev: Line = None
         self.next: Line = None
 
-        # Parse comment
-        parts = text.split(';', 1)
+        # Links between moves, skipping other lines. Only set for moves, and maintained by Section.
+        self.prev_move: Line = None
+        self.next_move: Line = None
 
-        if len(parts) == 2:
-            self.comment = parts[1]
-        else:
-            self.comment = None
+        # Original text, output as is unless the line is modified.
+        self._text = text
+        self._dirty = False
+
+        self._code = _UNPARSED
+        self._params = None
+
+    def _parse_code(self):
+        '''
+        Parses the code and comment. The parameters are kept as text until they are accessed.
+        '''
+        # Parse comment
+        text, separator, comment = self._text.partition(';')
+        self._comment = comment if separator else None
 
         # Parse remainder
-        text = parts[0].strip()
-        if text == '':
-            self.code = None
-            self.params = {}
-            self.eqparams = {}
-            self.is_move = False
+        parts = text.split(None, 1)
+        if not parts:
+            self._code = None
+            self._args = ''
             return
 
-        parts = text.split()
-        self.code = parts[0].upper()
+        self._code = parts[0].upper()
+        self._args = parts[1] if len(parts) == 2 else ''
 
-        self.is_move = self.code in ('G1', 'G0')
+    def _parse_params(self):
+        '''
+        Parses the parameters.
+        '''
+        if self._code is _UNPARSED:
+            self._parse_code()
 
-        # Parse the parameters
         params = {}
         eqparams = {}
-        for part in parts[1:]:
+        for part in self._args.split():
             if '=' in part:
                 key, value = part.split('=', 1)
                 eqparams[key] = value
@@ -102,8 +440,123 @@ class Line:
             else:
                 params[key] = float(value)
 
-        self.params = params
-        self.eqparams = eqparams
+        self._params = self._own_params(params)
+        self._eqparams = Params.owned_by(self, eqparams) if eqparams else None
+        self._args = None
+
+    def _own_params(self, params: Mapping) -> Params | MoveParams:
+        '''
+        Creates the parameters of the line using the representation suited to its code.
+        '''
+        if self._code in MOVE_CODES:
+            return MoveParams.owned_by(self, params)
+
+        if not params:
+            return NO_PARAMS
+
+        return Params.owned_by(self, params)
+
+    def _modified(self):
+        '''
+        Marks the line as modified so that it is output from its parsed fields.
+        '''
+        self._dirty = True
+        if self.section:
+            self.section.touch()
+
+    @property
+    def code(self) -> str:
+        if self._code is _UNPARSED:
+            self._parse_code()
+        return self._code
+
+    @code.setter
+    def code(self, code: str):
+        if self._params is None:
+            self._parse_params()
+        was_move = self._code in MOVE_CODES
+        self._code = code
+        self._params = self._own_params(self._params)
+        self._modified()
+
+        if self.section and was_move != (code in MOVE_CODES):
+            if was_move:
+                self.section._unlink_move(self)
+            else:
+                self.section._link_move(self)
+
+    @property
+    def comment(self) -> str:
+        if self._code is _UNPARSED:
+            self._parse_code()
+        return self._comment
+
+    @comment.setter
+    def comment(self, comment: str):
+        if self._params is None:
+            self._parse_params()
+        self._comment = comment
+        self._modified()
+
+    @property
+    def is_move(self) -> bool:
+        code = self._code
+        if code is _UNPARSED:
+            # Told from the start of the text where possible, so that the line stays unparsed.
+            text = self._text
+            if text.startswith(_MOVE_PREFIXES):
+                return True
+            if not text[:1].isspace():
+                return len(text) == 2 and text.upper() in MOVE_CODES
+
+            code = self.code
+
+        return code in MOVE_CODES
+
+    @property
+    def params(self) -> Params | MoveParams:
+        if self._params is None:
+            self._parse_params()
+
+        params = self._params
+        if params is NO_PARAMS:
+            # Shared, so the line is given its own parameters only if these are changed.
+            params = _EmptyParams()
+            params.line = self
+
+        return params
+
+    @params.setter
+    def params(self, params: Mapping):
+        if self._params is None:
+            self._parse_params()
+        self._params = self._own_params(params)
+        self._modified()
+
+    @property
+    def eqparams(self) -> Params:
+        if self._params is None:
+            self._parse_params()
+
+        # Most lines have none, so they are only created when needed.
+        if self._eqparams is None:
+            self._eqparams = Params.owned_by(self)
+
+        return self._eqparams
+
+    @eqparams.setter
+    def eqparams(self, eqparams: dict):
+        if self._params is None:
+            self._parse_params()
+        self._eqparams = Params.owned_by(self, eqparams)
+        self._modified()
+
+    @property
+    def dirty(self) -> bool:
+        '''
+        Whether the line has been modified since it was parsed.
+        '''
+        return self._dirty
 
     def copy(self):
         '''
@@ -111,14 +564,23 @@ class Line:
         '''
         line = Line(None)
         line.section = self.section
-        line.annotation = Annotation()
+        line.annotation = NO_ANNOTATION
         line.prev = self.prev
         line.next = self.next
-        line.comment = self.comment
-        line.code = self.code
-        line.is_move = self.is_move
-        line.params = self.params.copy()
-        line.eqparams = self.eqparams.copy()
+        line.prev_move = None
+        line.next_move = None
+        line._text = self._text
+        line._dirty = self._dirty
+        line._code = self._code
+        line._params = None
+
+        if self._code is not _UNPARSED:
+            line._comment = self._comment
+            line._args = self._args
+
+        if self._params is not None:
+            line._params = self._params.copy_for(line)
+            line._eqparams = Params.owned_by(line, self._eqparams) if self._eqparams else None
 
         return line
 
@@ -126,6 +588,9 @@ class Line:
         return f'<Line {self}>'
 
     def __str__(self):
+        if not self._dirty:
+            return self._text
+
         param_precision = PARAM_PRECISION.get(self.code, {})
 
         params = []
@@ -139,12 +604,38 @@ class Line:
         parts = [
             self.code,
             *params,
-            *(f'''{k}={'' if v is None else v}''' for k, v in self.eqparams.items()),
+            *(f'''{k}={'' if v is None else v}''' for k, v in (self._eqparams or {}).items()),
             f';{self.comment}' if self.comment else '',
         ]
         return ' '.join(x for x in parts if x is not None)
 
 
+class RawLine(Line):
+    '''
+    Unparsed block of one or more lines that is output as is.
+
+    Used for sections that are not parsed. Since any moves in the block are unknown, the annotator
+    restarts its state after it.
+    '''
+    __slots__ = []
+
+    def __init__(self, text):
+        super().__init__(text)
+
+        self._code = None
+        self._comment = None
+        self._args = ''
+
+class BlockLine(RawLine):
+    '''
+    Block of one or more lines without moves that is output as is.
+
+    Used for gcode that is inserted into files. Unlike after a RawLine, the annotator state carries
+    across the block, so inserting one does not need anything to be re-annotated. The annotator tells
+    the two apart by their exact class.
+    '''
+    __slots__ = []
+
 @dataclass
 class Section:
     section_type: str
@@ -153,6 +644,17 @@ class Section:
     next: 'Section' = None
     prev: 'Section' = None
 
+    # Position of the section in the file, counting from 0.
+    number: int = None
+
+    # Number of the layer the section is in, counting from 0 at the first layer change. None for
+    # sections before the first layer change.
+    layer: int = None
+
+    # Incremented whenever lines are inserted, removed or modified so that derived data can be
+    # rebuilt.
+    revision: int = 0
+
     def _set_first_line(self, line: Line):
         '''
         Handles adding the first line to the section.
@@ -160,13 +662,62 @@ class Section:
         self.first_line = line
         self.last_line = line
 
-        if self.prev:
-            self.prev.last_line.next = line
-            line.prev = self.prev.last_line
+        prev_line, next_line = self._outer_lines()
+
+        if prev_line:
+            prev_line.next = line
+            line.prev = prev_line
+
+        if next_line:
+            next_line.prev = line
+            line.next = next_line
+
+    def _outer_lines(self) -> tuple[Line, Line]:
+        '''
+        Gets the last line before the section and the first line after it, skipping empty sections.
+        '''
+        section = self.prev
+        while section and not section.last_line:
+            section = section.prev
+        prev_line = section.last_line if section else None
+
+        section = self.next
+        while section and not section.first_line:
+            section = section.next
+        next_line = section.first_line if section else None
 
-        if self.next:
-            self.next.first_line.prev = line
-            line.next = self.next.first_line
+        return prev_line, next_line
+
+    def _link_move(self, line: Line):
+        '''
+        Links a move that has been added to the file to the moves around it.
+        '''
+        prev_move = line.prev
+        while prev_move is not None and not prev_move.is_move:
+            prev_move = prev_move.prev
+
+        if prev_move is not None:
+            next_move = prev_move.next_move
+            prev_move.next_move = line
+        else:
+            next_move = line.next
+            while next_move is not None and not next_move.is_move:
+                next_move = next_move.next
+
+        line.prev_move = prev_move
+        line.next_move = next_move
+        if next_move is not None:
+            next_move.prev_move = line
+
+    def _unlink_move(self, line: Line):
+        '''
+        Links the moves around a move that is being removed from the file to each other. The move
+        keeps its own links, like it does for other lines.
+        '''
+        if line.prev_move is not None:
+            line.prev_move.next_move = line.next_move
+        if line.next_move is not None:
+            line.next_move.prev_move = line.prev_move
 
     def insert_before(self, place: Line, line: Line):
         '''
@@ -175,22 +726,25 @@ class Section:
         If place is None, then the section is cleared of any existing lines and initialized with the line.
         '''
         line.section = self
+        self.revision += 1
 
         if place is None:
             self._set_first_line(line)
-            return
+        else:
+            current_prev = place.prev
 
-        current_prev = place.prev
+            line.next = place
+            line.prev = current_prev
+            place.prev = line
 
-        line.next = place
-        line.prev = current_prev
-        place.prev = line
+            if current_prev:
+                current_prev.next = line
 
-        if current_prev:
-            current_prev.next = line
+            if place is self.first_line:
+                self.first_line = line
 
-        if place is self.first_line:
-            self.first_line = line
+        if line.is_move:
+            self._link_move(line)
 
     def insert_after(self, place: Line, line: Line):
         '''
@@ -199,28 +753,35 @@ class Section:
         If place is None, then the section is cleared of any existing lines and initialized with the line.
         '''
         line.section = self
+        self.revision += 1
 
         if place is None:
             self._set_first_line(line)
-            return
+        else:
+            current_next = place.next
 
-        current_next = place.next
+            line.next = current_next
+            line.prev = place
+            place.next = line
 
-        line.next = current_next
-        line.prev = place
-        place.next = line
+            if current_next:
+                current_next.prev = line
 
-        if current_next:
-            current_next.prev = line
+            if place is self.last_line:
+                self.last_line = line
 
-        if place is self.last_line:
-            self.last_line = line
+        if line.is_move:
+            self._link_move(line)
 
     def remove(self, line: Line):
         '''
         Assumes the line given is in the section.
         '''
         line.section = None
+        self.revision += 1
+
+        if line.is_move:
+            self._unlink_move(line)
 
         if line is self.first_line and line is self.last_line:
             self.first_line = None
@@ -230,24 +791,115 @@ class Section:
         elif line is self.last_line:
             self.last_line = line.prev
 
-        line.prev.next = line.next
-        line.next.prev = line.prev
+        # The line may be at the start or end of the file.
+        if line.prev:
+            line.prev.next = line.next
+        if line.next:
+            line.next.prev = line.prev
 
-    def __repr__(self):
-        return f'<Section {self.section_type}>'
+    def splice(self, place: Line, lines: list[Line]):
+        '''
+        Inserts the given lines in order after the given place, linking them in one go rather than
+        inserting them one at a time. Assumes the place given is in the section.
 
-    def __str__(self):
+        If place is None, the lines are inserted at the start of the section.
+        '''
+        if not lines:
+            return
+
+        if place is not None:
+            prev_line = place
+            next_line = place.next
+        elif self.first_line is not None:
+            prev_line = self.first_line.prev
+            next_line = self.first_line
+        else:
+            prev_line, next_line = self._outer_lines()
+
+        # Find the moves that the moves in the lines go between.
+        prev_move = prev_line
+        while prev_move is not None and not prev_move.is_move:
+            prev_move = prev_move.prev
+
+        if prev_move is not None:
+            next_move = prev_move.next_move
+        else:
+            next_move = next_line
+            while next_move is not None and not next_move.is_move:
+                next_move = next_move.next
+
+        last_line = prev_line
+        for line in lines:
+            line.section = self
+            line.prev = last_line
+            if last_line:
+                last_line.next = line
+            last_line = line
+
+            if line.is_move:
+                line.prev_move = prev_move
+                if prev_move is not None:
+                    prev_move.next_move = line
+                prev_move = line
+
+        last_line.next = next_line
+        if next_line:
+            next_line.prev = last_line
+
+        if prev_move is not None:
+            prev_move.next_move = next_move
+        if next_move is not None:
+            next_move.prev_move = prev_move
+
+        if place is None:
+            self.first_line = lines[0]
+        if place is self.last_line:
+            self.last_line = last_line
+
+        self.revision += 1
+
+    def touch(self):
+        '''
+        Marks the section as changed so that derived data, such as the move table, is rebuilt.
+
+        Called automatically when lines in the section are modified.
+        '''
+        self.revision += 1
+
+    def lines(self) -> Iterator[Line]:
+        '''
+        Iterates over the lines in the section.
+        '''
         current = self.first_line
-        last = self.last_line
-        parts = []
-        while current is not last:
-            parts.append(str(current))
+        while current is not None:
+            yield current
+
+            if current is self.last_line:
+                break
 
             current = current.next
 
-        parts.append(str(current))
+    def move_lines(self) -> Iterator[Line]:
+        '''
+        Iterates over the moves in the section, following the links between moves so that other
+        lines are skipped.
+        '''
+        current = self.first_line
+        while current is not None and not current.is_move:
+            if current is self.last_line:
+                return
+            current = current.next
+
+        while current is not None and current.section is self:
+            yield current
+
+            current = current.next_move
+
+    def __repr__(self):
+        return f'<Section {self.section_type}>'
 
-        return '\n'.join(parts)
+    def __str__(self):
+        return '\n'.join(str(line) for line in self.lines())
 
 
 @dataclass
@@ -257,44 +909,494 @@ class GCodeFile:
     '''
     first_section: Section
 
-    def __repr__(self):
-        return f'<GCodeFile>'
+    # Sections by type and layer. Built when the file is created, so call reindex() after adding or
+    # removing sections.
+    index: SectionIndex = field(init=False, repr=False, compare=False)
 
-    def __str__(self):
+    # Per section move tables, keyed by section id, along with the section revision they were built
+    # from.
+    _move_tables: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.index = SectionIndex(self.first_section)
+
+    def reindex(self):
+        '''
+        Rebuilds the section index, such as after sections have been added or removed.
+        '''
+        self.index = SectionIndex(self.first_section)
+
+    def sections(self) -> Iterator[Section]:
+        '''
+        Iterates over the sections in the file.
+        '''
         current = self.first_section
-        parts = []
         while current:
-            parts.append(str(current))
+            yield current
 
             current = current.next
 
-        return '\n'.join(parts)
+    def moves(self) -> MoveTable:
+        '''
+        Gets a columnar table of all the G0/G1 moves in the file.
+
+        The table is built on first use. Afterwards only sections that have had lines inserted or
+        changed since the last call are rebuilt.
+        '''
+        move_tables = self._move_tables
+        tables = []
+        for section in self.sections():
+            cached = move_tables.get(id(section))
+            if cached is None or cached[0] != section.revision:
+                cached = (section.revision, MoveTable.from_lines(section.move_lines()))
+                move_tables[id(section)] = cached
+
+            tables.append(cached[1])
+
+        return MoveTable.concatenate(tables)
+
+    def move_lines(self) -> Iterator[Line]:
+        '''
+        Iterates over the moves in the file, skipping other lines.
+        '''
+        for section in self.sections():
+            yield from section.move_lines()
+
+    def write(self, file: TextIO):
+        '''
+        Writes the file to the given file object.
+        '''
+        write_sections(self.sections(), file)
+
+    def dump(self, path: str | PathLike):
+        '''
+        Writes the file to the given path, atomically replacing any existing file.
+        '''
+        dump_sections(self.sections(), path)
+
+    def __repr__(self):
+        return f'<GCodeFile>'
 
-def parse(text) -> GCodeFile:
+    def __str__(self):
+        return '\n'.join(str(section) for section in self.sections())
+
+# Number of lines joined together into each write.
+WRITE_CHUNK_LINES = 8192
+
+def write_sections(sections: Iterable[Section], file: TextIO):
     '''
-    Parses the given text into a GCodeFile.
+    Writes the lines of the given sections to a file object, separated by newlines.
+
+    Lines are written in large chunks so that memory use stays flat regardless of file size.
+    '''
+    separator = ''
+    chunk = []
+    for section in sections:
+        for line in section.lines():
+            chunk.append(str(line))
+
+            if len(chunk) == WRITE_CHUNK_LINES:
+                file.write(separator)
+                file.write('\n'.join(chunk))
+                separator = '\n'
+                chunk.clear()
+
+    if chunk:
+        file.write(separator)
+        file.write('\n'.join(chunk))
+
+def dump_sections(sections: Iterable[Section], path: str | PathLike):
+    '''
+    Writes the lines of the given sections to the given path.
+
+    The lines are written to a temporary file next to the path, which then replaces the path, so
+    that the path is never left partially written. This also allows the sections to be streamed
+    from the file being replaced.
+    '''
+    path = Path(path)
+    file = tempfile.NamedTemporaryFile(
+        'w',
+        dir=path.parent,
+        prefix=path.name + '.',
+        suffix='.tmp',
+        delete=False,
+        newline='\n',
+        encoding='UTF-8'
+    )
+    try:
+        with file:
+            write_sections(sections, file)
+
+        # The temporary file is only readable by its owner, so it is given the mode of the file it
+        # replaces, or the mode a new file would get.
+        if path.exists():
+            shutil.copymode(path, file.name)
+        else:
+            os.chmod(file.name, 0o666 & ~_umask())
+
+        os.replace(file.name, path)
+    except BaseException:
+        os.unlink(file.name)
+        raise
+
+def _umask() -> int:
     '''
-    lines = text.splitlines()
+    Gets the process umask, which can only be read by setting it.
+    '''
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
 
-    first_section = Section('start')
-    current_section = first_section
+def _build_sections(lines: Iterable[str]) -> Iterator[Section]:
+    '''
+    Builds linked sections from the given lines, yielding each section once it is complete.
+    '''
+    current_section = Section('start', number=0)
+    section_lines = []
+    last_line = None
     for line in lines:
         line = line.strip()
         if line.startswith(';TYPE:'):
-            section_type = line[len(';TYPE:'):].lower()
-
-            new_section = Section(section_type)
-            new_section.prev = current_section
-            current_section.next = new_section
-            current_section = new_section
+            section_type = section_type_name(line[len(';TYPE:'):])
         elif line.startswith(';LAYER_CHANGE'):
             section_type = 'layer_change'
+        else:
+            section_type = None
+
+        if section_type is not None:
+            if section_lines:
+                last_line = _link_lines(current_section, section_lines, last_line)
+                section_lines = []
+
+            yield current_section
+
+            layer = current_section.layer
+            if section_type == 'layer_change':
+                layer = 0 if layer is None else layer + 1
 
-            new_section = Section(section_type)
+            new_section = Section(section_type, number=current_section.number + 1, layer=layer)
             new_section.prev = current_section
             current_section.next = new_section
             current_section = new_section
 
-        current_section.insert_after(current_section.last_line, Line(line))
+        section_lines.append(Line(line))
+
+    if section_lines:
+        _link_lines(current_section, section_lines, last_line)
+
+    yield current_section
+
+def _read_lines(source: TextIO | str | PathLike) -> Iterator[str]:
+    '''
+    Reads lines from the given file object or path.
+    '''
+    if isinstance(source, (str, PathLike)):
+        with open(source, encoding='UTF-8') as file:
+            yield from file
+    else:
+        yield from source
+
+@contextmanager
+def _gc_paused():
+    '''
+    Pauses garbage collection while parsing. Parsing only creates objects that stay alive, so
+    collections would otherwise spend a lot of time repeatedly scanning them for nothing.
+    '''
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+def _line_record(text: str) -> str | tuple:
+    '''
+    Parses a line in a worker process into a picklable record that _record_line() can rebuild the
+    line from.
+
+    Moves are fully parsed, other lines only have their code parsed. Lines that fail to parse are
+    left for the error to be raised if they are used after parsing, as they would be otherwise.
+    '''
+    line = Line(text.strip())
+    try:
+        if line.code not in MOVE_CODES:
+            return (line._text, line._code, line._comment, line._args)
+
+        params = line.params
+    except ValueError:
+        return line._text
+
+    present = params.present
+    return (
+        line._text,
+        line._code,
+        line._comment,
+        present,
+        params.X if present & X_BIT else None,
+        params.Y if present & Y_BIT else None,
+        params.Z if present & Z_BIT else None,
+        params.E if present & E_BIT else None,
+        params.F if present & F_BIT else None,
+        params.extra,
+        dict(line._eqparams) if line._eqparams else None,
+    )
+
+def _record_line(record: str | tuple) -> Line:
+    '''
+    Rebuilds a line from a record created by _line_record().
+    '''
+    if record.__class__ is str:
+        return Line(record)
+
+    line = Line(record[0])
+    line._code = record[1]
+    line._comment = record[2]
+    if len(record) == 4:
+        line._args = record[3]
+        return line
+
+    params = MoveParams()
+    params.line = line
+    params.present = present = record[3]
+    if present & X_BIT:
+        params.X = record[4]
+    if present & Y_BIT:
+        params.Y = record[5]
+    if present & Z_BIT:
+        params.Z = record[6]
+    if present & E_BIT:
+        params.E = record[7]
+    if present & F_BIT:
+        params.F = record[8]
+    params.extra = record[9]
+
+    line._args = None
+    line._params = params
+    line._eqparams = Params.owned_by(line, record[10]) if record[10] else None
+    return line
+
+def _link_lines(section: Section, lines: list[Line], last_line: Line, link_moves: bool=True) -> Line:
+    '''
+    Adds the given lines to an empty section that is being built at the end of a file, linking them
+    directly rather than inserting them one at a time. Returns the new last line of the file.
+
+    If link_moves is False, the moves are left for _link_moves() to link, such as once their codes
+    have been set.
+    '''
+    first_line = lines[0]
+    for line in lines:
+        line.section = section
+        line.prev = last_line
+        if last_line:
+            last_line.next = line
+        last_line = line
+
+    section.first_line = first_line
+    section.last_line = last_line
+
+    if link_moves:
+        prev_move = first_line.prev
+        while prev_move is not None and not prev_move.is_move:
+            prev_move = prev_move.prev
+
+        _link_moves(lines, prev_move)
+
+    return last_line
+
+def _link_moves(lines: Iterable[Line], prev_move: Line=None) -> Line:
+    '''
+    Links the moves in the given consecutive lines to each other, continuing from the given move
+    before them. Returns the last move.
+    '''
+    for line in lines:
+        if line.is_move:
+            line.prev_move = prev_move
+            if prev_move is not None:
+                prev_move.next_move = line
+            prev_move = line
+
+    return prev_move
+
+def _span_lines(text: str) -> list[str]:
+    '''
+    Splits the text of a section from read_span() into lines. The line ending of the last line has
+    been removed from the text, so a blank last line is kept rather than dropped by splitlines().
+    '''
+    return (text + '\n').splitlines()
+
+def _parse_texts(texts: list[str]) -> list[list]:
+    '''
+    Worker for parsing section texts into line records.
+    '''
+    return [[_line_record(text) for text in _span_lines(section_text)] for section_text in texts]
+
+def _parse_file_spans(path: str | PathLike, spans: list[SectionSpan]) -> list[list]:
+    '''
+    Worker for parsing sections of a file into line records.
+    '''
+    with map_file(path) as data:
+        return _parse_texts([read_span(data, span) for span in spans])
+
+# Number of chunks to split the file into per worker so that the work stays balanced.
+CHUNKS_PER_WORKER = 4
+
+def _layer_chunks(spans: list[SectionSpan], workers: int) -> list[list[SectionSpan]]:
+    '''
+    Groups the given section spans into chunks of about equal size, only splitting at layer changes.
+    '''
+    chunk_size = (spans[-1].end - spans[0].start) / (workers * CHUNKS_PER_WORKER) if spans else 0
+
+    chunks = []
+    chunk = []
+    chunk_start = 0
+    for span in spans:
+        if chunk and span.section_type == 'layer_change' and span.start - chunk_start >= chunk_size:
+            chunks.append(chunk)
+            chunk = []
+            chunk_start = span.start
+
+        chunk.append(span)
+
+    if chunk:
+        chunks.append(chunk)
+
+    return chunks
+
+def _parse_parallel(data: bytes, spans: list[SectionSpan], workers: int, path: str | PathLike=None, section_types: set[str]=None) -> GCodeFile:
+    '''
+    Parses the sections of the given gcode bytes using a pool of worker processes.
+
+    Lines are parsed into records by the workers, and then rebuilt into a linked file in order. If
+    a path is given, the workers read the file themselves rather than being sent the text.
+    '''
+    parsed_spans = [
+        span for span in spans
+        if span.start != span.end and (section_types is None or span.section_type in section_types)
+    ]
+    chunks = _layer_chunks(parsed_spans, workers)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if path is None:
+            results = executor.map(_parse_texts, [[read_span(data, span) for span in chunk] for chunk in chunks])
+        else:
+            results = executor.map(_parse_file_spans, [path] * len(chunks), chunks)
+
+        # Results come back in order, so they can be matched up with the spans as they arrive.
+        records = (section_records for result in results for section_records in result)
+
+        first_section = None
+        current_section = None
+        last_line = None
+        for number, span in enumerate(spans):
+            section = Section(span.section_type, number=number, layer=span.layer)
+            if current_section:
+                section.prev = current_section
+                current_section.next = section
+            else:
+                first_section = section
+            current_section = section
+
+            if span.start == span.end:
+                continue
+
+            if section_types is None or span.section_type in section_types:
+                lines = [_record_line(record) for record in next(records)]
+            else:
+                lines = [RawLine(read_span(data, span))]
+
+            last_line = _link_lines(section, lines, last_line)
 
     return GCodeFile(first_section)
+
+def parse(text, workers: int=None) -> GCodeFile:
+    '''
+    Parses the given text into a GCodeFile.
+
+    If workers is given, the text is split into chunks at layer changes that are parsed in that
+    many worker processes. The result is the same as parsing serially. Sending the parsed lines back
+    from the workers is costly, so this is only faster for large files with several cores.
+    '''
+    if workers is not None and workers > 1:
+        data = text.encode('UTF-8')
+        with _gc_paused():
+            return _parse_parallel(data, list(scan_sections(data)), workers)
+
+    with _gc_paused():
+        sections = _build_sections(text.splitlines())
+        first_section = next(sections)
+        for _ in sections:
+            pass
+
+    return GCodeFile(first_section)
+
+def parse_file(path: str | PathLike, section_types: Iterable[str]=None, workers: int=None) -> GCodeFile:
+    '''
+    Parses the given gcode file into a GCodeFile.
+
+    The file is memory mapped and indexed to find section boundaries before any lines are parsed.
+    If section_types is given, only sections of those types and layer changes are parsed, and
+    everything else is kept as RawLine blocks that are passed through to the output unchanged.
+
+    If workers is given, chunks of layers are parsed in that many worker processes.
+    '''
+    if section_types is not None:
+        section_types = set(section_types) | {'layer_change'}
+
+    if workers is not None and workers > 1:
+        with map_file(path) as data, _gc_paused():
+            return _parse_parallel(data, list(scan_sections(data)), workers, path, section_types)
+
+    first_section = None
+    current_section = None
+    last_line = None
+    with map_file(path) as data, _gc_paused():
+        for number, span in enumerate(scan_sections(data)):
+            section = Section(span.section_type, number=number, layer=span.layer)
+            if current_section:
+                section.prev = current_section
+                current_section.next = section
+            else:
+                first_section = section
+            current_section = section
+
+            if span.start == span.end:
+                continue
+
+            text = read_span(data, span)
+            if section_types is None or span.section_type in section_types:
+                lines = [Line(line.strip()) for line in _span_lines(text)]
+            else:
+                lines = [RawLine(text)]
+
+            last_line = _link_lines(section, lines, last_line)
+
+    return GCodeFile(first_section)
+
+def stream(source: TextIO | str | PathLike) -> Iterator[Section]:
+    '''
+    Parses the given file object or path lazily, yielding each Section as soon as it is complete.
+
+    Only the yielded section and the one before it are kept linked, so processors can look back
+    across the section boundary while memory use stays flat regardless of file size.
+    '''
+    for section in _build_sections(_read_lines(source)):
+        previous = section.prev
+        if previous and previous.prev:
+            # Unlink everything before the previous section so that it can be freed.
+            previous.prev.next = None
+            previous.prev = None
+
+            if previous.first_line and previous.first_line.prev:
+                previous.first_line.prev.next = None
+                previous.first_line.prev = None
+
+                first_move = previous.first_line
+                while first_move is not None and not first_move.is_move:
+                    first_move = first_move.next
+
+                if first_move is not None and first_move.prev_move is not None:
+                    first_move.prev_move.next_move = None
+                    first_move.prev_move = None
+
+        yield section
@@ -1,25 +1,14 @@
 
 import math
+from itertools import repeat
 
 from ..parser import GCodeFile, Line
-from ..edit_utils import split_distance_back, prev_continuous_move, split_distance_forward, next_continuous_move
+from ..annotator import AnnotationSession
+from ..junction import calc_junction_deviation, JunctionTable
+from ..edit_utils import split_distances_back, prev_continuous_move, split_distances_forward, next_continuous_move
 
 FEED_MMS_EPSILON = 0.001 * 60
 
-def calc_junction_speed(max_accel_mmss, deviation, cos_theta, desired_feed_mms):
-    # https://onehossshay.wordpress.com/2011/09/24/improving_grbl_cornering_algorithm/
-
-    # If cos_theta is -1 then the angle of the junction is 180 deg and the following math would
-    # divide by zero.
-    if cos_theta <= math.nextafter(-1, 0):
-        return desired_feed_mms
-
-    sin_half_theta = math.sqrt((1 - cos_theta) / 2)
-    r = deviation * (sin_half_theta / (1 - sin_half_theta))
-    v_junction = math.sqrt(max_accel_mmss * r)
-
-    return min(v_junction, desired_feed_mms)
-
 def accelerate_backward(line: Line, from_mms: float, step_distance_mm: float, min_segment_length_mm: float, acceleration_mmss: float):
     '''
     Apply acceleration down to the junction velocity by splitting the proceeding lines
@@ -29,12 +18,7 @@ def accelerate_backward(line: Line, from_mms: float, step_distance_mm: float, mi
     '''
     current_start = line
     feed_rate_mms = from_mms
-    while True:
-        slow_cut = split_distance_back(current_start, step_distance_mm, min_segment_length_mm)
-
-        if not slow_cut:
-            break
-
+    for slow_cut in split_distances_back(line, repeat(step_distance_mm), min_segment_length_mm):
         # Apply to all segments between the start and the cut.
         stop = False
         current_line = current_start.prev
@@ -51,7 +35,8 @@ def accelerate_backward(line: Line, from_mms: float, step_distance_mm: float, mi
             if current_line is slow_cut:
                 break
 
-            current_line = current_line.prev
+            # The cut is a move, so the lines between moves can be skipped.
+            current_line = current_line.prev_move if current_line.is_move else current_line.prev
 
         if stop:
             break
@@ -68,15 +53,9 @@ def accelerate_forward(line: Line, from_mms: float, step_distance_mm: float, min
     into segments of increasing velocity until the desired feed rate leaving the
     junction is hit.
     '''
-    first = True
-    current_start = line
+    slow_cut = None
     feed_rate_mms = from_mms
-    while True:
-        current_start, slow_cut = split_distance_forward(current_start, step_distance_mm, min_segment_length_mm)
-        if first:
-            first = False
-            line = current_start
-
+    for current_start, slow_cut in split_distances_forward(line, repeat(step_distance_mm), min_segment_length_mm):
         if not slow_cut:
             break
 
@@ -88,14 +67,14 @@ def accelerate_forward(line: Line, from_mms: float, step_distance_mm: float, min
             if current_line is slow_cut:
                 break
 
-            current_line = current_line.next
+            current_line = current_line.next_move if current_line.is_move else current_line.next
 
-        current_start = next_continuous_move('moving_extrude', slow_cut)
-        if current_start is None:
+        next_start = next_continuous_move('moving_extrude', slow_cut)
+        if next_start is None:
             break
 
         feed_rate_mms = math.sqrt(feed_rate_mms**2 + 2 * acceleration_mmss * step_distance_mm)
-        if feed_rate_mms >= current_start.annotation.desired_feed_mms:
+        if feed_rate_mms >= next_start.annotation.desired_feed_mms:
             break
 
     # Now that acceleration has finished, set the feed rate to the desired feed rate.
@@ -110,27 +89,24 @@ def apply(gcode: GCodeFile, options):
     acceleration_mmss = options['acceleration_mmss']
     square_corner_velocity_mms = options['square_corner_velocity_mms']
 
-    junction_deviation = (square_corner_velocity_mms**2) * (math.sqrt(2) - 1) / acceleration_mmss
+    junction_deviation = calc_junction_deviation(square_corner_velocity_mms, acceleration_mmss)
 
     # When cutting the moves to make velocity changes, if the cut falls within this distance of an
     # existing junction, that junction will be used instead of making a new one, preventing super
     # tiny line segments below this size.
     min_segment_length = 0.1
 
-    line = gcode.first_section.first_line
-    while line.next:
-        if line.annotation.move_type is None or line.annotation.desired_feed_mms is None or line.annotation.cos_theta is None or math.isnan(line.annotation.cos_theta):
-            line = line.next
-            continue
+    # Re-annotation after splits is deferred and done once at the end.
+    with AnnotationSession():
+        # The junctions to slow down for are found from the annotations before any lines are split.
+        table = JunctionTable.from_lines(gcode.move_lines())
+        speeds = table.speeds(acceleration_mmss, junction_deviation)
+        slow = table.desired_feed_mms - speeds >= FEED_MMS_EPSILON
 
-        desired_feed_mms = line.annotation.desired_feed_mms
-        junction_speed_mms = calc_junction_speed(acceleration_mmss, junction_deviation, line.annotation.cos_theta, desired_feed_mms)
-        if desired_feed_mms - junction_speed_mms < FEED_MMS_EPSILON:
-            line = line.next
-            continue
-
-        accelerate_backward(line, junction_speed_mms, step_distance_mm, min_segment_length, acceleration_mmss)
-        line = accelerate_forward(line, junction_speed_mms, step_distance_mm, min_segment_length, acceleration_mmss)
-
-        line = line.next
+        for line, junction_speed_mms in zip(table.lines[slow].tolist(), speeds[slow].tolist()):
+            # The last line of the file is left as is.
+            if line.next is None:
+                break
 
+            accelerate_backward(line, junction_speed_mms, step_distance_mm, min_segment_length, acceleration_mmss)
+            accelerate_forward(line, junction_speed_mms, step_distance_mm, min_segment_length, acceleration_mmss)
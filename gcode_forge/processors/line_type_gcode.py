@@ -1,36 +1,73 @@
+from dataclasses import dataclass
+from typing import Iterable, Iterator
 
-from ..parser import GCodeFile, Line, parse
-from ..annotator import annotate
+from ..parser import BlockLine, GCodeFile, Line, RawLine, Section, parse
+from ..annotator import AnnotationSession, reannotate
+from ..edit_utils import EditBatch
 
-def apply(gcode: GCodeFile, options):
-    options = {
-        section_type: parse(section_gcode)
-        for section_type, section_gcode in options.items()
-    }
+@dataclass(slots=True)
+class Template:
+    '''
+    Gcode to insert at the start of sections, compiled once.
 
-    section = gcode.first_section
-    while section:
-        section_gcode = options.get(section.section_type)
-        if not section_gcode:
-            section = section.next
-            continue
+    Gcode without moves is kept as the text of one BlockLine, which is inserted in one step and does
+    not change the annotations around it however many lines it has. Otherwise `lines` has the parsed
+    lines, which are copied in and re-annotated.
+    '''
+    text: str = None
+    lines: list[Line] = None
 
-        prev_section_start = section.first_line
+    @staticmethod
+    def compile(gcode: str) -> 'Template':
+        lines = list(parse(gcode).first_section.lines())
+        if not lines or any(line.is_move or line.__class__ is RawLine for line in lines):
+            return Template(lines=lines)
 
-        line_to_insert = section_gcode.first_section.last_line
-        insert_before = section.first_line
-        while True:
-            if not line_to_insert:
-                break
+        return Template(text='\n'.join(str(line) for line in lines))
 
-            section.insert_before(
-                insert_before,
-                line_to_insert.copy()
-            )
+    def insert(self, section: Section):
+        '''
+        Inserts the gcode at the start of the given section.
+        '''
+        if self.text is not None:
+            section.insert_before(section.first_line, BlockLine(self.text))
+            return
 
-            line_to_insert = line_to_insert.prev
-            insert_before = insert_before.prev
+        if not self.lines:
+            return
 
-        annotate(section.first_line.prev, prev_section_start, reannotate=True)
+        lines = [line.copy() for line in self.lines]
 
-        section = section.next
+        if section.first_line is None:
+            # There is no line in the section to insert at, so the moves after the new ones are
+            # re-annotated through to the end, as the batch does when nothing pins their start.
+            section.splice(None, lines)
+            reannotate(lines[0])
+        else:
+            with EditBatch() as batch:
+                for line in lines:
+                    batch.insert_before(section.first_line, line)
+
+def section_types(options) -> Iterable[str]:
+    # Only the sections that gcode is inserted into need parsing.
+    return options.keys()
+
+def apply_stream(sections: Iterable[Section], options) -> Iterator[Section]:
+    templates = {
+        section_type: Template.compile(section_gcode)
+        for section_type, section_gcode in options.items()
+    }
+
+    for section in sections:
+        template = templates.get(section.section_type)
+        if template is not None:
+            template.insert(section)
+
+        yield section
+
+def apply(gcode: GCodeFile, options):
+    # Only visit the sections that have gcode to insert. Those with moves are re-annotated together at
+    # the end.
+    with AnnotationSession():
+        for _ in apply_stream(gcode.index.sections(*options), options):
+            pass
@@ -1,13 +1,13 @@
+from typing import Iterable, Iterator
 
-from ..parser import GCodeFile, Line
+from ..parser import GCodeFile, Line, Section
 
-def apply(gcode: GCodeFile, options):
+def apply_stream(sections: Iterable[Section], options) -> Iterator[Section]:
     pa_values = options['pa_values']
 
     current_pa = options['default_pa']
 
-    section = gcode.first_section
-    while section:
+    for section in sections:
         current_pa = pa_values.get(section.section_type, current_pa)
 
         section.insert_before(
@@ -15,4 +15,8 @@ def apply(gcode: GCodeFile, options):
             Line(f'SET_PRESSURE_ADVANCE ADVANCE={current_pa:.3f}')
         )
 
-        section = section.next
+        yield section
+
+def apply(gcode: GCodeFile, options):
+    for _ in apply_stream(gcode.sections(), options):
+        pass
@@ -0,0 +1,180 @@
+import math
+
+import numpy as np
+import numpy.typing as npt
+
+from ..parser import GCodeFile, Line
+from ..annotator import AnnotationSession, annotate, extrusion_run
+from ..edit_utils import split_move
+from ..junction import calc_junction_deviation, calc_junction_speed, junction_speeds
+
+FEED_MMS_EPSILON = 0.001 * 60
+
+def plan_speeds(distances: npt.NDArray[np.float64], max_speeds: npt.NDArray[np.float64], acceleration_mmss: float) -> npt.NDArray[np.float64]:
+    '''
+    Plans the speeds at the junctions of a run of moves with the given distances, given the most that
+    each junction allows, including the start and end of the run.
+
+    Like Klipper and grbl, a backward pass lowers each junction's speed to what the junctions after it
+    can decelerate to in time, then a forward pass lowers it to what the junctions before it can
+    accelerate to. In terms of squared speed, reachable speeds change linearly with the distance along
+    the run, so each pass is a running minimum over the run.
+    '''
+    two_accel = 2 * acceleration_mmss
+    along_mm = np.r_[0, np.cumsum(distances)]
+
+    speeds_squared = max_speeds**2
+    speeds_squared = np.minimum.accumulate((speeds_squared + two_accel * along_mm)[::-1])[::-1] - two_accel * along_mm
+    speeds_squared = np.minimum.accumulate(speeds_squared - two_accel * along_mm) + two_accel * along_mm
+
+    return np.sqrt(np.maximum(speeds_squared, 0))
+
+def move_pieces(distance_mm: float, desired_mms: float, entry_mms: float, exit_mms: float, acceleration_mmss: float, step_distance_mm: float, min_segment_length_mm: float) -> list[tuple[float, float]]:
+    '''
+    Splits a move into pieces of about step_distance_mm where it accelerates from its entry speed or
+    decelerates to its exit speed, and one piece where it cruises at its desired speed.
+
+    Each piece is given the planned speed at its middle, which is never 0, even for pieces that start
+    or end at a stop. Returns the (length, speed) of each piece.
+    '''
+    two_accel = 2 * acceleration_mmss
+    desired_squared = desired_mms**2
+    accel_mm = min(max((desired_squared - entry_mms**2) / two_accel, 0), distance_mm)
+    decel_mm = min(max((desired_squared - exit_mms**2) / two_accel, 0), distance_mm)
+
+    # If it does not reach the desired speed, it accelerates until it has to decelerate.
+    if accel_mm + decel_mm > distance_mm:
+        accel_mm = min(max((two_accel * distance_mm + exit_mms**2 - entry_mms**2) / (2 * two_accel), 0), distance_mm)
+        decel_mm = distance_mm - accel_mm
+
+    cuts = [step_distance_mm * step for step in range(1, math.ceil(accel_mm / step_distance_mm))]
+    cuts.append(accel_mm)
+    cuts.append(distance_mm - decel_mm)
+    cuts += [distance_mm - step_distance_mm * step for step in range(math.ceil(decel_mm / step_distance_mm) - 1, 0, -1)]
+
+    # Drop cuts that would leave pieces that are too short.
+    ends = []
+    last_end = 0
+    for cut in cuts:
+        if cut - last_end >= min_segment_length_mm and distance_mm - cut >= min_segment_length_mm:
+            ends.append(cut)
+            last_end = cut
+    ends.append(distance_mm)
+
+    def speed_at(along_mm):
+        return math.sqrt(min(
+            desired_squared,
+            entry_mms**2 + two_accel * along_mm,
+            exit_mms**2 + two_accel * (distance_mm - along_mm),
+        ))
+
+    pieces = []
+    start = 0
+    for end in ends:
+        pieces.append((end - start, speed_at((start + end) / 2)))
+        start = end
+
+    return pieces
+
+def feed_before(line: Line) -> float | None:
+    '''
+    Gets the feed rate in effect before the given move.
+    '''
+    line = line.prev_move
+    while line is not None:
+        if 'F' in line.params:
+            return line.params['F']
+        line = line.prev_move
+
+    return None
+
+def junction_limit(line: Line, acceleration_mmss: float, junction_deviation: float, desired_mms: float) -> float:
+    '''
+    Gets the most that the junction at the start of the given move allows, or 0 if it is not known.
+    '''
+    cos_theta = line.annotation.cos_theta
+    if cos_theta is None or math.isnan(cos_theta):
+        return 0
+
+    return calc_junction_speed(acceleration_mmss, junction_deviation, cos_theta, desired_mms)
+
+def plan_run(lines: list[Line], options: dict, junction_deviation: float) -> tuple[list[float], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    '''
+    Plans the speeds at the junctions of a run of extruding moves.
+
+    Returns the distances and desired speeds of the moves, and the speeds at each of their junctions,
+    including the start and end of the run.
+    '''
+    acceleration_mmss = options['acceleration_mmss']
+
+    distances = np.array([line.annotation.distance_mm for line in lines])
+    desired = np.array([line.annotation.desired_feed_mms for line in lines])
+    cos_theta = np.array([line.annotation.cos_theta if line.annotation.cos_theta is not None else np.nan for line in lines])
+
+    # Junctions within the run. Unknown angles are taken as a stop.
+    inner = np.fmin(desired[:-1], desired[1:])
+    inner_limits = np.nan_to_num(junction_speeds(acceleration_mmss, junction_deviation, cos_theta[1:], inner), nan=0.0)
+
+    # The run starts and ends at the junctions with the moves around it.
+    entry_limit = junction_limit(lines[0], acceleration_mmss, junction_deviation, desired[0])
+    next_move = lines[-1].next_move
+    exit_limit = junction_limit(next_move, acceleration_mmss, junction_deviation, desired[-1]) if next_move is not None else 0
+
+    max_speeds = np.r_[entry_limit, inner_limits, exit_limit]
+
+    return distances, desired, plan_speeds(distances, max_speeds, acceleration_mmss)
+
+def apply(gcode: GCodeFile, options):
+    acceleration_mmss = options['acceleration_mmss']
+    square_corner_velocity_mms = options['square_corner_velocity_mms']
+    step_distance_mm = options['step_distance_mm']
+    min_segment_length_mm = options.get('min_segment_length_mm', 0.1)
+
+    junction_deviation = calc_junction_deviation(square_corner_velocity_mms, acceleration_mmss)
+
+    line = next(gcode.move_lines(), None)
+
+    # Re-annotation after splits is deferred and done once at the end.
+    with AnnotationSession():
+        while line is not None:
+            run = extrusion_run(line) if line.annotation.move_type == 'moving_extrude' else None
+            if run is None:
+                line = line.next_move
+                continue
+
+            # Splitting adds to the run, so the moves are copied first.
+            lines = list(run.lines)
+            distances, desired, speeds = plan_run(lines, options, junction_deviation)
+
+            # The feed rate that moves after the run expect.
+            after_run = lines[-1].next_move
+            feed_after = feed_before(after_run) if after_run is not None else None
+
+            feed = feed_before(lines[0])
+            for move, distance_mm, desired_mms, entry_mms, exit_mms in zip(lines, distances.tolist(), desired.tolist(), speeds[:-1].tolist(), speeds[1:].tolist()):
+                pieces = move_pieces(distance_mm, desired_mms, entry_mms, exit_mms, acceleration_mmss, step_distance_mm, min_segment_length_mm)
+
+                # The last piece is what is left of the move, rather than being split off, as the
+                # lengths of the pieces may not add up to exactly the move's distance.
+                remaining_mm = distance_mm
+                last_piece = len(pieces) - 1
+                for index, (length_mm, speed_mms) in enumerate(pieces):
+                    piece = move
+                    if index < last_piece:
+                        remaining_mm -= length_mm
+                        move = split_move(piece, length_mm, remaining_mm)
+                        annotate(piece, move, reannotate=True)
+
+                    # F is only emitted where it changes. Pieces split from a move start with its F.
+                    piece_feed = speed_mms * 60
+                    if feed is None or abs(piece_feed - feed) >= FEED_MMS_EPSILON:
+                        piece.params['F'] = piece_feed
+                        feed = piece_feed
+                    elif 'F' in piece.params and abs(piece.params['F'] - feed) >= FEED_MMS_EPSILON:
+                        del piece.params['F']
+
+            # Restore the feed rate for the moves after the run if they do not set their own.
+            if after_run is not None and feed_after is not None and 'F' not in after_run.params and abs(feed_after - feed) >= FEED_MMS_EPSILON:
+                after_run.params['F'] = feed_after
+
+            line = after_run
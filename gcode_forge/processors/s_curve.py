@@ -1,46 +1,69 @@
 
-import math
+from typing import Iterable
 
 import numpy as np
+import numpy.typing as npt
 
 from ..parser import GCodeFile, Line
-from ..edit_utils import split_distance_back, split_distance_forward, next_continuous_move, apply_forward, apply_backward
-from ..acceleration import SCurveAcceleration
-
-def calc_junction_speed(max_accel_mmss, deviation, cos_theta, desired_feed_mms):
-    # https://onehossshay.wordpress.com/2011/09/24/improving_grbl_cornering_algorithm/
-
-    # If cos_theta is -1 then the angle of the junction is 180 deg and the following math would
-    # divide by zero.
-    if cos_theta <= math.nextafter(-1, 0):
-        return desired_feed_mms
-
-    sin_half_theta = math.sqrt((1 - cos_theta) / 2)
-    r = deviation * (sin_half_theta / (1 - sin_half_theta))
-    v_junction = math.sqrt(max_accel_mmss * r)
-
-    return min(v_junction, desired_feed_mms)
-
-def accelerate_backward(line: Line, from_mms: float, min_segment_length_mm: float, profile: SCurveAcceleration):
-    accel, velocity, position = profile.calc(from_mms, line.annotation.desired_feed_mms)
+from ..annotator import AnnotationSession
+from ..edit_utils import split_distances_back, split_distances_forward, next_continuous_move, apply_moves_forward, apply_moves_backward
+from ..junction import calc_junction_deviation, JunctionTable
+from ..acceleration import resample_ramp, SCurveAcceleration, DEFAULT_RAMP_CACHE_SIZE, DEFAULT_DELTA_RESOLUTION_MMS
+
+def plan_ramps(
+    pairs: Iterable[tuple[float, float]],
+    profile: SCurveAcceleration,
+    max_velocity_error_mms: float=None,
+    max_segments: int=None
+) -> dict[tuple[float, float], tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]]:
+    '''
+    Calculates the ramps between the given pairs of from and to velocities in one batch.
+
+    If max_velocity_error_mms is given, the ramps are resampled by distance with resample_ramp() so
+    that they are split into fewer segments. Otherwise each time step is a segment.
+
+    Returns the velocities of each ramp and the distances between them, keyed by the pair.
+    '''
+    pairs = list(dict.fromkeys(pairs))
+    if not pairs:
+        return {}
+
+    from_mms, to_mms = zip(*pairs)
+    accel, velocity, position, offsets = profile.calc_many(from_mms, to_mms)
+
+    if max_velocity_error_mms is not None:
+        ramps = {}
+        for pair, start, end in zip(pairs, offsets[:-1].tolist(), offsets[1:].tolist()):
+            ramp_velocity, ramp_position = resample_ramp(velocity[start:end], position[start:end], max_velocity_error_mms, max_segments)
+            ramps[pair] = (ramp_velocity, np.diff(ramp_position))
+
+        return ramps
+
+    # The distances within each ramp. Those between the end of one ramp and the start of the next
+    # are not used.
+    distances = np.diff(position)
+
+    return {
+        pair: (velocity[start:end], distances[start:end - 1])
+        for pair, start, end in zip(pairs, offsets[:-1].tolist(), offsets[1:].tolist())
+    }
+
+def accelerate_backward(line: Line, ramp: tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]], min_segment_length_mm: float):
+    velocity, distances = ramp
 
     line.params['F'] = line.annotation.desired_feed_mms * 60
 
     current_start = line
-    for dx, set_velocity in zip(np.diff(position), velocity[1:]):
-        slow_cut = split_distance_back(current_start, dx, min_segment_length_mm)
-        if not slow_cut:
-            break
-
+    cuts = split_distances_back(line, distances, min_segment_length_mm)
+    for slow_cut, set_velocity in zip(cuts, velocity[1:]):
         def set_speed(line, set_velocity):
-            if line.is_move:
-                if 'F' in line.params:
-                    current_line_feed_mms = line.params['F'] / 60
-                    if current_line_feed_mms <= set_velocity:
-                        return True
-
-                line.params['F'] = set_velocity * 60
-        stop = apply_backward(current_start, slow_cut, set_speed, set_velocity)
+            if 'F' in line.params:
+                current_line_feed_mms = line.params['F'] / 60
+                if current_line_feed_mms <= set_velocity:
+                    return True
+
+            line.params['F'] = set_velocity * 60
+        stop = apply_moves_backward(current_start, slow_cut, set_speed, set_velocity)
         if stop:
             break
 
@@ -48,30 +71,24 @@ def accelerate_backward(line: Line, from_mms: float, min_segment_length_mm: floa
         if set_velocity >= current_start.annotation.desired_feed_mms:
             break
 
-def accelerate_forward(line: Line, from_mms: float, min_segment_length_mm: float, profile: SCurveAcceleration):
-    accel, velocity, position = profile.calc(from_mms, line.annotation.desired_feed_mms)
+def accelerate_forward(line: Line, ramp: tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]], min_segment_length_mm: float):
+    velocity, distances = ramp
 
     slow_cut = None
-    current_start = line
-    first = True
-    for dx, set_velocity in zip(np.diff(position), velocity[1:]):
-        current_start, slow_cut = split_distance_forward(current_start, dx, min_segment_length_mm)
-        if first:
-            first = False
-            line = current_start
+    cuts = split_distances_forward(line, distances, min_segment_length_mm)
+    for (current_start, slow_cut), set_velocity in zip(cuts, velocity[1:]):
         if not slow_cut:
             break
 
         def set_speed(line, set_velocity):
-            if line.is_move:
-                line.params['F'] = set_velocity * 60
-        apply_forward(current_start, slow_cut, set_speed, set_velocity)
+            line.params['F'] = set_velocity * 60
+        apply_moves_forward(current_start, slow_cut, set_speed, set_velocity)
 
-        current_start = next_continuous_move('moving_extrude', slow_cut)
-        if current_start is None:
+        next_start = next_continuous_move('moving_extrude', slow_cut)
+        if next_start is None:
             break
 
-        if set_velocity >= current_start.annotation.desired_feed_mms:
+        if set_velocity >= next_start.annotation.desired_feed_mms:
             break
 
     # Now that acceleration has finished, set the feed rate to the desired feed rate.
@@ -95,40 +112,57 @@ def apply(gcode: GCodeFile, options):
     max_accel_mmss = 3000
     junction_threshold_mms = 1.0
 
-    junction_deviation = (square_corner_velocity_mms**2) * (math.sqrt(2) - 1) / max_accel_mmss
-
-    profile = SCurveAcceleration(ramp_time_s, max_accel_mmss, dt_s, accel_dy_mmss)
-
-    section = gcode.first_section
-    while section:
-        if section.section_type not in ('outer wall', 'inner wall'):
-        # if section.section_type not in ('outer wall',):
-            section = section.next
-            continue
-
-        line = section.first_line
-        while True:
-            if line.annotation.move_type is None or line.annotation.desired_feed_mms is None or line.annotation.cos_theta is None or math.isnan(line.annotation.cos_theta):
-                if line is section.last_line:
-                    break
-                line = line.next
-                continue
-
-            desired_feed_mms = line.annotation.desired_feed_mms
-            junction_speed_mms = calc_junction_speed(max_accel_mmss, junction_deviation, line.annotation.cos_theta, desired_feed_mms)
-            if abs(desired_feed_mms - junction_speed_mms) < junction_threshold_mms:
-                if line is section.last_line:
-                    break
-                line = line.next
-                continue
-
-            accelerate_backward(line, junction_speed_mms, min_segment_length, profile)
-            line = accelerate_forward(line, junction_speed_mms, min_segment_length, profile)
-
-            if line is section.last_line:
-                break
-            line = line.next
-
-        section = section.next
-
-
+    junction_deviation = calc_junction_deviation(square_corner_velocity_mms, max_accel_mmss)
+
+    # Velocity deltas are rounded to delta_resolution_mms for a better ramp cache hit rate. The
+    # cache's hit, miss and eviction counts are on profile.cache.
+    profile = SCurveAcceleration(
+        ramp_time_s,
+        max_accel_mmss,
+        dt_s,
+        accel_dy_mmss,
+        cache_size=options.get('ramp_cache_size', DEFAULT_RAMP_CACHE_SIZE),
+        delta_resolution_mms=options.get('delta_resolution_mms', DEFAULT_DELTA_RESOLUTION_MMS)
+    )
+
+    # Optionally look velocity deltas up in a precomputed table, such as:
+    #   delta_table: {max_delta_mms: 500, resolution_mms: 0.05, directory: ~/.cache/gcode_forge}
+    # With a directory, the table is saved there and loaded on later runs.
+    table_options = options.get('delta_table')
+    if table_options:
+        profile.use_table(**table_options)
+
+    # Optionally resample ramps by distance so that each segment changes velocity by at most
+    # max_velocity_error_mms, optionally with at most max_segments_per_ramp segments. An error of
+    # max_accel_mmss * dt_s, 30 mm/s, is the most that one time step changes velocity by, so the worst
+    # segment is no worse than without resampling. By default a segment is emitted for every time step.
+    max_velocity_error_mms = options.get('max_velocity_error_mms')
+    max_segments = options.get('max_segments_per_ramp')
+
+    # Optionally print the number of moves in each section before and after.
+    report = options.get('report', False)
+
+    # Re-annotation after splits is deferred and done once at the end.
+    with AnnotationSession():
+        for section in gcode.index.sections('outer wall', 'inner wall'):
+        # for section in gcode.index.sections('outer wall'):
+            if report:
+                moves_before = sum(1 for _ in section.move_lines())
+
+            # The junctions to slow down for are found from the annotations before any lines of the
+            # section are split, and their ramps are calculated together up front.
+            table = JunctionTable.from_lines(section.move_lines())
+            speeds = table.speeds(max_accel_mmss, junction_deviation)
+            slow = np.abs(table.desired_feed_mms - speeds) >= junction_threshold_mms
+
+            pairs = list(zip(speeds[slow].tolist(), table.desired_feed_mms[slow].tolist()))
+            ramps = plan_ramps(pairs, profile, max_velocity_error_mms, max_segments)
+
+            for line, pair in zip(table.lines[slow].tolist(), pairs):
+                ramp = ramps[pair]
+                accelerate_backward(line, ramp, min_segment_length)
+                accelerate_forward(line, ramp, min_segment_length)
+
+            if report:
+                moves_after = sum(1 for _ in section.move_lines())
+                print(f'{section.section_type} (layer {section.layer}): {moves_before} -> {moves_after} moves')
@@ -1,35 +1,87 @@
+import math
 
+import numpy as np
+import numpy.typing as npt
 import scipy as sc
 
 from ..parser import GCodeFile, Line
+from ..edit_utils import EditBatch
+
+DEFAULT_LUT_RESOLUTION_MMS = 0.1
+
+PA_CODE = 'SET_PRESSURE_ADVANCE'
+
+def build_lut(speeds: list[float], pa_values: list[float], resolution_mms: float) -> list[str]:
+    '''
+    Evaluates the PA spline through the given points every resolution_mms from the lowest to the
+    highest speed, formatted as they are written to the file.
+    '''
+    pa_spline = sc.interpolate.make_interp_spline(speeds, pa_values, bc_type="natural")
+
+    min_speed = speeds[0]
+    max_speed = speeds[-1]
+    count = math.ceil((max_speed - min_speed) / resolution_mms) + 1
+
+    lut_speeds = np.minimum(min_speed + np.arange(count) * resolution_mms, max_speed)
+
+    return [f'{pa:.3f}' for pa in pa_spline(lut_speeds).tolist()]
+
+def _starts_with_pa(text: str) -> bool:
+    text = text.lstrip()
+    return text[:len(PA_CODE)].upper() == PA_CODE and text[len(PA_CODE):len(PA_CODE) + 1] in ('', ' ', '\t', ';')
+
+def _sets_pa(line: Line) -> bool:
+    # Told from the start of the text so that lines stay unparsed. Only modified lines are output from
+    # their code, and blocks may hold several lines.
+    if line._dirty:
+        return line.code == PA_CODE
+    text = line._text
+    return _starts_with_pa(text) or ('\n' in text and any(map(_starts_with_pa, text.splitlines())))
+
+def _pa_set_rows(gcode: GCodeFile) -> npt.NDArray[np.intp]:
+    '''
+    Gets the row in the move table of the first move after each line already in the file that sets
+    PA. Lines after the last move are left out.
+    '''
+    rows = []
+    row = 0
+    for section in gcode.sections():
+        for line in section.lines():
+            if line.is_move:
+                row += 1
+            elif _sets_pa(line) and (not rows or rows[-1] != row):
+                rows.append(row)
+
+    return np.array(rows, dtype=np.intp)
 
 def apply(gcode: GCodeFile, options):
-    pa_lut = sc.interpolate.make_interp_spline(options['speeds'], options['pa_values'], bc_type="natural")
-
-    min_speed = options['speeds'][0]
-    max_speed = options['speeds'][-1]
-
-    section = gcode.first_section
-    while section:
-        line = section.first_line
-        while True:
-            if line.is_move and 'F' in line.params:
-                feed_mms = line.params['F'] / 60
-
-                new_pa = pa_lut(
-                    min(
-                        max(feed_mms, min_speed),
-                        max_speed
-                    )
-                )
-
-                section.insert_before(
-                    line,
-                    Line(f'SET_PRESSURE_ADVANCE ADVANCE={new_pa:.3f}')
-                )
-
-            if line is section.last_line:
-                break
-            line = line.next
-
-        section = section.next
+    speeds = options['speeds']
+    resolution_mms = options.get('lut_resolution_mms', DEFAULT_LUT_RESOLUTION_MMS)
+
+    lut = build_lut(speeds, options['pa_values'], resolution_mms)
+
+    # Entries that are written the same share a code, so that changes can be found by comparing codes.
+    lut_texts, lut_codes = np.unique(lut, return_inverse=True)
+
+    moves = gcode.moves()
+    has_feed = ~np.isnan(moves.f)
+    feed_mms = moves.f[has_feed] / 60
+
+    indices = np.rint((np.clip(feed_mms, speeds[0], speeds[-1]) - speeds[0]) / resolution_mms).astype(np.intp)
+    codes = lut_codes[indices]
+
+    # PA is only set where the value written would change, or where something else in the file, such as
+    # line_type_pa, has set it since the previous move that sets F.
+    changed = np.diff(codes, prepend=-1) != 0
+
+    feed_rows = np.flatnonzero(has_feed)
+    reset = np.searchsorted(feed_rows, _pa_set_rows(gcode))
+    changed[reset[reset < len(feed_rows)]] = True
+
+    # The inserted lines are not moves, so the batch does not need to re-annotate anything.
+    with EditBatch() as batch:
+        for line, code in zip(moves.lines[has_feed][changed].tolist(), codes[changed].tolist()):
+            batch.insert_before(
+                line,
+                Line(f'SET_PRESSURE_ADVANCE ADVANCE={lut_texts[code]}')
+            )
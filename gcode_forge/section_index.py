@@ -0,0 +1,80 @@
+from heapq import merge
+from dataclasses import dataclass, field
+from typing import Iterable
+
+@dataclass(slots=True)
+class Layer:
+    '''
+    A layer of the print, starting at a layer change.
+    '''
+    number: int
+
+    # Height of the layer from the `;Z:` comment in the layer change block, if there is one.
+    z: float = None
+
+    # Sections in the layer in file order, including the layer change section.
+    sections: list = field(default_factory=list)
+
+class SectionIndex:
+    '''
+    Index of the sections of a file by type and by layer.
+
+    Sections are looked up by their `number` and `layer`, which the parser assigns. The index is a
+    snapshot of the sections when it was built, and is not updated as sections are added or removed.
+    '''
+    def __init__(self, first_section):
+        # Sections of each type in file order.
+        self.by_type: dict[str, list] = {}
+
+        # Sections of each type in each layer in file order, keyed by (layer number, type).
+        self.by_layer_type: dict[tuple[int, str], list] = {}
+
+        self.layers: list[Layer] = []
+
+        section = first_section
+        while section:
+            self.by_type.setdefault(section.section_type, []).append(section)
+
+            if section.layer is not None:
+                if section.section_type == 'layer_change':
+                    self.layers.append(Layer(section.layer, _layer_z(section)))
+
+                self.layers[section.layer].sections.append(section)
+                self.by_layer_type.setdefault((section.layer, section.section_type), []).append(section)
+
+            section = section.next
+
+    def sections(self, *section_types: str, layers: Iterable[int]=None) -> list:
+        '''
+        Gets the sections of the given types in file order, optionally only those in the given
+        layer numbers, such as range(10, 51).
+        '''
+        if layers is None:
+            groups = [self.by_type.get(section_type, ()) for section_type in section_types]
+        else:
+            groups = [
+                self.by_layer_type.get((layer, section_type), ())
+                for layer in layers
+                for section_type in section_types
+            ]
+
+        # Each group is in file order, but the groups can be in any order, such as when the layers
+        # are not sorted.
+        if len(groups) == 1:
+            return list(groups[0])
+
+        return list(merge(*groups, key=lambda section: section.number))
+
+def _layer_z(section) -> float:
+    '''
+    Gets the layer height from the `;Z:` comment of a layer change section.
+    '''
+    for line in section.lines():
+        comment = line.comment
+        if comment and comment.startswith('Z:'):
+            try:
+                return float(comment[len('Z:'):])
+            except ValueError:
+                return None
+
+    return None
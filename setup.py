@@ -7,6 +7,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         'Jinja2',
+        'numpy',
         'PyYAML'
     ]
 )
\ No newline at end of file
@@ -0,0 +1,9 @@
+import pytest
+
+from gcode_forge.parser import GCodeFile
+
+from helpers import load
+
+@pytest.fixture
+def sample() -> GCodeFile:
+    return load()
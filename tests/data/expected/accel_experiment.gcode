@@ -0,0 +1,2764 @@
+; HEADER_BLOCK_START
+; generated by synthetic
+; HEADER_BLOCK_END
+
+M104 S210 ; set temp
+G28
+G90
+M83
+G1 F1200
+;LAYER_CHANGE
+;Z:0.2
+;HEIGHT:0.2
+G1 E-.8 F2100
+G1 Z0.200 F720
+;TYPE:Outer wall
+;WIDTH:0.45
+G1 X62.000 Y50.000 F12000
+G1 E.8 F2100
+G1 F3000
+G1 X68.911 Y54.887 E0.28186 
+G1 X69.319 Y55.176 E0.01665 F364.996 
+G1 X69.128 Y55.638 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X67.512 Y59.538 E0.14056 
+G1 X67.321 Y60.000 E0.01665 F2077.396 
+G1 X67.017 Y60.397 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X64.446 Y63.745 E0.14056 
+G1 X64.142 Y64.142 E0.01665 F2080.299 
+G1 X63.745 Y64.446 E0.01665 F2080.299 
+G1 F3000.0 ; restore
+G1 X60.397 Y67.017 E0.14056 
+G1 X60.000 Y67.321 E0.01665 F2077.396 
+G1 X59.538 Y67.512 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X55.638 Y69.128 E0.14056 
+G1 X55.176 Y69.319 E0.01665 F364.996 
+G1 X54.887 Y68.911 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X50.289 Y62.408 E0.26521 
+G1 X50.000 Y62.000 E0.01665 F225.688 
+G1 X49.711 Y62.408 E0.01665 F225.688 
+G1 F3000.0 ; restore
+G1 X45.113 Y68.911 E0.26521 
+G1 X44.824 Y69.319 E0.01665 F364.996 
+G1 X44.362 Y69.128 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X40.462 Y67.512 E0.14056 
+G1 X40.000 Y67.321 E0.01665 F2077.396 
+G1 X39.603 Y67.017 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X36.255 Y64.446 E0.14056 
+G1 X35.858 Y64.142 E0.01665 F2080.299 
+G1 X35.554 Y63.745 E0.01665 F2080.299 
+G1 F3000.0 ; restore
+G1 X32.983 Y60.397 E0.14056 
+G1 X32.679 Y60.000 E0.01665 F2077.396 
+G1 X32.488 Y59.538 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X30.872 Y55.638 E0.14056 
+G1 X30.681 Y55.176 E0.01665 F364.996 
+G1 X31.089 Y54.887 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X37.592 Y50.289 E0.26521 
+G1 X38.000 Y50.000 E0.01665 F225.688 
+G1 X37.592 Y49.711 E0.01665 F225.688 
+G1 F3000.0 ; restore
+G1 X31.089 Y45.113 E0.26521 
+G1 X30.681 Y44.824 E0.01665 F364.996 
+G1 X30.872 Y44.362 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X32.488 Y40.462 E0.14056 
+G1 X32.679 Y40.000 E0.01665 F2077.396 
+G1 X32.983 Y39.603 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X35.554 Y36.255 E0.14056 
+G1 X35.858 Y35.858 E0.01665 F2080.299 
+G1 X36.255 Y35.554 E0.01665 F2080.299 
+G1 F3000.0 ; restore
+G1 X39.603 Y32.983 E0.14056 
+G1 X40.000 Y32.679 E0.01665 F2077.396 
+G1 X40.462 Y32.488 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X44.362 Y30.872 E0.14056 
+G1 X44.824 Y30.681 E0.01665 F364.996 
+G1 X45.113 Y31.089 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X49.711 Y37.592 E0.26521 
+G1 X50.000 Y38.000 E0.01665 F225.688 
+G1 X50.289 Y37.592 E0.01665 F225.688 
+G1 F3000.0 ; restore
+G1 X54.887 Y31.089 E0.26521 
+G1 X55.176 Y30.681 E0.01665 F364.996 
+G1 X55.638 Y30.872 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X59.538 Y32.488 E0.14056 
+G1 X60.000 Y32.679 E0.01665 F2077.396 
+G1 X60.397 Y32.983 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X63.745 Y35.554 E0.14056 
+G1 X64.142 Y35.858 E0.01665 F2080.299 
+G1 X64.446 Y36.255 E0.01665 F2080.299 
+G1 F3000.0 ; restore
+G1 X67.017 Y39.603 E0.14056 
+G1 X67.321 Y40.000 E0.01665 F2077.396 
+G1 X67.512 Y40.462 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X69.128 Y44.362 E0.14056 
+G1 X69.319 Y44.824 E0.01665 F364.996 
+G1 X68.911 Y45.113 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X62.408 Y49.711 E0.26521 
+G1 X62.163 Y49.885 E0.00999 F869.531 
+G1 X62.000 Y50.000 E0.00666 F127.289 
+G1 E-0.80000 F127.289 
+;TYPE:Inner wall
+;WIDTH:0.45
+G1 X61.700 Y50.000 F127.289 
+G1 E0.80000 F127.289 
+G1 F127.289 
+G1 X61.863 Y50.115 E0.00666 F127.289 
+G1 X62.108 Y50.289 E0.00999 F127.289 
+G1 X62.272 Y50.404 E0.00666 F3288.800 
+G1 X62.516 Y50.577 E0.00999 F3288.800 
+G1 X62.680 Y50.693 E0.00666 F4649.323 
+G1 X62.925 Y50.866 E0.00999 F4649.323 
+G1 X63.088 Y50.982 E0.00666 F5693.523 
+G1 F5693.523 ; restore
+G1 X63.333 Y51.155 E0.00999 F5693.523 
+G1 F6000.0 ; restore
+G1 X67.203 Y53.892 E0.15785 
+G1 X67.611 Y54.181 E0.01665 F5703.787 
+G1 X68.020 Y54.470 E0.01665 F4661.886 
+G1 X68.428 Y54.758 E0.01665 F3306.536 
+G1 X68.836 Y55.047 E0.01665 F364.942 
+G1 X68.645 Y55.509 E0.01665 F364.942 
+G1 X68.453 Y55.971 E0.01665 F3306.536 
+G1 X68.262 Y56.433 E0.01665 F4661.886 
+G1 X68.070 Y56.895 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X67.461 Y58.364 E0.05297 
+G1 X67.270 Y58.826 E0.01665 F5092.388 
+G1 X67.078 Y59.288 E0.01665 F3890.040 
+G1 X66.887 Y59.750 E0.01665 F2081.445 
+G1 X66.583 Y60.147 E0.01665 F2081.445 
+G1 X66.278 Y60.543 E0.01665 F3890.040 
+G1 X65.974 Y60.940 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X64.702 Y62.599 E0.06961 
+G1 X64.398 Y62.996 E0.01665 F5089.940 
+G1 X64.093 Y63.392 E0.01665 F3886.835 
+G1 X63.789 Y63.789 E0.01665 F2075.449 
+G1 X63.392 Y64.093 E0.01665 F2075.449 
+G1 X62.996 Y64.398 E0.01665 F3886.835 
+G1 X62.599 Y64.702 E0.01665 F5089.940 
+G1 F6000.0 ; restore
+G1 X60.940 Y65.974 E0.06961 
+G1 X60.543 Y66.278 E0.01665 F5092.388 
+G1 X60.147 Y66.583 E0.01665 F3890.040 
+G1 X59.750 Y66.887 E0.01665 F2081.445 
+G1 X59.288 Y67.078 E0.01665 F2081.445 
+G1 X58.826 Y67.270 E0.01665 F3890.040 
+G1 X58.364 Y67.461 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X56.895 Y68.070 E0.05297 
+G1 X56.433 Y68.262 E0.01665 F5703.787 
+G1 X55.971 Y68.453 E0.01665 F4661.886 
+G1 X55.509 Y68.645 E0.01665 F3306.536 
+G1 X55.047 Y68.836 E0.01665 F364.942 
+G1 X54.758 Y68.428 E0.01665 F364.942 
+G1 X54.470 Y68.020 E0.01665 F3306.536 
+G1 X54.181 Y67.611 E0.01665 F4661.886 
+G1 X53.892 Y67.203 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X51.155 Y63.333 E0.15785 
+G1 X50.866 Y62.925 E0.01665 F5696.573 
+G1 X50.577 Y62.516 E0.01665 F4653.057 
+G1 X50.289 Y62.108 E0.01665 F3294.077 
+G1 X50.000 Y61.700 E0.01665 F225.703 
+G1 X49.711 Y62.108 E0.01665 F225.703 
+G1 X49.423 Y62.516 E0.01665 F3294.077 
+G1 X49.134 Y62.925 E0.01665 F4653.057 
+G1 X48.845 Y63.333 E0.01665 F5696.573 
+G1 F6000.0 ; restore
+G1 X46.108 Y67.203 E0.15785 
+G1 X45.819 Y67.611 E0.01665 F5703.787 
+G1 X45.530 Y68.020 E0.01665 F4661.886 
+G1 X45.242 Y68.428 E0.01665 F3306.536 
+G1 X44.953 Y68.836 E0.01665 F364.942 
+G1 X44.491 Y68.645 E0.01665 F364.942 
+G1 X44.029 Y68.453 E0.01665 F3306.536 
+G1 X43.567 Y68.262 E0.01665 F4661.886 
+G1 X43.105 Y68.070 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X41.636 Y67.461 E0.05297 
+G1 X41.174 Y67.270 E0.01665 F5092.388 
+G1 X40.712 Y67.078 E0.01665 F3890.040 
+G1 X40.250 Y66.887 E0.01665 F2081.445 
+G1 X39.853 Y66.583 E0.01665 F2081.445 
+G1 X39.457 Y66.278 E0.01665 F3890.040 
+G1 X39.060 Y65.974 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X37.401 Y64.702 E0.06961 
+G1 X37.004 Y64.398 E0.01665 F5089.940 
+G1 X36.608 Y64.093 E0.01665 F3886.835 
+G1 X36.211 Y63.789 E0.01665 F2075.449 
+G1 X35.907 Y63.392 E0.01665 F2075.449 
+G1 X35.602 Y62.996 E0.01665 F3886.835 
+G1 X35.298 Y62.599 E0.01665 F5089.940 
+G1 F6000.0 ; restore
+G1 X34.026 Y60.940 E0.06961 
+G1 X33.722 Y60.543 E0.01665 F5092.388 
+G1 X33.417 Y60.147 E0.01665 F3890.040 
+G1 X33.113 Y59.750 E0.01665 F2081.445 
+G1 X32.922 Y59.288 E0.01665 F2081.445 
+G1 X32.730 Y58.826 E0.01665 F3890.040 
+G1 X32.539 Y58.364 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X31.930 Y56.895 E0.05297 
+G1 X31.738 Y56.433 E0.01665 F5703.787 
+G1 X31.547 Y55.971 E0.01665 F4661.886 
+G1 X31.355 Y55.509 E0.01665 F3306.536 
+G1 X31.164 Y55.047 E0.01665 F364.942 
+G1 X31.572 Y54.758 E0.01665 F364.942 
+G1 X31.980 Y54.470 E0.01665 F3306.536 
+G1 X32.389 Y54.181 E0.01665 F4661.886 
+G1 X32.797 Y53.892 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X36.667 Y51.155 E0.15785 
+G1 X37.075 Y50.866 E0.01665 F5696.573 
+G1 X37.484 Y50.577 E0.01665 F4653.057 
+G1 X37.892 Y50.289 E0.01665 F3294.077 
+G1 X38.300 Y50.000 E0.01665 F225.703 
+G1 X37.892 Y49.711 E0.01665 F225.703 
+G1 X37.484 Y49.423 E0.01665 F3294.077 
+G1 X37.075 Y49.134 E0.01665 F4653.057 
+G1 X36.667 Y48.845 E0.01665 F5696.573 
+G1 F6000.0 ; restore
+G1 X32.797 Y46.108 E0.15785 
+G1 X32.389 Y45.819 E0.01665 F5703.787 
+G1 X31.980 Y45.530 E0.01665 F4661.886 
+G1 X31.572 Y45.242 E0.01665 F3306.536 
+G1 X31.164 Y44.953 E0.01665 F364.942 
+G1 X31.355 Y44.491 E0.01665 F364.942 
+G1 X31.547 Y44.029 E0.01665 F3306.536 
+G1 X31.738 Y43.567 E0.01665 F4661.886 
+G1 X31.930 Y43.105 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X32.539 Y41.636 E0.05297 
+G1 X32.730 Y41.174 E0.01665 F5092.388 
+G1 X32.922 Y40.712 E0.01665 F3890.040 
+G1 X33.113 Y40.250 E0.01665 F2081.445 
+G1 X33.417 Y39.853 E0.01665 F2081.445 
+G1 X33.722 Y39.457 E0.01665 F3890.040 
+G1 X34.026 Y39.060 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X35.298 Y37.401 E0.06961 
+G1 X35.602 Y37.004 E0.01665 F5089.940 
+G1 X35.907 Y36.608 E0.01665 F3886.835 
+G1 X36.211 Y36.211 E0.01665 F2075.449 
+G1 X36.608 Y35.907 E0.01665 F2075.449 
+G1 X37.004 Y35.602 E0.01665 F3886.835 
+G1 X37.401 Y35.298 E0.01665 F5089.940 
+G1 F6000.0 ; restore
+G1 X39.060 Y34.026 E0.06961 
+G1 X39.457 Y33.722 E0.01665 F5092.388 
+G1 X39.853 Y33.417 E0.01665 F3890.040 
+G1 X40.250 Y33.113 E0.01665 F2081.445 
+G1 X40.712 Y32.922 E0.01665 F2081.445 
+G1 X41.174 Y32.730 E0.01665 F3890.040 
+G1 X41.636 Y32.539 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X43.105 Y31.930 E0.05297 
+G1 X43.567 Y31.738 E0.01665 F5703.787 
+G1 X44.029 Y31.547 E0.01665 F4661.886 
+G1 X44.491 Y31.355 E0.01665 F3306.536 
+G1 X44.953 Y31.164 E0.01665 F364.942 
+G1 X45.242 Y31.572 E0.01665 F364.942 
+G1 X45.530 Y31.980 E0.01665 F3306.536 
+G1 X45.819 Y32.389 E0.01665 F4661.886 
+G1 X46.108 Y32.797 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X48.845 Y36.667 E0.15785 
+G1 X49.134 Y37.075 E0.01665 F5696.573 
+G1 X49.423 Y37.484 E0.01665 F4653.057 
+G1 X49.711 Y37.892 E0.01665 F3294.077 
+G1 X50.000 Y38.300 E0.01665 F225.703 
+G1 X50.289 Y37.892 E0.01665 F225.703 
+G1 X50.577 Y37.484 E0.01665 F3294.077 
+G1 X50.866 Y37.075 E0.01665 F4653.057 
+G1 X51.155 Y36.667 E0.01665 F5696.573 
+G1 F6000.0 ; restore
+G1 X53.892 Y32.797 E0.15785 
+G1 X54.181 Y32.389 E0.01665 F5703.787 
+G1 X54.470 Y31.980 E0.01665 F4661.886 
+G1 X54.758 Y31.572 E0.01665 F3306.536 
+G1 X55.047 Y31.164 E0.01665 F364.942 
+G1 X55.509 Y31.355 E0.01665 F364.942 
+G1 X55.971 Y31.547 E0.01665 F3306.536 
+G1 X56.433 Y31.738 E0.01665 F4661.886 
+G1 X56.895 Y31.930 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X58.364 Y32.539 E0.05297 
+G1 X58.826 Y32.730 E0.01665 F5092.388 
+G1 X59.288 Y32.922 E0.01665 F3890.040 
+G1 X59.750 Y33.113 E0.01665 F2081.445 
+G1 X60.147 Y33.417 E0.01665 F2081.445 
+G1 X60.543 Y33.722 E0.01665 F3890.040 
+G1 X60.940 Y34.026 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X62.599 Y35.298 E0.06961 
+G1 X62.996 Y35.602 E0.01665 F5089.940 
+G1 X63.392 Y35.907 E0.01665 F3886.835 
+G1 X63.789 Y36.211 E0.01665 F2075.449 
+G1 X64.093 Y36.608 E0.01665 F2075.449 
+G1 X64.398 Y37.004 E0.01665 F3886.835 
+G1 X64.702 Y37.401 E0.01665 F5089.940 
+G1 F6000.0 ; restore
+G1 X65.974 Y39.060 E0.06961 
+G1 X66.278 Y39.457 E0.01665 F5092.388 
+G1 X66.583 Y39.853 E0.01665 F3890.040 
+G1 X66.887 Y40.250 E0.01665 F2081.445 
+G1 X67.078 Y40.712 E0.01665 F2081.445 
+G1 X67.270 Y41.174 E0.01665 F3890.040 
+G1 X67.461 Y41.636 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X68.070 Y43.105 E0.05297 
+G1 X68.262 Y43.567 E0.01665 F5703.787 
+G1 X68.453 Y44.029 E0.01665 F4661.886 
+G1 X68.645 Y44.491 E0.01665 F3306.536 
+G1 X68.836 Y44.953 E0.01665 F364.942 
+G1 X68.428 Y45.242 E0.01665 F364.942 
+G1 X68.020 Y45.530 E0.01665 F3306.536 
+G1 X67.611 Y45.819 E0.01665 F4661.886 
+G1 X67.203 Y46.108 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X63.333 Y48.845 E0.15785 
+G1 X62.925 Y49.134 E0.01665 F5713.219 
+G1 X62.516 Y49.423 E0.01665 F4673.422 
+G1 X62.108 Y49.711 E0.01665 F3322.780 
+G1 X61.700 Y50.000 E0.01665 F490.784 
+G1 E-0.80000 F490.784 
+;TYPE:Sparse infill
+;WIDTH:0.45
+G1 X61.246 Y49.791 F490.784 
+G1 F2100.0 ; restore
+G1 X40.454 Y40.209 F12000.000 
+G1 X40.000 Y40.000 F208.858 
+G1 E0.80000 F208.858 
+G1 F208.858 
+G1 X40.000 Y40.000 E0.66600 F208.858 
+G1 X40.000 Y40.500 E0.01665 F208.858 
+G1 X40.000 Y40.700 E0.00666 F3292.966 
+G1 X40.000 Y41.000 E0.00999 F3292.966 
+G1 X40.000 Y41.200 E0.00666 F3300.000 
+G1 X40.000 Y41.500 E0.00999 F300.000 
+G1 Y41.700 E0.00666 F300.000 
+G1 X40.300 Y41.700 E0.00999 F300.000 
+G1 X40.500 Y41.700 E0.00666 F300.000 
+G1 X40.800 Y41.700 E0.00999 F3300.000 
+G1 X41.000 Y41.700 E0.00666 F3300.000 
+G1 X41.300 Y41.700 E0.00999 F4657.252 
+G1 X41.500 Y41.700 E0.00666 F4657.252 
+G1 X41.800 Y41.700 E0.00999 F5700.000 
+G1 X42.000 Y41.700 E0.00666 F5700.000 
+G1 X42.300 Y41.700 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X42.500 Y41.700 E0.00666 F6579.514 
+G1 X43.000 Y41.700 E0.01665 F7354.590 
+G1 X43.500 Y41.700 E0.01665 F8055.433 
+G1 X44.000 Y41.700 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X56.000 Y41.700 E0.39960 
+G1 X56.500 Y41.700 E0.01665 F8700.000 
+G1 X57.000 Y41.700 E0.01665 F8055.433 
+G1 X57.500 Y41.700 E0.01665 F7354.590 
+G1 X58.000 Y41.700 E0.01665 F6579.514 
+G1 X58.500 Y41.700 E0.01665 F5700.000 
+G1 X59.000 Y41.700 E0.01665 F4657.252 
+G1 X59.500 Y41.700 E0.01665 F3300.000 
+G1 X60.000 Y41.700 E0.01665 F300.000 
+G1 X60.000 Y42.200 E0.01665 F300.000 
+G1 X60.000 Y42.400 E0.00666 F3300.000 
+G1 X60.000 Y42.700 E0.00999 F3300.000 
+G1 X60.000 Y42.900 E0.00666 F3300.000 
+G1 X60.000 Y43.200 E0.00999 F300.000 
+G1 Y43.400 E0.00666 F300.000 
+G1 X59.700 Y43.400 E0.00999 F300.000 
+G1 X59.500 Y43.400 E0.00666 F300.000 
+G1 X59.200 Y43.400 E0.00999 F3300.000 
+G1 X59.000 Y43.400 E0.00666 F3300.000 
+G1 X58.700 Y43.400 E0.00999 F4657.252 
+G1 X58.500 Y43.400 E0.00666 F4657.252 
+G1 X58.200 Y43.400 E0.00999 F5700.000 
+G1 X58.000 Y43.400 E0.00666 F5700.000 
+G1 X57.700 Y43.400 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X57.500 Y43.400 E0.00666 F6579.514 
+G1 X57.000 Y43.400 E0.01665 F7354.590 
+G1 X56.500 Y43.400 E0.01665 F8055.433 
+G1 X56.000 Y43.400 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X44.000 Y43.400 E0.39960 
+G1 X43.500 Y43.400 E0.01665 F8700.000 
+G1 X43.000 Y43.400 E0.01665 F8055.433 
+G1 X42.500 Y43.400 E0.01665 F7354.590 
+G1 X42.000 Y43.400 E0.01665 F6579.514 
+G1 X41.500 Y43.400 E0.01665 F5700.000 
+G1 X41.000 Y43.400 E0.01665 F4657.252 
+G1 X40.500 Y43.400 E0.01665 F3300.000 
+G1 X40.000 Y43.400 E0.01665 F300.000 
+G1 X40.000 Y43.900 E0.01665 F300.000 
+G1 X40.000 Y44.100 E0.00666 F3300.000 
+G1 X40.000 Y44.400 E0.00999 F3300.000 
+G1 X40.000 Y44.600 E0.00666 F3300.000 
+G1 X40.000 Y44.900 E0.00999 F300.000 
+G1 Y45.100 E0.00666 F300.000 
+G1 X40.300 Y45.100 E0.00999 F300.000 
+G1 X40.500 Y45.100 E0.00666 F300.000 
+G1 X40.800 Y45.100 E0.00999 F3300.000 
+G1 X41.000 Y45.100 E0.00666 F3300.000 
+G1 X41.300 Y45.100 E0.00999 F4657.252 
+G1 X41.500 Y45.100 E0.00666 F4657.252 
+G1 X41.800 Y45.100 E0.00999 F5700.000 
+G1 X42.000 Y45.100 E0.00666 F5700.000 
+G1 X42.300 Y45.100 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X42.500 Y45.100 E0.00666 F6579.514 
+G1 X43.000 Y45.100 E0.01665 F7354.590 
+G1 X43.500 Y45.100 E0.01665 F8055.433 
+G1 X44.000 Y45.100 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X56.000 Y45.100 E0.39960 
+G1 X56.500 Y45.100 E0.01665 F8700.000 
+G1 X57.000 Y45.100 E0.01665 F8055.433 
+G1 X57.500 Y45.100 E0.01665 F7354.590 
+G1 X58.000 Y45.100 E0.01665 F6579.514 
+G1 X58.500 Y45.100 E0.01665 F5700.000 
+G1 X59.000 Y45.100 E0.01665 F4657.252 
+G1 X59.500 Y45.100 E0.01665 F3300.000 
+G1 X60.000 Y45.100 E0.01665 F300.000 
+G1 X60.000 Y45.600 E0.01665 F300.000 
+G1 X60.000 Y45.800 E0.00666 F3300.000 
+G1 X60.000 Y46.100 E0.00999 F3300.000 
+G1 X60.000 Y46.300 E0.00666 F3300.000 
+G1 X60.000 Y46.600 E0.00999 F300.000 
+G1 Y46.800 E0.00666 F300.000 
+G1 X59.700 Y46.800 E0.00999 F300.000 
+G1 X59.500 Y46.800 E0.00666 F300.000 
+G1 X59.200 Y46.800 E0.00999 F3300.000 
+G1 X59.000 Y46.800 E0.00666 F3300.000 
+G1 X58.700 Y46.800 E0.00999 F4657.252 
+G1 X58.500 Y46.800 E0.00666 F4657.252 
+G1 X58.200 Y46.800 E0.00999 F5700.000 
+G1 X58.000 Y46.800 E0.00666 F5700.000 
+G1 X57.700 Y46.800 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X57.500 Y46.800 E0.00666 F6579.514 
+G1 X57.000 Y46.800 E0.01665 F7354.590 
+G1 X56.500 Y46.800 E0.01665 F8055.433 
+G1 X56.000 Y46.800 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X44.000 Y46.800 E0.39960 
+G1 X43.500 Y46.800 E0.01665 F8700.000 
+G1 X43.000 Y46.800 E0.01665 F8055.433 
+G1 X42.500 Y46.800 E0.01665 F7354.590 
+G1 X42.000 Y46.800 E0.01665 F6579.514 
+G1 X41.500 Y46.800 E0.01665 F5700.000 
+G1 X41.000 Y46.800 E0.01665 F4657.252 
+G1 X40.500 Y46.800 E0.01665 F3300.000 
+G1 X40.000 Y46.800 E0.01665 F300.000 
+G1 X40.000 Y47.300 E0.01665 F300.000 
+G1 X40.000 Y47.500 E0.00666 F3300.000 
+G1 X40.000 Y47.800 E0.00999 F3300.000 
+G1 X40.000 Y48.000 E0.00666 F3300.000 
+G1 X40.000 Y48.300 E0.00999 F300.000 
+G1 Y48.500 E0.00666 F300.000 
+G1 X40.300 Y48.500 E0.00999 F300.000 
+G1 X40.500 Y48.500 E0.00666 F300.000 
+G1 X40.800 Y48.500 E0.00999 F3300.000 
+G1 X41.000 Y48.500 E0.00666 F3300.000 
+G1 X41.300 Y48.500 E0.00999 F4657.252 
+G1 X41.500 Y48.500 E0.00666 F4657.252 
+G1 X41.800 Y48.500 E0.00999 F5700.000 
+G1 X42.000 Y48.500 E0.00666 F5700.000 
+G1 X42.300 Y48.500 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X42.500 Y48.500 E0.00666 F6579.514 
+G1 X43.000 Y48.500 E0.01665 F7354.590 
+G1 X43.500 Y48.500 E0.01665 F8055.433 
+G1 X44.000 Y48.500 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X56.000 Y48.500 E0.39960 
+G1 X56.500 Y48.500 E0.01665 F8700.000 
+G1 X57.000 Y48.500 E0.01665 F8055.433 
+G1 X57.500 Y48.500 E0.01665 F7354.590 
+G1 X58.000 Y48.500 E0.01665 F6579.514 
+G1 X58.500 Y48.500 E0.01665 F5700.000 
+G1 X59.000 Y48.500 E0.01665 F4657.252 
+G1 X59.500 Y48.500 E0.01665 F3300.000 
+G1 X60.000 Y48.500 E0.01665 F300.000 
+G1 X60.000 Y49.000 E0.01665 F300.000 
+G1 X60.000 Y49.200 E0.00666 F3300.000 
+G1 X60.000 Y49.500 E0.00999 F3300.000 
+G1 X60.000 Y49.700 E0.00666 F3300.000 
+G1 X60.000 Y50.000 E0.00999 F300.000 
+G1 Y50.200 E0.00666 F300.000 
+G1 X59.700 Y50.200 E0.00999 F300.000 
+G1 X59.500 Y50.200 E0.00666 F300.000 
+G1 X59.200 Y50.200 E0.00999 F3300.000 
+G1 X59.000 Y50.200 E0.00666 F3300.000 
+G1 X58.700 Y50.200 E0.00999 F4657.252 
+G1 X58.500 Y50.200 E0.00666 F4657.252 
+G1 X58.200 Y50.200 E0.00999 F5700.000 
+G1 X58.000 Y50.200 E0.00666 F5700.000 
+G1 X57.700 Y50.200 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X57.500 Y50.200 E0.00666 F6579.514 
+G1 X57.000 Y50.200 E0.01665 F7354.590 
+G1 X56.500 Y50.200 E0.01665 F8055.433 
+G1 X56.000 Y50.200 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X44.000 Y50.200 E0.39960 
+G1 X43.500 Y50.200 E0.01665 F8700.000 
+G1 X43.000 Y50.200 E0.01665 F8055.433 
+G1 X42.500 Y50.200 E0.01665 F7354.590 
+G1 X42.000 Y50.200 E0.01665 F6579.514 
+G1 X41.500 Y50.200 E0.01665 F5700.000 
+G1 X41.000 Y50.200 E0.01665 F4657.252 
+G1 X40.500 Y50.200 E0.01665 F3300.000 
+G1 X40.000 Y50.200 E0.01665 F300.000 
+G1 X40.000 Y50.700 E0.01665 F300.000 
+G1 X40.000 Y50.900 E0.00666 F3300.000 
+G1 X40.000 Y51.200 E0.00999 F3300.000 
+G1 X40.000 Y51.400 E0.00666 F3300.000 
+G1 X40.000 Y51.700 E0.00999 F300.000 
+G1 Y51.900 E0.00666 F300.000 
+G1 X40.300 Y51.900 E0.00999 F300.000 
+G1 X40.500 Y51.900 E0.00666 F300.000 
+G1 X40.800 Y51.900 E0.00999 F3300.000 
+G1 X41.000 Y51.900 E0.00666 F3300.000 
+G1 X41.300 Y51.900 E0.00999 F4657.252 
+G1 X41.500 Y51.900 E0.00666 F4657.252 
+G1 X41.800 Y51.900 E0.00999 F5700.000 
+G1 X42.000 Y51.900 E0.00666 F5700.000 
+G1 X42.300 Y51.900 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X42.500 Y51.900 E0.00666 F6579.514 
+G1 X43.000 Y51.900 E0.01665 F7354.590 
+G1 X43.500 Y51.900 E0.01665 F8055.433 
+G1 X44.000 Y51.900 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X56.000 Y51.900 E0.39960 
+G1 X56.500 Y51.900 E0.01665 F8700.000 
+G1 X57.000 Y51.900 E0.01665 F8055.433 
+G1 X57.500 Y51.900 E0.01665 F7354.590 
+G1 X58.000 Y51.900 E0.01665 F6579.514 
+G1 X58.500 Y51.900 E0.01665 F5700.000 
+G1 X59.000 Y51.900 E0.01665 F4657.252 
+G1 X59.500 Y51.900 E0.01665 F3300.000 
+G1 X60.000 Y51.900 E0.01665 F300.000 
+G1 X60.000 Y52.400 E0.01665 F300.000 
+G1 X60.000 Y52.600 E0.00666 F3300.000 
+G1 X60.000 Y52.900 E0.00999 F3300.000 
+G1 X60.000 Y53.100 E0.00666 F3300.000 
+G1 X60.000 Y53.400 E0.00999 F300.000 
+G1 Y53.600 E0.00666 F300.000 
+G1 X59.700 Y53.600 E0.00999 F300.000 
+G1 X59.500 Y53.600 E0.00666 F300.000 
+G1 X59.200 Y53.600 E0.00999 F3300.000 
+G1 X59.000 Y53.600 E0.00666 F3300.000 
+G1 X58.700 Y53.600 E0.00999 F4657.252 
+G1 X58.500 Y53.600 E0.00666 F4657.252 
+G1 X58.200 Y53.600 E0.00999 F5700.000 
+G1 X58.000 Y53.600 E0.00666 F5700.000 
+G1 X57.700 Y53.600 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X57.500 Y53.600 E0.00666 F6579.514 
+G1 X57.000 Y53.600 E0.01665 F7354.590 
+G1 X56.500 Y53.600 E0.01665 F8055.433 
+G1 X56.000 Y53.600 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X44.000 Y53.600 E0.39960 
+G1 X43.500 Y53.600 E0.01665 F8700.000 
+G1 X43.000 Y53.600 E0.01665 F8055.433 
+G1 X42.500 Y53.600 E0.01665 F7354.590 
+G1 X42.000 Y53.600 E0.01665 F6579.514 
+G1 X41.500 Y53.600 E0.01665 F5700.000 
+G1 X41.000 Y53.600 E0.01665 F4657.252 
+G1 X40.500 Y53.600 E0.01665 F3300.000 
+G1 X40.000 Y53.600 E0.01665 F300.000 
+G1 X40.000 Y54.100 E0.01665 F300.000 
+G1 X40.000 Y54.300 E0.00666 F3300.000 
+G1 X40.000 Y54.600 E0.00999 F3300.000 
+G1 X40.000 Y54.800 E0.00666 F3300.000 
+G1 X40.000 Y55.100 E0.00999 F300.000 
+G1 Y55.300 E0.00666 F300.000 
+G1 X40.300 Y55.300 E0.00999 F300.000 
+G1 X40.500 Y55.300 E0.00666 F300.000 
+G1 X40.800 Y55.300 E0.00999 F3300.000 
+G1 X41.000 Y55.300 E0.00666 F3300.000 
+G1 X41.300 Y55.300 E0.00999 F4657.252 
+G1 X41.500 Y55.300 E0.00666 F4657.252 
+G1 X41.800 Y55.300 E0.00999 F5700.000 
+G1 X42.000 Y55.300 E0.00666 F5700.000 
+G1 X42.300 Y55.300 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X42.500 Y55.300 E0.00666 F6579.514 
+G1 X43.000 Y55.300 E0.01665 F7354.590 
+G1 X43.500 Y55.300 E0.01665 F8055.433 
+G1 X44.000 Y55.300 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X56.000 Y55.300 E0.39960 
+G1 X56.500 Y55.300 E0.01665 F8700.000 
+G1 X57.000 Y55.300 E0.01665 F8055.433 
+G1 X57.500 Y55.300 E0.01665 F7354.590 
+G1 X58.000 Y55.300 E0.01665 F6579.514 
+G1 X58.500 Y55.300 E0.01665 F5700.000 
+G1 X59.000 Y55.300 E0.01665 F4657.252 
+G1 X59.500 Y55.300 E0.01665 F3300.000 
+G1 X60.000 Y55.300 E0.01665 F300.000 
+G1 X60.000 Y55.800 E0.01665 F300.000 
+G1 X60.000 Y56.000 E0.00666 F3300.000 
+G1 X60.000 Y56.300 E0.00999 F3300.000 
+G1 X60.000 Y56.500 E0.00666 F3300.000 
+G1 X60.000 Y56.800 E0.00999 F300.000 
+G1 Y57.000 E0.00666 F300.000 
+G1 X59.700 Y57.000 E0.00999 F300.000 
+G1 X59.500 Y57.000 E0.00666 F300.000 
+G1 X59.200 Y57.000 E0.00999 F3300.000 
+G1 X59.000 Y57.000 E0.00666 F3300.000 
+G1 X58.700 Y57.000 E0.00999 F4657.252 
+G1 X58.500 Y57.000 E0.00666 F4657.252 
+G1 X58.200 Y57.000 E0.00999 F5700.000 
+G1 X58.000 Y57.000 E0.00666 F5700.000 
+G1 X57.700 Y57.000 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X57.500 Y57.000 E0.00666 F6579.514 
+G1 X57.000 Y57.000 E0.01665 F7354.590 
+G1 X56.500 Y57.000 E0.01665 F8055.433 
+G1 X56.000 Y57.000 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X44.000 Y57.000 E0.39960 
+G1 X43.500 Y57.000 E0.01665 F8700.000 
+G1 X43.000 Y57.000 E0.01665 F8055.433 
+G1 X42.500 Y57.000 E0.01665 F7354.590 
+G1 X42.000 Y57.000 E0.01665 F6579.514 
+G1 X41.500 Y57.000 E0.01665 F5700.000 
+G1 X41.000 Y57.000 E0.01665 F4657.252 
+G1 X40.500 Y57.000 E0.01665 F3300.000 
+G1 X40.000 Y57.000 E0.01665 F300.000 
+G1 X40.000 Y57.500 E0.01665 F300.000 
+G1 X40.000 Y57.700 E0.00666 F3300.000 
+G1 X40.000 Y58.000 E0.00999 F3300.000 
+G1 X40.000 Y58.200 E0.00666 F3300.000 
+G1 X40.000 Y58.500 E0.00999 F300.000 
+G1 Y58.700 E0.00666 F300.000 
+G1 X40.300 Y58.700 E0.00999 F300.000 
+G1 X40.500 Y58.700 E0.00666 F300.000 
+G1 X40.800 Y58.700 E0.00999 F3300.000 
+G1 X41.000 Y58.700 E0.00666 F3300.000 
+G1 X41.300 Y58.700 E0.00999 F4657.252 
+G1 X41.500 Y58.700 E0.00666 F4657.252 
+G1 X41.800 Y58.700 E0.00999 F5700.000 
+G1 X42.000 Y58.700 E0.00666 F5700.000 
+G1 X42.300 Y58.700 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X42.500 Y58.700 E0.00666 F6579.514 
+G1 X43.000 Y58.700 E0.01665 F7354.590 
+G1 X43.500 Y58.700 E0.01665 F8055.433 
+G1 X44.000 Y58.700 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X56.000 Y58.700 E0.39960 
+G1 X56.500 Y58.700 E0.01665 F8700.000 
+G1 X57.000 Y58.700 E0.01665 F8055.433 
+G1 X57.500 Y58.700 E0.01665 F7354.590 
+G1 X58.000 Y58.700 E0.01665 F6579.514 
+G1 X58.500 Y58.700 E0.01665 F5700.000 
+G1 X59.000 Y58.700 E0.01665 F4657.252 
+G1 X59.500 Y58.700 E0.01665 F3300.000 
+G1 X60.000 Y58.700 E0.01665 F300.000 
+G1 X60.000 Y59.200 E0.01665 F300.000 
+G1 X60.000 Y59.400 E0.00666 F3300.000 
+G1 X60.000 Y59.700 E0.00999 F3300.000 
+G1 X60.000 Y59.900 E0.00666 F3308.200 
+G1 X60.000 Y60.200 E0.00999 F379.717 
+G1 Y60.400 E0.00666 F379.717 
+; some comment
+
+G1 E-0.80000 F379.717 
+;TYPE:Outer wall
+;WIDTH:0.45
+G1 X60.289 Y60.479 F379.717 
+G1 F379.717 ; restore
+G1 X60.482 Y60.531 F379.717 
+G1 F2100.0 ; restore
+G1 X131.518 Y79.869 F12000.000 
+G1 X132.000 Y80.000 F1551.401 
+G1 E0.80000 F1551.401 
+G1 F1551.401 
+G1 X132.408 Y80.289 E0.01665 F1551.401 
+G1 F3000.0 ; restore
+G1 X138.911 Y84.887 E0.26521 
+G1 X139.319 Y85.176 E0.01665 F364.996 
+G1 X139.128 Y85.638 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X137.512 Y89.538 E0.14056 
+G1 X137.321 Y90.000 E0.01665 F2077.396 
+G1 X137.017 Y90.397 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X134.446 Y93.745 E0.14056 
+G1 X134.142 Y94.142 E0.01665 F2080.299 
+G1 X133.745 Y94.446 E0.01665 F2080.299 
+G1 F3000.0 ; restore
+G1 X130.397 Y97.017 E0.14056 
+G1 X130.000 Y97.321 E0.01665 F2077.396 
+G1 X129.538 Y97.512 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X125.638 Y99.128 E0.14056 
+G1 X125.176 Y99.319 E0.01665 F364.996 
+G1 X124.887 Y98.911 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X120.289 Y92.408 E0.26521 
+G1 X120.000 Y92.000 E0.01665 F225.688 
+G1 X119.711 Y92.408 E0.01665 F225.688 
+G1 F3000.0 ; restore
+G1 X115.113 Y98.911 E0.26521 
+G1 X114.824 Y99.319 E0.01665 F364.996 
+G1 X114.362 Y99.128 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X110.462 Y97.512 E0.14056 
+G1 X110.000 Y97.321 E0.01665 F2077.396 
+G1 X109.603 Y97.017 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X106.255 Y94.446 E0.14056 
+G1 X105.858 Y94.142 E0.01665 F2080.299 
+G1 X105.554 Y93.745 E0.01665 F2080.299 
+G1 F3000.0 ; restore
+G1 X102.983 Y90.397 E0.14056 
+G1 X102.679 Y90.000 E0.01665 F2077.396 
+G1 X102.488 Y89.538 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X100.872 Y85.638 E0.14056 
+G1 X100.681 Y85.176 E0.01665 F364.996 
+G1 X101.089 Y84.887 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X107.592 Y80.289 E0.26521 
+G1 X108.000 Y80.000 E0.01665 F225.688 
+G1 X107.592 Y79.711 E0.01665 F225.688 
+G1 F3000.0 ; restore
+G1 X101.089 Y75.113 E0.26521 
+G1 X100.681 Y74.824 E0.01665 F364.996 
+G1 X100.872 Y74.362 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X102.488 Y70.462 E0.14056 
+G1 X102.679 Y70.000 E0.01665 F2077.396 
+G1 X102.983 Y69.603 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X105.554 Y66.255 E0.14056 
+G1 X105.858 Y65.858 E0.01665 F2080.299 
+G1 X106.255 Y65.554 E0.01665 F2080.299 
+G1 F3000.0 ; restore
+G1 X109.603 Y62.983 E0.14056 
+G1 X110.000 Y62.679 E0.01665 F2077.396 
+G1 X110.462 Y62.488 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X114.362 Y60.872 E0.14056 
+G1 X114.824 Y60.681 E0.01665 F364.996 
+G1 X115.113 Y61.089 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X119.711 Y67.592 E0.26521 
+G1 X120.000 Y68.000 E0.01665 F225.688 
+G1 X120.289 Y67.592 E0.01665 F225.688 
+G1 F3000.0 ; restore
+G1 X124.887 Y61.089 E0.26521 
+G1 X125.176 Y60.681 E0.01665 F364.996 
+G1 X125.638 Y60.872 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X129.538 Y62.488 E0.14056 
+G1 X130.000 Y62.679 E0.01665 F2077.396 
+G1 X130.397 Y62.983 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X133.745 Y65.554 E0.14056 
+G1 X134.142 Y65.858 E0.01665 F2080.299 
+G1 X134.446 Y66.255 E0.01665 F2080.299 
+G1 F3000.0 ; restore
+G1 X137.017 Y69.603 E0.14056 
+G1 X137.321 Y70.000 E0.01665 F2077.396 
+G1 X137.512 Y70.462 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X139.128 Y74.362 E0.14056 
+G1 X139.319 Y74.824 E0.01665 F364.996 
+G1 X138.911 Y75.113 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X132.408 Y79.711 E0.26521 
+G1 X132.163 Y79.885 E0.00999 F869.531 
+G1 X132.000 Y80.000 E0.00666 F127.289 
+G1 E-0.80000 F127.289 
+;TYPE:Inner wall
+;WIDTH:0.45
+G1 X131.700 Y80.000 F127.289 
+G1 E0.80000 F127.289 
+G1 F127.289 
+G1 X131.863 Y80.115 E0.00666 F127.289 
+G1 X132.108 Y80.289 E0.00999 F127.289 
+G1 X132.272 Y80.404 E0.00666 F3288.800 
+G1 X132.516 Y80.577 E0.00999 F3288.800 
+G1 X132.680 Y80.693 E0.00666 F4649.323 
+G1 X132.925 Y80.866 E0.00999 F4649.323 
+G1 X133.088 Y80.982 E0.00666 F5693.523 
+G1 F5693.523 ; restore
+G1 X133.333 Y81.155 E0.00999 F5693.523 
+G1 F6000.0 ; restore
+G1 X137.203 Y83.892 E0.15785 
+G1 X137.611 Y84.181 E0.01665 F5703.787 
+G1 X138.020 Y84.470 E0.01665 F4661.886 
+G1 X138.428 Y84.758 E0.01665 F3306.536 
+G1 X138.836 Y85.047 E0.01665 F364.942 
+G1 X138.645 Y85.509 E0.01665 F364.942 
+G1 X138.453 Y85.971 E0.01665 F3306.536 
+G1 X138.262 Y86.433 E0.01665 F4661.886 
+G1 X138.070 Y86.895 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X137.461 Y88.364 E0.05297 
+G1 X137.270 Y88.826 E0.01665 F5092.388 
+G1 X137.078 Y89.288 E0.01665 F3890.040 
+G1 X136.887 Y89.750 E0.01665 F2081.445 
+G1 X136.583 Y90.147 E0.01665 F2081.445 
+G1 X136.278 Y90.543 E0.01665 F3890.040 
+G1 X135.974 Y90.940 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X134.702 Y92.599 E0.06961 
+G1 X134.398 Y92.996 E0.01665 F5089.940 
+G1 X134.093 Y93.392 E0.01665 F3886.835 
+G1 X133.789 Y93.789 E0.01665 F2075.449 
+G1 X133.392 Y94.093 E0.01665 F2075.449 
+G1 X132.996 Y94.398 E0.01665 F3886.835 
+G1 X132.599 Y94.702 E0.01665 F5089.940 
+G1 F6000.0 ; restore
+G1 X130.940 Y95.974 E0.06961 
+G1 X130.543 Y96.278 E0.01665 F5092.388 
+G1 X130.147 Y96.583 E0.01665 F3890.040 
+G1 X129.750 Y96.887 E0.01665 F2081.445 
+G1 X129.288 Y97.078 E0.01665 F2081.445 
+G1 X128.826 Y97.270 E0.01665 F3890.040 
+G1 X128.364 Y97.461 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X126.895 Y98.070 E0.05297 
+G1 X126.433 Y98.262 E0.01665 F5703.787 
+G1 X125.971 Y98.453 E0.01665 F4661.886 
+G1 X125.509 Y98.645 E0.01665 F3306.536 
+G1 X125.047 Y98.836 E0.01665 F364.942 
+G1 X124.758 Y98.428 E0.01665 F364.942 
+G1 X124.470 Y98.020 E0.01665 F3306.536 
+G1 X124.181 Y97.611 E0.01665 F4661.886 
+G1 X123.892 Y97.203 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X121.155 Y93.333 E0.15785 
+G1 X120.866 Y92.925 E0.01665 F5696.573 
+G1 X120.577 Y92.516 E0.01665 F4653.057 
+G1 X120.289 Y92.108 E0.01665 F3294.077 
+G1 X120.000 Y91.700 E0.01665 F225.703 
+G1 X119.711 Y92.108 E0.01665 F225.703 
+G1 X119.423 Y92.516 E0.01665 F3294.077 
+G1 X119.134 Y92.925 E0.01665 F4653.057 
+G1 X118.845 Y93.333 E0.01665 F5696.573 
+G1 F6000.0 ; restore
+G1 X116.108 Y97.203 E0.15785 
+G1 X115.819 Y97.611 E0.01665 F5703.787 
+G1 X115.530 Y98.020 E0.01665 F4661.886 
+G1 X115.242 Y98.428 E0.01665 F3306.536 
+G1 X114.953 Y98.836 E0.01665 F364.942 
+G1 X114.491 Y98.645 E0.01665 F364.942 
+G1 X114.029 Y98.453 E0.01665 F3306.536 
+G1 X113.567 Y98.262 E0.01665 F4661.886 
+G1 X113.105 Y98.070 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X111.636 Y97.461 E0.05297 
+G1 X111.174 Y97.270 E0.01665 F5092.388 
+G1 X110.712 Y97.078 E0.01665 F3890.040 
+G1 X110.250 Y96.887 E0.01665 F2081.445 
+G1 X109.853 Y96.583 E0.01665 F2081.445 
+G1 X109.457 Y96.278 E0.01665 F3890.040 
+G1 X109.060 Y95.974 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X107.401 Y94.702 E0.06961 
+G1 X107.004 Y94.398 E0.01665 F5089.940 
+G1 X106.608 Y94.093 E0.01665 F3886.835 
+G1 X106.211 Y93.789 E0.01665 F2075.449 
+G1 X105.907 Y93.392 E0.01665 F2075.449 
+G1 X105.602 Y92.996 E0.01665 F3886.835 
+G1 X105.298 Y92.599 E0.01665 F5089.940 
+G1 F6000.0 ; restore
+G1 X104.026 Y90.940 E0.06961 
+G1 X103.722 Y90.543 E0.01665 F5092.388 
+G1 X103.417 Y90.147 E0.01665 F3890.040 
+G1 X103.113 Y89.750 E0.01665 F2081.445 
+G1 X102.922 Y89.288 E0.01665 F2081.445 
+G1 X102.730 Y88.826 E0.01665 F3890.040 
+G1 X102.539 Y88.364 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X101.930 Y86.895 E0.05297 
+G1 X101.738 Y86.433 E0.01665 F5703.787 
+G1 X101.547 Y85.971 E0.01665 F4661.886 
+G1 X101.355 Y85.509 E0.01665 F3306.536 
+G1 X101.164 Y85.047 E0.01665 F364.942 
+G1 X101.572 Y84.758 E0.01665 F364.942 
+G1 X101.980 Y84.470 E0.01665 F3306.536 
+G1 X102.389 Y84.181 E0.01665 F4661.886 
+G1 X102.797 Y83.892 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X106.667 Y81.155 E0.15785 
+G1 X107.075 Y80.866 E0.01665 F5696.573 
+G1 X107.484 Y80.577 E0.01665 F4653.057 
+G1 X107.892 Y80.289 E0.01665 F3294.077 
+G1 X108.300 Y80.000 E0.01665 F225.703 
+G1 X107.892 Y79.711 E0.01665 F225.703 
+G1 X107.484 Y79.423 E0.01665 F3294.077 
+G1 X107.075 Y79.134 E0.01665 F4653.057 
+G1 X106.667 Y78.845 E0.01665 F5696.573 
+G1 F6000.0 ; restore
+G1 X102.797 Y76.108 E0.15785 
+G1 X102.389 Y75.819 E0.01665 F5703.787 
+G1 X101.980 Y75.530 E0.01665 F4661.886 
+G1 X101.572 Y75.242 E0.01665 F3306.536 
+G1 X101.164 Y74.953 E0.01665 F364.942 
+G1 X101.355 Y74.491 E0.01665 F364.942 
+G1 X101.547 Y74.029 E0.01665 F3306.536 
+G1 X101.738 Y73.567 E0.01665 F4661.886 
+G1 X101.930 Y73.105 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X102.539 Y71.636 E0.05297 
+G1 X102.730 Y71.174 E0.01665 F5092.388 
+G1 X102.922 Y70.712 E0.01665 F3890.040 
+G1 X103.113 Y70.250 E0.01665 F2081.445 
+G1 X103.417 Y69.853 E0.01665 F2081.445 
+G1 X103.722 Y69.457 E0.01665 F3890.040 
+G1 X104.026 Y69.060 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X105.298 Y67.401 E0.06961 
+G1 X105.602 Y67.004 E0.01665 F5089.940 
+G1 X105.907 Y66.608 E0.01665 F3886.835 
+G1 X106.211 Y66.211 E0.01665 F2075.449 
+G1 X106.608 Y65.907 E0.01665 F2075.449 
+G1 X107.004 Y65.602 E0.01665 F3886.835 
+G1 X107.401 Y65.298 E0.01665 F5089.940 
+G1 F6000.0 ; restore
+G1 X109.060 Y64.026 E0.06961 
+G1 X109.457 Y63.722 E0.01665 F5092.388 
+G1 X109.853 Y63.417 E0.01665 F3890.040 
+G1 X110.250 Y63.113 E0.01665 F2081.445 
+G1 X110.712 Y62.922 E0.01665 F2081.445 
+G1 X111.174 Y62.730 E0.01665 F3890.040 
+G1 X111.636 Y62.539 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X113.105 Y61.930 E0.05297 
+G1 X113.567 Y61.738 E0.01665 F5703.787 
+G1 X114.029 Y61.547 E0.01665 F4661.886 
+G1 X114.491 Y61.355 E0.01665 F3306.536 
+G1 X114.953 Y61.164 E0.01665 F364.942 
+G1 X115.242 Y61.572 E0.01665 F364.942 
+G1 X115.530 Y61.980 E0.01665 F3306.536 
+G1 X115.819 Y62.389 E0.01665 F4661.886 
+G1 X116.108 Y62.797 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X118.845 Y66.667 E0.15785 
+G1 X119.134 Y67.075 E0.01665 F5696.573 
+G1 X119.423 Y67.484 E0.01665 F4653.057 
+G1 X119.711 Y67.892 E0.01665 F3294.077 
+G1 X120.000 Y68.300 E0.01665 F225.703 
+G1 X120.289 Y67.892 E0.01665 F225.703 
+G1 X120.577 Y67.484 E0.01665 F3294.077 
+G1 X120.866 Y67.075 E0.01665 F4653.057 
+G1 X121.155 Y66.667 E0.01665 F5696.573 
+G1 F6000.0 ; restore
+G1 X123.892 Y62.797 E0.15785 
+G1 X124.181 Y62.389 E0.01665 F5703.787 
+G1 X124.470 Y61.980 E0.01665 F4661.886 
+G1 X124.758 Y61.572 E0.01665 F3306.536 
+G1 X125.047 Y61.164 E0.01665 F364.942 
+G1 X125.509 Y61.355 E0.01665 F364.942 
+G1 X125.971 Y61.547 E0.01665 F3306.536 
+G1 X126.433 Y61.738 E0.01665 F4661.886 
+G1 X126.895 Y61.930 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X128.364 Y62.539 E0.05297 
+G1 X128.826 Y62.730 E0.01665 F5092.388 
+G1 X129.288 Y62.922 E0.01665 F3890.040 
+G1 X129.750 Y63.113 E0.01665 F2081.445 
+G1 X130.147 Y63.417 E0.01665 F2081.445 
+G1 X130.543 Y63.722 E0.01665 F3890.040 
+G1 X130.940 Y64.026 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X132.599 Y65.298 E0.06961 
+G1 X132.996 Y65.602 E0.01665 F5089.940 
+G1 X133.392 Y65.907 E0.01665 F3886.835 
+G1 X133.789 Y66.211 E0.01665 F2075.449 
+G1 X134.093 Y66.608 E0.01665 F2075.449 
+G1 X134.398 Y67.004 E0.01665 F3886.835 
+G1 X134.702 Y67.401 E0.01665 F5089.940 
+G1 F6000.0 ; restore
+G1 X135.974 Y69.060 E0.06961 
+G1 X136.278 Y69.457 E0.01665 F5092.388 
+G1 X136.583 Y69.853 E0.01665 F3890.040 
+G1 X136.887 Y70.250 E0.01665 F2081.445 
+G1 X137.078 Y70.712 E0.01665 F2081.445 
+G1 X137.270 Y71.174 E0.01665 F3890.040 
+G1 X137.461 Y71.636 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X138.070 Y73.105 E0.05297 
+G1 X138.262 Y73.567 E0.01665 F5703.787 
+G1 X138.453 Y74.029 E0.01665 F4661.886 
+G1 X138.645 Y74.491 E0.01665 F3306.536 
+G1 X138.836 Y74.953 E0.01665 F364.942 
+G1 X138.428 Y75.242 E0.01665 F364.942 
+G1 X138.020 Y75.530 E0.01665 F3306.536 
+G1 X137.611 Y75.819 E0.01665 F4661.886 
+G1 X137.203 Y76.108 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X133.333 Y78.845 E0.15785 
+G1 X132.925 Y79.134 E0.01665 F5713.219 
+G1 X132.516 Y79.423 E0.01665 F4673.422 
+G1 X132.108 Y79.711 E0.01665 F3322.780 
+G1 X131.700 Y80.000 E0.01665 F490.784 
+G1 E-0.80000 F490.784 
+;TYPE:Sparse infill
+;WIDTH:0.45
+G1 X131.246 Y79.791 F490.784 
+G1 F2100.0 ; restore
+G1 X110.454 Y70.209 F12000.000 
+G1 X110.000 Y70.000 F208.858 
+G1 E0.80000 F208.858 
+G1 F208.858 
+G1 X110.000 Y70.000 E0.66600 F208.858 
+G1 X110.000 Y70.500 E0.01665 F208.858 
+G1 X110.000 Y70.700 E0.00666 F3292.966 
+G1 X110.000 Y71.000 E0.00999 F3292.966 
+G1 X110.000 Y71.200 E0.00666 F3300.000 
+G1 X110.000 Y71.500 E0.00999 F300.000 
+G1 Y71.700 E0.00666 F300.000 
+G1 X110.300 Y71.700 E0.00999 F300.000 
+G1 X110.500 Y71.700 E0.00666 F300.000 
+G1 X110.800 Y71.700 E0.00999 F3300.000 
+G1 X111.000 Y71.700 E0.00666 F3300.000 
+G1 X111.300 Y71.700 E0.00999 F4657.252 
+G1 X111.500 Y71.700 E0.00666 F4657.252 
+G1 X111.800 Y71.700 E0.00999 F5700.000 
+G1 X112.000 Y71.700 E0.00666 F5700.000 
+G1 X112.300 Y71.700 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X112.500 Y71.700 E0.00666 F6579.514 
+G1 X113.000 Y71.700 E0.01665 F7354.590 
+G1 X113.500 Y71.700 E0.01665 F8055.433 
+G1 X114.000 Y71.700 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X126.000 Y71.700 E0.39960 
+G1 X126.500 Y71.700 E0.01665 F8700.000 
+G1 X127.000 Y71.700 E0.01665 F8055.433 
+G1 X127.500 Y71.700 E0.01665 F7354.590 
+G1 X128.000 Y71.700 E0.01665 F6579.514 
+G1 X128.500 Y71.700 E0.01665 F5700.000 
+G1 X129.000 Y71.700 E0.01665 F4657.252 
+G1 X129.500 Y71.700 E0.01665 F3300.000 
+G1 X130.000 Y71.700 E0.01665 F300.000 
+G1 X130.000 Y72.200 E0.01665 F300.000 
+G1 X130.000 Y72.400 E0.00666 F3300.000 
+G1 X130.000 Y72.700 E0.00999 F3300.000 
+G1 X130.000 Y72.900 E0.00666 F3300.000 
+G1 X130.000 Y73.200 E0.00999 F300.000 
+G1 Y73.400 E0.00666 F300.000 
+G1 X129.700 Y73.400 E0.00999 F300.000 
+G1 X129.500 Y73.400 E0.00666 F300.000 
+G1 X129.200 Y73.400 E0.00999 F3300.000 
+G1 X129.000 Y73.400 E0.00666 F3300.000 
+G1 X128.700 Y73.400 E0.00999 F4657.252 
+G1 X128.500 Y73.400 E0.00666 F4657.252 
+G1 X128.200 Y73.400 E0.00999 F5700.000 
+G1 X128.000 Y73.400 E0.00666 F5700.000 
+G1 X127.700 Y73.400 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X127.500 Y73.400 E0.00666 F6579.514 
+G1 X127.000 Y73.400 E0.01665 F7354.590 
+G1 X126.500 Y73.400 E0.01665 F8055.433 
+G1 X126.000 Y73.400 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X114.000 Y73.400 E0.39960 
+G1 X113.500 Y73.400 E0.01665 F8700.000 
+G1 X113.000 Y73.400 E0.01665 F8055.433 
+G1 X112.500 Y73.400 E0.01665 F7354.590 
+G1 X112.000 Y73.400 E0.01665 F6579.514 
+G1 X111.500 Y73.400 E0.01665 F5700.000 
+G1 X111.000 Y73.400 E0.01665 F4657.252 
+G1 X110.500 Y73.400 E0.01665 F3300.000 
+G1 X110.000 Y73.400 E0.01665 F300.000 
+G1 X110.000 Y73.900 E0.01665 F300.000 
+G1 X110.000 Y74.100 E0.00666 F3300.000 
+G1 X110.000 Y74.400 E0.00999 F3300.000 
+G1 X110.000 Y74.600 E0.00666 F3300.000 
+G1 X110.000 Y74.900 E0.00999 F300.000 
+G1 Y75.100 E0.00666 F300.000 
+G1 X110.300 Y75.100 E0.00999 F300.000 
+G1 X110.500 Y75.100 E0.00666 F300.000 
+G1 X110.800 Y75.100 E0.00999 F3300.000 
+G1 X111.000 Y75.100 E0.00666 F3300.000 
+G1 X111.300 Y75.100 E0.00999 F4657.252 
+G1 X111.500 Y75.100 E0.00666 F4657.252 
+G1 X111.800 Y75.100 E0.00999 F5700.000 
+G1 X112.000 Y75.100 E0.00666 F5700.000 
+G1 X112.300 Y75.100 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X112.500 Y75.100 E0.00666 F6579.514 
+G1 X113.000 Y75.100 E0.01665 F7354.590 
+G1 X113.500 Y75.100 E0.01665 F8055.433 
+G1 X114.000 Y75.100 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X126.000 Y75.100 E0.39960 
+G1 X126.500 Y75.100 E0.01665 F8700.000 
+G1 X127.000 Y75.100 E0.01665 F8055.433 
+G1 X127.500 Y75.100 E0.01665 F7354.590 
+G1 X128.000 Y75.100 E0.01665 F6579.514 
+G1 X128.500 Y75.100 E0.01665 F5700.000 
+G1 X129.000 Y75.100 E0.01665 F4657.252 
+G1 X129.500 Y75.100 E0.01665 F3300.000 
+G1 X130.000 Y75.100 E0.01665 F300.000 
+G1 X130.000 Y75.600 E0.01665 F300.000 
+G1 X130.000 Y75.800 E0.00666 F3300.000 
+G1 X130.000 Y76.100 E0.00999 F3300.000 
+G1 X130.000 Y76.300 E0.00666 F3300.000 
+G1 X130.000 Y76.600 E0.00999 F300.000 
+G1 Y76.800 E0.00666 F300.000 
+G1 X129.700 Y76.800 E0.00999 F300.000 
+G1 X129.500 Y76.800 E0.00666 F300.000 
+G1 X129.200 Y76.800 E0.00999 F3300.000 
+G1 X129.000 Y76.800 E0.00666 F3300.000 
+G1 X128.700 Y76.800 E0.00999 F4657.252 
+G1 X128.500 Y76.800 E0.00666 F4657.252 
+G1 X128.200 Y76.800 E0.00999 F5700.000 
+G1 X128.000 Y76.800 E0.00666 F5700.000 
+G1 X127.700 Y76.800 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X127.500 Y76.800 E0.00666 F6579.514 
+G1 X127.000 Y76.800 E0.01665 F7354.590 
+G1 X126.500 Y76.800 E0.01665 F8055.433 
+G1 X126.000 Y76.800 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X114.000 Y76.800 E0.39960 
+G1 X113.500 Y76.800 E0.01665 F8700.000 
+G1 X113.000 Y76.800 E0.01665 F8055.433 
+G1 X112.500 Y76.800 E0.01665 F7354.590 
+G1 X112.000 Y76.800 E0.01665 F6579.514 
+G1 X111.500 Y76.800 E0.01665 F5700.000 
+G1 X111.000 Y76.800 E0.01665 F4657.252 
+G1 X110.500 Y76.800 E0.01665 F3300.000 
+G1 X110.000 Y76.800 E0.01665 F300.000 
+G1 X110.000 Y77.300 E0.01665 F300.000 
+G1 X110.000 Y77.500 E0.00666 F3300.000 
+G1 X110.000 Y77.800 E0.00999 F3300.000 
+G1 X110.000 Y78.000 E0.00666 F3300.000 
+G1 X110.000 Y78.300 E0.00999 F300.000 
+G1 Y78.500 E0.00666 F300.000 
+G1 X110.300 Y78.500 E0.00999 F300.000 
+G1 X110.500 Y78.500 E0.00666 F300.000 
+G1 X110.800 Y78.500 E0.00999 F3300.000 
+G1 X111.000 Y78.500 E0.00666 F3300.000 
+G1 X111.300 Y78.500 E0.00999 F4657.252 
+G1 X111.500 Y78.500 E0.00666 F4657.252 
+G1 X111.800 Y78.500 E0.00999 F5700.000 
+G1 X112.000 Y78.500 E0.00666 F5700.000 
+G1 X112.300 Y78.500 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X112.500 Y78.500 E0.00666 F6579.514 
+G1 X113.000 Y78.500 E0.01665 F7354.590 
+G1 X113.500 Y78.500 E0.01665 F8055.433 
+G1 X114.000 Y78.500 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X126.000 Y78.500 E0.39960 
+G1 X126.500 Y78.500 E0.01665 F8700.000 
+G1 X127.000 Y78.500 E0.01665 F8055.433 
+G1 X127.500 Y78.500 E0.01665 F7354.590 
+G1 X128.000 Y78.500 E0.01665 F6579.514 
+G1 X128.500 Y78.500 E0.01665 F5700.000 
+G1 X129.000 Y78.500 E0.01665 F4657.252 
+G1 X129.500 Y78.500 E0.01665 F3300.000 
+G1 X130.000 Y78.500 E0.01665 F300.000 
+G1 X130.000 Y79.000 E0.01665 F300.000 
+G1 X130.000 Y79.200 E0.00666 F3300.000 
+G1 X130.000 Y79.500 E0.00999 F3300.000 
+G1 X130.000 Y79.700 E0.00666 F3300.000 
+G1 X130.000 Y80.000 E0.00999 F300.000 
+G1 Y80.200 E0.00666 F300.000 
+G1 X129.700 Y80.200 E0.00999 F300.000 
+G1 X129.500 Y80.200 E0.00666 F300.000 
+G1 X129.200 Y80.200 E0.00999 F3300.000 
+G1 X129.000 Y80.200 E0.00666 F3300.000 
+G1 X128.700 Y80.200 E0.00999 F4657.252 
+G1 X128.500 Y80.200 E0.00666 F4657.252 
+G1 X128.200 Y80.200 E0.00999 F5700.000 
+G1 X128.000 Y80.200 E0.00666 F5700.000 
+G1 X127.700 Y80.200 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X127.500 Y80.200 E0.00666 F6579.514 
+G1 X127.000 Y80.200 E0.01665 F7354.590 
+G1 X126.500 Y80.200 E0.01665 F8055.433 
+G1 X126.000 Y80.200 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X114.000 Y80.200 E0.39960 
+G1 X113.500 Y80.200 E0.01665 F8700.000 
+G1 X113.000 Y80.200 E0.01665 F8055.433 
+G1 X112.500 Y80.200 E0.01665 F7354.590 
+G1 X112.000 Y80.200 E0.01665 F6579.514 
+G1 X111.500 Y80.200 E0.01665 F5700.000 
+G1 X111.000 Y80.200 E0.01665 F4657.252 
+G1 X110.500 Y80.200 E0.01665 F3300.000 
+G1 X110.000 Y80.200 E0.01665 F300.000 
+G1 X110.000 Y80.700 E0.01665 F300.000 
+G1 X110.000 Y80.900 E0.00666 F3300.000 
+G1 X110.000 Y81.200 E0.00999 F3300.000 
+G1 X110.000 Y81.400 E0.00666 F3300.000 
+G1 X110.000 Y81.700 E0.00999 F300.000 
+G1 Y81.900 E0.00666 F300.000 
+G1 X110.300 Y81.900 E0.00999 F300.000 
+G1 X110.500 Y81.900 E0.00666 F300.000 
+G1 X110.800 Y81.900 E0.00999 F3300.000 
+G1 X111.000 Y81.900 E0.00666 F3300.000 
+G1 X111.300 Y81.900 E0.00999 F4657.252 
+G1 X111.500 Y81.900 E0.00666 F4657.252 
+G1 X111.800 Y81.900 E0.00999 F5700.000 
+G1 X112.000 Y81.900 E0.00666 F5700.000 
+G1 X112.300 Y81.900 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X112.500 Y81.900 E0.00666 F6579.514 
+G1 X113.000 Y81.900 E0.01665 F7354.590 
+G1 X113.500 Y81.900 E0.01665 F8055.433 
+G1 X114.000 Y81.900 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X126.000 Y81.900 E0.39960 
+G1 X126.500 Y81.900 E0.01665 F8700.000 
+G1 X127.000 Y81.900 E0.01665 F8055.433 
+G1 X127.500 Y81.900 E0.01665 F7354.590 
+G1 X128.000 Y81.900 E0.01665 F6579.514 
+G1 X128.500 Y81.900 E0.01665 F5700.000 
+G1 X129.000 Y81.900 E0.01665 F4657.252 
+G1 X129.500 Y81.900 E0.01665 F3300.000 
+G1 X130.000 Y81.900 E0.01665 F300.000 
+G1 X130.000 Y82.400 E0.01665 F300.000 
+G1 X130.000 Y82.600 E0.00666 F3300.000 
+G1 X130.000 Y82.900 E0.00999 F3300.000 
+G1 X130.000 Y83.100 E0.00666 F3300.000 
+G1 X130.000 Y83.400 E0.00999 F300.000 
+G1 Y83.600 E0.00666 F300.000 
+G1 X129.700 Y83.600 E0.00999 F300.000 
+G1 X129.500 Y83.600 E0.00666 F300.000 
+G1 X129.200 Y83.600 E0.00999 F3300.000 
+G1 X129.000 Y83.600 E0.00666 F3300.000 
+G1 X128.700 Y83.600 E0.00999 F4657.252 
+G1 X128.500 Y83.600 E0.00666 F4657.252 
+G1 X128.200 Y83.600 E0.00999 F5700.000 
+G1 X128.000 Y83.600 E0.00666 F5700.000 
+G1 X127.700 Y83.600 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X127.500 Y83.600 E0.00666 F6579.514 
+G1 X127.000 Y83.600 E0.01665 F7354.590 
+G1 X126.500 Y83.600 E0.01665 F8055.433 
+G1 X126.000 Y83.600 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X114.000 Y83.600 E0.39960 
+G1 X113.500 Y83.600 E0.01665 F8700.000 
+G1 X113.000 Y83.600 E0.01665 F8055.433 
+G1 X112.500 Y83.600 E0.01665 F7354.590 
+G1 X112.000 Y83.600 E0.01665 F6579.514 
+G1 X111.500 Y83.600 E0.01665 F5700.000 
+G1 X111.000 Y83.600 E0.01665 F4657.252 
+G1 X110.500 Y83.600 E0.01665 F3300.000 
+G1 X110.000 Y83.600 E0.01665 F300.000 
+G1 X110.000 Y84.100 E0.01665 F300.000 
+G1 X110.000 Y84.300 E0.00666 F3300.000 
+G1 X110.000 Y84.600 E0.00999 F3300.000 
+G1 X110.000 Y84.800 E0.00666 F3300.000 
+G1 X110.000 Y85.100 E0.00999 F300.000 
+G1 Y85.300 E0.00666 F300.000 
+G1 X110.300 Y85.300 E0.00999 F300.000 
+G1 X110.500 Y85.300 E0.00666 F300.000 
+G1 X110.800 Y85.300 E0.00999 F3300.000 
+G1 X111.000 Y85.300 E0.00666 F3300.000 
+G1 X111.300 Y85.300 E0.00999 F4657.252 
+G1 X111.500 Y85.300 E0.00666 F4657.252 
+G1 X111.800 Y85.300 E0.00999 F5700.000 
+G1 X112.000 Y85.300 E0.00666 F5700.000 
+G1 X112.300 Y85.300 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X112.500 Y85.300 E0.00666 F6579.514 
+G1 X113.000 Y85.300 E0.01665 F7354.590 
+G1 X113.500 Y85.300 E0.01665 F8055.433 
+G1 X114.000 Y85.300 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X126.000 Y85.300 E0.39960 
+G1 X126.500 Y85.300 E0.01665 F8700.000 
+G1 X127.000 Y85.300 E0.01665 F8055.433 
+G1 X127.500 Y85.300 E0.01665 F7354.590 
+G1 X128.000 Y85.300 E0.01665 F6579.514 
+G1 X128.500 Y85.300 E0.01665 F5700.000 
+G1 X129.000 Y85.300 E0.01665 F4657.252 
+G1 X129.500 Y85.300 E0.01665 F3300.000 
+G1 X130.000 Y85.300 E0.01665 F300.000 
+G1 X130.000 Y85.800 E0.01665 F300.000 
+G1 X130.000 Y86.000 E0.00666 F3300.000 
+G1 X130.000 Y86.300 E0.00999 F3300.000 
+G1 X130.000 Y86.500 E0.00666 F3300.000 
+G1 X130.000 Y86.800 E0.00999 F300.000 
+G1 Y87.000 E0.00666 F300.000 
+G1 X129.700 Y87.000 E0.00999 F300.000 
+G1 X129.500 Y87.000 E0.00666 F300.000 
+G1 X129.200 Y87.000 E0.00999 F3300.000 
+G1 X129.000 Y87.000 E0.00666 F3300.000 
+G1 X128.700 Y87.000 E0.00999 F4657.252 
+G1 X128.500 Y87.000 E0.00666 F4657.252 
+G1 X128.200 Y87.000 E0.00999 F5700.000 
+G1 X128.000 Y87.000 E0.00666 F5700.000 
+G1 X127.700 Y87.000 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X127.500 Y87.000 E0.00666 F6579.514 
+G1 X127.000 Y87.000 E0.01665 F7354.590 
+G1 X126.500 Y87.000 E0.01665 F8055.433 
+G1 X126.000 Y87.000 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X114.000 Y87.000 E0.39960 
+G1 X113.500 Y87.000 E0.01665 F8700.000 
+G1 X113.000 Y87.000 E0.01665 F8055.433 
+G1 X112.500 Y87.000 E0.01665 F7354.590 
+G1 X112.000 Y87.000 E0.01665 F6579.514 
+G1 X111.500 Y87.000 E0.01665 F5700.000 
+G1 X111.000 Y87.000 E0.01665 F4657.252 
+G1 X110.500 Y87.000 E0.01665 F3300.000 
+G1 X110.000 Y87.000 E0.01665 F300.000 
+G1 X110.000 Y87.500 E0.01665 F300.000 
+G1 X110.000 Y87.700 E0.00666 F3300.000 
+G1 X110.000 Y88.000 E0.00999 F3300.000 
+G1 X110.000 Y88.200 E0.00666 F3300.000 
+G1 X110.000 Y88.500 E0.00999 F300.000 
+G1 Y88.700 E0.00666 F300.000 
+G1 X110.300 Y88.700 E0.00999 F300.000 
+G1 X110.500 Y88.700 E0.00666 F300.000 
+G1 X110.800 Y88.700 E0.00999 F3300.000 
+G1 X111.000 Y88.700 E0.00666 F3300.000 
+G1 X111.300 Y88.700 E0.00999 F4657.252 
+G1 X111.500 Y88.700 E0.00666 F4657.252 
+G1 X111.800 Y88.700 E0.00999 F5700.000 
+G1 X112.000 Y88.700 E0.00666 F5700.000 
+G1 X112.300 Y88.700 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X112.500 Y88.700 E0.00666 F6579.514 
+G1 X113.000 Y88.700 E0.01665 F7354.590 
+G1 X113.500 Y88.700 E0.01665 F8055.433 
+G1 X114.000 Y88.700 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X126.000 Y88.700 E0.39960 
+G1 X126.500 Y88.700 E0.01665 F8700.000 
+G1 X127.000 Y88.700 E0.01665 F8055.433 
+G1 X127.500 Y88.700 E0.01665 F7354.590 
+G1 X128.000 Y88.700 E0.01665 F6579.514 
+G1 X128.500 Y88.700 E0.01665 F5700.000 
+G1 X129.000 Y88.700 E0.01665 F4657.252 
+G1 X129.500 Y88.700 E0.01665 F3300.000 
+G1 X130.000 Y88.700 E0.01665 F300.000 
+G1 X130.000 Y88.900 E0.00666 F300.000 
+G1 X130.000 Y89.200 E0.00999 F300.000 
+G1 X130.000 Y89.400 E0.00666 F3300.000 
+G1 X130.000 Y89.700 E0.00999 F3291.378 
+G1 X130.000 Y89.900 E0.00666 F3291.378 
+G1 X130.000 Y90.200 E0.00999 F182.129 
+G1 Y90.400 E0.00666 F182.129 
+; some comment
+
+G1 E-0.80000 F182.129 
+;TYPE:Gap infill
+G1 X129.751 Y90.233 F182.129 
+G1 F182.129 ; restore
+G1 X129.585 Y90.122 F182.129 
+G1 F2100.0 ; restore
+G1 X10.415 Y10.278 F12000.000 
+G1 X10.000 Y10.000 F104.596 
+G1 X10.496 Y10.066 E0.00330 F104.596 
+G1 F2100.0 ; restore
+G1 X11.004 Y10.134 E0.00339 F3000.000 
+G1 X11.500 Y10.200 E0.00330 F3000.000 
+;LAYER_CHANGE
+;Z:0.4
+;HEIGHT:0.2
+G1 E-.8 F2100
+G1 Z0.400 F720
+;TYPE:Outer wall
+;WIDTH:0.45
+G1 X11.893 Y10.509 F1005.630 
+G1 F720.0 ; restore
+G1 X62.000 Y50.000 F12000
+G1 E.8 F2100
+G1 F3000
+G1 X68.911 Y54.887 E0.28186 
+G1 X69.319 Y55.176 E0.01665 F364.996 
+G1 X69.128 Y55.638 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X67.512 Y59.538 E0.14056 
+G1 X67.321 Y60.000 E0.01665 F2077.396 
+G1 X67.017 Y60.397 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X64.446 Y63.745 E0.14056 
+G1 X64.142 Y64.142 E0.01665 F2080.299 
+G1 X63.745 Y64.446 E0.01665 F2080.299 
+G1 F3000.0 ; restore
+G1 X60.397 Y67.017 E0.14056 
+G1 X60.000 Y67.321 E0.01665 F2077.396 
+G1 X59.538 Y67.512 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X55.638 Y69.128 E0.14056 
+G1 X55.176 Y69.319 E0.01665 F364.996 
+G1 X54.887 Y68.911 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X50.289 Y62.408 E0.26521 
+G1 X50.000 Y62.000 E0.01665 F225.688 
+G1 X49.711 Y62.408 E0.01665 F225.688 
+G1 F3000.0 ; restore
+G1 X45.113 Y68.911 E0.26521 
+G1 X44.824 Y69.319 E0.01665 F364.996 
+G1 X44.362 Y69.128 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X40.462 Y67.512 E0.14056 
+G1 X40.000 Y67.321 E0.01665 F2077.396 
+G1 X39.603 Y67.017 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X36.255 Y64.446 E0.14056 
+G1 X35.858 Y64.142 E0.01665 F2080.299 
+G1 X35.554 Y63.745 E0.01665 F2080.299 
+G1 F3000.0 ; restore
+G1 X32.983 Y60.397 E0.14056 
+G1 X32.679 Y60.000 E0.01665 F2077.396 
+G1 X32.488 Y59.538 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X30.872 Y55.638 E0.14056 
+G1 X30.681 Y55.176 E0.01665 F364.996 
+G1 X31.089 Y54.887 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X37.592 Y50.289 E0.26521 
+G1 X38.000 Y50.000 E0.01665 F225.688 
+G1 X37.592 Y49.711 E0.01665 F225.688 
+G1 F3000.0 ; restore
+G1 X31.089 Y45.113 E0.26521 
+G1 X30.681 Y44.824 E0.01665 F364.996 
+G1 X30.872 Y44.362 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X32.488 Y40.462 E0.14056 
+G1 X32.679 Y40.000 E0.01665 F2077.396 
+G1 X32.983 Y39.603 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X35.554 Y36.255 E0.14056 
+G1 X35.858 Y35.858 E0.01665 F2080.299 
+G1 X36.255 Y35.554 E0.01665 F2080.299 
+G1 F3000.0 ; restore
+G1 X39.603 Y32.983 E0.14056 
+G1 X40.000 Y32.679 E0.01665 F2077.396 
+G1 X40.462 Y32.488 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X44.362 Y30.872 E0.14056 
+G1 X44.824 Y30.681 E0.01665 F364.996 
+G1 X45.113 Y31.089 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X49.711 Y37.592 E0.26521 
+G1 X50.000 Y38.000 E0.01665 F225.688 
+G1 X50.289 Y37.592 E0.01665 F225.688 
+G1 F3000.0 ; restore
+G1 X54.887 Y31.089 E0.26521 
+G1 X55.176 Y30.681 E0.01665 F364.996 
+G1 X55.638 Y30.872 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X59.538 Y32.488 E0.14056 
+G1 X60.000 Y32.679 E0.01665 F2077.396 
+G1 X60.397 Y32.983 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X63.745 Y35.554 E0.14056 
+G1 X64.142 Y35.858 E0.01665 F2080.299 
+G1 X64.446 Y36.255 E0.01665 F2080.299 
+G1 F3000.0 ; restore
+G1 X67.017 Y39.603 E0.14056 
+G1 X67.321 Y40.000 E0.01665 F2077.396 
+G1 X67.512 Y40.462 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X69.128 Y44.362 E0.14056 
+G1 X69.319 Y44.824 E0.01665 F364.996 
+G1 X68.911 Y45.113 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X62.408 Y49.711 E0.26521 
+G1 X62.163 Y49.885 E0.00999 F869.531 
+G1 X62.000 Y50.000 E0.00666 F127.289 
+G1 E-0.80000 F127.289 
+;TYPE:Inner wall
+;WIDTH:0.45
+G1 X61.700 Y50.000 F127.289 
+G1 E0.80000 F127.289 
+G1 F127.289 
+G1 X61.863 Y50.115 E0.00666 F127.289 
+G1 X62.108 Y50.289 E0.00999 F127.289 
+G1 X62.272 Y50.404 E0.00666 F3288.800 
+G1 X62.516 Y50.577 E0.00999 F3288.800 
+G1 X62.680 Y50.693 E0.00666 F4649.323 
+G1 X62.925 Y50.866 E0.00999 F4649.323 
+G1 X63.088 Y50.982 E0.00666 F5693.523 
+G1 F5693.523 ; restore
+G1 X63.333 Y51.155 E0.00999 F5693.523 
+G1 F6000.0 ; restore
+G1 X67.203 Y53.892 E0.15785 
+G1 X67.611 Y54.181 E0.01665 F5703.787 
+G1 X68.020 Y54.470 E0.01665 F4661.886 
+G1 X68.428 Y54.758 E0.01665 F3306.536 
+G1 X68.836 Y55.047 E0.01665 F364.942 
+G1 X68.645 Y55.509 E0.01665 F364.942 
+G1 X68.453 Y55.971 E0.01665 F3306.536 
+G1 X68.262 Y56.433 E0.01665 F4661.886 
+G1 X68.070 Y56.895 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X67.461 Y58.364 E0.05297 
+G1 X67.270 Y58.826 E0.01665 F5092.388 
+G1 X67.078 Y59.288 E0.01665 F3890.040 
+G1 X66.887 Y59.750 E0.01665 F2081.445 
+G1 X66.583 Y60.147 E0.01665 F2081.445 
+G1 X66.278 Y60.543 E0.01665 F3890.040 
+G1 X65.974 Y60.940 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X64.702 Y62.599 E0.06961 
+G1 X64.398 Y62.996 E0.01665 F5089.940 
+G1 X64.093 Y63.392 E0.01665 F3886.835 
+G1 X63.789 Y63.789 E0.01665 F2075.449 
+G1 X63.392 Y64.093 E0.01665 F2075.449 
+G1 X62.996 Y64.398 E0.01665 F3886.835 
+G1 X62.599 Y64.702 E0.01665 F5089.940 
+G1 F6000.0 ; restore
+G1 X60.940 Y65.974 E0.06961 
+G1 X60.543 Y66.278 E0.01665 F5092.388 
+G1 X60.147 Y66.583 E0.01665 F3890.040 
+G1 X59.750 Y66.887 E0.01665 F2081.445 
+G1 X59.288 Y67.078 E0.01665 F2081.445 
+G1 X58.826 Y67.270 E0.01665 F3890.040 
+G1 X58.364 Y67.461 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X56.895 Y68.070 E0.05297 
+G1 X56.433 Y68.262 E0.01665 F5703.787 
+G1 X55.971 Y68.453 E0.01665 F4661.886 
+G1 X55.509 Y68.645 E0.01665 F3306.536 
+G1 X55.047 Y68.836 E0.01665 F364.942 
+G1 X54.758 Y68.428 E0.01665 F364.942 
+G1 X54.470 Y68.020 E0.01665 F3306.536 
+G1 X54.181 Y67.611 E0.01665 F4661.886 
+G1 X53.892 Y67.203 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X51.155 Y63.333 E0.15785 
+G1 X50.866 Y62.925 E0.01665 F5696.573 
+G1 X50.577 Y62.516 E0.01665 F4653.057 
+G1 X50.289 Y62.108 E0.01665 F3294.077 
+G1 X50.000 Y61.700 E0.01665 F225.703 
+G1 X49.711 Y62.108 E0.01665 F225.703 
+G1 X49.423 Y62.516 E0.01665 F3294.077 
+G1 X49.134 Y62.925 E0.01665 F4653.057 
+G1 X48.845 Y63.333 E0.01665 F5696.573 
+G1 F6000.0 ; restore
+G1 X46.108 Y67.203 E0.15785 
+G1 X45.819 Y67.611 E0.01665 F5703.787 
+G1 X45.530 Y68.020 E0.01665 F4661.886 
+G1 X45.242 Y68.428 E0.01665 F3306.536 
+G1 X44.953 Y68.836 E0.01665 F364.942 
+G1 X44.491 Y68.645 E0.01665 F364.942 
+G1 X44.029 Y68.453 E0.01665 F3306.536 
+G1 X43.567 Y68.262 E0.01665 F4661.886 
+G1 X43.105 Y68.070 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X41.636 Y67.461 E0.05297 
+G1 X41.174 Y67.270 E0.01665 F5092.388 
+G1 X40.712 Y67.078 E0.01665 F3890.040 
+G1 X40.250 Y66.887 E0.01665 F2081.445 
+G1 X39.853 Y66.583 E0.01665 F2081.445 
+G1 X39.457 Y66.278 E0.01665 F3890.040 
+G1 X39.060 Y65.974 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X37.401 Y64.702 E0.06961 
+G1 X37.004 Y64.398 E0.01665 F5089.940 
+G1 X36.608 Y64.093 E0.01665 F3886.835 
+G1 X36.211 Y63.789 E0.01665 F2075.449 
+G1 X35.907 Y63.392 E0.01665 F2075.449 
+G1 X35.602 Y62.996 E0.01665 F3886.835 
+G1 X35.298 Y62.599 E0.01665 F5089.940 
+G1 F6000.0 ; restore
+G1 X34.026 Y60.940 E0.06961 
+G1 X33.722 Y60.543 E0.01665 F5092.388 
+G1 X33.417 Y60.147 E0.01665 F3890.040 
+G1 X33.113 Y59.750 E0.01665 F2081.445 
+G1 X32.922 Y59.288 E0.01665 F2081.445 
+G1 X32.730 Y58.826 E0.01665 F3890.040 
+G1 X32.539 Y58.364 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X31.930 Y56.895 E0.05297 
+G1 X31.738 Y56.433 E0.01665 F5703.787 
+G1 X31.547 Y55.971 E0.01665 F4661.886 
+G1 X31.355 Y55.509 E0.01665 F3306.536 
+G1 X31.164 Y55.047 E0.01665 F364.942 
+G1 X31.572 Y54.758 E0.01665 F364.942 
+G1 X31.980 Y54.470 E0.01665 F3306.536 
+G1 X32.389 Y54.181 E0.01665 F4661.886 
+G1 X32.797 Y53.892 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X36.667 Y51.155 E0.15785 
+G1 X37.075 Y50.866 E0.01665 F5696.573 
+G1 X37.484 Y50.577 E0.01665 F4653.057 
+G1 X37.892 Y50.289 E0.01665 F3294.077 
+G1 X38.300 Y50.000 E0.01665 F225.703 
+G1 X37.892 Y49.711 E0.01665 F225.703 
+G1 X37.484 Y49.423 E0.01665 F3294.077 
+G1 X37.075 Y49.134 E0.01665 F4653.057 
+G1 X36.667 Y48.845 E0.01665 F5696.573 
+G1 F6000.0 ; restore
+G1 X32.797 Y46.108 E0.15785 
+G1 X32.389 Y45.819 E0.01665 F5703.787 
+G1 X31.980 Y45.530 E0.01665 F4661.886 
+G1 X31.572 Y45.242 E0.01665 F3306.536 
+G1 X31.164 Y44.953 E0.01665 F364.942 
+G1 X31.355 Y44.491 E0.01665 F364.942 
+G1 X31.547 Y44.029 E0.01665 F3306.536 
+G1 X31.738 Y43.567 E0.01665 F4661.886 
+G1 X31.930 Y43.105 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X32.539 Y41.636 E0.05297 
+G1 X32.730 Y41.174 E0.01665 F5092.388 
+G1 X32.922 Y40.712 E0.01665 F3890.040 
+G1 X33.113 Y40.250 E0.01665 F2081.445 
+G1 X33.417 Y39.853 E0.01665 F2081.445 
+G1 X33.722 Y39.457 E0.01665 F3890.040 
+G1 X34.026 Y39.060 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X35.298 Y37.401 E0.06961 
+G1 X35.602 Y37.004 E0.01665 F5089.940 
+G1 X35.907 Y36.608 E0.01665 F3886.835 
+G1 X36.211 Y36.211 E0.01665 F2075.449 
+G1 X36.608 Y35.907 E0.01665 F2075.449 
+G1 X37.004 Y35.602 E0.01665 F3886.835 
+G1 X37.401 Y35.298 E0.01665 F5089.940 
+G1 F6000.0 ; restore
+G1 X39.060 Y34.026 E0.06961 
+G1 X39.457 Y33.722 E0.01665 F5092.388 
+G1 X39.853 Y33.417 E0.01665 F3890.040 
+G1 X40.250 Y33.113 E0.01665 F2081.445 
+G1 X40.712 Y32.922 E0.01665 F2081.445 
+G1 X41.174 Y32.730 E0.01665 F3890.040 
+G1 X41.636 Y32.539 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X43.105 Y31.930 E0.05297 
+G1 X43.567 Y31.738 E0.01665 F5703.787 
+G1 X44.029 Y31.547 E0.01665 F4661.886 
+G1 X44.491 Y31.355 E0.01665 F3306.536 
+G1 X44.953 Y31.164 E0.01665 F364.942 
+G1 X45.242 Y31.572 E0.01665 F364.942 
+G1 X45.530 Y31.980 E0.01665 F3306.536 
+G1 X45.819 Y32.389 E0.01665 F4661.886 
+G1 X46.108 Y32.797 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X48.845 Y36.667 E0.15785 
+G1 X49.134 Y37.075 E0.01665 F5696.573 
+G1 X49.423 Y37.484 E0.01665 F4653.057 
+G1 X49.711 Y37.892 E0.01665 F3294.077 
+G1 X50.000 Y38.300 E0.01665 F225.703 
+G1 X50.289 Y37.892 E0.01665 F225.703 
+G1 X50.577 Y37.484 E0.01665 F3294.077 
+G1 X50.866 Y37.075 E0.01665 F4653.057 
+G1 X51.155 Y36.667 E0.01665 F5696.573 
+G1 F6000.0 ; restore
+G1 X53.892 Y32.797 E0.15785 
+G1 X54.181 Y32.389 E0.01665 F5703.787 
+G1 X54.470 Y31.980 E0.01665 F4661.886 
+G1 X54.758 Y31.572 E0.01665 F3306.536 
+G1 X55.047 Y31.164 E0.01665 F364.942 
+G1 X55.509 Y31.355 E0.01665 F364.942 
+G1 X55.971 Y31.547 E0.01665 F3306.536 
+G1 X56.433 Y31.738 E0.01665 F4661.886 
+G1 X56.895 Y31.930 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X58.364 Y32.539 E0.05297 
+G1 X58.826 Y32.730 E0.01665 F5092.388 
+G1 X59.288 Y32.922 E0.01665 F3890.040 
+G1 X59.750 Y33.113 E0.01665 F2081.445 
+G1 X60.147 Y33.417 E0.01665 F2081.445 
+G1 X60.543 Y33.722 E0.01665 F3890.040 
+G1 X60.940 Y34.026 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X62.599 Y35.298 E0.06961 
+G1 X62.996 Y35.602 E0.01665 F5089.940 
+G1 X63.392 Y35.907 E0.01665 F3886.835 
+G1 X63.789 Y36.211 E0.01665 F2075.449 
+G1 X64.093 Y36.608 E0.01665 F2075.449 
+G1 X64.398 Y37.004 E0.01665 F3886.835 
+G1 X64.702 Y37.401 E0.01665 F5089.940 
+G1 F6000.0 ; restore
+G1 X65.974 Y39.060 E0.06961 
+G1 X66.278 Y39.457 E0.01665 F5092.388 
+G1 X66.583 Y39.853 E0.01665 F3890.040 
+G1 X66.887 Y40.250 E0.01665 F2081.445 
+G1 X67.078 Y40.712 E0.01665 F2081.445 
+G1 X67.270 Y41.174 E0.01665 F3890.040 
+G1 X67.461 Y41.636 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X68.070 Y43.105 E0.05297 
+G1 X68.262 Y43.567 E0.01665 F5703.787 
+G1 X68.453 Y44.029 E0.01665 F4661.886 
+G1 X68.645 Y44.491 E0.01665 F3306.536 
+G1 X68.836 Y44.953 E0.01665 F364.942 
+G1 X68.428 Y45.242 E0.01665 F364.942 
+G1 X68.020 Y45.530 E0.01665 F3306.536 
+G1 X67.611 Y45.819 E0.01665 F4661.886 
+G1 X67.203 Y46.108 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X63.333 Y48.845 E0.15785 
+G1 X62.925 Y49.134 E0.01665 F5713.219 
+G1 X62.516 Y49.423 E0.01665 F4673.422 
+G1 X62.108 Y49.711 E0.01665 F3322.780 
+G1 X61.700 Y50.000 E0.01665 F490.784 
+G1 E-0.80000 F490.784 
+;TYPE:Sparse infill
+;WIDTH:0.45
+G1 X61.246 Y49.791 F490.784 
+G1 F2100.0 ; restore
+G1 X40.454 Y40.209 F12000.000 
+G1 X40.000 Y40.000 F208.858 
+G1 E0.80000 F208.858 
+G1 F208.858 
+G1 X40.000 Y40.000 E0.66600 F208.858 
+G1 X40.000 Y40.500 E0.01665 F208.858 
+G1 X40.000 Y40.700 E0.00666 F3292.966 
+G1 X40.000 Y41.000 E0.00999 F3292.966 
+G1 X40.000 Y41.200 E0.00666 F3300.000 
+G1 X40.000 Y41.500 E0.00999 F300.000 
+G1 Y41.700 E0.00666 F300.000 
+G1 X40.300 Y41.700 E0.00999 F300.000 
+G1 X40.500 Y41.700 E0.00666 F300.000 
+G1 X40.800 Y41.700 E0.00999 F3300.000 
+G1 X41.000 Y41.700 E0.00666 F3300.000 
+G1 X41.300 Y41.700 E0.00999 F4657.252 
+G1 X41.500 Y41.700 E0.00666 F4657.252 
+G1 X41.800 Y41.700 E0.00999 F5700.000 
+G1 X42.000 Y41.700 E0.00666 F5700.000 
+G1 X42.300 Y41.700 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X42.500 Y41.700 E0.00666 F6579.514 
+G1 X43.000 Y41.700 E0.01665 F7354.590 
+G1 X43.500 Y41.700 E0.01665 F8055.433 
+G1 X44.000 Y41.700 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X56.000 Y41.700 E0.39960 
+G1 X56.500 Y41.700 E0.01665 F8700.000 
+G1 X57.000 Y41.700 E0.01665 F8055.433 
+G1 X57.500 Y41.700 E0.01665 F7354.590 
+G1 X58.000 Y41.700 E0.01665 F6579.514 
+G1 X58.500 Y41.700 E0.01665 F5700.000 
+G1 X59.000 Y41.700 E0.01665 F4657.252 
+G1 X59.500 Y41.700 E0.01665 F3300.000 
+G1 X60.000 Y41.700 E0.01665 F300.000 
+G1 X60.000 Y42.200 E0.01665 F300.000 
+G1 X60.000 Y42.400 E0.00666 F3300.000 
+G1 X60.000 Y42.700 E0.00999 F3300.000 
+G1 X60.000 Y42.900 E0.00666 F3300.000 
+G1 X60.000 Y43.200 E0.00999 F300.000 
+G1 Y43.400 E0.00666 F300.000 
+G1 X59.700 Y43.400 E0.00999 F300.000 
+G1 X59.500 Y43.400 E0.00666 F300.000 
+G1 X59.200 Y43.400 E0.00999 F3300.000 
+G1 X59.000 Y43.400 E0.00666 F3300.000 
+G1 X58.700 Y43.400 E0.00999 F4657.252 
+G1 X58.500 Y43.400 E0.00666 F4657.252 
+G1 X58.200 Y43.400 E0.00999 F5700.000 
+G1 X58.000 Y43.400 E0.00666 F5700.000 
+G1 X57.700 Y43.400 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X57.500 Y43.400 E0.00666 F6579.514 
+G1 X57.000 Y43.400 E0.01665 F7354.590 
+G1 X56.500 Y43.400 E0.01665 F8055.433 
+G1 X56.000 Y43.400 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X44.000 Y43.400 E0.39960 
+G1 X43.500 Y43.400 E0.01665 F8700.000 
+G1 X43.000 Y43.400 E0.01665 F8055.433 
+G1 X42.500 Y43.400 E0.01665 F7354.590 
+G1 X42.000 Y43.400 E0.01665 F6579.514 
+G1 X41.500 Y43.400 E0.01665 F5700.000 
+G1 X41.000 Y43.400 E0.01665 F4657.252 
+G1 X40.500 Y43.400 E0.01665 F3300.000 
+G1 X40.000 Y43.400 E0.01665 F300.000 
+G1 X40.000 Y43.900 E0.01665 F300.000 
+G1 X40.000 Y44.100 E0.00666 F3300.000 
+G1 X40.000 Y44.400 E0.00999 F3300.000 
+G1 X40.000 Y44.600 E0.00666 F3300.000 
+G1 X40.000 Y44.900 E0.00999 F300.000 
+G1 Y45.100 E0.00666 F300.000 
+G1 X40.300 Y45.100 E0.00999 F300.000 
+G1 X40.500 Y45.100 E0.00666 F300.000 
+G1 X40.800 Y45.100 E0.00999 F3300.000 
+G1 X41.000 Y45.100 E0.00666 F3300.000 
+G1 X41.300 Y45.100 E0.00999 F4657.252 
+G1 X41.500 Y45.100 E0.00666 F4657.252 
+G1 X41.800 Y45.100 E0.00999 F5700.000 
+G1 X42.000 Y45.100 E0.00666 F5700.000 
+G1 X42.300 Y45.100 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X42.500 Y45.100 E0.00666 F6579.514 
+G1 X43.000 Y45.100 E0.01665 F7354.590 
+G1 X43.500 Y45.100 E0.01665 F8055.433 
+G1 X44.000 Y45.100 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X56.000 Y45.100 E0.39960 
+G1 X56.500 Y45.100 E0.01665 F8700.000 
+G1 X57.000 Y45.100 E0.01665 F8055.433 
+G1 X57.500 Y45.100 E0.01665 F7354.590 
+G1 X58.000 Y45.100 E0.01665 F6579.514 
+G1 X58.500 Y45.100 E0.01665 F5700.000 
+G1 X59.000 Y45.100 E0.01665 F4657.252 
+G1 X59.500 Y45.100 E0.01665 F3300.000 
+G1 X60.000 Y45.100 E0.01665 F300.000 
+G1 X60.000 Y45.600 E0.01665 F300.000 
+G1 X60.000 Y45.800 E0.00666 F3300.000 
+G1 X60.000 Y46.100 E0.00999 F3300.000 
+G1 X60.000 Y46.300 E0.00666 F3300.000 
+G1 X60.000 Y46.600 E0.00999 F300.000 
+G1 Y46.800 E0.00666 F300.000 
+G1 X59.700 Y46.800 E0.00999 F300.000 
+G1 X59.500 Y46.800 E0.00666 F300.000 
+G1 X59.200 Y46.800 E0.00999 F3300.000 
+G1 X59.000 Y46.800 E0.00666 F3300.000 
+G1 X58.700 Y46.800 E0.00999 F4657.252 
+G1 X58.500 Y46.800 E0.00666 F4657.252 
+G1 X58.200 Y46.800 E0.00999 F5700.000 
+G1 X58.000 Y46.800 E0.00666 F5700.000 
+G1 X57.700 Y46.800 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X57.500 Y46.800 E0.00666 F6579.514 
+G1 X57.000 Y46.800 E0.01665 F7354.590 
+G1 X56.500 Y46.800 E0.01665 F8055.433 
+G1 X56.000 Y46.800 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X44.000 Y46.800 E0.39960 
+G1 X43.500 Y46.800 E0.01665 F8700.000 
+G1 X43.000 Y46.800 E0.01665 F8055.433 
+G1 X42.500 Y46.800 E0.01665 F7354.590 
+G1 X42.000 Y46.800 E0.01665 F6579.514 
+G1 X41.500 Y46.800 E0.01665 F5700.000 
+G1 X41.000 Y46.800 E0.01665 F4657.252 
+G1 X40.500 Y46.800 E0.01665 F3300.000 
+G1 X40.000 Y46.800 E0.01665 F300.000 
+G1 X40.000 Y47.300 E0.01665 F300.000 
+G1 X40.000 Y47.500 E0.00666 F3300.000 
+G1 X40.000 Y47.800 E0.00999 F3300.000 
+G1 X40.000 Y48.000 E0.00666 F3300.000 
+G1 X40.000 Y48.300 E0.00999 F300.000 
+G1 Y48.500 E0.00666 F300.000 
+G1 X40.300 Y48.500 E0.00999 F300.000 
+G1 X40.500 Y48.500 E0.00666 F300.000 
+G1 X40.800 Y48.500 E0.00999 F3300.000 
+G1 X41.000 Y48.500 E0.00666 F3300.000 
+G1 X41.300 Y48.500 E0.00999 F4657.252 
+G1 X41.500 Y48.500 E0.00666 F4657.252 
+G1 X41.800 Y48.500 E0.00999 F5700.000 
+G1 X42.000 Y48.500 E0.00666 F5700.000 
+G1 X42.300 Y48.500 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X42.500 Y48.500 E0.00666 F6579.514 
+G1 X43.000 Y48.500 E0.01665 F7354.590 
+G1 X43.500 Y48.500 E0.01665 F8055.433 
+G1 X44.000 Y48.500 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X56.000 Y48.500 E0.39960 
+G1 X56.500 Y48.500 E0.01665 F8700.000 
+G1 X57.000 Y48.500 E0.01665 F8055.433 
+G1 X57.500 Y48.500 E0.01665 F7354.590 
+G1 X58.000 Y48.500 E0.01665 F6579.514 
+G1 X58.500 Y48.500 E0.01665 F5700.000 
+G1 X59.000 Y48.500 E0.01665 F4657.252 
+G1 X59.500 Y48.500 E0.01665 F3300.000 
+G1 X60.000 Y48.500 E0.01665 F300.000 
+G1 X60.000 Y49.000 E0.01665 F300.000 
+G1 X60.000 Y49.200 E0.00666 F3300.000 
+G1 X60.000 Y49.500 E0.00999 F3300.000 
+G1 X60.000 Y49.700 E0.00666 F3300.000 
+G1 X60.000 Y50.000 E0.00999 F300.000 
+G1 Y50.200 E0.00666 F300.000 
+G1 X59.700 Y50.200 E0.00999 F300.000 
+G1 X59.500 Y50.200 E0.00666 F300.000 
+G1 X59.200 Y50.200 E0.00999 F3300.000 
+G1 X59.000 Y50.200 E0.00666 F3300.000 
+G1 X58.700 Y50.200 E0.00999 F4657.252 
+G1 X58.500 Y50.200 E0.00666 F4657.252 
+G1 X58.200 Y50.200 E0.00999 F5700.000 
+G1 X58.000 Y50.200 E0.00666 F5700.000 
+G1 X57.700 Y50.200 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X57.500 Y50.200 E0.00666 F6579.514 
+G1 X57.000 Y50.200 E0.01665 F7354.590 
+G1 X56.500 Y50.200 E0.01665 F8055.433 
+G1 X56.000 Y50.200 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X44.000 Y50.200 E0.39960 
+G1 X43.500 Y50.200 E0.01665 F8700.000 
+G1 X43.000 Y50.200 E0.01665 F8055.433 
+G1 X42.500 Y50.200 E0.01665 F7354.590 
+G1 X42.000 Y50.200 E0.01665 F6579.514 
+G1 X41.500 Y50.200 E0.01665 F5700.000 
+G1 X41.000 Y50.200 E0.01665 F4657.252 
+G1 X40.500 Y50.200 E0.01665 F3300.000 
+G1 X40.000 Y50.200 E0.01665 F300.000 
+G1 X40.000 Y50.700 E0.01665 F300.000 
+G1 X40.000 Y50.900 E0.00666 F3300.000 
+G1 X40.000 Y51.200 E0.00999 F3300.000 
+G1 X40.000 Y51.400 E0.00666 F3300.000 
+G1 X40.000 Y51.700 E0.00999 F300.000 
+G1 Y51.900 E0.00666 F300.000 
+G1 X40.300 Y51.900 E0.00999 F300.000 
+G1 X40.500 Y51.900 E0.00666 F300.000 
+G1 X40.800 Y51.900 E0.00999 F3300.000 
+G1 X41.000 Y51.900 E0.00666 F3300.000 
+G1 X41.300 Y51.900 E0.00999 F4657.252 
+G1 X41.500 Y51.900 E0.00666 F4657.252 
+G1 X41.800 Y51.900 E0.00999 F5700.000 
+G1 X42.000 Y51.900 E0.00666 F5700.000 
+G1 X42.300 Y51.900 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X42.500 Y51.900 E0.00666 F6579.514 
+G1 X43.000 Y51.900 E0.01665 F7354.590 
+G1 X43.500 Y51.900 E0.01665 F8055.433 
+G1 X44.000 Y51.900 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X56.000 Y51.900 E0.39960 
+G1 X56.500 Y51.900 E0.01665 F8700.000 
+G1 X57.000 Y51.900 E0.01665 F8055.433 
+G1 X57.500 Y51.900 E0.01665 F7354.590 
+G1 X58.000 Y51.900 E0.01665 F6579.514 
+G1 X58.500 Y51.900 E0.01665 F5700.000 
+G1 X59.000 Y51.900 E0.01665 F4657.252 
+G1 X59.500 Y51.900 E0.01665 F3300.000 
+G1 X60.000 Y51.900 E0.01665 F300.000 
+G1 X60.000 Y52.400 E0.01665 F300.000 
+G1 X60.000 Y52.600 E0.00666 F3300.000 
+G1 X60.000 Y52.900 E0.00999 F3300.000 
+G1 X60.000 Y53.100 E0.00666 F3300.000 
+G1 X60.000 Y53.400 E0.00999 F300.000 
+G1 Y53.600 E0.00666 F300.000 
+G1 X59.700 Y53.600 E0.00999 F300.000 
+G1 X59.500 Y53.600 E0.00666 F300.000 
+G1 X59.200 Y53.600 E0.00999 F3300.000 
+G1 X59.000 Y53.600 E0.00666 F3300.000 
+G1 X58.700 Y53.600 E0.00999 F4657.252 
+G1 X58.500 Y53.600 E0.00666 F4657.252 
+G1 X58.200 Y53.600 E0.00999 F5700.000 
+G1 X58.000 Y53.600 E0.00666 F5700.000 
+G1 X57.700 Y53.600 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X57.500 Y53.600 E0.00666 F6579.514 
+G1 X57.000 Y53.600 E0.01665 F7354.590 
+G1 X56.500 Y53.600 E0.01665 F8055.433 
+G1 X56.000 Y53.600 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X44.000 Y53.600 E0.39960 
+G1 X43.500 Y53.600 E0.01665 F8700.000 
+G1 X43.000 Y53.600 E0.01665 F8055.433 
+G1 X42.500 Y53.600 E0.01665 F7354.590 
+G1 X42.000 Y53.600 E0.01665 F6579.514 
+G1 X41.500 Y53.600 E0.01665 F5700.000 
+G1 X41.000 Y53.600 E0.01665 F4657.252 
+G1 X40.500 Y53.600 E0.01665 F3300.000 
+G1 X40.000 Y53.600 E0.01665 F300.000 
+G1 X40.000 Y54.100 E0.01665 F300.000 
+G1 X40.000 Y54.300 E0.00666 F3300.000 
+G1 X40.000 Y54.600 E0.00999 F3300.000 
+G1 X40.000 Y54.800 E0.00666 F3300.000 
+G1 X40.000 Y55.100 E0.00999 F300.000 
+G1 Y55.300 E0.00666 F300.000 
+G1 X40.300 Y55.300 E0.00999 F300.000 
+G1 X40.500 Y55.300 E0.00666 F300.000 
+G1 X40.800 Y55.300 E0.00999 F3300.000 
+G1 X41.000 Y55.300 E0.00666 F3300.000 
+G1 X41.300 Y55.300 E0.00999 F4657.252 
+G1 X41.500 Y55.300 E0.00666 F4657.252 
+G1 X41.800 Y55.300 E0.00999 F5700.000 
+G1 X42.000 Y55.300 E0.00666 F5700.000 
+G1 X42.300 Y55.300 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X42.500 Y55.300 E0.00666 F6579.514 
+G1 X43.000 Y55.300 E0.01665 F7354.590 
+G1 X43.500 Y55.300 E0.01665 F8055.433 
+G1 X44.000 Y55.300 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X56.000 Y55.300 E0.39960 
+G1 X56.500 Y55.300 E0.01665 F8700.000 
+G1 X57.000 Y55.300 E0.01665 F8055.433 
+G1 X57.500 Y55.300 E0.01665 F7354.590 
+G1 X58.000 Y55.300 E0.01665 F6579.514 
+G1 X58.500 Y55.300 E0.01665 F5700.000 
+G1 X59.000 Y55.300 E0.01665 F4657.252 
+G1 X59.500 Y55.300 E0.01665 F3300.000 
+G1 X60.000 Y55.300 E0.01665 F300.000 
+G1 X60.000 Y55.800 E0.01665 F300.000 
+G1 X60.000 Y56.000 E0.00666 F3300.000 
+G1 X60.000 Y56.300 E0.00999 F3300.000 
+G1 X60.000 Y56.500 E0.00666 F3300.000 
+G1 X60.000 Y56.800 E0.00999 F300.000 
+G1 Y57.000 E0.00666 F300.000 
+G1 X59.700 Y57.000 E0.00999 F300.000 
+G1 X59.500 Y57.000 E0.00666 F300.000 
+G1 X59.200 Y57.000 E0.00999 F3300.000 
+G1 X59.000 Y57.000 E0.00666 F3300.000 
+G1 X58.700 Y57.000 E0.00999 F4657.252 
+G1 X58.500 Y57.000 E0.00666 F4657.252 
+G1 X58.200 Y57.000 E0.00999 F5700.000 
+G1 X58.000 Y57.000 E0.00666 F5700.000 
+G1 X57.700 Y57.000 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X57.500 Y57.000 E0.00666 F6579.514 
+G1 X57.000 Y57.000 E0.01665 F7354.590 
+G1 X56.500 Y57.000 E0.01665 F8055.433 
+G1 X56.000 Y57.000 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X44.000 Y57.000 E0.39960 
+G1 X43.500 Y57.000 E0.01665 F8700.000 
+G1 X43.000 Y57.000 E0.01665 F8055.433 
+G1 X42.500 Y57.000 E0.01665 F7354.590 
+G1 X42.000 Y57.000 E0.01665 F6579.514 
+G1 X41.500 Y57.000 E0.01665 F5700.000 
+G1 X41.000 Y57.000 E0.01665 F4657.252 
+G1 X40.500 Y57.000 E0.01665 F3300.000 
+G1 X40.000 Y57.000 E0.01665 F300.000 
+G1 X40.000 Y57.500 E0.01665 F300.000 
+G1 X40.000 Y57.700 E0.00666 F3300.000 
+G1 X40.000 Y58.000 E0.00999 F3300.000 
+G1 X40.000 Y58.200 E0.00666 F3300.000 
+G1 X40.000 Y58.500 E0.00999 F300.000 
+G1 Y58.700 E0.00666 F300.000 
+G1 X40.300 Y58.700 E0.00999 F300.000 
+G1 X40.500 Y58.700 E0.00666 F300.000 
+G1 X40.800 Y58.700 E0.00999 F3300.000 
+G1 X41.000 Y58.700 E0.00666 F3300.000 
+G1 X41.300 Y58.700 E0.00999 F4657.252 
+G1 X41.500 Y58.700 E0.00666 F4657.252 
+G1 X41.800 Y58.700 E0.00999 F5700.000 
+G1 X42.000 Y58.700 E0.00666 F5700.000 
+G1 X42.300 Y58.700 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X42.500 Y58.700 E0.00666 F6579.514 
+G1 X43.000 Y58.700 E0.01665 F7354.590 
+G1 X43.500 Y58.700 E0.01665 F8055.433 
+G1 X44.000 Y58.700 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X56.000 Y58.700 E0.39960 
+G1 X56.500 Y58.700 E0.01665 F8700.000 
+G1 X57.000 Y58.700 E0.01665 F8055.433 
+G1 X57.500 Y58.700 E0.01665 F7354.590 
+G1 X58.000 Y58.700 E0.01665 F6579.514 
+G1 X58.500 Y58.700 E0.01665 F5700.000 
+G1 X59.000 Y58.700 E0.01665 F4657.252 
+G1 X59.500 Y58.700 E0.01665 F3300.000 
+G1 X60.000 Y58.700 E0.01665 F300.000 
+G1 X60.000 Y59.200 E0.01665 F300.000 
+G1 X60.000 Y59.400 E0.00666 F3300.000 
+G1 X60.000 Y59.700 E0.00999 F3300.000 
+G1 X60.000 Y59.900 E0.00666 F3308.200 
+G1 X60.000 Y60.200 E0.00999 F379.717 
+G1 Y60.400 E0.00666 F379.717 
+; some comment
+
+G1 E-0.80000 F379.717 
+;TYPE:Outer wall
+;WIDTH:0.45
+G1 X60.289 Y60.479 F379.717 
+G1 F379.717 ; restore
+G1 X60.482 Y60.531 F379.717 
+G1 F2100.0 ; restore
+G1 X131.518 Y79.869 F12000.000 
+G1 X132.000 Y80.000 F1551.401 
+G1 E0.80000 F1551.401 
+G1 F1551.401 
+G1 X132.408 Y80.289 E0.01665 F1551.401 
+G1 F3000.0 ; restore
+G1 X138.911 Y84.887 E0.26521 
+G1 X139.319 Y85.176 E0.01665 F364.996 
+G1 X139.128 Y85.638 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X137.512 Y89.538 E0.14056 
+G1 X137.321 Y90.000 E0.01665 F2077.396 
+G1 X137.017 Y90.397 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X134.446 Y93.745 E0.14056 
+G1 X134.142 Y94.142 E0.01665 F2080.299 
+G1 X133.745 Y94.446 E0.01665 F2080.299 
+G1 F3000.0 ; restore
+G1 X130.397 Y97.017 E0.14056 
+G1 X130.000 Y97.321 E0.01665 F2077.396 
+G1 X129.538 Y97.512 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X125.638 Y99.128 E0.14056 
+G1 X125.176 Y99.319 E0.01665 F364.996 
+G1 X124.887 Y98.911 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X120.289 Y92.408 E0.26521 
+G1 X120.000 Y92.000 E0.01665 F225.688 
+G1 X119.711 Y92.408 E0.01665 F225.688 
+G1 F3000.0 ; restore
+G1 X115.113 Y98.911 E0.26521 
+G1 X114.824 Y99.319 E0.01665 F364.996 
+G1 X114.362 Y99.128 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X110.462 Y97.512 E0.14056 
+G1 X110.000 Y97.321 E0.01665 F2077.396 
+G1 X109.603 Y97.017 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X106.255 Y94.446 E0.14056 
+G1 X105.858 Y94.142 E0.01665 F2080.299 
+G1 X105.554 Y93.745 E0.01665 F2080.299 
+G1 F3000.0 ; restore
+G1 X102.983 Y90.397 E0.14056 
+G1 X102.679 Y90.000 E0.01665 F2077.396 
+G1 X102.488 Y89.538 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X100.872 Y85.638 E0.14056 
+G1 X100.681 Y85.176 E0.01665 F364.996 
+G1 X101.089 Y84.887 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X107.592 Y80.289 E0.26521 
+G1 X108.000 Y80.000 E0.01665 F225.688 
+G1 X107.592 Y79.711 E0.01665 F225.688 
+G1 F3000.0 ; restore
+G1 X101.089 Y75.113 E0.26521 
+G1 X100.681 Y74.824 E0.01665 F364.996 
+G1 X100.872 Y74.362 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X102.488 Y70.462 E0.14056 
+G1 X102.679 Y70.000 E0.01665 F2077.396 
+G1 X102.983 Y69.603 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X105.554 Y66.255 E0.14056 
+G1 X105.858 Y65.858 E0.01665 F2080.299 
+G1 X106.255 Y65.554 E0.01665 F2080.299 
+G1 F3000.0 ; restore
+G1 X109.603 Y62.983 E0.14056 
+G1 X110.000 Y62.679 E0.01665 F2077.396 
+G1 X110.462 Y62.488 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X114.362 Y60.872 E0.14056 
+G1 X114.824 Y60.681 E0.01665 F364.996 
+G1 X115.113 Y61.089 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X119.711 Y67.592 E0.26521 
+G1 X120.000 Y68.000 E0.01665 F225.688 
+G1 X120.289 Y67.592 E0.01665 F225.688 
+G1 F3000.0 ; restore
+G1 X124.887 Y61.089 E0.26521 
+G1 X125.176 Y60.681 E0.01665 F364.996 
+G1 X125.638 Y60.872 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X129.538 Y62.488 E0.14056 
+G1 X130.000 Y62.679 E0.01665 F2077.396 
+G1 X130.397 Y62.983 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X133.745 Y65.554 E0.14056 
+G1 X134.142 Y65.858 E0.01665 F2080.299 
+G1 X134.446 Y66.255 E0.01665 F2080.299 
+G1 F3000.0 ; restore
+G1 X137.017 Y69.603 E0.14056 
+G1 X137.321 Y70.000 E0.01665 F2077.396 
+G1 X137.512 Y70.462 E0.01665 F2077.396 
+G1 F3000.0 ; restore
+G1 X139.128 Y74.362 E0.14056 
+G1 X139.319 Y74.824 E0.01665 F364.996 
+G1 X138.911 Y75.113 E0.01665 F364.996 
+G1 F3000.0 ; restore
+G1 X132.408 Y79.711 E0.26521 
+G1 X132.163 Y79.885 E0.00999 F869.531 
+G1 X132.000 Y80.000 E0.00666 F127.289 
+G1 E-0.80000 F127.289 
+;TYPE:Inner wall
+;WIDTH:0.45
+G1 X131.700 Y80.000 F127.289 
+G1 E0.80000 F127.289 
+G1 F127.289 
+G1 X131.863 Y80.115 E0.00666 F127.289 
+G1 X132.108 Y80.289 E0.00999 F127.289 
+G1 X132.272 Y80.404 E0.00666 F3288.800 
+G1 X132.516 Y80.577 E0.00999 F3288.800 
+G1 X132.680 Y80.693 E0.00666 F4649.323 
+G1 X132.925 Y80.866 E0.00999 F4649.323 
+G1 X133.088 Y80.982 E0.00666 F5693.523 
+G1 F5693.523 ; restore
+G1 X133.333 Y81.155 E0.00999 F5693.523 
+G1 F6000.0 ; restore
+G1 X137.203 Y83.892 E0.15785 
+G1 X137.611 Y84.181 E0.01665 F5703.787 
+G1 X138.020 Y84.470 E0.01665 F4661.886 
+G1 X138.428 Y84.758 E0.01665 F3306.536 
+G1 X138.836 Y85.047 E0.01665 F364.942 
+G1 X138.645 Y85.509 E0.01665 F364.942 
+G1 X138.453 Y85.971 E0.01665 F3306.536 
+G1 X138.262 Y86.433 E0.01665 F4661.886 
+G1 X138.070 Y86.895 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X137.461 Y88.364 E0.05297 
+G1 X137.270 Y88.826 E0.01665 F5092.388 
+G1 X137.078 Y89.288 E0.01665 F3890.040 
+G1 X136.887 Y89.750 E0.01665 F2081.445 
+G1 X136.583 Y90.147 E0.01665 F2081.445 
+G1 X136.278 Y90.543 E0.01665 F3890.040 
+G1 X135.974 Y90.940 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X134.702 Y92.599 E0.06961 
+G1 X134.398 Y92.996 E0.01665 F5089.940 
+G1 X134.093 Y93.392 E0.01665 F3886.835 
+G1 X133.789 Y93.789 E0.01665 F2075.449 
+G1 X133.392 Y94.093 E0.01665 F2075.449 
+G1 X132.996 Y94.398 E0.01665 F3886.835 
+G1 X132.599 Y94.702 E0.01665 F5089.940 
+G1 F6000.0 ; restore
+G1 X130.940 Y95.974 E0.06961 
+G1 X130.543 Y96.278 E0.01665 F5092.388 
+G1 X130.147 Y96.583 E0.01665 F3890.040 
+G1 X129.750 Y96.887 E0.01665 F2081.445 
+G1 X129.288 Y97.078 E0.01665 F2081.445 
+G1 X128.826 Y97.270 E0.01665 F3890.040 
+G1 X128.364 Y97.461 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X126.895 Y98.070 E0.05297 
+G1 X126.433 Y98.262 E0.01665 F5703.787 
+G1 X125.971 Y98.453 E0.01665 F4661.886 
+G1 X125.509 Y98.645 E0.01665 F3306.536 
+G1 X125.047 Y98.836 E0.01665 F364.942 
+G1 X124.758 Y98.428 E0.01665 F364.942 
+G1 X124.470 Y98.020 E0.01665 F3306.536 
+G1 X124.181 Y97.611 E0.01665 F4661.886 
+G1 X123.892 Y97.203 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X121.155 Y93.333 E0.15785 
+G1 X120.866 Y92.925 E0.01665 F5696.573 
+G1 X120.577 Y92.516 E0.01665 F4653.057 
+G1 X120.289 Y92.108 E0.01665 F3294.077 
+G1 X120.000 Y91.700 E0.01665 F225.703 
+G1 X119.711 Y92.108 E0.01665 F225.703 
+G1 X119.423 Y92.516 E0.01665 F3294.077 
+G1 X119.134 Y92.925 E0.01665 F4653.057 
+G1 X118.845 Y93.333 E0.01665 F5696.573 
+G1 F6000.0 ; restore
+G1 X116.108 Y97.203 E0.15785 
+G1 X115.819 Y97.611 E0.01665 F5703.787 
+G1 X115.530 Y98.020 E0.01665 F4661.886 
+G1 X115.242 Y98.428 E0.01665 F3306.536 
+G1 X114.953 Y98.836 E0.01665 F364.942 
+G1 X114.491 Y98.645 E0.01665 F364.942 
+G1 X114.029 Y98.453 E0.01665 F3306.536 
+G1 X113.567 Y98.262 E0.01665 F4661.886 
+G1 X113.105 Y98.070 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X111.636 Y97.461 E0.05297 
+G1 X111.174 Y97.270 E0.01665 F5092.388 
+G1 X110.712 Y97.078 E0.01665 F3890.040 
+G1 X110.250 Y96.887 E0.01665 F2081.445 
+G1 X109.853 Y96.583 E0.01665 F2081.445 
+G1 X109.457 Y96.278 E0.01665 F3890.040 
+G1 X109.060 Y95.974 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X107.401 Y94.702 E0.06961 
+G1 X107.004 Y94.398 E0.01665 F5089.940 
+G1 X106.608 Y94.093 E0.01665 F3886.835 
+G1 X106.211 Y93.789 E0.01665 F2075.449 
+G1 X105.907 Y93.392 E0.01665 F2075.449 
+G1 X105.602 Y92.996 E0.01665 F3886.835 
+G1 X105.298 Y92.599 E0.01665 F5089.940 
+G1 F6000.0 ; restore
+G1 X104.026 Y90.940 E0.06961 
+G1 X103.722 Y90.543 E0.01665 F5092.388 
+G1 X103.417 Y90.147 E0.01665 F3890.040 
+G1 X103.113 Y89.750 E0.01665 F2081.445 
+G1 X102.922 Y89.288 E0.01665 F2081.445 
+G1 X102.730 Y88.826 E0.01665 F3890.040 
+G1 X102.539 Y88.364 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X101.930 Y86.895 E0.05297 
+G1 X101.738 Y86.433 E0.01665 F5703.787 
+G1 X101.547 Y85.971 E0.01665 F4661.886 
+G1 X101.355 Y85.509 E0.01665 F3306.536 
+G1 X101.164 Y85.047 E0.01665 F364.942 
+G1 X101.572 Y84.758 E0.01665 F364.942 
+G1 X101.980 Y84.470 E0.01665 F3306.536 
+G1 X102.389 Y84.181 E0.01665 F4661.886 
+G1 X102.797 Y83.892 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X106.667 Y81.155 E0.15785 
+G1 X107.075 Y80.866 E0.01665 F5696.573 
+G1 X107.484 Y80.577 E0.01665 F4653.057 
+G1 X107.892 Y80.289 E0.01665 F3294.077 
+G1 X108.300 Y80.000 E0.01665 F225.703 
+G1 X107.892 Y79.711 E0.01665 F225.703 
+G1 X107.484 Y79.423 E0.01665 F3294.077 
+G1 X107.075 Y79.134 E0.01665 F4653.057 
+G1 X106.667 Y78.845 E0.01665 F5696.573 
+G1 F6000.0 ; restore
+G1 X102.797 Y76.108 E0.15785 
+G1 X102.389 Y75.819 E0.01665 F5703.787 
+G1 X101.980 Y75.530 E0.01665 F4661.886 
+G1 X101.572 Y75.242 E0.01665 F3306.536 
+G1 X101.164 Y74.953 E0.01665 F364.942 
+G1 X101.355 Y74.491 E0.01665 F364.942 
+G1 X101.547 Y74.029 E0.01665 F3306.536 
+G1 X101.738 Y73.567 E0.01665 F4661.886 
+G1 X101.930 Y73.105 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X102.539 Y71.636 E0.05297 
+G1 X102.730 Y71.174 E0.01665 F5092.388 
+G1 X102.922 Y70.712 E0.01665 F3890.040 
+G1 X103.113 Y70.250 E0.01665 F2081.445 
+G1 X103.417 Y69.853 E0.01665 F2081.445 
+G1 X103.722 Y69.457 E0.01665 F3890.040 
+G1 X104.026 Y69.060 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X105.298 Y67.401 E0.06961 
+G1 X105.602 Y67.004 E0.01665 F5089.940 
+G1 X105.907 Y66.608 E0.01665 F3886.835 
+G1 X106.211 Y66.211 E0.01665 F2075.449 
+G1 X106.608 Y65.907 E0.01665 F2075.449 
+G1 X107.004 Y65.602 E0.01665 F3886.835 
+G1 X107.401 Y65.298 E0.01665 F5089.940 
+G1 F6000.0 ; restore
+G1 X109.060 Y64.026 E0.06961 
+G1 X109.457 Y63.722 E0.01665 F5092.388 
+G1 X109.853 Y63.417 E0.01665 F3890.040 
+G1 X110.250 Y63.113 E0.01665 F2081.445 
+G1 X110.712 Y62.922 E0.01665 F2081.445 
+G1 X111.174 Y62.730 E0.01665 F3890.040 
+G1 X111.636 Y62.539 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X113.105 Y61.930 E0.05297 
+G1 X113.567 Y61.738 E0.01665 F5703.787 
+G1 X114.029 Y61.547 E0.01665 F4661.886 
+G1 X114.491 Y61.355 E0.01665 F3306.536 
+G1 X114.953 Y61.164 E0.01665 F364.942 
+G1 X115.242 Y61.572 E0.01665 F364.942 
+G1 X115.530 Y61.980 E0.01665 F3306.536 
+G1 X115.819 Y62.389 E0.01665 F4661.886 
+G1 X116.108 Y62.797 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X118.845 Y66.667 E0.15785 
+G1 X119.134 Y67.075 E0.01665 F5696.573 
+G1 X119.423 Y67.484 E0.01665 F4653.057 
+G1 X119.711 Y67.892 E0.01665 F3294.077 
+G1 X120.000 Y68.300 E0.01665 F225.703 
+G1 X120.289 Y67.892 E0.01665 F225.703 
+G1 X120.577 Y67.484 E0.01665 F3294.077 
+G1 X120.866 Y67.075 E0.01665 F4653.057 
+G1 X121.155 Y66.667 E0.01665 F5696.573 
+G1 F6000.0 ; restore
+G1 X123.892 Y62.797 E0.15785 
+G1 X124.181 Y62.389 E0.01665 F5703.787 
+G1 X124.470 Y61.980 E0.01665 F4661.886 
+G1 X124.758 Y61.572 E0.01665 F3306.536 
+G1 X125.047 Y61.164 E0.01665 F364.942 
+G1 X125.509 Y61.355 E0.01665 F364.942 
+G1 X125.971 Y61.547 E0.01665 F3306.536 
+G1 X126.433 Y61.738 E0.01665 F4661.886 
+G1 X126.895 Y61.930 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X128.364 Y62.539 E0.05297 
+G1 X128.826 Y62.730 E0.01665 F5092.388 
+G1 X129.288 Y62.922 E0.01665 F3890.040 
+G1 X129.750 Y63.113 E0.01665 F2081.445 
+G1 X130.147 Y63.417 E0.01665 F2081.445 
+G1 X130.543 Y63.722 E0.01665 F3890.040 
+G1 X130.940 Y64.026 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X132.599 Y65.298 E0.06961 
+G1 X132.996 Y65.602 E0.01665 F5089.940 
+G1 X133.392 Y65.907 E0.01665 F3886.835 
+G1 X133.789 Y66.211 E0.01665 F2075.449 
+G1 X134.093 Y66.608 E0.01665 F2075.449 
+G1 X134.398 Y67.004 E0.01665 F3886.835 
+G1 X134.702 Y67.401 E0.01665 F5089.940 
+G1 F6000.0 ; restore
+G1 X135.974 Y69.060 E0.06961 
+G1 X136.278 Y69.457 E0.01665 F5092.388 
+G1 X136.583 Y69.853 E0.01665 F3890.040 
+G1 X136.887 Y70.250 E0.01665 F2081.445 
+G1 X137.078 Y70.712 E0.01665 F2081.445 
+G1 X137.270 Y71.174 E0.01665 F3890.040 
+G1 X137.461 Y71.636 E0.01665 F5092.388 
+G1 F6000.0 ; restore
+G1 X138.070 Y73.105 E0.05297 
+G1 X138.262 Y73.567 E0.01665 F5703.787 
+G1 X138.453 Y74.029 E0.01665 F4661.886 
+G1 X138.645 Y74.491 E0.01665 F3306.536 
+G1 X138.836 Y74.953 E0.01665 F364.942 
+G1 X138.428 Y75.242 E0.01665 F364.942 
+G1 X138.020 Y75.530 E0.01665 F3306.536 
+G1 X137.611 Y75.819 E0.01665 F4661.886 
+G1 X137.203 Y76.108 E0.01665 F5703.787 
+G1 F6000.0 ; restore
+G1 X133.333 Y78.845 E0.15785 
+G1 X132.925 Y79.134 E0.01665 F5713.219 
+G1 X132.516 Y79.423 E0.01665 F4673.422 
+G1 X132.108 Y79.711 E0.01665 F3322.780 
+G1 X131.700 Y80.000 E0.01665 F490.784 
+G1 E-0.80000 F490.784 
+;TYPE:Sparse infill
+;WIDTH:0.45
+G1 X131.246 Y79.791 F490.784 
+G1 F2100.0 ; restore
+G1 X110.454 Y70.209 F12000.000 
+G1 X110.000 Y70.000 F208.858 
+G1 E0.80000 F208.858 
+G1 F208.858 
+G1 X110.000 Y70.000 E0.66600 F208.858 
+G1 X110.000 Y70.500 E0.01665 F208.858 
+G1 X110.000 Y70.700 E0.00666 F3292.966 
+G1 X110.000 Y71.000 E0.00999 F3292.966 
+G1 X110.000 Y71.200 E0.00666 F3300.000 
+G1 X110.000 Y71.500 E0.00999 F300.000 
+G1 Y71.700 E0.00666 F300.000 
+G1 X110.300 Y71.700 E0.00999 F300.000 
+G1 X110.500 Y71.700 E0.00666 F300.000 
+G1 X110.800 Y71.700 E0.00999 F3300.000 
+G1 X111.000 Y71.700 E0.00666 F3300.000 
+G1 X111.300 Y71.700 E0.00999 F4657.252 
+G1 X111.500 Y71.700 E0.00666 F4657.252 
+G1 X111.800 Y71.700 E0.00999 F5700.000 
+G1 X112.000 Y71.700 E0.00666 F5700.000 
+G1 X112.300 Y71.700 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X112.500 Y71.700 E0.00666 F6579.514 
+G1 X113.000 Y71.700 E0.01665 F7354.590 
+G1 X113.500 Y71.700 E0.01665 F8055.433 
+G1 X114.000 Y71.700 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X126.000 Y71.700 E0.39960 
+G1 X126.500 Y71.700 E0.01665 F8700.000 
+G1 X127.000 Y71.700 E0.01665 F8055.433 
+G1 X127.500 Y71.700 E0.01665 F7354.590 
+G1 X128.000 Y71.700 E0.01665 F6579.514 
+G1 X128.500 Y71.700 E0.01665 F5700.000 
+G1 X129.000 Y71.700 E0.01665 F4657.252 
+G1 X129.500 Y71.700 E0.01665 F3300.000 
+G1 X130.000 Y71.700 E0.01665 F300.000 
+G1 X130.000 Y72.200 E0.01665 F300.000 
+G1 X130.000 Y72.400 E0.00666 F3300.000 
+G1 X130.000 Y72.700 E0.00999 F3300.000 
+G1 X130.000 Y72.900 E0.00666 F3300.000 
+G1 X130.000 Y73.200 E0.00999 F300.000 
+G1 Y73.400 E0.00666 F300.000 
+G1 X129.700 Y73.400 E0.00999 F300.000 
+G1 X129.500 Y73.400 E0.00666 F300.000 
+G1 X129.200 Y73.400 E0.00999 F3300.000 
+G1 X129.000 Y73.400 E0.00666 F3300.000 
+G1 X128.700 Y73.400 E0.00999 F4657.252 
+G1 X128.500 Y73.400 E0.00666 F4657.252 
+G1 X128.200 Y73.400 E0.00999 F5700.000 
+G1 X128.000 Y73.400 E0.00666 F5700.000 
+G1 X127.700 Y73.400 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X127.500 Y73.400 E0.00666 F6579.514 
+G1 X127.000 Y73.400 E0.01665 F7354.590 
+G1 X126.500 Y73.400 E0.01665 F8055.433 
+G1 X126.000 Y73.400 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X114.000 Y73.400 E0.39960 
+G1 X113.500 Y73.400 E0.01665 F8700.000 
+G1 X113.000 Y73.400 E0.01665 F8055.433 
+G1 X112.500 Y73.400 E0.01665 F7354.590 
+G1 X112.000 Y73.400 E0.01665 F6579.514 
+G1 X111.500 Y73.400 E0.01665 F5700.000 
+G1 X111.000 Y73.400 E0.01665 F4657.252 
+G1 X110.500 Y73.400 E0.01665 F3300.000 
+G1 X110.000 Y73.400 E0.01665 F300.000 
+G1 X110.000 Y73.900 E0.01665 F300.000 
+G1 X110.000 Y74.100 E0.00666 F3300.000 
+G1 X110.000 Y74.400 E0.00999 F3300.000 
+G1 X110.000 Y74.600 E0.00666 F3300.000 
+G1 X110.000 Y74.900 E0.00999 F300.000 
+G1 Y75.100 E0.00666 F300.000 
+G1 X110.300 Y75.100 E0.00999 F300.000 
+G1 X110.500 Y75.100 E0.00666 F300.000 
+G1 X110.800 Y75.100 E0.00999 F3300.000 
+G1 X111.000 Y75.100 E0.00666 F3300.000 
+G1 X111.300 Y75.100 E0.00999 F4657.252 
+G1 X111.500 Y75.100 E0.00666 F4657.252 
+G1 X111.800 Y75.100 E0.00999 F5700.000 
+G1 X112.000 Y75.100 E0.00666 F5700.000 
+G1 X112.300 Y75.100 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X112.500 Y75.100 E0.00666 F6579.514 
+G1 X113.000 Y75.100 E0.01665 F7354.590 
+G1 X113.500 Y75.100 E0.01665 F8055.433 
+G1 X114.000 Y75.100 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X126.000 Y75.100 E0.39960 
+G1 X126.500 Y75.100 E0.01665 F8700.000 
+G1 X127.000 Y75.100 E0.01665 F8055.433 
+G1 X127.500 Y75.100 E0.01665 F7354.590 
+G1 X128.000 Y75.100 E0.01665 F6579.514 
+G1 X128.500 Y75.100 E0.01665 F5700.000 
+G1 X129.000 Y75.100 E0.01665 F4657.252 
+G1 X129.500 Y75.100 E0.01665 F3300.000 
+G1 X130.000 Y75.100 E0.01665 F300.000 
+G1 X130.000 Y75.600 E0.01665 F300.000 
+G1 X130.000 Y75.800 E0.00666 F3300.000 
+G1 X130.000 Y76.100 E0.00999 F3300.000 
+G1 X130.000 Y76.300 E0.00666 F3300.000 
+G1 X130.000 Y76.600 E0.00999 F300.000 
+G1 Y76.800 E0.00666 F300.000 
+G1 X129.700 Y76.800 E0.00999 F300.000 
+G1 X129.500 Y76.800 E0.00666 F300.000 
+G1 X129.200 Y76.800 E0.00999 F3300.000 
+G1 X129.000 Y76.800 E0.00666 F3300.000 
+G1 X128.700 Y76.800 E0.00999 F4657.252 
+G1 X128.500 Y76.800 E0.00666 F4657.252 
+G1 X128.200 Y76.800 E0.00999 F5700.000 
+G1 X128.000 Y76.800 E0.00666 F5700.000 
+G1 X127.700 Y76.800 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X127.500 Y76.800 E0.00666 F6579.514 
+G1 X127.000 Y76.800 E0.01665 F7354.590 
+G1 X126.500 Y76.800 E0.01665 F8055.433 
+G1 X126.000 Y76.800 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X114.000 Y76.800 E0.39960 
+G1 X113.500 Y76.800 E0.01665 F8700.000 
+G1 X113.000 Y76.800 E0.01665 F8055.433 
+G1 X112.500 Y76.800 E0.01665 F7354.590 
+G1 X112.000 Y76.800 E0.01665 F6579.514 
+G1 X111.500 Y76.800 E0.01665 F5700.000 
+G1 X111.000 Y76.800 E0.01665 F4657.252 
+G1 X110.500 Y76.800 E0.01665 F3300.000 
+G1 X110.000 Y76.800 E0.01665 F300.000 
+G1 X110.000 Y77.300 E0.01665 F300.000 
+G1 X110.000 Y77.500 E0.00666 F3300.000 
+G1 X110.000 Y77.800 E0.00999 F3300.000 
+G1 X110.000 Y78.000 E0.00666 F3300.000 
+G1 X110.000 Y78.300 E0.00999 F300.000 
+G1 Y78.500 E0.00666 F300.000 
+G1 X110.300 Y78.500 E0.00999 F300.000 
+G1 X110.500 Y78.500 E0.00666 F300.000 
+G1 X110.800 Y78.500 E0.00999 F3300.000 
+G1 X111.000 Y78.500 E0.00666 F3300.000 
+G1 X111.300 Y78.500 E0.00999 F4657.252 
+G1 X111.500 Y78.500 E0.00666 F4657.252 
+G1 X111.800 Y78.500 E0.00999 F5700.000 
+G1 X112.000 Y78.500 E0.00666 F5700.000 
+G1 X112.300 Y78.500 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X112.500 Y78.500 E0.00666 F6579.514 
+G1 X113.000 Y78.500 E0.01665 F7354.590 
+G1 X113.500 Y78.500 E0.01665 F8055.433 
+G1 X114.000 Y78.500 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X126.000 Y78.500 E0.39960 
+G1 X126.500 Y78.500 E0.01665 F8700.000 
+G1 X127.000 Y78.500 E0.01665 F8055.433 
+G1 X127.500 Y78.500 E0.01665 F7354.590 
+G1 X128.000 Y78.500 E0.01665 F6579.514 
+G1 X128.500 Y78.500 E0.01665 F5700.000 
+G1 X129.000 Y78.500 E0.01665 F4657.252 
+G1 X129.500 Y78.500 E0.01665 F3300.000 
+G1 X130.000 Y78.500 E0.01665 F300.000 
+G1 X130.000 Y79.000 E0.01665 F300.000 
+G1 X130.000 Y79.200 E0.00666 F3300.000 
+G1 X130.000 Y79.500 E0.00999 F3300.000 
+G1 X130.000 Y79.700 E0.00666 F3300.000 
+G1 X130.000 Y80.000 E0.00999 F300.000 
+G1 Y80.200 E0.00666 F300.000 
+G1 X129.700 Y80.200 E0.00999 F300.000 
+G1 X129.500 Y80.200 E0.00666 F300.000 
+G1 X129.200 Y80.200 E0.00999 F3300.000 
+G1 X129.000 Y80.200 E0.00666 F3300.000 
+G1 X128.700 Y80.200 E0.00999 F4657.252 
+G1 X128.500 Y80.200 E0.00666 F4657.252 
+G1 X128.200 Y80.200 E0.00999 F5700.000 
+G1 X128.000 Y80.200 E0.00666 F5700.000 
+G1 X127.700 Y80.200 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X127.500 Y80.200 E0.00666 F6579.514 
+G1 X127.000 Y80.200 E0.01665 F7354.590 
+G1 X126.500 Y80.200 E0.01665 F8055.433 
+G1 X126.000 Y80.200 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X114.000 Y80.200 E0.39960 
+G1 X113.500 Y80.200 E0.01665 F8700.000 
+G1 X113.000 Y80.200 E0.01665 F8055.433 
+G1 X112.500 Y80.200 E0.01665 F7354.590 
+G1 X112.000 Y80.200 E0.01665 F6579.514 
+G1 X111.500 Y80.200 E0.01665 F5700.000 
+G1 X111.000 Y80.200 E0.01665 F4657.252 
+G1 X110.500 Y80.200 E0.01665 F3300.000 
+G1 X110.000 Y80.200 E0.01665 F300.000 
+G1 X110.000 Y80.700 E0.01665 F300.000 
+G1 X110.000 Y80.900 E0.00666 F3300.000 
+G1 X110.000 Y81.200 E0.00999 F3300.000 
+G1 X110.000 Y81.400 E0.00666 F3300.000 
+G1 X110.000 Y81.700 E0.00999 F300.000 
+G1 Y81.900 E0.00666 F300.000 
+G1 X110.300 Y81.900 E0.00999 F300.000 
+G1 X110.500 Y81.900 E0.00666 F300.000 
+G1 X110.800 Y81.900 E0.00999 F3300.000 
+G1 X111.000 Y81.900 E0.00666 F3300.000 
+G1 X111.300 Y81.900 E0.00999 F4657.252 
+G1 X111.500 Y81.900 E0.00666 F4657.252 
+G1 X111.800 Y81.900 E0.00999 F5700.000 
+G1 X112.000 Y81.900 E0.00666 F5700.000 
+G1 X112.300 Y81.900 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X112.500 Y81.900 E0.00666 F6579.514 
+G1 X113.000 Y81.900 E0.01665 F7354.590 
+G1 X113.500 Y81.900 E0.01665 F8055.433 
+G1 X114.000 Y81.900 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X126.000 Y81.900 E0.39960 
+G1 X126.500 Y81.900 E0.01665 F8700.000 
+G1 X127.000 Y81.900 E0.01665 F8055.433 
+G1 X127.500 Y81.900 E0.01665 F7354.590 
+G1 X128.000 Y81.900 E0.01665 F6579.514 
+G1 X128.500 Y81.900 E0.01665 F5700.000 
+G1 X129.000 Y81.900 E0.01665 F4657.252 
+G1 X129.500 Y81.900 E0.01665 F3300.000 
+G1 X130.000 Y81.900 E0.01665 F300.000 
+G1 X130.000 Y82.400 E0.01665 F300.000 
+G1 X130.000 Y82.600 E0.00666 F3300.000 
+G1 X130.000 Y82.900 E0.00999 F3300.000 
+G1 X130.000 Y83.100 E0.00666 F3300.000 
+G1 X130.000 Y83.400 E0.00999 F300.000 
+G1 Y83.600 E0.00666 F300.000 
+G1 X129.700 Y83.600 E0.00999 F300.000 
+G1 X129.500 Y83.600 E0.00666 F300.000 
+G1 X129.200 Y83.600 E0.00999 F3300.000 
+G1 X129.000 Y83.600 E0.00666 F3300.000 
+G1 X128.700 Y83.600 E0.00999 F4657.252 
+G1 X128.500 Y83.600 E0.00666 F4657.252 
+G1 X128.200 Y83.600 E0.00999 F5700.000 
+G1 X128.000 Y83.600 E0.00666 F5700.000 
+G1 X127.700 Y83.600 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X127.500 Y83.600 E0.00666 F6579.514 
+G1 X127.000 Y83.600 E0.01665 F7354.590 
+G1 X126.500 Y83.600 E0.01665 F8055.433 
+G1 X126.000 Y83.600 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X114.000 Y83.600 E0.39960 
+G1 X113.500 Y83.600 E0.01665 F8700.000 
+G1 X113.000 Y83.600 E0.01665 F8055.433 
+G1 X112.500 Y83.600 E0.01665 F7354.590 
+G1 X112.000 Y83.600 E0.01665 F6579.514 
+G1 X111.500 Y83.600 E0.01665 F5700.000 
+G1 X111.000 Y83.600 E0.01665 F4657.252 
+G1 X110.500 Y83.600 E0.01665 F3300.000 
+G1 X110.000 Y83.600 E0.01665 F300.000 
+G1 X110.000 Y84.100 E0.01665 F300.000 
+G1 X110.000 Y84.300 E0.00666 F3300.000 
+G1 X110.000 Y84.600 E0.00999 F3300.000 
+G1 X110.000 Y84.800 E0.00666 F3300.000 
+G1 X110.000 Y85.100 E0.00999 F300.000 
+G1 Y85.300 E0.00666 F300.000 
+G1 X110.300 Y85.300 E0.00999 F300.000 
+G1 X110.500 Y85.300 E0.00666 F300.000 
+G1 X110.800 Y85.300 E0.00999 F3300.000 
+G1 X111.000 Y85.300 E0.00666 F3300.000 
+G1 X111.300 Y85.300 E0.00999 F4657.252 
+G1 X111.500 Y85.300 E0.00666 F4657.252 
+G1 X111.800 Y85.300 E0.00999 F5700.000 
+G1 X112.000 Y85.300 E0.00666 F5700.000 
+G1 X112.300 Y85.300 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X112.500 Y85.300 E0.00666 F6579.514 
+G1 X113.000 Y85.300 E0.01665 F7354.590 
+G1 X113.500 Y85.300 E0.01665 F8055.433 
+G1 X114.000 Y85.300 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X126.000 Y85.300 E0.39960 
+G1 X126.500 Y85.300 E0.01665 F8700.000 
+G1 X127.000 Y85.300 E0.01665 F8055.433 
+G1 X127.500 Y85.300 E0.01665 F7354.590 
+G1 X128.000 Y85.300 E0.01665 F6579.514 
+G1 X128.500 Y85.300 E0.01665 F5700.000 
+G1 X129.000 Y85.300 E0.01665 F4657.252 
+G1 X129.500 Y85.300 E0.01665 F3300.000 
+G1 X130.000 Y85.300 E0.01665 F300.000 
+G1 X130.000 Y85.800 E0.01665 F300.000 
+G1 X130.000 Y86.000 E0.00666 F3300.000 
+G1 X130.000 Y86.300 E0.00999 F3300.000 
+G1 X130.000 Y86.500 E0.00666 F3300.000 
+G1 X130.000 Y86.800 E0.00999 F300.000 
+G1 Y87.000 E0.00666 F300.000 
+G1 X129.700 Y87.000 E0.00999 F300.000 
+G1 X129.500 Y87.000 E0.00666 F300.000 
+G1 X129.200 Y87.000 E0.00999 F3300.000 
+G1 X129.000 Y87.000 E0.00666 F3300.000 
+G1 X128.700 Y87.000 E0.00999 F4657.252 
+G1 X128.500 Y87.000 E0.00666 F4657.252 
+G1 X128.200 Y87.000 E0.00999 F5700.000 
+G1 X128.000 Y87.000 E0.00666 F5700.000 
+G1 X127.700 Y87.000 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X127.500 Y87.000 E0.00666 F6579.514 
+G1 X127.000 Y87.000 E0.01665 F7354.590 
+G1 X126.500 Y87.000 E0.01665 F8055.433 
+G1 X126.000 Y87.000 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X114.000 Y87.000 E0.39960 
+G1 X113.500 Y87.000 E0.01665 F8700.000 
+G1 X113.000 Y87.000 E0.01665 F8055.433 
+G1 X112.500 Y87.000 E0.01665 F7354.590 
+G1 X112.000 Y87.000 E0.01665 F6579.514 
+G1 X111.500 Y87.000 E0.01665 F5700.000 
+G1 X111.000 Y87.000 E0.01665 F4657.252 
+G1 X110.500 Y87.000 E0.01665 F3300.000 
+G1 X110.000 Y87.000 E0.01665 F300.000 
+G1 X110.000 Y87.500 E0.01665 F300.000 
+G1 X110.000 Y87.700 E0.00666 F3300.000 
+G1 X110.000 Y88.000 E0.00999 F3300.000 
+G1 X110.000 Y88.200 E0.00666 F3300.000 
+G1 X110.000 Y88.500 E0.00999 F300.000 
+G1 Y88.700 E0.00666 F300.000 
+G1 X110.300 Y88.700 E0.00999 F300.000 
+G1 X110.500 Y88.700 E0.00666 F300.000 
+G1 X110.800 Y88.700 E0.00999 F3300.000 
+G1 X111.000 Y88.700 E0.00666 F3300.000 
+G1 X111.300 Y88.700 E0.00999 F4657.252 
+G1 X111.500 Y88.700 E0.00666 F4657.252 
+G1 X111.800 Y88.700 E0.00999 F5700.000 
+G1 X112.000 Y88.700 E0.00666 F5700.000 
+G1 X112.300 Y88.700 E0.00999 F6579.514 
+G1 F6579.514 ; restore
+G1 X112.500 Y88.700 E0.00666 F6579.514 
+G1 X113.000 Y88.700 E0.01665 F7354.590 
+G1 X113.500 Y88.700 E0.01665 F8055.433 
+G1 X114.000 Y88.700 E0.01665 F8700.000 
+G1 F9000.0 ; restore
+G1 X126.000 Y88.700 E0.39960 
+G1 X126.500 Y88.700 E0.01665 F8700.000 
+G1 X127.000 Y88.700 E0.01665 F8055.433 
+G1 X127.500 Y88.700 E0.01665 F7354.590 
+G1 X128.000 Y88.700 E0.01665 F6579.514 
+G1 X128.500 Y88.700 E0.01665 F5700.000 
+G1 X129.000 Y88.700 E0.01665 F4657.252 
+G1 X129.500 Y88.700 E0.01665 F3300.000 
+G1 X130.000 Y88.700 E0.01665 F300.000 
+G1 X130.000 Y88.900 E0.00666 F300.000 
+G1 X130.000 Y89.200 E0.00999 F300.000 
+G1 X130.000 Y89.400 E0.00666 F3300.000 
+G1 X130.000 Y89.700 E0.00999 F3291.378 
+G1 X130.000 Y89.900 E0.00666 F3291.378 
+G1 X130.000 Y90.200 E0.00999 F182.129 
+G1 Y90.400 E0.00666 F182.129 
+; some comment
+
+G1 E-0.80000 F182.129 
+;TYPE:Gap infill
+G1 X129.751 Y90.233 F182.129 
+G1 F182.129 ; restore
+G1 X129.585 Y90.122 F182.129 
+G1 F2100.0 ; restore
+G1 X10.415 Y10.278 F12000.000 
+G1 X10.000 Y10.000 F104.596 
+G1 X10.496 Y10.066 E0.00330 F104.596 
+G1 F2100.0 ; restore
+G1 X11.500 Y10.200 E0.00670 F3000.000 
+M107
+; EXECUTABLE_BLOCK_END
\ No newline at end of file
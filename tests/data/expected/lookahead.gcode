@@ -0,0 +1,2110 @@
+; HEADER_BLOCK_START
+; generated by synthetic
+; HEADER_BLOCK_END
+
+M104 S210 ; set temp
+G28
+G90
+M83
+G1 F1200
+;LAYER_CHANGE
+;Z:0.2
+;HEIGHT:0.2
+G1 E-.8 F2100
+G1 Z0.200 F720
+;TYPE:Outer wall
+;WIDTH:0.45
+G1 X62.000 Y50.000 F12000
+G1 E.8 F2100
+G1 F3000
+G1 X62.340 Y50.241 E0.01387 F2121.320 
+G1 X68.984 Y54.939 E0.27097 F3000.000 
+G1 X69.319 Y55.176 E0.01367 F2136.963 
+G1 X69.162 Y55.555 E0.01367 
+G1 X67.404 Y59.800 E0.15297 F3000.000 
+G1 X67.321 Y60.000 E0.00722 F2580.269 
+G1 X67.189 Y60.172 E0.00722 
+G1 X64.274 Y63.970 E0.15944 F3000.000 
+G1 X64.142 Y64.142 E0.00720 F2581.438 
+G1 X63.970 Y64.274 E0.00720 
+G1 X60.172 Y67.189 E0.15944 F3000.000 
+G1 X60.000 Y67.321 E0.00722 F2580.269 
+G1 X59.800 Y67.404 E0.00722 
+G1 X55.555 Y69.162 E0.15297 F3000.000 
+G1 X55.176 Y69.319 E0.01367 F2136.963 
+G1 X54.939 Y68.984 E0.01367 
+G1 X50.239 Y62.338 E0.27104 F3000.000 
+G1 X50.000 Y62.000 E0.01380 F2127.315 
+G1 X49.761 Y62.338 E0.01380 
+G1 X45.061 Y68.984 E0.27104 F3000.000 
+G1 X44.824 Y69.319 E0.01367 F2136.963 
+G1 X44.445 Y69.162 E0.01367 
+G1 X40.200 Y67.404 E0.15297 F3000.000 
+G1 X40.000 Y67.321 E0.00722 F2580.269 
+G1 X39.828 Y67.189 E0.00722 
+G1 X36.030 Y64.274 E0.15944 F3000.000 
+G1 X35.858 Y64.142 E0.00720 F2581.438 
+G1 X35.726 Y63.970 E0.00720 
+G1 X32.811 Y60.172 E0.15944 F3000.000 
+G1 X32.679 Y60.000 E0.00722 F2580.269 
+G1 X32.596 Y59.800 E0.00722 
+G1 X30.838 Y55.555 E0.15297 F3000.000 
+G1 X30.681 Y55.176 E0.01367 F2136.963 
+G1 X31.016 Y54.939 E0.01367 
+G1 X37.662 Y50.239 E0.27104 F3000.000 
+G1 X38.000 Y50.000 E0.01380 F2127.315 
+G1 X37.662 Y49.761 E0.01380 
+G1 X31.016 Y45.061 E0.27104 F3000.000 
+G1 X30.681 Y44.824 E0.01367 F2136.963 
+G1 X30.838 Y44.445 E0.01367 
+G1 X32.596 Y40.200 E0.15297 F3000.000 
+G1 X32.679 Y40.000 E0.00722 F2580.269 
+G1 X32.811 Y39.828 E0.00722 
+G1 X35.726 Y36.030 E0.15944 F3000.000 
+G1 X35.858 Y35.858 E0.00720 F2581.438 
+G1 X36.030 Y35.726 E0.00720 
+G1 X39.828 Y32.811 E0.15944 F3000.000 
+G1 X40.000 Y32.679 E0.00722 F2580.269 
+G1 X40.200 Y32.596 E0.00722 
+G1 X44.445 Y30.838 E0.15297 F3000.000 
+G1 X44.824 Y30.681 E0.01367 F2136.963 
+G1 X45.061 Y31.016 E0.01367 
+G1 X49.761 Y37.662 E0.27104 F3000.000 
+G1 X50.000 Y38.000 E0.01380 F2127.315 
+G1 X50.239 Y37.662 E0.01380 
+G1 X54.939 Y31.016 E0.27104 F3000.000 
+G1 X55.176 Y30.681 E0.01367 F2136.963 
+G1 X55.555 Y30.838 E0.01367 
+G1 X59.800 Y32.596 E0.15297 F3000.000 
+G1 X60.000 Y32.679 E0.00722 F2580.269 
+G1 X60.172 Y32.811 E0.00722 
+G1 X63.970 Y35.726 E0.15944 F3000.000 
+G1 X64.142 Y35.858 E0.00720 F2581.438 
+G1 X64.274 Y36.030 E0.00720 
+G1 X67.189 Y39.828 E0.15944 F3000.000 
+G1 X67.321 Y40.000 E0.00722 F2580.269 
+G1 X67.404 Y40.200 E0.00722 
+G1 X69.162 Y44.445 E0.15297 F3000.000 
+G1 X69.319 Y44.824 E0.01367 F2136.963 
+G1 X68.984 Y45.061 E0.01367 
+G1 X62.340 Y49.759 E0.27097 F3000.000 
+G1 X62.000 Y50.000 E0.01387 F2121.320 
+G1 E-.8 F2100
+;TYPE:Inner wall
+;WIDTH:0.45
+G1 X61.700 Y50.000 F12000
+G1 E.8 F2100
+G1 F6000
+G1 X62.108 Y50.289 E0.01665 F2327.274 
+G1 X62.516 Y50.577 E0.01665 F4026.935 
+G1 X62.925 Y50.866 E0.01665 F5197.711 
+G1 X63.060 Y50.962 E0.00552 F5848.769 
+G1 X67.480 Y54.088 E0.18028 F6000.000 
+G1 X67.611 Y54.181 E0.00534 F5853.767 
+G1 X68.020 Y54.470 E0.01665 F5208.952 
+G1 X68.428 Y54.758 E0.01665 F4041.433 
+G1 X68.836 Y55.047 E0.01665 F2352.272 
+G1 X68.645 Y55.509 E0.01665 
+G1 X68.453 Y55.971 E0.01665 F4041.433 
+G1 X68.262 Y56.433 E0.01665 F5208.952 
+G1 X68.200 Y56.581 E0.00534 F5853.767 
+G1 X67.448 Y58.396 E0.06540 F6000.000 
+G1 X67.270 Y58.826 E0.01552 F5564.729 
+G1 X67.078 Y59.288 E0.01665 F4531.271 
+G1 X66.887 Y59.750 E0.01665 F3119.682 
+G1 X66.583 Y60.147 E0.01665 
+G1 X66.278 Y60.543 E0.01665 F4531.271 
+G1 X65.995 Y60.913 E0.01552 F5564.729 
+G1 X64.682 Y62.625 E0.07183 F6000.000 
+G1 X64.398 Y62.996 E0.01556 F5563.609 
+G1 X64.093 Y63.392 E0.01665 F4528.520 
+G1 X63.789 Y63.789 E0.01665 F3115.684 
+G1 X63.392 Y64.093 E0.01665 
+G1 X62.996 Y64.398 E0.01665 F4528.520 
+G1 X62.625 Y64.682 E0.01556 F5563.609 
+G1 X60.913 Y65.995 E0.07183 F6000.000 
+G1 X60.543 Y66.278 E0.01552 F5564.729 
+G1 X60.147 Y66.583 E0.01665 F4531.271 
+G1 X59.750 Y66.887 E0.01665 F3119.682 
+G1 X59.288 Y67.078 E0.01665 
+G1 X58.826 Y67.270 E0.01665 F4531.271 
+G1 X58.396 Y67.448 E0.01552 F5564.729 
+G1 X56.581 Y68.200 E0.06540 F6000.000 
+G1 X56.433 Y68.262 E0.00534 F5853.767 
+G1 X55.971 Y68.453 E0.01665 F5208.952 
+G1 X55.509 Y68.645 E0.01665 F4041.433 
+G1 X55.047 Y68.836 E0.01665 F2352.272 
+G1 X54.758 Y68.428 E0.01665 
+G1 X54.470 Y68.020 E0.01665 F4041.433 
+G1 X54.181 Y67.611 E0.01665 F5208.952 
+G1 X54.088 Y67.480 E0.00534 F5853.767 
+G1 X50.961 Y63.059 E0.18033 F6000.000 
+G1 X50.866 Y62.925 E0.00547 F5850.254 
+G1 X50.577 Y62.516 E0.01665 F5201.052 
+G1 X50.289 Y62.108 E0.01665 F4031.246 
+G1 X50.000 Y61.700 E0.01665 F2334.725 
+G1 X49.711 Y62.108 E0.01665 
+G1 X49.423 Y62.516 E0.01665 F4031.246 
+G1 X49.134 Y62.925 E0.01665 F5201.052 
+G1 X49.039 Y63.059 E0.00547 F5850.254 
+G1 X45.912 Y67.480 E0.18033 F6000.000 
+G1 X45.819 Y67.611 E0.00534 F5853.767 
+G1 X45.530 Y68.020 E0.01665 F5208.952 
+G1 X45.242 Y68.428 E0.01665 F4041.433 
+G1 X44.953 Y68.836 E0.01665 F2352.272 
+G1 X44.491 Y68.645 E0.01665 
+G1 X44.029 Y68.453 E0.01665 F4041.433 
+G1 X43.567 Y68.262 E0.01665 F5208.952 
+G1 X43.419 Y68.200 E0.00534 F5853.767 
+G1 X41.604 Y67.448 E0.06540 F6000.000 
+G1 X41.174 Y67.270 E0.01552 F5564.729 
+G1 X40.712 Y67.078 E0.01665 F4531.271 
+G1 X40.250 Y66.887 E0.01665 F3119.682 
+G1 X39.853 Y66.583 E0.01665 
+G1 X39.457 Y66.278 E0.01665 F4531.271 
+G1 X39.087 Y65.995 E0.01552 F5564.729 
+G1 X37.375 Y64.682 E0.07183 F6000.000 
+G1 X37.004 Y64.398 E0.01556 F5563.609 
+G1 X36.608 Y64.093 E0.01665 F4528.520 
+G1 X36.211 Y63.789 E0.01665 F3115.684 
+G1 X35.907 Y63.392 E0.01665 
+G1 X35.602 Y62.996 E0.01665 F4528.520 
+G1 X35.318 Y62.625 E0.01556 F5563.609 
+G1 X34.005 Y60.913 E0.07183 F6000.000 
+G1 X33.722 Y60.543 E0.01552 F5564.729 
+G1 X33.417 Y60.147 E0.01665 F4531.271 
+G1 X33.113 Y59.750 E0.01665 F3119.682 
+G1 X32.922 Y59.288 E0.01665 
+G1 X32.730 Y58.826 E0.01665 F4531.271 
+G1 X32.552 Y58.396 E0.01552 F5564.729 
+G1 X31.800 Y56.581 E0.06540 F6000.000 
+G1 X31.738 Y56.433 E0.00534 F5853.767 
+G1 X31.547 Y55.971 E0.01665 F5208.952 
+G1 X31.355 Y55.509 E0.01665 F4041.433 
+G1 X31.164 Y55.047 E0.01665 F2352.272 
+G1 X31.572 Y54.758 E0.01665 
+G1 X31.980 Y54.470 E0.01665 F4041.433 
+G1 X32.389 Y54.181 E0.01665 F5208.952 
+G1 X32.520 Y54.088 E0.00534 F5853.767 
+G1 X36.941 Y50.961 E0.18033 F6000.000 
+G1 X37.075 Y50.866 E0.00547 F5850.254 
+G1 X37.484 Y50.577 E0.01665 F5201.052 
+G1 X37.892 Y50.289 E0.01665 F4031.246 
+G1 X38.300 Y50.000 E0.01665 F2334.725 
+G1 X37.892 Y49.711 E0.01665 
+G1 X37.484 Y49.423 E0.01665 F4031.246 
+G1 X37.075 Y49.134 E0.01665 F5201.052 
+G1 X36.941 Y49.039 E0.00547 F5850.254 
+G1 X32.520 Y45.912 E0.18033 F6000.000 
+G1 X32.389 Y45.819 E0.00534 F5853.767 
+G1 X31.980 Y45.530 E0.01665 F5208.952 
+G1 X31.572 Y45.242 E0.01665 F4041.433 
+G1 X31.164 Y44.953 E0.01665 F2352.272 
+G1 X31.355 Y44.491 E0.01665 
+G1 X31.547 Y44.029 E0.01665 F4041.433 
+G1 X31.738 Y43.567 E0.01665 F5208.952 
+G1 X31.800 Y43.419 E0.00534 F5853.767 
+G1 X32.552 Y41.604 E0.06540 F6000.000 
+G1 X32.730 Y41.174 E0.01552 F5564.729 
+G1 X32.922 Y40.712 E0.01665 F4531.271 
+G1 X33.113 Y40.250 E0.01665 F3119.682 
+G1 X33.417 Y39.853 E0.01665 
+G1 X33.722 Y39.457 E0.01665 F4531.271 
+G1 X34.005 Y39.087 E0.01552 F5564.729 
+G1 X35.318 Y37.375 E0.07183 F6000.000 
+G1 X35.602 Y37.004 E0.01556 F5563.609 
+G1 X35.907 Y36.608 E0.01665 F4528.520 
+G1 X36.211 Y36.211 E0.01665 F3115.684 
+G1 X36.608 Y35.907 E0.01665 
+G1 X37.004 Y35.602 E0.01665 F4528.520 
+G1 X37.375 Y35.318 E0.01556 F5563.609 
+G1 X39.087 Y34.005 E0.07183 F6000.000 
+G1 X39.457 Y33.722 E0.01552 F5564.729 
+G1 X39.853 Y33.417 E0.01665 F4531.271 
+G1 X40.250 Y33.113 E0.01665 F3119.682 
+G1 X40.712 Y32.922 E0.01665 
+G1 X41.174 Y32.730 E0.01665 F4531.271 
+G1 X41.604 Y32.552 E0.01552 F5564.729 
+G1 X43.419 Y31.800 E0.06540 F6000.000 
+G1 X43.567 Y31.738 E0.00534 F5853.767 
+G1 X44.029 Y31.547 E0.01665 F5208.952 
+G1 X44.491 Y31.355 E0.01665 F4041.433 
+G1 X44.953 Y31.164 E0.01665 F2352.272 
+G1 X45.242 Y31.572 E0.01665 
+G1 X45.530 Y31.980 E0.01665 F4041.433 
+G1 X45.819 Y32.389 E0.01665 F5208.952 
+G1 X45.912 Y32.520 E0.00534 F5853.767 
+G1 X49.039 Y36.941 E0.18033 F6000.000 
+G1 X49.134 Y37.075 E0.00547 F5850.254 
+G1 X49.423 Y37.484 E0.01665 F5201.052 
+G1 X49.711 Y37.892 E0.01665 F4031.246 
+G1 X50.000 Y38.300 E0.01665 F2334.725 
+G1 X50.289 Y37.892 E0.01665 
+G1 X50.577 Y37.484 E0.01665 F4031.246 
+G1 X50.866 Y37.075 E0.01665 F5201.052 
+G1 X50.961 Y36.941 E0.00547 F5850.254 
+G1 X54.088 Y32.520 E0.18033 F6000.000 
+G1 X54.181 Y32.389 E0.00534 F5853.767 
+G1 X54.470 Y31.980 E0.01665 F5208.952 
+G1 X54.758 Y31.572 E0.01665 F4041.433 
+G1 X55.047 Y31.164 E0.01665 F2352.272 
+G1 X55.509 Y31.355 E0.01665 
+G1 X55.971 Y31.547 E0.01665 F4041.433 
+G1 X56.433 Y31.738 E0.01665 F5208.952 
+G1 X56.581 Y31.800 E0.00534 F5853.767 
+G1 X58.396 Y32.552 E0.06540 F6000.000 
+G1 X58.826 Y32.730 E0.01552 F5564.729 
+G1 X59.288 Y32.922 E0.01665 F4531.271 
+G1 X59.750 Y33.113 E0.01665 F3119.682 
+G1 X60.147 Y33.417 E0.01665 
+G1 X60.543 Y33.722 E0.01665 F4531.271 
+G1 X60.913 Y34.005 E0.01552 F5564.729 
+G1 X62.625 Y35.318 E0.07183 F6000.000 
+G1 X62.996 Y35.602 E0.01556 F5563.609 
+G1 X63.392 Y35.907 E0.01665 F4528.520 
+G1 X63.789 Y36.211 E0.01665 F3115.684 
+G1 X64.093 Y36.608 E0.01665 
+G1 X64.398 Y37.004 E0.01665 F4528.520 
+G1 X64.682 Y37.375 E0.01556 F5563.609 
+G1 X65.995 Y39.087 E0.07183 F6000.000 
+G1 X66.278 Y39.457 E0.01552 F5564.729 
+G1 X66.583 Y39.853 E0.01665 F4531.271 
+G1 X66.887 Y40.250 E0.01665 F3119.682 
+G1 X67.078 Y40.712 E0.01665 
+G1 X67.270 Y41.174 E0.01665 F4531.271 
+G1 X67.448 Y41.604 E0.01552 F5564.729 
+G1 X68.200 Y43.419 E0.06540 F6000.000 
+G1 X68.262 Y43.567 E0.00534 F5853.767 
+G1 X68.453 Y44.029 E0.01665 F5208.952 
+G1 X68.645 Y44.491 E0.01665 F4041.433 
+G1 X68.836 Y44.953 E0.01665 F2352.272 
+G1 X68.428 Y45.242 E0.01665 
+G1 X68.020 Y45.530 E0.01665 F4041.433 
+G1 X67.611 Y45.819 E0.01665 F5208.952 
+G1 X67.480 Y45.912 E0.00534 F5853.767 
+G1 X63.061 Y49.038 E0.18025 F6000.000 
+G1 X62.925 Y49.134 E0.00555 F5848.077 
+G1 X62.516 Y49.423 E0.01665 F5196.152 
+G1 X62.108 Y49.711 E0.01665 F4024.922 
+G1 X61.700 Y50.000 E0.01665 F2323.790 
+G1 E-.8 F2100
+;TYPE:Sparse infill
+;WIDTH:0.45
+G1 X40.000 Y40.000 F12000
+G1 E.8 F2100
+G1 F9000
+G1 X40.000 Y40.000 E0.66600
+G1 X40.000 Y40.500 E0.01665 F2333.157 
+G1 X40.000 Y40.851 E0.01169 F3825.600 
+G1 X40.000 Y41.200 E0.01162 F3828.630 
+G1 Y41.700 E0.01665 F2343.075 
+G1 X40.500 Y41.700 E0.01665 
+G1 X41.000 Y41.700 E0.01665 F4036.087 
+G1 X41.500 Y41.700 E0.01665 F5204.805 
+G1 X42.000 Y41.700 E0.01665 F6155.485 
+G1 X42.500 Y41.700 E0.01665 F6977.822 
+G1 X43.000 Y41.700 E0.01665 F7712.976 
+G1 X43.500 Y41.700 E0.01665 F8383.913 
+G1 X43.746 Y41.700 E0.00819 F8851.271 
+G1 X56.254 Y41.700 E0.41653 F9000.000 
+G1 X56.500 Y41.700 E0.00819 F8851.271 
+G1 X57.000 Y41.700 E0.01665 F8383.913 
+G1 X57.500 Y41.700 E0.01665 F7712.976 
+G1 X58.000 Y41.700 E0.01665 F6977.822 
+G1 X58.500 Y41.700 E0.01665 F6155.485 
+G1 X59.000 Y41.700 E0.01665 F5204.805 
+G1 X59.500 Y41.700 E0.01665 F4036.087 
+G1 X60.000 Y41.700 E0.01665 F2343.075 
+G1 X60.000 Y42.200 E0.01665 
+G1 X60.000 Y42.550 E0.01165 F3830.144 
+G1 X60.000 Y42.900 E0.01165 
+G1 Y43.400 E0.01665 F2343.075 
+G1 X59.500 Y43.400 E0.01665 
+G1 X59.000 Y43.400 E0.01665 F4036.087 
+G1 X58.500 Y43.400 E0.01665 F5204.805 
+G1 X58.000 Y43.400 E0.01665 F6155.485 
+G1 X57.500 Y43.400 E0.01665 F6977.822 
+G1 X57.000 Y43.400 E0.01665 F7712.976 
+G1 X56.500 Y43.400 E0.01665 F8383.913 
+G1 X56.254 Y43.400 E0.00819 F8851.271 
+G1 X43.746 Y43.400 E0.41653 F9000.000 
+G1 X43.500 Y43.400 E0.00819 F8851.271 
+G1 X43.000 Y43.400 E0.01665 F8383.913 
+G1 X42.500 Y43.400 E0.01665 F7712.976 
+G1 X42.000 Y43.400 E0.01665 F6977.822 
+G1 X41.500 Y43.400 E0.01665 F6155.485 
+G1 X41.000 Y43.400 E0.01665 F5204.805 
+G1 X40.500 Y43.400 E0.01665 F4036.087 
+G1 X40.000 Y43.400 E0.01665 F2343.075 
+G1 X40.000 Y43.900 E0.01665 
+G1 X40.000 Y44.250 E0.01166 F3830.144 
+G1 X40.000 Y44.600 E0.01166 
+G1 Y45.100 E0.01665 F2343.075 
+G1 X40.500 Y45.100 E0.01665 
+G1 X41.000 Y45.100 E0.01665 F4036.087 
+G1 X41.500 Y45.100 E0.01665 F5204.805 
+G1 X42.000 Y45.100 E0.01665 F6155.485 
+G1 X42.500 Y45.100 E0.01665 F6977.822 
+G1 X43.000 Y45.100 E0.01665 F7712.976 
+G1 X43.500 Y45.100 E0.01665 F8383.913 
+G1 X43.746 Y45.100 E0.00819 F8851.271 
+G1 X56.254 Y45.100 E0.41653 F9000.000 
+G1 X56.500 Y45.100 E0.00819 F8851.271 
+G1 X57.000 Y45.100 E0.01665 F8383.913 
+G1 X57.500 Y45.100 E0.01665 F7712.976 
+G1 X58.000 Y45.100 E0.01665 F6977.822 
+G1 X58.500 Y45.100 E0.01665 F6155.485 
+G1 X59.000 Y45.100 E0.01665 F5204.805 
+G1 X59.500 Y45.100 E0.01665 F4036.087 
+G1 X60.000 Y45.100 E0.01665 F2343.075 
+G1 X60.000 Y45.600 E0.01665 
+G1 X60.000 Y45.950 E0.01165 F3830.144 
+G1 X60.000 Y46.300 E0.01165 
+G1 Y46.800 E0.01665 F2343.075 
+G1 X59.500 Y46.800 E0.01665 
+G1 X59.000 Y46.800 E0.01665 F4036.087 
+G1 X58.500 Y46.800 E0.01665 F5204.805 
+G1 X58.000 Y46.800 E0.01665 F6155.485 
+G1 X57.500 Y46.800 E0.01665 F6977.822 
+G1 X57.000 Y46.800 E0.01665 F7712.976 
+G1 X56.500 Y46.800 E0.01665 F8383.913 
+G1 X56.254 Y46.800 E0.00819 F8851.271 
+G1 X43.746 Y46.800 E0.41653 F9000.000 
+G1 X43.500 Y46.800 E0.00819 F8851.271 
+G1 X43.000 Y46.800 E0.01665 F8383.913 
+G1 X42.500 Y46.800 E0.01665 F7712.976 
+G1 X42.000 Y46.800 E0.01665 F6977.822 
+G1 X41.500 Y46.800 E0.01665 F6155.485 
+G1 X41.000 Y46.800 E0.01665 F5204.805 
+G1 X40.500 Y46.800 E0.01665 F4036.087 
+G1 X40.000 Y46.800 E0.01665 F2343.075 
+G1 X40.000 Y47.300 E0.01665 
+G1 X40.000 Y47.650 E0.01166 F3830.144 
+G1 X40.000 Y48.000 E0.01166 
+G1 Y48.500 E0.01665 F2343.075 
+G1 X40.500 Y48.500 E0.01665 
+G1 X41.000 Y48.500 E0.01665 F4036.087 
+G1 X41.500 Y48.500 E0.01665 F5204.805 
+G1 X42.000 Y48.500 E0.01665 F6155.485 
+G1 X42.500 Y48.500 E0.01665 F6977.822 
+G1 X43.000 Y48.500 E0.01665 F7712.976 
+G1 X43.500 Y48.500 E0.01665 F8383.913 
+G1 X43.746 Y48.500 E0.00819 F8851.271 
+G1 X56.254 Y48.500 E0.41653 F9000.000 
+G1 X56.500 Y48.500 E0.00819 F8851.271 
+G1 X57.000 Y48.500 E0.01665 F8383.913 
+G1 X57.500 Y48.500 E0.01665 F7712.976 
+G1 X58.000 Y48.500 E0.01665 F6977.822 
+G1 X58.500 Y48.500 E0.01665 F6155.485 
+G1 X59.000 Y48.500 E0.01665 F5204.805 
+G1 X59.500 Y48.500 E0.01665 F4036.087 
+G1 X60.000 Y48.500 E0.01665 F2343.075 
+G1 X60.000 Y49.000 E0.01665 
+G1 X60.000 Y49.350 E0.01166 F3830.144 
+G1 X60.000 Y49.700 E0.01166 
+G1 Y50.200 E0.01665 F2343.075 
+G1 X59.500 Y50.200 E0.01665 
+G1 X59.000 Y50.200 E0.01665 F4036.087 
+G1 X58.500 Y50.200 E0.01665 F5204.805 
+G1 X58.000 Y50.200 E0.01665 F6155.485 
+G1 X57.500 Y50.200 E0.01665 F6977.822 
+G1 X57.000 Y50.200 E0.01665 F7712.976 
+G1 X56.500 Y50.200 E0.01665 F8383.913 
+G1 X56.254 Y50.200 E0.00819 F8851.271 
+G1 X43.746 Y50.200 E0.41653 F9000.000 
+G1 X43.500 Y50.200 E0.00819 F8851.271 
+G1 X43.000 Y50.200 E0.01665 F8383.913 
+G1 X42.500 Y50.200 E0.01665 F7712.976 
+G1 X42.000 Y50.200 E0.01665 F6977.822 
+G1 X41.500 Y50.200 E0.01665 F6155.485 
+G1 X41.000 Y50.200 E0.01665 F5204.805 
+G1 X40.500 Y50.200 E0.01665 F4036.087 
+G1 X40.000 Y50.200 E0.01665 F2343.075 
+G1 X40.000 Y50.700 E0.01665 
+G1 X40.000 Y51.050 E0.01165 F3830.144 
+G1 X40.000 Y51.400 E0.01165 
+G1 Y51.900 E0.01665 F2343.075 
+G1 X40.500 Y51.900 E0.01665 
+G1 X41.000 Y51.900 E0.01665 F4036.087 
+G1 X41.500 Y51.900 E0.01665 F5204.805 
+G1 X42.000 Y51.900 E0.01665 F6155.485 
+G1 X42.500 Y51.900 E0.01665 F6977.822 
+G1 X43.000 Y51.900 E0.01665 F7712.976 
+G1 X43.500 Y51.900 E0.01665 F8383.913 
+G1 X43.746 Y51.900 E0.00819 F8851.271 
+G1 X56.254 Y51.900 E0.41653 F9000.000 
+G1 X56.500 Y51.900 E0.00819 F8851.271 
+G1 X57.000 Y51.900 E0.01665 F8383.913 
+G1 X57.500 Y51.900 E0.01665 F7712.976 
+G1 X58.000 Y51.900 E0.01665 F6977.822 
+G1 X58.500 Y51.900 E0.01665 F6155.485 
+G1 X59.000 Y51.900 E0.01665 F5204.805 
+G1 X59.500 Y51.900 E0.01665 F4036.087 
+G1 X60.000 Y51.900 E0.01665 F2343.075 
+G1 X60.000 Y52.400 E0.01665 
+G1 X60.000 Y52.750 E0.01166 F3830.144 
+G1 X60.000 Y53.100 E0.01166 
+G1 Y53.600 E0.01665 F2343.075 
+G1 X59.500 Y53.600 E0.01665 
+G1 X59.000 Y53.600 E0.01665 F4036.087 
+G1 X58.500 Y53.600 E0.01665 F5204.805 
+G1 X58.000 Y53.600 E0.01665 F6155.485 
+G1 X57.500 Y53.600 E0.01665 F6977.822 
+G1 X57.000 Y53.600 E0.01665 F7712.976 
+G1 X56.500 Y53.600 E0.01665 F8383.913 
+G1 X56.254 Y53.600 E0.00819 F8851.271 
+G1 X43.746 Y53.600 E0.41653 F9000.000 
+G1 X43.500 Y53.600 E0.00819 F8851.271 
+G1 X43.000 Y53.600 E0.01665 F8383.913 
+G1 X42.500 Y53.600 E0.01665 F7712.976 
+G1 X42.000 Y53.600 E0.01665 F6977.822 
+G1 X41.500 Y53.600 E0.01665 F6155.485 
+G1 X41.000 Y53.600 E0.01665 F5204.805 
+G1 X40.500 Y53.600 E0.01665 F4036.087 
+G1 X40.000 Y53.600 E0.01665 F2343.075 
+G1 X40.000 Y54.100 E0.01665 
+G1 X40.000 Y54.450 E0.01165 F3830.144 
+G1 X40.000 Y54.800 E0.01165 
+G1 Y55.300 E0.01665 F2343.075 
+G1 X40.500 Y55.300 E0.01665 
+G1 X41.000 Y55.300 E0.01665 F4036.087 
+G1 X41.500 Y55.300 E0.01665 F5204.805 
+G1 X42.000 Y55.300 E0.01665 F6155.485 
+G1 X42.500 Y55.300 E0.01665 F6977.822 
+G1 X43.000 Y55.300 E0.01665 F7712.976 
+G1 X43.500 Y55.300 E0.01665 F8383.913 
+G1 X43.746 Y55.300 E0.00819 F8851.271 
+G1 X56.254 Y55.300 E0.41653 F9000.000 
+G1 X56.500 Y55.300 E0.00819 F8851.271 
+G1 X57.000 Y55.300 E0.01665 F8383.913 
+G1 X57.500 Y55.300 E0.01665 F7712.976 
+G1 X58.000 Y55.300 E0.01665 F6977.822 
+G1 X58.500 Y55.300 E0.01665 F6155.485 
+G1 X59.000 Y55.300 E0.01665 F5204.805 
+G1 X59.500 Y55.300 E0.01665 F4036.087 
+G1 X60.000 Y55.300 E0.01665 F2343.075 
+G1 X60.000 Y55.800 E0.01665 
+G1 X60.000 Y56.150 E0.01166 F3830.144 
+G1 X60.000 Y56.500 E0.01166 
+G1 Y57.000 E0.01665 F2343.075 
+G1 X59.500 Y57.000 E0.01665 
+G1 X59.000 Y57.000 E0.01665 F4036.087 
+G1 X58.500 Y57.000 E0.01665 F5204.805 
+G1 X58.000 Y57.000 E0.01665 F6155.485 
+G1 X57.500 Y57.000 E0.01665 F6977.822 
+G1 X57.000 Y57.000 E0.01665 F7712.976 
+G1 X56.500 Y57.000 E0.01665 F8383.913 
+G1 X56.254 Y57.000 E0.00819 F8851.271 
+G1 X43.746 Y57.000 E0.41653 F9000.000 
+G1 X43.500 Y57.000 E0.00819 F8851.271 
+G1 X43.000 Y57.000 E0.01665 F8383.913 
+G1 X42.500 Y57.000 E0.01665 F7712.976 
+G1 X42.000 Y57.000 E0.01665 F6977.822 
+G1 X41.500 Y57.000 E0.01665 F6155.485 
+G1 X41.000 Y57.000 E0.01665 F5204.805 
+G1 X40.500 Y57.000 E0.01665 F4036.087 
+G1 X40.000 Y57.000 E0.01665 F2343.075 
+G1 X40.000 Y57.500 E0.01665 
+G1 X40.000 Y57.850 E0.01166 F3830.144 
+G1 X40.000 Y58.200 E0.01166 
+G1 Y58.700 E0.01665 F2343.075 
+G1 X40.500 Y58.700 E0.01665 
+G1 X41.000 Y58.700 E0.01665 F4036.087 
+G1 X41.500 Y58.700 E0.01665 F5204.805 
+G1 X42.000 Y58.700 E0.01665 F6155.485 
+G1 X42.500 Y58.700 E0.01665 F6977.822 
+G1 X43.000 Y58.700 E0.01665 F7712.976 
+G1 X43.500 Y58.700 E0.01665 F8383.913 
+G1 X43.746 Y58.700 E0.00819 F8851.271 
+G1 X56.254 Y58.700 E0.41653 F9000.000 
+G1 X56.500 Y58.700 E0.00819 F8851.271 
+G1 X57.000 Y58.700 E0.01665 F8383.913 
+G1 X57.500 Y58.700 E0.01665 F7712.976 
+G1 X58.000 Y58.700 E0.01665 F6977.822 
+G1 X58.500 Y58.700 E0.01665 F6155.485 
+G1 X59.000 Y58.700 E0.01665 F5204.805 
+G1 X59.500 Y58.700 E0.01665 F4036.087 
+G1 X60.000 Y58.700 E0.01665 F2343.075 
+G1 X60.000 Y59.200 E0.01665 
+G1 X60.000 Y59.548 E0.01159 F3827.205 
+G1 X60.000 Y59.900 E0.01172 F3821.322 
+G1 Y60.400 E0.01665 F2323.790 
+; some comment
+
+G1 E-.8 F2100
+;TYPE:Outer wall
+;WIDTH:0.45
+G1 X132.000 Y80.000 F12000
+G1 E.8 F2100
+G1 F3000
+G1 X132.249 Y80.176 E0.01016 F2388.184 
+G1 X138.984 Y84.939 E0.27468 F3000.000 
+G1 X139.319 Y85.176 E0.01367 F2136.963 
+G1 X139.162 Y85.555 E0.01367 
+G1 X137.404 Y89.800 E0.15297 F3000.000 
+G1 X137.321 Y90.000 E0.00722 F2580.269 
+G1 X137.189 Y90.172 E0.00722 
+G1 X134.274 Y93.970 E0.15944 F3000.000 
+G1 X134.142 Y94.142 E0.00720 F2581.438 
+G1 X133.970 Y94.274 E0.00720 
+G1 X130.172 Y97.189 E0.15944 F3000.000 
+G1 X130.000 Y97.321 E0.00722 F2580.269 
+G1 X129.800 Y97.404 E0.00722 
+G1 X125.555 Y99.162 E0.15297 F3000.000 
+G1 X125.176 Y99.319 E0.01367 F2136.963 
+G1 X124.939 Y98.984 E0.01367 
+G1 X120.239 Y92.338 E0.27104 F3000.000 
+G1 X120.000 Y92.000 E0.01380 F2127.315 
+G1 X119.761 Y92.338 E0.01380 
+G1 X115.061 Y98.984 E0.27104 F3000.000 
+G1 X114.824 Y99.319 E0.01367 F2136.963 
+G1 X114.445 Y99.162 E0.01367 
+G1 X110.200 Y97.404 E0.15297 F3000.000 
+G1 X110.000 Y97.321 E0.00722 F2580.269 
+G1 X109.828 Y97.189 E0.00722 
+G1 X106.030 Y94.274 E0.15944 F3000.000 
+G1 X105.858 Y94.142 E0.00720 F2581.438 
+G1 X105.726 Y93.970 E0.00720 
+G1 X102.811 Y90.172 E0.15944 F3000.000 
+G1 X102.679 Y90.000 E0.00722 F2580.269 
+G1 X102.596 Y89.800 E0.00722 
+G1 X100.838 Y85.555 E0.15297 F3000.000 
+G1 X100.681 Y85.176 E0.01367 F2136.963 
+G1 X101.016 Y84.939 E0.01367 
+G1 X107.662 Y80.239 E0.27104 F3000.000 
+G1 X108.000 Y80.000 E0.01380 F2127.315 
+G1 X107.662 Y79.761 E0.01380 
+G1 X101.016 Y75.061 E0.27104 F3000.000 
+G1 X100.681 Y74.824 E0.01367 F2136.963 
+G1 X100.838 Y74.445 E0.01367 
+G1 X102.596 Y70.200 E0.15297 F3000.000 
+G1 X102.679 Y70.000 E0.00722 F2580.269 
+G1 X102.811 Y69.828 E0.00722 
+G1 X105.726 Y66.030 E0.15944 F3000.000 
+G1 X105.858 Y65.858 E0.00720 F2581.438 
+G1 X106.030 Y65.726 E0.00720 
+G1 X109.828 Y62.811 E0.15944 F3000.000 
+G1 X110.000 Y62.679 E0.00722 F2580.269 
+G1 X110.200 Y62.596 E0.00722 
+G1 X114.445 Y60.838 E0.15297 F3000.000 
+G1 X114.824 Y60.681 E0.01367 F2136.963 
+G1 X115.061 Y61.016 E0.01367 
+G1 X119.761 Y67.662 E0.27104 F3000.000 
+G1 X120.000 Y68.000 E0.01380 F2127.315 
+G1 X120.239 Y67.662 E0.01380 
+G1 X124.939 Y61.016 E0.27104 F3000.000 
+G1 X125.176 Y60.681 E0.01367 F2136.963 
+G1 X125.555 Y60.838 E0.01367 
+G1 X129.800 Y62.596 E0.15297 F3000.000 
+G1 X130.000 Y62.679 E0.00722 F2580.269 
+G1 X130.172 Y62.811 E0.00722 
+G1 X133.970 Y65.726 E0.15944 F3000.000 
+G1 X134.142 Y65.858 E0.00720 F2581.438 
+G1 X134.274 Y66.030 E0.00720 
+G1 X137.189 Y69.828 E0.15944 F3000.000 
+G1 X137.321 Y70.000 E0.00722 F2580.269 
+G1 X137.404 Y70.200 E0.00722 
+G1 X139.162 Y74.445 E0.15297 F3000.000 
+G1 X139.319 Y74.824 E0.01367 F2136.963 
+G1 X138.984 Y75.061 E0.01367 
+G1 X132.340 Y79.759 E0.27097 F3000.000 
+G1 X132.000 Y80.000 E0.01387 F2121.320 
+G1 E-.8 F2100
+;TYPE:Inner wall
+;WIDTH:0.45
+G1 X131.700 Y80.000 F12000
+G1 E.8 F2100
+G1 F6000
+G1 X132.108 Y80.289 E0.01665 F2327.274 
+G1 X132.516 Y80.577 E0.01665 F4026.935 
+G1 X132.925 Y80.866 E0.01665 F5197.711 
+G1 X133.060 Y80.962 E0.00552 F5848.769 
+G1 X137.480 Y84.088 E0.18028 F6000.000 
+G1 X137.611 Y84.181 E0.00534 F5853.767 
+G1 X138.020 Y84.470 E0.01665 F5208.952 
+G1 X138.428 Y84.758 E0.01665 F4041.433 
+G1 X138.836 Y85.047 E0.01665 F2352.272 
+G1 X138.645 Y85.509 E0.01665 
+G1 X138.453 Y85.971 E0.01665 F4041.433 
+G1 X138.262 Y86.433 E0.01665 F5208.952 
+G1 X138.200 Y86.581 E0.00534 F5853.767 
+G1 X137.448 Y88.396 E0.06540 F6000.000 
+G1 X137.270 Y88.826 E0.01552 F5564.729 
+G1 X137.078 Y89.288 E0.01665 F4531.271 
+G1 X136.887 Y89.750 E0.01665 F3119.682 
+G1 X136.583 Y90.147 E0.01665 
+G1 X136.278 Y90.543 E0.01665 F4531.271 
+G1 X135.995 Y90.913 E0.01552 F5564.729 
+G1 X134.682 Y92.625 E0.07183 F6000.000 
+G1 X134.398 Y92.996 E0.01556 F5563.609 
+G1 X134.093 Y93.392 E0.01665 F4528.520 
+G1 X133.789 Y93.789 E0.01665 F3115.684 
+G1 X133.392 Y94.093 E0.01665 
+G1 X132.996 Y94.398 E0.01665 F4528.520 
+G1 X132.625 Y94.682 E0.01556 F5563.609 
+G1 X130.913 Y95.995 E0.07183 F6000.000 
+G1 X130.543 Y96.278 E0.01552 F5564.729 
+G1 X130.147 Y96.583 E0.01665 F4531.271 
+G1 X129.750 Y96.887 E0.01665 F3119.682 
+G1 X129.288 Y97.078 E0.01665 
+G1 X128.826 Y97.270 E0.01665 F4531.271 
+G1 X128.396 Y97.448 E0.01552 F5564.729 
+G1 X126.581 Y98.200 E0.06540 F6000.000 
+G1 X126.433 Y98.262 E0.00534 F5853.767 
+G1 X125.971 Y98.453 E0.01665 F5208.952 
+G1 X125.509 Y98.645 E0.01665 F4041.433 
+G1 X125.047 Y98.836 E0.01665 F2352.272 
+G1 X124.758 Y98.428 E0.01665 
+G1 X124.470 Y98.020 E0.01665 F4041.433 
+G1 X124.181 Y97.611 E0.01665 F5208.952 
+G1 X124.088 Y97.480 E0.00534 F5853.767 
+G1 X120.961 Y93.059 E0.18033 F6000.000 
+G1 X120.866 Y92.925 E0.00547 F5850.254 
+G1 X120.577 Y92.516 E0.01665 F5201.052 
+G1 X120.289 Y92.108 E0.01665 F4031.246 
+G1 X120.000 Y91.700 E0.01665 F2334.725 
+G1 X119.711 Y92.108 E0.01665 
+G1 X119.423 Y92.516 E0.01665 F4031.246 
+G1 X119.134 Y92.925 E0.01665 F5201.052 
+G1 X119.039 Y93.059 E0.00547 F5850.254 
+G1 X115.912 Y97.480 E0.18033 F6000.000 
+G1 X115.819 Y97.611 E0.00534 F5853.767 
+G1 X115.530 Y98.020 E0.01665 F5208.952 
+G1 X115.242 Y98.428 E0.01665 F4041.433 
+G1 X114.953 Y98.836 E0.01665 F2352.272 
+G1 X114.491 Y98.645 E0.01665 
+G1 X114.029 Y98.453 E0.01665 F4041.433 
+G1 X113.567 Y98.262 E0.01665 F5208.952 
+G1 X113.419 Y98.200 E0.00534 F5853.767 
+G1 X111.604 Y97.448 E0.06540 F6000.000 
+G1 X111.174 Y97.270 E0.01552 F5564.729 
+G1 X110.712 Y97.078 E0.01665 F4531.271 
+G1 X110.250 Y96.887 E0.01665 F3119.682 
+G1 X109.853 Y96.583 E0.01665 
+G1 X109.457 Y96.278 E0.01665 F4531.271 
+G1 X109.087 Y95.995 E0.01552 F5564.729 
+G1 X107.375 Y94.682 E0.07183 F6000.000 
+G1 X107.004 Y94.398 E0.01556 F5563.609 
+G1 X106.608 Y94.093 E0.01665 F4528.520 
+G1 X106.211 Y93.789 E0.01665 F3115.684 
+G1 X105.907 Y93.392 E0.01665 
+G1 X105.602 Y92.996 E0.01665 F4528.520 
+G1 X105.318 Y92.625 E0.01556 F5563.609 
+G1 X104.005 Y90.913 E0.07183 F6000.000 
+G1 X103.722 Y90.543 E0.01552 F5564.729 
+G1 X103.417 Y90.147 E0.01665 F4531.271 
+G1 X103.113 Y89.750 E0.01665 F3119.682 
+G1 X102.922 Y89.288 E0.01665 
+G1 X102.730 Y88.826 E0.01665 F4531.271 
+G1 X102.552 Y88.396 E0.01552 F5564.729 
+G1 X101.800 Y86.581 E0.06540 F6000.000 
+G1 X101.738 Y86.433 E0.00534 F5853.767 
+G1 X101.547 Y85.971 E0.01665 F5208.952 
+G1 X101.355 Y85.509 E0.01665 F4041.433 
+G1 X101.164 Y85.047 E0.01665 F2352.272 
+G1 X101.572 Y84.758 E0.01665 
+G1 X101.980 Y84.470 E0.01665 F4041.433 
+G1 X102.389 Y84.181 E0.01665 F5208.952 
+G1 X102.520 Y84.088 E0.00534 F5853.767 
+G1 X106.941 Y80.961 E0.18033 F6000.000 
+G1 X107.075 Y80.866 E0.00547 F5850.254 
+G1 X107.484 Y80.577 E0.01665 F5201.052 
+G1 X107.892 Y80.289 E0.01665 F4031.246 
+G1 X108.300 Y80.000 E0.01665 F2334.725 
+G1 X107.892 Y79.711 E0.01665 
+G1 X107.484 Y79.423 E0.01665 F4031.246 
+G1 X107.075 Y79.134 E0.01665 F5201.052 
+G1 X106.941 Y79.039 E0.00547 F5850.254 
+G1 X102.520 Y75.912 E0.18033 F6000.000 
+G1 X102.389 Y75.819 E0.00534 F5853.767 
+G1 X101.980 Y75.530 E0.01665 F5208.952 
+G1 X101.572 Y75.242 E0.01665 F4041.433 
+G1 X101.164 Y74.953 E0.01665 F2352.272 
+G1 X101.355 Y74.491 E0.01665 
+G1 X101.547 Y74.029 E0.01665 F4041.433 
+G1 X101.738 Y73.567 E0.01665 F5208.952 
+G1 X101.800 Y73.419 E0.00534 F5853.767 
+G1 X102.552 Y71.604 E0.06540 F6000.000 
+G1 X102.730 Y71.174 E0.01552 F5564.729 
+G1 X102.922 Y70.712 E0.01665 F4531.271 
+G1 X103.113 Y70.250 E0.01665 F3119.682 
+G1 X103.417 Y69.853 E0.01665 
+G1 X103.722 Y69.457 E0.01665 F4531.271 
+G1 X104.005 Y69.087 E0.01552 F5564.729 
+G1 X105.318 Y67.375 E0.07183 F6000.000 
+G1 X105.602 Y67.004 E0.01556 F5563.609 
+G1 X105.907 Y66.608 E0.01665 F4528.520 
+G1 X106.211 Y66.211 E0.01665 F3115.684 
+G1 X106.608 Y65.907 E0.01665 
+G1 X107.004 Y65.602 E0.01665 F4528.520 
+G1 X107.375 Y65.318 E0.01556 F5563.609 
+G1 X109.087 Y64.005 E0.07183 F6000.000 
+G1 X109.457 Y63.722 E0.01552 F5564.729 
+G1 X109.853 Y63.417 E0.01665 F4531.271 
+G1 X110.250 Y63.113 E0.01665 F3119.682 
+G1 X110.712 Y62.922 E0.01665 
+G1 X111.174 Y62.730 E0.01665 F4531.271 
+G1 X111.604 Y62.552 E0.01552 F5564.729 
+G1 X113.419 Y61.800 E0.06540 F6000.000 
+G1 X113.567 Y61.738 E0.00534 F5853.767 
+G1 X114.029 Y61.547 E0.01665 F5208.952 
+G1 X114.491 Y61.355 E0.01665 F4041.433 
+G1 X114.953 Y61.164 E0.01665 F2352.272 
+G1 X115.242 Y61.572 E0.01665 
+G1 X115.530 Y61.980 E0.01665 F4041.433 
+G1 X115.819 Y62.389 E0.01665 F5208.952 
+G1 X115.912 Y62.520 E0.00534 F5853.767 
+G1 X119.039 Y66.941 E0.18033 F6000.000 
+G1 X119.134 Y67.075 E0.00547 F5850.254 
+G1 X119.423 Y67.484 E0.01665 F5201.052 
+G1 X119.711 Y67.892 E0.01665 F4031.246 
+G1 X120.000 Y68.300 E0.01665 F2334.725 
+G1 X120.289 Y67.892 E0.01665 
+G1 X120.577 Y67.484 E0.01665 F4031.246 
+G1 X120.866 Y67.075 E0.01665 F5201.052 
+G1 X120.961 Y66.941 E0.00547 F5850.254 
+G1 X124.088 Y62.520 E0.18033 F6000.000 
+G1 X124.181 Y62.389 E0.00534 F5853.767 
+G1 X124.470 Y61.980 E0.01665 F5208.952 
+G1 X124.758 Y61.572 E0.01665 F4041.433 
+G1 X125.047 Y61.164 E0.01665 F2352.272 
+G1 X125.509 Y61.355 E0.01665 
+G1 X125.971 Y61.547 E0.01665 F4041.433 
+G1 X126.433 Y61.738 E0.01665 F5208.952 
+G1 X126.581 Y61.800 E0.00534 F5853.767 
+G1 X128.396 Y62.552 E0.06540 F6000.000 
+G1 X128.826 Y62.730 E0.01552 F5564.729 
+G1 X129.288 Y62.922 E0.01665 F4531.271 
+G1 X129.750 Y63.113 E0.01665 F3119.682 
+G1 X130.147 Y63.417 E0.01665 
+G1 X130.543 Y63.722 E0.01665 F4531.271 
+G1 X130.913 Y64.005 E0.01552 F5564.729 
+G1 X132.625 Y65.318 E0.07183 F6000.000 
+G1 X132.996 Y65.602 E0.01556 F5563.609 
+G1 X133.392 Y65.907 E0.01665 F4528.520 
+G1 X133.789 Y66.211 E0.01665 F3115.684 
+G1 X134.093 Y66.608 E0.01665 
+G1 X134.398 Y67.004 E0.01665 F4528.520 
+G1 X134.682 Y67.375 E0.01556 F5563.609 
+G1 X135.995 Y69.087 E0.07183 F6000.000 
+G1 X136.278 Y69.457 E0.01552 F5564.729 
+G1 X136.583 Y69.853 E0.01665 F4531.271 
+G1 X136.887 Y70.250 E0.01665 F3119.682 
+G1 X137.078 Y70.712 E0.01665 
+G1 X137.270 Y71.174 E0.01665 F4531.271 
+G1 X137.448 Y71.604 E0.01552 F5564.729 
+G1 X138.200 Y73.419 E0.06540 F6000.000 
+G1 X138.262 Y73.567 E0.00534 F5853.767 
+G1 X138.453 Y74.029 E0.01665 F5208.952 
+G1 X138.645 Y74.491 E0.01665 F4041.433 
+G1 X138.836 Y74.953 E0.01665 F2352.272 
+G1 X138.428 Y75.242 E0.01665 
+G1 X138.020 Y75.530 E0.01665 F4041.433 
+G1 X137.611 Y75.819 E0.01665 F5208.952 
+G1 X137.480 Y75.912 E0.00534 F5853.767 
+G1 X133.061 Y79.038 E0.18025 F6000.000 
+G1 X132.925 Y79.134 E0.00555 F5848.077 
+G1 X132.516 Y79.423 E0.01665 F5196.152 
+G1 X132.108 Y79.711 E0.01665 F4024.922 
+G1 X131.700 Y80.000 E0.01665 F2323.790 
+G1 E-.8 F2100
+;TYPE:Sparse infill
+;WIDTH:0.45
+G1 X110.000 Y70.000 F12000
+G1 E.8 F2100
+G1 F9000
+G1 X110.000 Y70.000 E0.66600
+G1 X110.000 Y70.500 E0.01665 F2333.157 
+G1 X110.000 Y70.851 E0.01169 F3825.600 
+G1 X110.000 Y71.200 E0.01162 F3828.630 
+G1 Y71.700 E0.01665 F2343.075 
+G1 X110.500 Y71.700 E0.01665 
+G1 X111.000 Y71.700 E0.01665 F4036.087 
+G1 X111.500 Y71.700 E0.01665 F5204.805 
+G1 X112.000 Y71.700 E0.01665 F6155.485 
+G1 X112.500 Y71.700 E0.01665 F6977.822 
+G1 X113.000 Y71.700 E0.01665 F7712.976 
+G1 X113.500 Y71.700 E0.01665 F8383.913 
+G1 X113.746 Y71.700 E0.00819 F8851.271 
+G1 X126.254 Y71.700 E0.41653 F9000.000 
+G1 X126.500 Y71.700 E0.00819 F8851.271 
+G1 X127.000 Y71.700 E0.01665 F8383.913 
+G1 X127.500 Y71.700 E0.01665 F7712.976 
+G1 X128.000 Y71.700 E0.01665 F6977.822 
+G1 X128.500 Y71.700 E0.01665 F6155.485 
+G1 X129.000 Y71.700 E0.01665 F5204.805 
+G1 X129.500 Y71.700 E0.01665 F4036.087 
+G1 X130.000 Y71.700 E0.01665 F2343.075 
+G1 X130.000 Y72.200 E0.01665 
+G1 X130.000 Y72.550 E0.01166 F3830.144 
+G1 X130.000 Y72.900 E0.01166 
+G1 Y73.400 E0.01665 F2343.075 
+G1 X129.500 Y73.400 E0.01665 
+G1 X129.000 Y73.400 E0.01665 F4036.087 
+G1 X128.500 Y73.400 E0.01665 F5204.805 
+G1 X128.000 Y73.400 E0.01665 F6155.485 
+G1 X127.500 Y73.400 E0.01665 F6977.822 
+G1 X127.000 Y73.400 E0.01665 F7712.976 
+G1 X126.500 Y73.400 E0.01665 F8383.913 
+G1 X126.254 Y73.400 E0.00819 F8851.271 
+G1 X113.746 Y73.400 E0.41653 F9000.000 
+G1 X113.500 Y73.400 E0.00819 F8851.271 
+G1 X113.000 Y73.400 E0.01665 F8383.913 
+G1 X112.500 Y73.400 E0.01665 F7712.976 
+G1 X112.000 Y73.400 E0.01665 F6977.822 
+G1 X111.500 Y73.400 E0.01665 F6155.485 
+G1 X111.000 Y73.400 E0.01665 F5204.805 
+G1 X110.500 Y73.400 E0.01665 F4036.087 
+G1 X110.000 Y73.400 E0.01665 F2343.075 
+G1 X110.000 Y73.900 E0.01665 
+G1 X110.000 Y74.250 E0.01165 F3830.144 
+G1 X110.000 Y74.600 E0.01165 
+G1 Y75.100 E0.01665 F2343.075 
+G1 X110.500 Y75.100 E0.01665 
+G1 X111.000 Y75.100 E0.01665 F4036.087 
+G1 X111.500 Y75.100 E0.01665 F5204.805 
+G1 X112.000 Y75.100 E0.01665 F6155.485 
+G1 X112.500 Y75.100 E0.01665 F6977.822 
+G1 X113.000 Y75.100 E0.01665 F7712.976 
+G1 X113.500 Y75.100 E0.01665 F8383.913 
+G1 X113.746 Y75.100 E0.00819 F8851.271 
+G1 X126.254 Y75.100 E0.41653 F9000.000 
+G1 X126.500 Y75.100 E0.00819 F8851.271 
+G1 X127.000 Y75.100 E0.01665 F8383.913 
+G1 X127.500 Y75.100 E0.01665 F7712.976 
+G1 X128.000 Y75.100 E0.01665 F6977.822 
+G1 X128.500 Y75.100 E0.01665 F6155.485 
+G1 X129.000 Y75.100 E0.01665 F5204.805 
+G1 X129.500 Y75.100 E0.01665 F4036.087 
+G1 X130.000 Y75.100 E0.01665 F2343.075 
+G1 X130.000 Y75.600 E0.01665 
+G1 X130.000 Y75.950 E0.01166 F3830.144 
+G1 X130.000 Y76.300 E0.01166 
+G1 Y76.800 E0.01665 F2343.075 
+G1 X129.500 Y76.800 E0.01665 
+G1 X129.000 Y76.800 E0.01665 F4036.087 
+G1 X128.500 Y76.800 E0.01665 F5204.805 
+G1 X128.000 Y76.800 E0.01665 F6155.485 
+G1 X127.500 Y76.800 E0.01665 F6977.822 
+G1 X127.000 Y76.800 E0.01665 F7712.976 
+G1 X126.500 Y76.800 E0.01665 F8383.913 
+G1 X126.254 Y76.800 E0.00819 F8851.271 
+G1 X113.746 Y76.800 E0.41653 F9000.000 
+G1 X113.500 Y76.800 E0.00819 F8851.271 
+G1 X113.000 Y76.800 E0.01665 F8383.913 
+G1 X112.500 Y76.800 E0.01665 F7712.976 
+G1 X112.000 Y76.800 E0.01665 F6977.822 
+G1 X111.500 Y76.800 E0.01665 F6155.485 
+G1 X111.000 Y76.800 E0.01665 F5204.805 
+G1 X110.500 Y76.800 E0.01665 F4036.087 
+G1 X110.000 Y76.800 E0.01665 F2343.075 
+G1 X110.000 Y77.300 E0.01665 
+G1 X110.000 Y77.650 E0.01166 F3830.144 
+G1 X110.000 Y78.000 E0.01166 
+G1 Y78.500 E0.01665 F2343.075 
+G1 X110.500 Y78.500 E0.01665 
+G1 X111.000 Y78.500 E0.01665 F4036.087 
+G1 X111.500 Y78.500 E0.01665 F5204.805 
+G1 X112.000 Y78.500 E0.01665 F6155.485 
+G1 X112.500 Y78.500 E0.01665 F6977.822 
+G1 X113.000 Y78.500 E0.01665 F7712.976 
+G1 X113.500 Y78.500 E0.01665 F8383.913 
+G1 X113.746 Y78.500 E0.00819 F8851.271 
+G1 X126.254 Y78.500 E0.41653 F9000.000 
+G1 X126.500 Y78.500 E0.00819 F8851.271 
+G1 X127.000 Y78.500 E0.01665 F8383.913 
+G1 X127.500 Y78.500 E0.01665 F7712.976 
+G1 X128.000 Y78.500 E0.01665 F6977.822 
+G1 X128.500 Y78.500 E0.01665 F6155.485 
+G1 X129.000 Y78.500 E0.01665 F5204.805 
+G1 X129.500 Y78.500 E0.01665 F4036.087 
+G1 X130.000 Y78.500 E0.01665 F2343.075 
+G1 X130.000 Y79.000 E0.01665 
+G1 X130.000 Y79.350 E0.01166 F3830.144 
+G1 X130.000 Y79.700 E0.01166 
+G1 Y80.200 E0.01665 F2343.075 
+G1 X129.500 Y80.200 E0.01665 
+G1 X129.000 Y80.200 E0.01665 F4036.087 
+G1 X128.500 Y80.200 E0.01665 F5204.805 
+G1 X128.000 Y80.200 E0.01665 F6155.485 
+G1 X127.500 Y80.200 E0.01665 F6977.822 
+G1 X127.000 Y80.200 E0.01665 F7712.976 
+G1 X126.500 Y80.200 E0.01665 F8383.913 
+G1 X126.254 Y80.200 E0.00819 F8851.271 
+G1 X113.746 Y80.200 E0.41653 F9000.000 
+G1 X113.500 Y80.200 E0.00819 F8851.271 
+G1 X113.000 Y80.200 E0.01665 F8383.913 
+G1 X112.500 Y80.200 E0.01665 F7712.976 
+G1 X112.000 Y80.200 E0.01665 F6977.822 
+G1 X111.500 Y80.200 E0.01665 F6155.485 
+G1 X111.000 Y80.200 E0.01665 F5204.805 
+G1 X110.500 Y80.200 E0.01665 F4036.087 
+G1 X110.000 Y80.200 E0.01665 F2343.075 
+G1 X110.000 Y80.700 E0.01665 
+G1 X110.000 Y81.050 E0.01166 F3830.144 
+G1 X110.000 Y81.400 E0.01166 
+G1 Y81.900 E0.01665 F2343.075 
+G1 X110.500 Y81.900 E0.01665 
+G1 X111.000 Y81.900 E0.01665 F4036.087 
+G1 X111.500 Y81.900 E0.01665 F5204.805 
+G1 X112.000 Y81.900 E0.01665 F6155.485 
+G1 X112.500 Y81.900 E0.01665 F6977.822 
+G1 X113.000 Y81.900 E0.01665 F7712.976 
+G1 X113.500 Y81.900 E0.01665 F8383.913 
+G1 X113.746 Y81.900 E0.00819 F8851.271 
+G1 X126.254 Y81.900 E0.41653 F9000.000 
+G1 X126.500 Y81.900 E0.00819 F8851.271 
+G1 X127.000 Y81.900 E0.01665 F8383.913 
+G1 X127.500 Y81.900 E0.01665 F7712.976 
+G1 X128.000 Y81.900 E0.01665 F6977.822 
+G1 X128.500 Y81.900 E0.01665 F6155.485 
+G1 X129.000 Y81.900 E0.01665 F5204.805 
+G1 X129.500 Y81.900 E0.01665 F4036.087 
+G1 X130.000 Y81.900 E0.01665 F2343.075 
+G1 X130.000 Y82.400 E0.01665 
+G1 X130.000 Y82.750 E0.01165 F3830.144 
+G1 X130.000 Y83.100 E0.01165 
+G1 Y83.600 E0.01665 F2343.075 
+G1 X129.500 Y83.600 E0.01665 
+G1 X129.000 Y83.600 E0.01665 F4036.087 
+G1 X128.500 Y83.600 E0.01665 F5204.805 
+G1 X128.000 Y83.600 E0.01665 F6155.485 
+G1 X127.500 Y83.600 E0.01665 F6977.822 
+G1 X127.000 Y83.600 E0.01665 F7712.976 
+G1 X126.500 Y83.600 E0.01665 F8383.913 
+G1 X126.254 Y83.600 E0.00819 F8851.271 
+G1 X113.746 Y83.600 E0.41653 F9000.000 
+G1 X113.500 Y83.600 E0.00819 F8851.271 
+G1 X113.000 Y83.600 E0.01665 F8383.913 
+G1 X112.500 Y83.600 E0.01665 F7712.976 
+G1 X112.000 Y83.600 E0.01665 F6977.822 
+G1 X111.500 Y83.600 E0.01665 F6155.485 
+G1 X111.000 Y83.600 E0.01665 F5204.805 
+G1 X110.500 Y83.600 E0.01665 F4036.087 
+G1 X110.000 Y83.600 E0.01665 F2343.075 
+G1 X110.000 Y84.100 E0.01665 
+G1 X110.000 Y84.450 E0.01166 F3830.144 
+G1 X110.000 Y84.800 E0.01166 
+G1 Y85.300 E0.01665 F2343.075 
+G1 X110.500 Y85.300 E0.01665 
+G1 X111.000 Y85.300 E0.01665 F4036.087 
+G1 X111.500 Y85.300 E0.01665 F5204.805 
+G1 X112.000 Y85.300 E0.01665 F6155.485 
+G1 X112.500 Y85.300 E0.01665 F6977.822 
+G1 X113.000 Y85.300 E0.01665 F7712.976 
+G1 X113.500 Y85.300 E0.01665 F8383.913 
+G1 X113.746 Y85.300 E0.00819 F8851.271 
+G1 X126.254 Y85.300 E0.41653 F9000.000 
+G1 X126.500 Y85.300 E0.00819 F8851.271 
+G1 X127.000 Y85.300 E0.01665 F8383.913 
+G1 X127.500 Y85.300 E0.01665 F7712.976 
+G1 X128.000 Y85.300 E0.01665 F6977.822 
+G1 X128.500 Y85.300 E0.01665 F6155.485 
+G1 X129.000 Y85.300 E0.01665 F5204.805 
+G1 X129.500 Y85.300 E0.01665 F4036.087 
+G1 X130.000 Y85.300 E0.01665 F2343.075 
+G1 X130.000 Y85.800 E0.01665 
+G1 X130.000 Y86.150 E0.01166 F3830.144 
+G1 X130.000 Y86.500 E0.01166 
+G1 Y87.000 E0.01665 F2343.075 
+G1 X129.500 Y87.000 E0.01665 
+G1 X129.000 Y87.000 E0.01665 F4036.087 
+G1 X128.500 Y87.000 E0.01665 F5204.805 
+G1 X128.000 Y87.000 E0.01665 F6155.485 
+G1 X127.500 Y87.000 E0.01665 F6977.822 
+G1 X127.000 Y87.000 E0.01665 F7712.976 
+G1 X126.500 Y87.000 E0.01665 F8383.913 
+G1 X126.254 Y87.000 E0.00819 F8851.271 
+G1 X113.746 Y87.000 E0.41653 F9000.000 
+G1 X113.500 Y87.000 E0.00819 F8851.271 
+G1 X113.000 Y87.000 E0.01665 F8383.913 
+G1 X112.500 Y87.000 E0.01665 F7712.976 
+G1 X112.000 Y87.000 E0.01665 F6977.822 
+G1 X111.500 Y87.000 E0.01665 F6155.485 
+G1 X111.000 Y87.000 E0.01665 F5204.805 
+G1 X110.500 Y87.000 E0.01665 F4036.087 
+G1 X110.000 Y87.000 E0.01665 F2343.075 
+G1 X110.000 Y87.500 E0.01665 
+G1 X110.000 Y87.850 E0.01166 F3830.144 
+G1 X110.000 Y88.200 E0.01166 
+G1 Y88.700 E0.01665 F2343.075 
+G1 X110.500 Y88.700 E0.01665 
+G1 X111.000 Y88.700 E0.01665 F4036.087 
+G1 X111.500 Y88.700 E0.01665 F5204.805 
+G1 X112.000 Y88.700 E0.01665 F6155.485 
+G1 X112.500 Y88.700 E0.01665 F6977.822 
+G1 X113.000 Y88.700 E0.01665 F7712.976 
+G1 X113.500 Y88.700 E0.01665 F8383.913 
+G1 X113.746 Y88.700 E0.00819 F8851.271 
+G1 X126.254 Y88.700 E0.41653 F9000.000 
+G1 X126.500 Y88.700 E0.00819 F8851.271 
+G1 X127.000 Y88.700 E0.01665 F8383.913 
+G1 X127.500 Y88.700 E0.01665 F7712.976 
+G1 X128.000 Y88.700 E0.01665 F6977.822 
+G1 X128.500 Y88.700 E0.01665 F6155.485 
+G1 X129.000 Y88.700 E0.01665 F5204.805 
+G1 X129.500 Y88.700 E0.01665 F4036.087 
+G1 X130.000 Y88.700 E0.01665 F2343.075 
+G1 X130.000 Y89.200 E0.01665 
+G1 X130.000 Y89.548 E0.01159 F3827.205 
+G1 X130.000 Y89.900 E0.01172 F3821.322 
+G1 Y90.400 E0.01665 F2323.790 
+; some comment
+
+G1 E-.8 F2100
+;TYPE:Gap infill
+G1 X10 Y10 F12000
+G1 X10.413 Y10.055 E0.00275 F2122.609 
+G1 X11.087 Y10.145 E0.00450 F3000.000 
+G1 X11.500 Y10.200 E0.00275 F2121.320 
+;LAYER_CHANGE
+;Z:0.4
+;HEIGHT:0.2
+G1 E-.8 F2100
+G1 Z0.400 F720
+;TYPE:Outer wall
+;WIDTH:0.45
+G1 X62.000 Y50.000 F12000
+G1 E.8 F2100
+G1 F3000
+G1 X68.984 Y54.939 E0.28484 
+G1 X69.319 Y55.176 E0.01367 F2136.963 
+G1 X69.162 Y55.555 E0.01367 
+G1 X67.404 Y59.800 E0.15297 F3000.000 
+G1 X67.321 Y60.000 E0.00722 F2580.269 
+G1 X67.189 Y60.172 E0.00722 
+G1 X64.274 Y63.970 E0.15944 F3000.000 
+G1 X64.142 Y64.142 E0.00720 F2581.438 
+G1 X63.970 Y64.274 E0.00720 
+G1 X60.172 Y67.189 E0.15944 F3000.000 
+G1 X60.000 Y67.321 E0.00722 F2580.269 
+G1 X59.800 Y67.404 E0.00722 
+G1 X55.555 Y69.162 E0.15297 F3000.000 
+G1 X55.176 Y69.319 E0.01367 F2136.963 
+G1 X54.939 Y68.984 E0.01367 
+G1 X50.239 Y62.338 E0.27104 F3000.000 
+G1 X50.000 Y62.000 E0.01380 F2127.315 
+G1 X49.761 Y62.338 E0.01380 
+G1 X45.061 Y68.984 E0.27104 F3000.000 
+G1 X44.824 Y69.319 E0.01367 F2136.963 
+G1 X44.445 Y69.162 E0.01367 
+G1 X40.200 Y67.404 E0.15297 F3000.000 
+G1 X40.000 Y67.321 E0.00722 F2580.269 
+G1 X39.828 Y67.189 E0.00722 
+G1 X36.030 Y64.274 E0.15944 F3000.000 
+G1 X35.858 Y64.142 E0.00720 F2581.438 
+G1 X35.726 Y63.970 E0.00720 
+G1 X32.811 Y60.172 E0.15944 F3000.000 
+G1 X32.679 Y60.000 E0.00722 F2580.269 
+G1 X32.596 Y59.800 E0.00722 
+G1 X30.838 Y55.555 E0.15297 F3000.000 
+G1 X30.681 Y55.176 E0.01367 F2136.963 
+G1 X31.016 Y54.939 E0.01367 
+G1 X37.662 Y50.239 E0.27104 F3000.000 
+G1 X38.000 Y50.000 E0.01380 F2127.315 
+G1 X37.662 Y49.761 E0.01380 
+G1 X31.016 Y45.061 E0.27104 F3000.000 
+G1 X30.681 Y44.824 E0.01367 F2136.963 
+G1 X30.838 Y44.445 E0.01367 
+G1 X32.596 Y40.200 E0.15297 F3000.000 
+G1 X32.679 Y40.000 E0.00722 F2580.269 
+G1 X32.811 Y39.828 E0.00722 
+G1 X35.726 Y36.030 E0.15944 F3000.000 
+G1 X35.858 Y35.858 E0.00720 F2581.438 
+G1 X36.030 Y35.726 E0.00720 
+G1 X39.828 Y32.811 E0.15944 F3000.000 
+G1 X40.000 Y32.679 E0.00722 F2580.269 
+G1 X40.200 Y32.596 E0.00722 
+G1 X44.445 Y30.838 E0.15297 F3000.000 
+G1 X44.824 Y30.681 E0.01367 F2136.963 
+G1 X45.061 Y31.016 E0.01367 
+G1 X49.761 Y37.662 E0.27104 F3000.000 
+G1 X50.000 Y38.000 E0.01380 F2127.315 
+G1 X50.239 Y37.662 E0.01380 
+G1 X54.939 Y31.016 E0.27104 F3000.000 
+G1 X55.176 Y30.681 E0.01367 F2136.963 
+G1 X55.555 Y30.838 E0.01367 
+G1 X59.800 Y32.596 E0.15297 F3000.000 
+G1 X60.000 Y32.679 E0.00722 F2580.269 
+G1 X60.172 Y32.811 E0.00722 
+G1 X63.970 Y35.726 E0.15944 F3000.000 
+G1 X64.142 Y35.858 E0.00720 F2581.438 
+G1 X64.274 Y36.030 E0.00720 
+G1 X67.189 Y39.828 E0.15944 F3000.000 
+G1 X67.321 Y40.000 E0.00722 F2580.269 
+G1 X67.404 Y40.200 E0.00722 
+G1 X69.162 Y44.445 E0.15297 F3000.000 
+G1 X69.319 Y44.824 E0.01367 F2136.963 
+G1 X68.984 Y45.061 E0.01367 
+G1 X62.340 Y49.759 E0.27097 F3000.000 
+G1 X62.000 Y50.000 E0.01387 F2121.320 
+G1 E-.8 F2100
+;TYPE:Inner wall
+;WIDTH:0.45
+G1 X61.700 Y50.000 F12000
+G1 E.8 F2100
+G1 F6000
+G1 X62.108 Y50.289 E0.01665 F2327.274 
+G1 X62.516 Y50.577 E0.01665 F4026.935 
+G1 X62.925 Y50.866 E0.01665 F5197.711 
+G1 X63.060 Y50.962 E0.00552 F5848.769 
+G1 X67.480 Y54.088 E0.18028 F6000.000 
+G1 X67.611 Y54.181 E0.00534 F5853.767 
+G1 X68.020 Y54.470 E0.01665 F5208.952 
+G1 X68.428 Y54.758 E0.01665 F4041.433 
+G1 X68.836 Y55.047 E0.01665 F2352.272 
+G1 X68.645 Y55.509 E0.01665 
+G1 X68.453 Y55.971 E0.01665 F4041.433 
+G1 X68.262 Y56.433 E0.01665 F5208.952 
+G1 X68.200 Y56.581 E0.00534 F5853.767 
+G1 X67.448 Y58.396 E0.06540 F6000.000 
+G1 X67.270 Y58.826 E0.01552 F5564.729 
+G1 X67.078 Y59.288 E0.01665 F4531.271 
+G1 X66.887 Y59.750 E0.01665 F3119.682 
+G1 X66.583 Y60.147 E0.01665 
+G1 X66.278 Y60.543 E0.01665 F4531.271 
+G1 X65.995 Y60.913 E0.01552 F5564.729 
+G1 X64.682 Y62.625 E0.07183 F6000.000 
+G1 X64.398 Y62.996 E0.01556 F5563.609 
+G1 X64.093 Y63.392 E0.01665 F4528.520 
+G1 X63.789 Y63.789 E0.01665 F3115.684 
+G1 X63.392 Y64.093 E0.01665 
+G1 X62.996 Y64.398 E0.01665 F4528.520 
+G1 X62.625 Y64.682 E0.01556 F5563.609 
+G1 X60.913 Y65.995 E0.07183 F6000.000 
+G1 X60.543 Y66.278 E0.01552 F5564.729 
+G1 X60.147 Y66.583 E0.01665 F4531.271 
+G1 X59.750 Y66.887 E0.01665 F3119.682 
+G1 X59.288 Y67.078 E0.01665 
+G1 X58.826 Y67.270 E0.01665 F4531.271 
+G1 X58.396 Y67.448 E0.01552 F5564.729 
+G1 X56.581 Y68.200 E0.06540 F6000.000 
+G1 X56.433 Y68.262 E0.00534 F5853.767 
+G1 X55.971 Y68.453 E0.01665 F5208.952 
+G1 X55.509 Y68.645 E0.01665 F4041.433 
+G1 X55.047 Y68.836 E0.01665 F2352.272 
+G1 X54.758 Y68.428 E0.01665 
+G1 X54.470 Y68.020 E0.01665 F4041.433 
+G1 X54.181 Y67.611 E0.01665 F5208.952 
+G1 X54.088 Y67.480 E0.00534 F5853.767 
+G1 X50.961 Y63.059 E0.18033 F6000.000 
+G1 X50.866 Y62.925 E0.00547 F5850.254 
+G1 X50.577 Y62.516 E0.01665 F5201.052 
+G1 X50.289 Y62.108 E0.01665 F4031.246 
+G1 X50.000 Y61.700 E0.01665 F2334.725 
+G1 X49.711 Y62.108 E0.01665 
+G1 X49.423 Y62.516 E0.01665 F4031.246 
+G1 X49.134 Y62.925 E0.01665 F5201.052 
+G1 X49.039 Y63.059 E0.00547 F5850.254 
+G1 X45.912 Y67.480 E0.18033 F6000.000 
+G1 X45.819 Y67.611 E0.00534 F5853.767 
+G1 X45.530 Y68.020 E0.01665 F5208.952 
+G1 X45.242 Y68.428 E0.01665 F4041.433 
+G1 X44.953 Y68.836 E0.01665 F2352.272 
+G1 X44.491 Y68.645 E0.01665 
+G1 X44.029 Y68.453 E0.01665 F4041.433 
+G1 X43.567 Y68.262 E0.01665 F5208.952 
+G1 X43.419 Y68.200 E0.00534 F5853.767 
+G1 X41.604 Y67.448 E0.06540 F6000.000 
+G1 X41.174 Y67.270 E0.01552 F5564.729 
+G1 X40.712 Y67.078 E0.01665 F4531.271 
+G1 X40.250 Y66.887 E0.01665 F3119.682 
+G1 X39.853 Y66.583 E0.01665 
+G1 X39.457 Y66.278 E0.01665 F4531.271 
+G1 X39.087 Y65.995 E0.01552 F5564.729 
+G1 X37.375 Y64.682 E0.07183 F6000.000 
+G1 X37.004 Y64.398 E0.01556 F5563.609 
+G1 X36.608 Y64.093 E0.01665 F4528.520 
+G1 X36.211 Y63.789 E0.01665 F3115.684 
+G1 X35.907 Y63.392 E0.01665 
+G1 X35.602 Y62.996 E0.01665 F4528.520 
+G1 X35.318 Y62.625 E0.01556 F5563.609 
+G1 X34.005 Y60.913 E0.07183 F6000.000 
+G1 X33.722 Y60.543 E0.01552 F5564.729 
+G1 X33.417 Y60.147 E0.01665 F4531.271 
+G1 X33.113 Y59.750 E0.01665 F3119.682 
+G1 X32.922 Y59.288 E0.01665 
+G1 X32.730 Y58.826 E0.01665 F4531.271 
+G1 X32.552 Y58.396 E0.01552 F5564.729 
+G1 X31.800 Y56.581 E0.06540 F6000.000 
+G1 X31.738 Y56.433 E0.00534 F5853.767 
+G1 X31.547 Y55.971 E0.01665 F5208.952 
+G1 X31.355 Y55.509 E0.01665 F4041.433 
+G1 X31.164 Y55.047 E0.01665 F2352.272 
+G1 X31.572 Y54.758 E0.01665 
+G1 X31.980 Y54.470 E0.01665 F4041.433 
+G1 X32.389 Y54.181 E0.01665 F5208.952 
+G1 X32.520 Y54.088 E0.00534 F5853.767 
+G1 X36.941 Y50.961 E0.18033 F6000.000 
+G1 X37.075 Y50.866 E0.00547 F5850.254 
+G1 X37.484 Y50.577 E0.01665 F5201.052 
+G1 X37.892 Y50.289 E0.01665 F4031.246 
+G1 X38.300 Y50.000 E0.01665 F2334.725 
+G1 X37.892 Y49.711 E0.01665 
+G1 X37.484 Y49.423 E0.01665 F4031.246 
+G1 X37.075 Y49.134 E0.01665 F5201.052 
+G1 X36.941 Y49.039 E0.00547 F5850.254 
+G1 X32.520 Y45.912 E0.18033 F6000.000 
+G1 X32.389 Y45.819 E0.00534 F5853.767 
+G1 X31.980 Y45.530 E0.01665 F5208.952 
+G1 X31.572 Y45.242 E0.01665 F4041.433 
+G1 X31.164 Y44.953 E0.01665 F2352.272 
+G1 X31.355 Y44.491 E0.01665 
+G1 X31.547 Y44.029 E0.01665 F4041.433 
+G1 X31.738 Y43.567 E0.01665 F5208.952 
+G1 X31.800 Y43.419 E0.00534 F5853.767 
+G1 X32.552 Y41.604 E0.06540 F6000.000 
+G1 X32.730 Y41.174 E0.01552 F5564.729 
+G1 X32.922 Y40.712 E0.01665 F4531.271 
+G1 X33.113 Y40.250 E0.01665 F3119.682 
+G1 X33.417 Y39.853 E0.01665 
+G1 X33.722 Y39.457 E0.01665 F4531.271 
+G1 X34.005 Y39.087 E0.01552 F5564.729 
+G1 X35.318 Y37.375 E0.07183 F6000.000 
+G1 X35.602 Y37.004 E0.01556 F5563.609 
+G1 X35.907 Y36.608 E0.01665 F4528.520 
+G1 X36.211 Y36.211 E0.01665 F3115.684 
+G1 X36.608 Y35.907 E0.01665 
+G1 X37.004 Y35.602 E0.01665 F4528.520 
+G1 X37.375 Y35.318 E0.01556 F5563.609 
+G1 X39.087 Y34.005 E0.07183 F6000.000 
+G1 X39.457 Y33.722 E0.01552 F5564.729 
+G1 X39.853 Y33.417 E0.01665 F4531.271 
+G1 X40.250 Y33.113 E0.01665 F3119.682 
+G1 X40.712 Y32.922 E0.01665 
+G1 X41.174 Y32.730 E0.01665 F4531.271 
+G1 X41.604 Y32.552 E0.01552 F5564.729 
+G1 X43.419 Y31.800 E0.06540 F6000.000 
+G1 X43.567 Y31.738 E0.00534 F5853.767 
+G1 X44.029 Y31.547 E0.01665 F5208.952 
+G1 X44.491 Y31.355 E0.01665 F4041.433 
+G1 X44.953 Y31.164 E0.01665 F2352.272 
+G1 X45.242 Y31.572 E0.01665 
+G1 X45.530 Y31.980 E0.01665 F4041.433 
+G1 X45.819 Y32.389 E0.01665 F5208.952 
+G1 X45.912 Y32.520 E0.00534 F5853.767 
+G1 X49.039 Y36.941 E0.18033 F6000.000 
+G1 X49.134 Y37.075 E0.00547 F5850.254 
+G1 X49.423 Y37.484 E0.01665 F5201.052 
+G1 X49.711 Y37.892 E0.01665 F4031.246 
+G1 X50.000 Y38.300 E0.01665 F2334.725 
+G1 X50.289 Y37.892 E0.01665 
+G1 X50.577 Y37.484 E0.01665 F4031.246 
+G1 X50.866 Y37.075 E0.01665 F5201.052 
+G1 X50.961 Y36.941 E0.00547 F5850.254 
+G1 X54.088 Y32.520 E0.18033 F6000.000 
+G1 X54.181 Y32.389 E0.00534 F5853.767 
+G1 X54.470 Y31.980 E0.01665 F5208.952 
+G1 X54.758 Y31.572 E0.01665 F4041.433 
+G1 X55.047 Y31.164 E0.01665 F2352.272 
+G1 X55.509 Y31.355 E0.01665 
+G1 X55.971 Y31.547 E0.01665 F4041.433 
+G1 X56.433 Y31.738 E0.01665 F5208.952 
+G1 X56.581 Y31.800 E0.00534 F5853.767 
+G1 X58.396 Y32.552 E0.06540 F6000.000 
+G1 X58.826 Y32.730 E0.01552 F5564.729 
+G1 X59.288 Y32.922 E0.01665 F4531.271 
+G1 X59.750 Y33.113 E0.01665 F3119.682 
+G1 X60.147 Y33.417 E0.01665 
+G1 X60.543 Y33.722 E0.01665 F4531.271 
+G1 X60.913 Y34.005 E0.01552 F5564.729 
+G1 X62.625 Y35.318 E0.07183 F6000.000 
+G1 X62.996 Y35.602 E0.01556 F5563.609 
+G1 X63.392 Y35.907 E0.01665 F4528.520 
+G1 X63.789 Y36.211 E0.01665 F3115.684 
+G1 X64.093 Y36.608 E0.01665 
+G1 X64.398 Y37.004 E0.01665 F4528.520 
+G1 X64.682 Y37.375 E0.01556 F5563.609 
+G1 X65.995 Y39.087 E0.07183 F6000.000 
+G1 X66.278 Y39.457 E0.01552 F5564.729 
+G1 X66.583 Y39.853 E0.01665 F4531.271 
+G1 X66.887 Y40.250 E0.01665 F3119.682 
+G1 X67.078 Y40.712 E0.01665 
+G1 X67.270 Y41.174 E0.01665 F4531.271 
+G1 X67.448 Y41.604 E0.01552 F5564.729 
+G1 X68.200 Y43.419 E0.06540 F6000.000 
+G1 X68.262 Y43.567 E0.00534 F5853.767 
+G1 X68.453 Y44.029 E0.01665 F5208.952 
+G1 X68.645 Y44.491 E0.01665 F4041.433 
+G1 X68.836 Y44.953 E0.01665 F2352.272 
+G1 X68.428 Y45.242 E0.01665 
+G1 X68.020 Y45.530 E0.01665 F4041.433 
+G1 X67.611 Y45.819 E0.01665 F5208.952 
+G1 X67.480 Y45.912 E0.00534 F5853.767 
+G1 X63.061 Y49.038 E0.18025 F6000.000 
+G1 X62.925 Y49.134 E0.00555 F5848.077 
+G1 X62.516 Y49.423 E0.01665 F5196.152 
+G1 X62.108 Y49.711 E0.01665 F4024.922 
+G1 X61.700 Y50.000 E0.01665 F2323.790 
+G1 E-.8 F2100
+;TYPE:Sparse infill
+;WIDTH:0.45
+G1 X40.000 Y40.000 F12000
+G1 E.8 F2100
+G1 F9000
+G1 X40.000 Y40.000 E0.66600
+G1 X40.000 Y40.500 E0.01665 F2333.157 
+G1 X40.000 Y40.851 E0.01169 F3825.600 
+G1 X40.000 Y41.200 E0.01162 F3828.630 
+G1 Y41.700 E0.01665 F2343.075 
+G1 X40.500 Y41.700 E0.01665 
+G1 X41.000 Y41.700 E0.01665 F4036.087 
+G1 X41.500 Y41.700 E0.01665 F5204.805 
+G1 X42.000 Y41.700 E0.01665 F6155.485 
+G1 X42.500 Y41.700 E0.01665 F6977.822 
+G1 X43.000 Y41.700 E0.01665 F7712.976 
+G1 X43.500 Y41.700 E0.01665 F8383.913 
+G1 X43.746 Y41.700 E0.00819 F8851.271 
+G1 X56.254 Y41.700 E0.41653 F9000.000 
+G1 X56.500 Y41.700 E0.00819 F8851.271 
+G1 X57.000 Y41.700 E0.01665 F8383.913 
+G1 X57.500 Y41.700 E0.01665 F7712.976 
+G1 X58.000 Y41.700 E0.01665 F6977.822 
+G1 X58.500 Y41.700 E0.01665 F6155.485 
+G1 X59.000 Y41.700 E0.01665 F5204.805 
+G1 X59.500 Y41.700 E0.01665 F4036.087 
+G1 X60.000 Y41.700 E0.01665 F2343.075 
+G1 X60.000 Y42.200 E0.01665 
+G1 X60.000 Y42.550 E0.01165 F3830.144 
+G1 X60.000 Y42.900 E0.01165 
+G1 Y43.400 E0.01665 F2343.075 
+G1 X59.500 Y43.400 E0.01665 
+G1 X59.000 Y43.400 E0.01665 F4036.087 
+G1 X58.500 Y43.400 E0.01665 F5204.805 
+G1 X58.000 Y43.400 E0.01665 F6155.485 
+G1 X57.500 Y43.400 E0.01665 F6977.822 
+G1 X57.000 Y43.400 E0.01665 F7712.976 
+G1 X56.500 Y43.400 E0.01665 F8383.913 
+G1 X56.254 Y43.400 E0.00819 F8851.271 
+G1 X43.746 Y43.400 E0.41653 F9000.000 
+G1 X43.500 Y43.400 E0.00819 F8851.271 
+G1 X43.000 Y43.400 E0.01665 F8383.913 
+G1 X42.500 Y43.400 E0.01665 F7712.976 
+G1 X42.000 Y43.400 E0.01665 F6977.822 
+G1 X41.500 Y43.400 E0.01665 F6155.485 
+G1 X41.000 Y43.400 E0.01665 F5204.805 
+G1 X40.500 Y43.400 E0.01665 F4036.087 
+G1 X40.000 Y43.400 E0.01665 F2343.075 
+G1 X40.000 Y43.900 E0.01665 
+G1 X40.000 Y44.250 E0.01166 F3830.144 
+G1 X40.000 Y44.600 E0.01166 
+G1 Y45.100 E0.01665 F2343.075 
+G1 X40.500 Y45.100 E0.01665 
+G1 X41.000 Y45.100 E0.01665 F4036.087 
+G1 X41.500 Y45.100 E0.01665 F5204.805 
+G1 X42.000 Y45.100 E0.01665 F6155.485 
+G1 X42.500 Y45.100 E0.01665 F6977.822 
+G1 X43.000 Y45.100 E0.01665 F7712.976 
+G1 X43.500 Y45.100 E0.01665 F8383.913 
+G1 X43.746 Y45.100 E0.00819 F8851.271 
+G1 X56.254 Y45.100 E0.41653 F9000.000 
+G1 X56.500 Y45.100 E0.00819 F8851.271 
+G1 X57.000 Y45.100 E0.01665 F8383.913 
+G1 X57.500 Y45.100 E0.01665 F7712.976 
+G1 X58.000 Y45.100 E0.01665 F6977.822 
+G1 X58.500 Y45.100 E0.01665 F6155.485 
+G1 X59.000 Y45.100 E0.01665 F5204.805 
+G1 X59.500 Y45.100 E0.01665 F4036.087 
+G1 X60.000 Y45.100 E0.01665 F2343.075 
+G1 X60.000 Y45.600 E0.01665 
+G1 X60.000 Y45.950 E0.01165 F3830.144 
+G1 X60.000 Y46.300 E0.01165 
+G1 Y46.800 E0.01665 F2343.075 
+G1 X59.500 Y46.800 E0.01665 
+G1 X59.000 Y46.800 E0.01665 F4036.087 
+G1 X58.500 Y46.800 E0.01665 F5204.805 
+G1 X58.000 Y46.800 E0.01665 F6155.485 
+G1 X57.500 Y46.800 E0.01665 F6977.822 
+G1 X57.000 Y46.800 E0.01665 F7712.976 
+G1 X56.500 Y46.800 E0.01665 F8383.913 
+G1 X56.254 Y46.800 E0.00819 F8851.271 
+G1 X43.746 Y46.800 E0.41653 F9000.000 
+G1 X43.500 Y46.800 E0.00819 F8851.271 
+G1 X43.000 Y46.800 E0.01665 F8383.913 
+G1 X42.500 Y46.800 E0.01665 F7712.976 
+G1 X42.000 Y46.800 E0.01665 F6977.822 
+G1 X41.500 Y46.800 E0.01665 F6155.485 
+G1 X41.000 Y46.800 E0.01665 F5204.805 
+G1 X40.500 Y46.800 E0.01665 F4036.087 
+G1 X40.000 Y46.800 E0.01665 F2343.075 
+G1 X40.000 Y47.300 E0.01665 
+G1 X40.000 Y47.650 E0.01166 F3830.144 
+G1 X40.000 Y48.000 E0.01166 
+G1 Y48.500 E0.01665 F2343.075 
+G1 X40.500 Y48.500 E0.01665 
+G1 X41.000 Y48.500 E0.01665 F4036.087 
+G1 X41.500 Y48.500 E0.01665 F5204.805 
+G1 X42.000 Y48.500 E0.01665 F6155.485 
+G1 X42.500 Y48.500 E0.01665 F6977.822 
+G1 X43.000 Y48.500 E0.01665 F7712.976 
+G1 X43.500 Y48.500 E0.01665 F8383.913 
+G1 X43.746 Y48.500 E0.00819 F8851.271 
+G1 X56.254 Y48.500 E0.41653 F9000.000 
+G1 X56.500 Y48.500 E0.00819 F8851.271 
+G1 X57.000 Y48.500 E0.01665 F8383.913 
+G1 X57.500 Y48.500 E0.01665 F7712.976 
+G1 X58.000 Y48.500 E0.01665 F6977.822 
+G1 X58.500 Y48.500 E0.01665 F6155.485 
+G1 X59.000 Y48.500 E0.01665 F5204.805 
+G1 X59.500 Y48.500 E0.01665 F4036.087 
+G1 X60.000 Y48.500 E0.01665 F2343.075 
+G1 X60.000 Y49.000 E0.01665 
+G1 X60.000 Y49.350 E0.01166 F3830.144 
+G1 X60.000 Y49.700 E0.01166 
+G1 Y50.200 E0.01665 F2343.075 
+G1 X59.500 Y50.200 E0.01665 
+G1 X59.000 Y50.200 E0.01665 F4036.087 
+G1 X58.500 Y50.200 E0.01665 F5204.805 
+G1 X58.000 Y50.200 E0.01665 F6155.485 
+G1 X57.500 Y50.200 E0.01665 F6977.822 
+G1 X57.000 Y50.200 E0.01665 F7712.976 
+G1 X56.500 Y50.200 E0.01665 F8383.913 
+G1 X56.254 Y50.200 E0.00819 F8851.271 
+G1 X43.746 Y50.200 E0.41653 F9000.000 
+G1 X43.500 Y50.200 E0.00819 F8851.271 
+G1 X43.000 Y50.200 E0.01665 F8383.913 
+G1 X42.500 Y50.200 E0.01665 F7712.976 
+G1 X42.000 Y50.200 E0.01665 F6977.822 
+G1 X41.500 Y50.200 E0.01665 F6155.485 
+G1 X41.000 Y50.200 E0.01665 F5204.805 
+G1 X40.500 Y50.200 E0.01665 F4036.087 
+G1 X40.000 Y50.200 E0.01665 F2343.075 
+G1 X40.000 Y50.700 E0.01665 
+G1 X40.000 Y51.050 E0.01165 F3830.144 
+G1 X40.000 Y51.400 E0.01165 
+G1 Y51.900 E0.01665 F2343.075 
+G1 X40.500 Y51.900 E0.01665 
+G1 X41.000 Y51.900 E0.01665 F4036.087 
+G1 X41.500 Y51.900 E0.01665 F5204.805 
+G1 X42.000 Y51.900 E0.01665 F6155.485 
+G1 X42.500 Y51.900 E0.01665 F6977.822 
+G1 X43.000 Y51.900 E0.01665 F7712.976 
+G1 X43.500 Y51.900 E0.01665 F8383.913 
+G1 X43.746 Y51.900 E0.00819 F8851.271 
+G1 X56.254 Y51.900 E0.41653 F9000.000 
+G1 X56.500 Y51.900 E0.00819 F8851.271 
+G1 X57.000 Y51.900 E0.01665 F8383.913 
+G1 X57.500 Y51.900 E0.01665 F7712.976 
+G1 X58.000 Y51.900 E0.01665 F6977.822 
+G1 X58.500 Y51.900 E0.01665 F6155.485 
+G1 X59.000 Y51.900 E0.01665 F5204.805 
+G1 X59.500 Y51.900 E0.01665 F4036.087 
+G1 X60.000 Y51.900 E0.01665 F2343.075 
+G1 X60.000 Y52.400 E0.01665 
+G1 X60.000 Y52.750 E0.01166 F3830.144 
+G1 X60.000 Y53.100 E0.01166 
+G1 Y53.600 E0.01665 F2343.075 
+G1 X59.500 Y53.600 E0.01665 
+G1 X59.000 Y53.600 E0.01665 F4036.087 
+G1 X58.500 Y53.600 E0.01665 F5204.805 
+G1 X58.000 Y53.600 E0.01665 F6155.485 
+G1 X57.500 Y53.600 E0.01665 F6977.822 
+G1 X57.000 Y53.600 E0.01665 F7712.976 
+G1 X56.500 Y53.600 E0.01665 F8383.913 
+G1 X56.254 Y53.600 E0.00819 F8851.271 
+G1 X43.746 Y53.600 E0.41653 F9000.000 
+G1 X43.500 Y53.600 E0.00819 F8851.271 
+G1 X43.000 Y53.600 E0.01665 F8383.913 
+G1 X42.500 Y53.600 E0.01665 F7712.976 
+G1 X42.000 Y53.600 E0.01665 F6977.822 
+G1 X41.500 Y53.600 E0.01665 F6155.485 
+G1 X41.000 Y53.600 E0.01665 F5204.805 
+G1 X40.500 Y53.600 E0.01665 F4036.087 
+G1 X40.000 Y53.600 E0.01665 F2343.075 
+G1 X40.000 Y54.100 E0.01665 
+G1 X40.000 Y54.450 E0.01165 F3830.144 
+G1 X40.000 Y54.800 E0.01165 
+G1 Y55.300 E0.01665 F2343.075 
+G1 X40.500 Y55.300 E0.01665 
+G1 X41.000 Y55.300 E0.01665 F4036.087 
+G1 X41.500 Y55.300 E0.01665 F5204.805 
+G1 X42.000 Y55.300 E0.01665 F6155.485 
+G1 X42.500 Y55.300 E0.01665 F6977.822 
+G1 X43.000 Y55.300 E0.01665 F7712.976 
+G1 X43.500 Y55.300 E0.01665 F8383.913 
+G1 X43.746 Y55.300 E0.00819 F8851.271 
+G1 X56.254 Y55.300 E0.41653 F9000.000 
+G1 X56.500 Y55.300 E0.00819 F8851.271 
+G1 X57.000 Y55.300 E0.01665 F8383.913 
+G1 X57.500 Y55.300 E0.01665 F7712.976 
+G1 X58.000 Y55.300 E0.01665 F6977.822 
+G1 X58.500 Y55.300 E0.01665 F6155.485 
+G1 X59.000 Y55.300 E0.01665 F5204.805 
+G1 X59.500 Y55.300 E0.01665 F4036.087 
+G1 X60.000 Y55.300 E0.01665 F2343.075 
+G1 X60.000 Y55.800 E0.01665 
+G1 X60.000 Y56.150 E0.01166 F3830.144 
+G1 X60.000 Y56.500 E0.01166 
+G1 Y57.000 E0.01665 F2343.075 
+G1 X59.500 Y57.000 E0.01665 
+G1 X59.000 Y57.000 E0.01665 F4036.087 
+G1 X58.500 Y57.000 E0.01665 F5204.805 
+G1 X58.000 Y57.000 E0.01665 F6155.485 
+G1 X57.500 Y57.000 E0.01665 F6977.822 
+G1 X57.000 Y57.000 E0.01665 F7712.976 
+G1 X56.500 Y57.000 E0.01665 F8383.913 
+G1 X56.254 Y57.000 E0.00819 F8851.271 
+G1 X43.746 Y57.000 E0.41653 F9000.000 
+G1 X43.500 Y57.000 E0.00819 F8851.271 
+G1 X43.000 Y57.000 E0.01665 F8383.913 
+G1 X42.500 Y57.000 E0.01665 F7712.976 
+G1 X42.000 Y57.000 E0.01665 F6977.822 
+G1 X41.500 Y57.000 E0.01665 F6155.485 
+G1 X41.000 Y57.000 E0.01665 F5204.805 
+G1 X40.500 Y57.000 E0.01665 F4036.087 
+G1 X40.000 Y57.000 E0.01665 F2343.075 
+G1 X40.000 Y57.500 E0.01665 
+G1 X40.000 Y57.850 E0.01166 F3830.144 
+G1 X40.000 Y58.200 E0.01166 
+G1 Y58.700 E0.01665 F2343.075 
+G1 X40.500 Y58.700 E0.01665 
+G1 X41.000 Y58.700 E0.01665 F4036.087 
+G1 X41.500 Y58.700 E0.01665 F5204.805 
+G1 X42.000 Y58.700 E0.01665 F6155.485 
+G1 X42.500 Y58.700 E0.01665 F6977.822 
+G1 X43.000 Y58.700 E0.01665 F7712.976 
+G1 X43.500 Y58.700 E0.01665 F8383.913 
+G1 X43.746 Y58.700 E0.00819 F8851.271 
+G1 X56.254 Y58.700 E0.41653 F9000.000 
+G1 X56.500 Y58.700 E0.00819 F8851.271 
+G1 X57.000 Y58.700 E0.01665 F8383.913 
+G1 X57.500 Y58.700 E0.01665 F7712.976 
+G1 X58.000 Y58.700 E0.01665 F6977.822 
+G1 X58.500 Y58.700 E0.01665 F6155.485 
+G1 X59.000 Y58.700 E0.01665 F5204.805 
+G1 X59.500 Y58.700 E0.01665 F4036.087 
+G1 X60.000 Y58.700 E0.01665 F2343.075 
+G1 X60.000 Y59.200 E0.01665 
+G1 X60.000 Y59.548 E0.01159 F3827.205 
+G1 X60.000 Y59.900 E0.01172 F3821.322 
+G1 Y60.400 E0.01665 F2323.790 
+; some comment
+
+G1 E-.8 F2100
+;TYPE:Outer wall
+;WIDTH:0.45
+G1 X132.000 Y80.000 F12000
+G1 E.8 F2100
+G1 F3000
+G1 X132.249 Y80.176 E0.01016 F2388.184 
+G1 X138.984 Y84.939 E0.27468 F3000.000 
+G1 X139.319 Y85.176 E0.01367 F2136.963 
+G1 X139.162 Y85.555 E0.01367 
+G1 X137.404 Y89.800 E0.15297 F3000.000 
+G1 X137.321 Y90.000 E0.00722 F2580.269 
+G1 X137.189 Y90.172 E0.00722 
+G1 X134.274 Y93.970 E0.15944 F3000.000 
+G1 X134.142 Y94.142 E0.00720 F2581.438 
+G1 X133.970 Y94.274 E0.00720 
+G1 X130.172 Y97.189 E0.15944 F3000.000 
+G1 X130.000 Y97.321 E0.00722 F2580.269 
+G1 X129.800 Y97.404 E0.00722 
+G1 X125.555 Y99.162 E0.15297 F3000.000 
+G1 X125.176 Y99.319 E0.01367 F2136.963 
+G1 X124.939 Y98.984 E0.01367 
+G1 X120.239 Y92.338 E0.27104 F3000.000 
+G1 X120.000 Y92.000 E0.01380 F2127.315 
+G1 X119.761 Y92.338 E0.01380 
+G1 X115.061 Y98.984 E0.27104 F3000.000 
+G1 X114.824 Y99.319 E0.01367 F2136.963 
+G1 X114.445 Y99.162 E0.01367 
+G1 X110.200 Y97.404 E0.15297 F3000.000 
+G1 X110.000 Y97.321 E0.00722 F2580.269 
+G1 X109.828 Y97.189 E0.00722 
+G1 X106.030 Y94.274 E0.15944 F3000.000 
+G1 X105.858 Y94.142 E0.00720 F2581.438 
+G1 X105.726 Y93.970 E0.00720 
+G1 X102.811 Y90.172 E0.15944 F3000.000 
+G1 X102.679 Y90.000 E0.00722 F2580.269 
+G1 X102.596 Y89.800 E0.00722 
+G1 X100.838 Y85.555 E0.15297 F3000.000 
+G1 X100.681 Y85.176 E0.01367 F2136.963 
+G1 X101.016 Y84.939 E0.01367 
+G1 X107.662 Y80.239 E0.27104 F3000.000 
+G1 X108.000 Y80.000 E0.01380 F2127.315 
+G1 X107.662 Y79.761 E0.01380 
+G1 X101.016 Y75.061 E0.27104 F3000.000 
+G1 X100.681 Y74.824 E0.01367 F2136.963 
+G1 X100.838 Y74.445 E0.01367 
+G1 X102.596 Y70.200 E0.15297 F3000.000 
+G1 X102.679 Y70.000 E0.00722 F2580.269 
+G1 X102.811 Y69.828 E0.00722 
+G1 X105.726 Y66.030 E0.15944 F3000.000 
+G1 X105.858 Y65.858 E0.00720 F2581.438 
+G1 X106.030 Y65.726 E0.00720 
+G1 X109.828 Y62.811 E0.15944 F3000.000 
+G1 X110.000 Y62.679 E0.00722 F2580.269 
+G1 X110.200 Y62.596 E0.00722 
+G1 X114.445 Y60.838 E0.15297 F3000.000 
+G1 X114.824 Y60.681 E0.01367 F2136.963 
+G1 X115.061 Y61.016 E0.01367 
+G1 X119.761 Y67.662 E0.27104 F3000.000 
+G1 X120.000 Y68.000 E0.01380 F2127.315 
+G1 X120.239 Y67.662 E0.01380 
+G1 X124.939 Y61.016 E0.27104 F3000.000 
+G1 X125.176 Y60.681 E0.01367 F2136.963 
+G1 X125.555 Y60.838 E0.01367 
+G1 X129.800 Y62.596 E0.15297 F3000.000 
+G1 X130.000 Y62.679 E0.00722 F2580.269 
+G1 X130.172 Y62.811 E0.00722 
+G1 X133.970 Y65.726 E0.15944 F3000.000 
+G1 X134.142 Y65.858 E0.00720 F2581.438 
+G1 X134.274 Y66.030 E0.00720 
+G1 X137.189 Y69.828 E0.15944 F3000.000 
+G1 X137.321 Y70.000 E0.00722 F2580.269 
+G1 X137.404 Y70.200 E0.00722 
+G1 X139.162 Y74.445 E0.15297 F3000.000 
+G1 X139.319 Y74.824 E0.01367 F2136.963 
+G1 X138.984 Y75.061 E0.01367 
+G1 X132.340 Y79.759 E0.27097 F3000.000 
+G1 X132.000 Y80.000 E0.01387 F2121.320 
+G1 E-.8 F2100
+;TYPE:Inner wall
+;WIDTH:0.45
+G1 X131.700 Y80.000 F12000
+G1 E.8 F2100
+G1 F6000
+G1 X132.108 Y80.289 E0.01665 F2327.274 
+G1 X132.516 Y80.577 E0.01665 F4026.935 
+G1 X132.925 Y80.866 E0.01665 F5197.711 
+G1 X133.060 Y80.962 E0.00552 F5848.769 
+G1 X137.480 Y84.088 E0.18028 F6000.000 
+G1 X137.611 Y84.181 E0.00534 F5853.767 
+G1 X138.020 Y84.470 E0.01665 F5208.952 
+G1 X138.428 Y84.758 E0.01665 F4041.433 
+G1 X138.836 Y85.047 E0.01665 F2352.272 
+G1 X138.645 Y85.509 E0.01665 
+G1 X138.453 Y85.971 E0.01665 F4041.433 
+G1 X138.262 Y86.433 E0.01665 F5208.952 
+G1 X138.200 Y86.581 E0.00534 F5853.767 
+G1 X137.448 Y88.396 E0.06540 F6000.000 
+G1 X137.270 Y88.826 E0.01552 F5564.729 
+G1 X137.078 Y89.288 E0.01665 F4531.271 
+G1 X136.887 Y89.750 E0.01665 F3119.682 
+G1 X136.583 Y90.147 E0.01665 
+G1 X136.278 Y90.543 E0.01665 F4531.271 
+G1 X135.995 Y90.913 E0.01552 F5564.729 
+G1 X134.682 Y92.625 E0.07183 F6000.000 
+G1 X134.398 Y92.996 E0.01556 F5563.609 
+G1 X134.093 Y93.392 E0.01665 F4528.520 
+G1 X133.789 Y93.789 E0.01665 F3115.684 
+G1 X133.392 Y94.093 E0.01665 
+G1 X132.996 Y94.398 E0.01665 F4528.520 
+G1 X132.625 Y94.682 E0.01556 F5563.609 
+G1 X130.913 Y95.995 E0.07183 F6000.000 
+G1 X130.543 Y96.278 E0.01552 F5564.729 
+G1 X130.147 Y96.583 E0.01665 F4531.271 
+G1 X129.750 Y96.887 E0.01665 F3119.682 
+G1 X129.288 Y97.078 E0.01665 
+G1 X128.826 Y97.270 E0.01665 F4531.271 
+G1 X128.396 Y97.448 E0.01552 F5564.729 
+G1 X126.581 Y98.200 E0.06540 F6000.000 
+G1 X126.433 Y98.262 E0.00534 F5853.767 
+G1 X125.971 Y98.453 E0.01665 F5208.952 
+G1 X125.509 Y98.645 E0.01665 F4041.433 
+G1 X125.047 Y98.836 E0.01665 F2352.272 
+G1 X124.758 Y98.428 E0.01665 
+G1 X124.470 Y98.020 E0.01665 F4041.433 
+G1 X124.181 Y97.611 E0.01665 F5208.952 
+G1 X124.088 Y97.480 E0.00534 F5853.767 
+G1 X120.961 Y93.059 E0.18033 F6000.000 
+G1 X120.866 Y92.925 E0.00547 F5850.254 
+G1 X120.577 Y92.516 E0.01665 F5201.052 
+G1 X120.289 Y92.108 E0.01665 F4031.246 
+G1 X120.000 Y91.700 E0.01665 F2334.725 
+G1 X119.711 Y92.108 E0.01665 
+G1 X119.423 Y92.516 E0.01665 F4031.246 
+G1 X119.134 Y92.925 E0.01665 F5201.052 
+G1 X119.039 Y93.059 E0.00547 F5850.254 
+G1 X115.912 Y97.480 E0.18033 F6000.000 
+G1 X115.819 Y97.611 E0.00534 F5853.767 
+G1 X115.530 Y98.020 E0.01665 F5208.952 
+G1 X115.242 Y98.428 E0.01665 F4041.433 
+G1 X114.953 Y98.836 E0.01665 F2352.272 
+G1 X114.491 Y98.645 E0.01665 
+G1 X114.029 Y98.453 E0.01665 F4041.433 
+G1 X113.567 Y98.262 E0.01665 F5208.952 
+G1 X113.419 Y98.200 E0.00534 F5853.767 
+G1 X111.604 Y97.448 E0.06540 F6000.000 
+G1 X111.174 Y97.270 E0.01552 F5564.729 
+G1 X110.712 Y97.078 E0.01665 F4531.271 
+G1 X110.250 Y96.887 E0.01665 F3119.682 
+G1 X109.853 Y96.583 E0.01665 
+G1 X109.457 Y96.278 E0.01665 F4531.271 
+G1 X109.087 Y95.995 E0.01552 F5564.729 
+G1 X107.375 Y94.682 E0.07183 F6000.000 
+G1 X107.004 Y94.398 E0.01556 F5563.609 
+G1 X106.608 Y94.093 E0.01665 F4528.520 
+G1 X106.211 Y93.789 E0.01665 F3115.684 
+G1 X105.907 Y93.392 E0.01665 
+G1 X105.602 Y92.996 E0.01665 F4528.520 
+G1 X105.318 Y92.625 E0.01556 F5563.609 
+G1 X104.005 Y90.913 E0.07183 F6000.000 
+G1 X103.722 Y90.543 E0.01552 F5564.729 
+G1 X103.417 Y90.147 E0.01665 F4531.271 
+G1 X103.113 Y89.750 E0.01665 F3119.682 
+G1 X102.922 Y89.288 E0.01665 
+G1 X102.730 Y88.826 E0.01665 F4531.271 
+G1 X102.552 Y88.396 E0.01552 F5564.729 
+G1 X101.800 Y86.581 E0.06540 F6000.000 
+G1 X101.738 Y86.433 E0.00534 F5853.767 
+G1 X101.547 Y85.971 E0.01665 F5208.952 
+G1 X101.355 Y85.509 E0.01665 F4041.433 
+G1 X101.164 Y85.047 E0.01665 F2352.272 
+G1 X101.572 Y84.758 E0.01665 
+G1 X101.980 Y84.470 E0.01665 F4041.433 
+G1 X102.389 Y84.181 E0.01665 F5208.952 
+G1 X102.520 Y84.088 E0.00534 F5853.767 
+G1 X106.941 Y80.961 E0.18033 F6000.000 
+G1 X107.075 Y80.866 E0.00547 F5850.254 
+G1 X107.484 Y80.577 E0.01665 F5201.052 
+G1 X107.892 Y80.289 E0.01665 F4031.246 
+G1 X108.300 Y80.000 E0.01665 F2334.725 
+G1 X107.892 Y79.711 E0.01665 
+G1 X107.484 Y79.423 E0.01665 F4031.246 
+G1 X107.075 Y79.134 E0.01665 F5201.052 
+G1 X106.941 Y79.039 E0.00547 F5850.254 
+G1 X102.520 Y75.912 E0.18033 F6000.000 
+G1 X102.389 Y75.819 E0.00534 F5853.767 
+G1 X101.980 Y75.530 E0.01665 F5208.952 
+G1 X101.572 Y75.242 E0.01665 F4041.433 
+G1 X101.164 Y74.953 E0.01665 F2352.272 
+G1 X101.355 Y74.491 E0.01665 
+G1 X101.547 Y74.029 E0.01665 F4041.433 
+G1 X101.738 Y73.567 E0.01665 F5208.952 
+G1 X101.800 Y73.419 E0.00534 F5853.767 
+G1 X102.552 Y71.604 E0.06540 F6000.000 
+G1 X102.730 Y71.174 E0.01552 F5564.729 
+G1 X102.922 Y70.712 E0.01665 F4531.271 
+G1 X103.113 Y70.250 E0.01665 F3119.682 
+G1 X103.417 Y69.853 E0.01665 
+G1 X103.722 Y69.457 E0.01665 F4531.271 
+G1 X104.005 Y69.087 E0.01552 F5564.729 
+G1 X105.318 Y67.375 E0.07183 F6000.000 
+G1 X105.602 Y67.004 E0.01556 F5563.609 
+G1 X105.907 Y66.608 E0.01665 F4528.520 
+G1 X106.211 Y66.211 E0.01665 F3115.684 
+G1 X106.608 Y65.907 E0.01665 
+G1 X107.004 Y65.602 E0.01665 F4528.520 
+G1 X107.375 Y65.318 E0.01556 F5563.609 
+G1 X109.087 Y64.005 E0.07183 F6000.000 
+G1 X109.457 Y63.722 E0.01552 F5564.729 
+G1 X109.853 Y63.417 E0.01665 F4531.271 
+G1 X110.250 Y63.113 E0.01665 F3119.682 
+G1 X110.712 Y62.922 E0.01665 
+G1 X111.174 Y62.730 E0.01665 F4531.271 
+G1 X111.604 Y62.552 E0.01552 F5564.729 
+G1 X113.419 Y61.800 E0.06540 F6000.000 
+G1 X113.567 Y61.738 E0.00534 F5853.767 
+G1 X114.029 Y61.547 E0.01665 F5208.952 
+G1 X114.491 Y61.355 E0.01665 F4041.433 
+G1 X114.953 Y61.164 E0.01665 F2352.272 
+G1 X115.242 Y61.572 E0.01665 
+G1 X115.530 Y61.980 E0.01665 F4041.433 
+G1 X115.819 Y62.389 E0.01665 F5208.952 
+G1 X115.912 Y62.520 E0.00534 F5853.767 
+G1 X119.039 Y66.941 E0.18033 F6000.000 
+G1 X119.134 Y67.075 E0.00547 F5850.254 
+G1 X119.423 Y67.484 E0.01665 F5201.052 
+G1 X119.711 Y67.892 E0.01665 F4031.246 
+G1 X120.000 Y68.300 E0.01665 F2334.725 
+G1 X120.289 Y67.892 E0.01665 
+G1 X120.577 Y67.484 E0.01665 F4031.246 
+G1 X120.866 Y67.075 E0.01665 F5201.052 
+G1 X120.961 Y66.941 E0.00547 F5850.254 
+G1 X124.088 Y62.520 E0.18033 F6000.000 
+G1 X124.181 Y62.389 E0.00534 F5853.767 
+G1 X124.470 Y61.980 E0.01665 F5208.952 
+G1 X124.758 Y61.572 E0.01665 F4041.433 
+G1 X125.047 Y61.164 E0.01665 F2352.272 
+G1 X125.509 Y61.355 E0.01665 
+G1 X125.971 Y61.547 E0.01665 F4041.433 
+G1 X126.433 Y61.738 E0.01665 F5208.952 
+G1 X126.581 Y61.800 E0.00534 F5853.767 
+G1 X128.396 Y62.552 E0.06540 F6000.000 
+G1 X128.826 Y62.730 E0.01552 F5564.729 
+G1 X129.288 Y62.922 E0.01665 F4531.271 
+G1 X129.750 Y63.113 E0.01665 F3119.682 
+G1 X130.147 Y63.417 E0.01665 
+G1 X130.543 Y63.722 E0.01665 F4531.271 
+G1 X130.913 Y64.005 E0.01552 F5564.729 
+G1 X132.625 Y65.318 E0.07183 F6000.000 
+G1 X132.996 Y65.602 E0.01556 F5563.609 
+G1 X133.392 Y65.907 E0.01665 F4528.520 
+G1 X133.789 Y66.211 E0.01665 F3115.684 
+G1 X134.093 Y66.608 E0.01665 
+G1 X134.398 Y67.004 E0.01665 F4528.520 
+G1 X134.682 Y67.375 E0.01556 F5563.609 
+G1 X135.995 Y69.087 E0.07183 F6000.000 
+G1 X136.278 Y69.457 E0.01552 F5564.729 
+G1 X136.583 Y69.853 E0.01665 F4531.271 
+G1 X136.887 Y70.250 E0.01665 F3119.682 
+G1 X137.078 Y70.712 E0.01665 
+G1 X137.270 Y71.174 E0.01665 F4531.271 
+G1 X137.448 Y71.604 E0.01552 F5564.729 
+G1 X138.200 Y73.419 E0.06540 F6000.000 
+G1 X138.262 Y73.567 E0.00534 F5853.767 
+G1 X138.453 Y74.029 E0.01665 F5208.952 
+G1 X138.645 Y74.491 E0.01665 F4041.433 
+G1 X138.836 Y74.953 E0.01665 F2352.272 
+G1 X138.428 Y75.242 E0.01665 
+G1 X138.020 Y75.530 E0.01665 F4041.433 
+G1 X137.611 Y75.819 E0.01665 F5208.952 
+G1 X137.480 Y75.912 E0.00534 F5853.767 
+G1 X133.061 Y79.038 E0.18025 F6000.000 
+G1 X132.925 Y79.134 E0.00555 F5848.077 
+G1 X132.516 Y79.423 E0.01665 F5196.152 
+G1 X132.108 Y79.711 E0.01665 F4024.922 
+G1 X131.700 Y80.000 E0.01665 F2323.790 
+G1 E-.8 F2100
+;TYPE:Sparse infill
+;WIDTH:0.45
+G1 X110.000 Y70.000 F12000
+G1 E.8 F2100
+G1 F9000
+G1 X110.000 Y70.000 E0.66600
+G1 X110.000 Y70.500 E0.01665 F2333.157 
+G1 X110.000 Y70.851 E0.01169 F3825.600 
+G1 X110.000 Y71.200 E0.01162 F3828.630 
+G1 Y71.700 E0.01665 F2343.075 
+G1 X110.500 Y71.700 E0.01665 
+G1 X111.000 Y71.700 E0.01665 F4036.087 
+G1 X111.500 Y71.700 E0.01665 F5204.805 
+G1 X112.000 Y71.700 E0.01665 F6155.485 
+G1 X112.500 Y71.700 E0.01665 F6977.822 
+G1 X113.000 Y71.700 E0.01665 F7712.976 
+G1 X113.500 Y71.700 E0.01665 F8383.913 
+G1 X113.746 Y71.700 E0.00819 F8851.271 
+G1 X126.254 Y71.700 E0.41653 F9000.000 
+G1 X126.500 Y71.700 E0.00819 F8851.271 
+G1 X127.000 Y71.700 E0.01665 F8383.913 
+G1 X127.500 Y71.700 E0.01665 F7712.976 
+G1 X128.000 Y71.700 E0.01665 F6977.822 
+G1 X128.500 Y71.700 E0.01665 F6155.485 
+G1 X129.000 Y71.700 E0.01665 F5204.805 
+G1 X129.500 Y71.700 E0.01665 F4036.087 
+G1 X130.000 Y71.700 E0.01665 F2343.075 
+G1 X130.000 Y72.200 E0.01665 
+G1 X130.000 Y72.550 E0.01166 F3830.144 
+G1 X130.000 Y72.900 E0.01166 
+G1 Y73.400 E0.01665 F2343.075 
+G1 X129.500 Y73.400 E0.01665 
+G1 X129.000 Y73.400 E0.01665 F4036.087 
+G1 X128.500 Y73.400 E0.01665 F5204.805 
+G1 X128.000 Y73.400 E0.01665 F6155.485 
+G1 X127.500 Y73.400 E0.01665 F6977.822 
+G1 X127.000 Y73.400 E0.01665 F7712.976 
+G1 X126.500 Y73.400 E0.01665 F8383.913 
+G1 X126.254 Y73.400 E0.00819 F8851.271 
+G1 X113.746 Y73.400 E0.41653 F9000.000 
+G1 X113.500 Y73.400 E0.00819 F8851.271 
+G1 X113.000 Y73.400 E0.01665 F8383.913 
+G1 X112.500 Y73.400 E0.01665 F7712.976 
+G1 X112.000 Y73.400 E0.01665 F6977.822 
+G1 X111.500 Y73.400 E0.01665 F6155.485 
+G1 X111.000 Y73.400 E0.01665 F5204.805 
+G1 X110.500 Y73.400 E0.01665 F4036.087 
+G1 X110.000 Y73.400 E0.01665 F2343.075 
+G1 X110.000 Y73.900 E0.01665 
+G1 X110.000 Y74.250 E0.01165 F3830.144 
+G1 X110.000 Y74.600 E0.01165 
+G1 Y75.100 E0.01665 F2343.075 
+G1 X110.500 Y75.100 E0.01665 
+G1 X111.000 Y75.100 E0.01665 F4036.087 
+G1 X111.500 Y75.100 E0.01665 F5204.805 
+G1 X112.000 Y75.100 E0.01665 F6155.485 
+G1 X112.500 Y75.100 E0.01665 F6977.822 
+G1 X113.000 Y75.100 E0.01665 F7712.976 
+G1 X113.500 Y75.100 E0.01665 F8383.913 
+G1 X113.746 Y75.100 E0.00819 F8851.271 
+G1 X126.254 Y75.100 E0.41653 F9000.000 
+G1 X126.500 Y75.100 E0.00819 F8851.271 
+G1 X127.000 Y75.100 E0.01665 F8383.913 
+G1 X127.500 Y75.100 E0.01665 F7712.976 
+G1 X128.000 Y75.100 E0.01665 F6977.822 
+G1 X128.500 Y75.100 E0.01665 F6155.485 
+G1 X129.000 Y75.100 E0.01665 F5204.805 
+G1 X129.500 Y75.100 E0.01665 F4036.087 
+G1 X130.000 Y75.100 E0.01665 F2343.075 
+G1 X130.000 Y75.600 E0.01665 
+G1 X130.000 Y75.950 E0.01166 F3830.144 
+G1 X130.000 Y76.300 E0.01166 
+G1 Y76.800 E0.01665 F2343.075 
+G1 X129.500 Y76.800 E0.01665 
+G1 X129.000 Y76.800 E0.01665 F4036.087 
+G1 X128.500 Y76.800 E0.01665 F5204.805 
+G1 X128.000 Y76.800 E0.01665 F6155.485 
+G1 X127.500 Y76.800 E0.01665 F6977.822 
+G1 X127.000 Y76.800 E0.01665 F7712.976 
+G1 X126.500 Y76.800 E0.01665 F8383.913 
+G1 X126.254 Y76.800 E0.00819 F8851.271 
+G1 X113.746 Y76.800 E0.41653 F9000.000 
+G1 X113.500 Y76.800 E0.00819 F8851.271 
+G1 X113.000 Y76.800 E0.01665 F8383.913 
+G1 X112.500 Y76.800 E0.01665 F7712.976 
+G1 X112.000 Y76.800 E0.01665 F6977.822 
+G1 X111.500 Y76.800 E0.01665 F6155.485 
+G1 X111.000 Y76.800 E0.01665 F5204.805 
+G1 X110.500 Y76.800 E0.01665 F4036.087 
+G1 X110.000 Y76.800 E0.01665 F2343.075 
+G1 X110.000 Y77.300 E0.01665 
+G1 X110.000 Y77.650 E0.01166 F3830.144 
+G1 X110.000 Y78.000 E0.01166 
+G1 Y78.500 E0.01665 F2343.075 
+G1 X110.500 Y78.500 E0.01665 
+G1 X111.000 Y78.500 E0.01665 F4036.087 
+G1 X111.500 Y78.500 E0.01665 F5204.805 
+G1 X112.000 Y78.500 E0.01665 F6155.485 
+G1 X112.500 Y78.500 E0.01665 F6977.822 
+G1 X113.000 Y78.500 E0.01665 F7712.976 
+G1 X113.500 Y78.500 E0.01665 F8383.913 
+G1 X113.746 Y78.500 E0.00819 F8851.271 
+G1 X126.254 Y78.500 E0.41653 F9000.000 
+G1 X126.500 Y78.500 E0.00819 F8851.271 
+G1 X127.000 Y78.500 E0.01665 F8383.913 
+G1 X127.500 Y78.500 E0.01665 F7712.976 
+G1 X128.000 Y78.500 E0.01665 F6977.822 
+G1 X128.500 Y78.500 E0.01665 F6155.485 
+G1 X129.000 Y78.500 E0.01665 F5204.805 
+G1 X129.500 Y78.500 E0.01665 F4036.087 
+G1 X130.000 Y78.500 E0.01665 F2343.075 
+G1 X130.000 Y79.000 E0.01665 
+G1 X130.000 Y79.350 E0.01166 F3830.144 
+G1 X130.000 Y79.700 E0.01166 
+G1 Y80.200 E0.01665 F2343.075 
+G1 X129.500 Y80.200 E0.01665 
+G1 X129.000 Y80.200 E0.01665 F4036.087 
+G1 X128.500 Y80.200 E0.01665 F5204.805 
+G1 X128.000 Y80.200 E0.01665 F6155.485 
+G1 X127.500 Y80.200 E0.01665 F6977.822 
+G1 X127.000 Y80.200 E0.01665 F7712.976 
+G1 X126.500 Y80.200 E0.01665 F8383.913 
+G1 X126.254 Y80.200 E0.00819 F8851.271 
+G1 X113.746 Y80.200 E0.41653 F9000.000 
+G1 X113.500 Y80.200 E0.00819 F8851.271 
+G1 X113.000 Y80.200 E0.01665 F8383.913 
+G1 X112.500 Y80.200 E0.01665 F7712.976 
+G1 X112.000 Y80.200 E0.01665 F6977.822 
+G1 X111.500 Y80.200 E0.01665 F6155.485 
+G1 X111.000 Y80.200 E0.01665 F5204.805 
+G1 X110.500 Y80.200 E0.01665 F4036.087 
+G1 X110.000 Y80.200 E0.01665 F2343.075 
+G1 X110.000 Y80.700 E0.01665 
+G1 X110.000 Y81.050 E0.01166 F3830.144 
+G1 X110.000 Y81.400 E0.01166 
+G1 Y81.900 E0.01665 F2343.075 
+G1 X110.500 Y81.900 E0.01665 
+G1 X111.000 Y81.900 E0.01665 F4036.087 
+G1 X111.500 Y81.900 E0.01665 F5204.805 
+G1 X112.000 Y81.900 E0.01665 F6155.485 
+G1 X112.500 Y81.900 E0.01665 F6977.822 
+G1 X113.000 Y81.900 E0.01665 F7712.976 
+G1 X113.500 Y81.900 E0.01665 F8383.913 
+G1 X113.746 Y81.900 E0.00819 F8851.271 
+G1 X126.254 Y81.900 E0.41653 F9000.000 
+G1 X126.500 Y81.900 E0.00819 F8851.271 
+G1 X127.000 Y81.900 E0.01665 F8383.913 
+G1 X127.500 Y81.900 E0.01665 F7712.976 
+G1 X128.000 Y81.900 E0.01665 F6977.822 
+G1 X128.500 Y81.900 E0.01665 F6155.485 
+G1 X129.000 Y81.900 E0.01665 F5204.805 
+G1 X129.500 Y81.900 E0.01665 F4036.087 
+G1 X130.000 Y81.900 E0.01665 F2343.075 
+G1 X130.000 Y82.400 E0.01665 
+G1 X130.000 Y82.750 E0.01165 F3830.144 
+G1 X130.000 Y83.100 E0.01165 
+G1 Y83.600 E0.01665 F2343.075 
+G1 X129.500 Y83.600 E0.01665 
+G1 X129.000 Y83.600 E0.01665 F4036.087 
+G1 X128.500 Y83.600 E0.01665 F5204.805 
+G1 X128.000 Y83.600 E0.01665 F6155.485 
+G1 X127.500 Y83.600 E0.01665 F6977.822 
+G1 X127.000 Y83.600 E0.01665 F7712.976 
+G1 X126.500 Y83.600 E0.01665 F8383.913 
+G1 X126.254 Y83.600 E0.00819 F8851.271 
+G1 X113.746 Y83.600 E0.41653 F9000.000 
+G1 X113.500 Y83.600 E0.00819 F8851.271 
+G1 X113.000 Y83.600 E0.01665 F8383.913 
+G1 X112.500 Y83.600 E0.01665 F7712.976 
+G1 X112.000 Y83.600 E0.01665 F6977.822 
+G1 X111.500 Y83.600 E0.01665 F6155.485 
+G1 X111.000 Y83.600 E0.01665 F5204.805 
+G1 X110.500 Y83.600 E0.01665 F4036.087 
+G1 X110.000 Y83.600 E0.01665 F2343.075 
+G1 X110.000 Y84.100 E0.01665 
+G1 X110.000 Y84.450 E0.01166 F3830.144 
+G1 X110.000 Y84.800 E0.01166 
+G1 Y85.300 E0.01665 F2343.075 
+G1 X110.500 Y85.300 E0.01665 
+G1 X111.000 Y85.300 E0.01665 F4036.087 
+G1 X111.500 Y85.300 E0.01665 F5204.805 
+G1 X112.000 Y85.300 E0.01665 F6155.485 
+G1 X112.500 Y85.300 E0.01665 F6977.822 
+G1 X113.000 Y85.300 E0.01665 F7712.976 
+G1 X113.500 Y85.300 E0.01665 F8383.913 
+G1 X113.746 Y85.300 E0.00819 F8851.271 
+G1 X126.254 Y85.300 E0.41653 F9000.000 
+G1 X126.500 Y85.300 E0.00819 F8851.271 
+G1 X127.000 Y85.300 E0.01665 F8383.913 
+G1 X127.500 Y85.300 E0.01665 F7712.976 
+G1 X128.000 Y85.300 E0.01665 F6977.822 
+G1 X128.500 Y85.300 E0.01665 F6155.485 
+G1 X129.000 Y85.300 E0.01665 F5204.805 
+G1 X129.500 Y85.300 E0.01665 F4036.087 
+G1 X130.000 Y85.300 E0.01665 F2343.075 
+G1 X130.000 Y85.800 E0.01665 
+G1 X130.000 Y86.150 E0.01166 F3830.144 
+G1 X130.000 Y86.500 E0.01166 
+G1 Y87.000 E0.01665 F2343.075 
+G1 X129.500 Y87.000 E0.01665 
+G1 X129.000 Y87.000 E0.01665 F4036.087 
+G1 X128.500 Y87.000 E0.01665 F5204.805 
+G1 X128.000 Y87.000 E0.01665 F6155.485 
+G1 X127.500 Y87.000 E0.01665 F6977.822 
+G1 X127.000 Y87.000 E0.01665 F7712.976 
+G1 X126.500 Y87.000 E0.01665 F8383.913 
+G1 X126.254 Y87.000 E0.00819 F8851.271 
+G1 X113.746 Y87.000 E0.41653 F9000.000 
+G1 X113.500 Y87.000 E0.00819 F8851.271 
+G1 X113.000 Y87.000 E0.01665 F8383.913 
+G1 X112.500 Y87.000 E0.01665 F7712.976 
+G1 X112.000 Y87.000 E0.01665 F6977.822 
+G1 X111.500 Y87.000 E0.01665 F6155.485 
+G1 X111.000 Y87.000 E0.01665 F5204.805 
+G1 X110.500 Y87.000 E0.01665 F4036.087 
+G1 X110.000 Y87.000 E0.01665 F2343.075 
+G1 X110.000 Y87.500 E0.01665 
+G1 X110.000 Y87.850 E0.01166 F3830.144 
+G1 X110.000 Y88.200 E0.01166 
+G1 Y88.700 E0.01665 F2343.075 
+G1 X110.500 Y88.700 E0.01665 
+G1 X111.000 Y88.700 E0.01665 F4036.087 
+G1 X111.500 Y88.700 E0.01665 F5204.805 
+G1 X112.000 Y88.700 E0.01665 F6155.485 
+G1 X112.500 Y88.700 E0.01665 F6977.822 
+G1 X113.000 Y88.700 E0.01665 F7712.976 
+G1 X113.500 Y88.700 E0.01665 F8383.913 
+G1 X113.746 Y88.700 E0.00819 F8851.271 
+G1 X126.254 Y88.700 E0.41653 F9000.000 
+G1 X126.500 Y88.700 E0.00819 F8851.271 
+G1 X127.000 Y88.700 E0.01665 F8383.913 
+G1 X127.500 Y88.700 E0.01665 F7712.976 
+G1 X128.000 Y88.700 E0.01665 F6977.822 
+G1 X128.500 Y88.700 E0.01665 F6155.485 
+G1 X129.000 Y88.700 E0.01665 F5204.805 
+G1 X129.500 Y88.700 E0.01665 F4036.087 
+G1 X130.000 Y88.700 E0.01665 F2343.075 
+G1 X130.000 Y89.200 E0.01665 
+G1 X130.000 Y89.548 E0.01159 F3827.205 
+G1 X130.000 Y89.900 E0.01172 F3821.322 
+G1 Y90.400 E0.01665 F2323.790 
+; some comment
+
+G1 E-.8 F2100
+;TYPE:Gap infill
+G1 X10 Y10 F12000
+G1 X10.413 Y10.055 E0.00275 F2122.609 
+G1 X11.087 Y10.145 E0.00450 F3000.000 
+G1 X11.500 Y10.200 E0.00275 F2121.320 
+M107
+; EXECUTABLE_BLOCK_END
\ No newline at end of file
@@ -0,0 +1,815 @@
+; HEADER_BLOCK_START
+; generated by synthetic
+; HEADER_BLOCK_END
+
+M104 S210 ; set temp
+G28
+G90
+M83
+G1 F1200
+;LAYER_CHANGE
+;Z:0.2
+;HEIGHT:0.2
+G1 E-.8 F2100
+G1 Z0.200 F720
+;TYPE:Outer wall
+;WIDTH:0.45
+G1 X62.000 Y50.000 F12000
+G1 E.8 F2100
+G1 F3000
+G1 X69.319 Y55.176 E0.29851
+G1 X67.321 Y60.000 E0.17386
+G1 X64.142 Y64.142 E0.17386
+G1 X60.000 Y67.321 E0.17386
+G1 X55.176 Y69.319 E0.17386
+G1 X51.444 Y64.041 E0.21526 
+G1 X51.155 Y63.633 E0.01665 F2400.000 
+G1 X50.866 Y63.225 E0.01665 F1800.000 
+G1 X50.577 Y62.816 E0.01665 F1200.000 
+G1 X50.000 Y62.000 E0.03330 F1200.000 
+G1 X49.423 Y62.816 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X49.134 Y63.225 E0.01665 F1200.000 
+G1 X48.845 Y63.633 E0.01665 F1800.000 
+G1 X48.556 Y64.041 E0.01665 F2400.000 
+G1 F3000.0 ; restore
+G1 X44.824 Y69.319 E0.21526 
+G1 X40.000 Y67.321 E0.17386
+G1 X35.858 Y64.142 E0.17386
+G1 X32.679 Y60.000 E0.17386
+G1 X30.681 Y55.176 E0.17386
+G1 X35.959 Y51.444 E0.21526 
+G1 X36.367 Y51.155 E0.01665 F2400.000 
+G1 X36.775 Y50.866 E0.01665 F1800.000 
+G1 X37.184 Y50.577 E0.01665 F1200.000 
+G1 X38.000 Y50.000 E0.03330 F1200.000 
+G1 X37.184 Y49.423 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X36.775 Y49.134 E0.01665 F1200.000 
+G1 X36.367 Y48.845 E0.01665 F1800.000 
+G1 X35.959 Y48.556 E0.01665 F2400.000 
+G1 F3000.0 ; restore
+G1 X30.681 Y44.824 E0.21526 
+G1 X32.679 Y40.000 E0.17386
+G1 X35.858 Y35.858 E0.17386
+G1 X40.000 Y32.679 E0.17386
+G1 X44.824 Y30.681 E0.17386
+G1 X48.556 Y35.959 E0.21526 
+G1 X48.845 Y36.367 E0.01665 F2400.000 
+G1 X49.134 Y36.775 E0.01665 F1800.000 
+G1 X49.423 Y37.184 E0.01665 F1200.000 
+G1 X50.000 Y38.000 E0.03330 F1200.000 
+G1 X50.577 Y37.184 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X50.866 Y36.775 E0.01665 F1200.000 
+G1 X51.155 Y36.367 E0.01665 F1800.000 
+G1 X51.444 Y35.959 E0.01665 F2400.000 
+G1 F3000.0 ; restore
+G1 X55.176 Y30.681 E0.21526 
+G1 X60.000 Y32.679 E0.17386
+G1 X64.142 Y35.858 E0.17386
+G1 X67.321 Y40.000 E0.17386
+G1 X69.319 Y44.824 E0.17386
+G1 X63.796 Y48.730 E0.22525 
+G1 X63.388 Y49.018 E0.01665 F2400.000 
+G1 X62.980 Y49.307 E0.01665 F1800.000 
+G1 X62.572 Y49.596 E0.01665 F1200.000 
+G1 X62.000 Y50.000 E0.02331 
+G1 E-.8 F2100
+;TYPE:Inner wall
+;WIDTH:0.45
+G1 X61.700 Y50.000 F1200.000 
+G1 E0.80000 F1200.000 
+G1 F1200.000 
+G1 X62.516 Y50.577 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X62.925 Y50.866 E0.01665 F1200.000 
+G1 X63.333 Y51.155 E0.01665 F1800.000 
+G1 X63.741 Y51.444 E0.01665 F2400.000 
+G1 X64.149 Y51.732 E0.01665 F3000.000 
+G1 X64.558 Y52.021 E0.01665 F3600.000 
+G1 X64.966 Y52.310 E0.01665 F4200.000 
+G1 X65.374 Y52.598 E0.01665 F4800.000 
+G1 X65.782 Y52.887 E0.01665 F5400.000 
+G1 F6000.0 ; restore
+G1 X68.836 Y55.047 E0.12455 
+G1 X66.887 Y59.750 E0.16951
+G1 X63.789 Y63.789 E0.16951
+G1 X59.750 Y66.887 E0.16951
+G1 X55.047 Y68.836 E0.16951
+G1 X52.887 Y65.782 E0.12455 
+G1 X52.598 Y65.374 E0.01665 F5400.000 
+G1 X52.310 Y64.966 E0.01665 F4800.000 
+G1 X52.021 Y64.558 E0.01665 F4200.000 
+G1 X51.732 Y64.149 E0.01665 F3600.000 
+G1 X51.444 Y63.741 E0.01665 F3000.000 
+G1 X51.155 Y63.333 E0.01665 F2400.000 
+G1 X50.866 Y62.925 E0.01665 F1800.000 
+G1 X50.577 Y62.516 E0.01665 F1200.000 
+G1 X50.000 Y61.700 E0.03330 F1200.000 
+G1 X49.423 Y62.516 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X49.134 Y62.925 E0.01665 F1200.000 
+G1 X48.845 Y63.333 E0.01665 F1800.000 
+G1 X48.556 Y63.741 E0.01665 F2400.000 
+G1 X48.268 Y64.149 E0.01665 F3000.000 
+G1 X47.979 Y64.558 E0.01665 F3600.000 
+G1 X47.690 Y64.966 E0.01665 F4200.000 
+G1 X47.402 Y65.374 E0.01665 F4800.000 
+G1 X47.113 Y65.782 E0.01665 F5400.000 
+G1 F6000.0 ; restore
+G1 X44.953 Y68.836 E0.12455 
+G1 X40.250 Y66.887 E0.16951
+G1 X36.211 Y63.789 E0.16951
+G1 X33.113 Y59.750 E0.16951
+G1 X31.164 Y55.047 E0.16951
+G1 X34.218 Y52.887 E0.12455 
+G1 X34.626 Y52.598 E0.01665 F5400.000 
+G1 X35.034 Y52.310 E0.01665 F4800.000 
+G1 X35.442 Y52.021 E0.01665 F4200.000 
+G1 X35.851 Y51.732 E0.01665 F3600.000 
+G1 X36.259 Y51.444 E0.01665 F3000.000 
+G1 X36.667 Y51.155 E0.01665 F2400.000 
+G1 X37.075 Y50.866 E0.01665 F1800.000 
+G1 X37.484 Y50.577 E0.01665 F1200.000 
+G1 X38.300 Y50.000 E0.03330 F1200.000 
+G1 X37.484 Y49.423 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X37.075 Y49.134 E0.01665 F1200.000 
+G1 X36.667 Y48.845 E0.01665 F1800.000 
+G1 X36.259 Y48.556 E0.01665 F2400.000 
+G1 X35.851 Y48.268 E0.01665 F3000.000 
+G1 X35.442 Y47.979 E0.01665 F3600.000 
+G1 X35.034 Y47.690 E0.01665 F4200.000 
+G1 X34.626 Y47.402 E0.01665 F4800.000 
+G1 X34.218 Y47.113 E0.01665 F5400.000 
+G1 F6000.0 ; restore
+G1 X31.164 Y44.953 E0.12455 
+G1 X33.113 Y40.250 E0.16951
+G1 X36.211 Y36.211 E0.16951
+G1 X40.250 Y33.113 E0.16951
+G1 X44.953 Y31.164 E0.16951
+G1 X47.113 Y34.218 E0.12455 
+G1 X47.402 Y34.626 E0.01665 F5400.000 
+G1 X47.690 Y35.034 E0.01665 F4800.000 
+G1 X47.979 Y35.442 E0.01665 F4200.000 
+G1 X48.268 Y35.851 E0.01665 F3600.000 
+G1 X48.556 Y36.259 E0.01665 F3000.000 
+G1 X48.845 Y36.667 E0.01665 F2400.000 
+G1 X49.134 Y37.075 E0.01665 F1800.000 
+G1 X49.423 Y37.484 E0.01665 F1200.000 
+G1 X50.000 Y38.300 E0.03330 F1200.000 
+G1 X50.577 Y37.484 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X50.866 Y37.075 E0.01665 F1200.000 
+G1 X51.155 Y36.667 E0.01665 F1800.000 
+G1 X51.444 Y36.259 E0.01665 F2400.000 
+G1 X51.732 Y35.851 E0.01665 F3000.000 
+G1 X52.021 Y35.442 E0.01665 F3600.000 
+G1 X52.310 Y35.034 E0.01665 F4200.000 
+G1 X52.598 Y34.626 E0.01665 F4800.000 
+G1 X52.887 Y34.218 E0.01665 F5400.000 
+G1 F6000.0 ; restore
+G1 X55.047 Y31.164 E0.12455 
+G1 X59.750 Y33.113 E0.16951
+G1 X63.789 Y36.211 E0.16951
+G1 X66.887 Y40.250 E0.16951
+G1 X68.836 Y44.953 E0.16951
+G1 X61.700 Y50.000 E0.29104
+G1 E-.8 F2100
+;TYPE:Sparse infill
+;WIDTH:0.45
+G1 X40.000 Y40.000 F12000
+G1 E.8 F2100
+G1 F9000
+G1 X40.000 Y40.000 E0.66600
+G1 Y41.700 E0.05661
+G1 X60.000 Y41.700 E0.66600
+G1 Y43.400 E0.05661
+G1 X40.000 Y43.400 E0.66600
+G1 Y45.100 E0.05661
+G1 X60.000 Y45.100 E0.66600
+G1 Y46.800 E0.05661
+G1 X40.000 Y46.800 E0.66600
+G1 Y48.500 E0.05661
+G1 X60.000 Y48.500 E0.66600
+G1 Y50.200 E0.05661
+G1 X40.000 Y50.200 E0.66600
+G1 Y51.900 E0.05661
+G1 X60.000 Y51.900 E0.66600
+G1 Y53.600 E0.05661
+G1 X40.000 Y53.600 E0.66600
+G1 Y55.300 E0.05661
+G1 X60.000 Y55.300 E0.66600
+G1 Y57.000 E0.05661
+G1 X40.000 Y57.000 E0.66600
+G1 Y58.700 E0.05661
+G1 X60.000 Y58.700 E0.66600
+G1 Y60.400 E0.05661
+; some comment
+
+G1 E-.8 F2100
+;TYPE:Outer wall
+;WIDTH:0.45
+G1 X132.000 Y80.000 F12000
+G1 E.8 F2100
+G1 F3000
+G1 X139.319 Y85.176 E0.29851
+G1 X137.321 Y90.000 E0.17386
+G1 X134.142 Y94.142 E0.17386
+G1 X130.000 Y97.321 E0.17386
+G1 X125.176 Y99.319 E0.17386
+G1 X121.444 Y94.041 E0.21526 
+G1 X121.155 Y93.633 E0.01665 F2400.000 
+G1 X120.866 Y93.225 E0.01665 F1800.000 
+G1 X120.577 Y92.816 E0.01665 F1200.000 
+G1 X120.000 Y92.000 E0.03330 F1200.000 
+G1 X119.423 Y92.816 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X119.134 Y93.225 E0.01665 F1200.000 
+G1 X118.845 Y93.633 E0.01665 F1800.000 
+G1 X118.556 Y94.041 E0.01665 F2400.000 
+G1 F3000.0 ; restore
+G1 X114.824 Y99.319 E0.21526 
+G1 X110.000 Y97.321 E0.17386
+G1 X105.858 Y94.142 E0.17386
+G1 X102.679 Y90.000 E0.17386
+G1 X100.681 Y85.176 E0.17386
+G1 X105.959 Y81.444 E0.21526 
+G1 X106.367 Y81.155 E0.01665 F2400.000 
+G1 X106.775 Y80.866 E0.01665 F1800.000 
+G1 X107.184 Y80.577 E0.01665 F1200.000 
+G1 X108.000 Y80.000 E0.03330 F1200.000 
+G1 X107.184 Y79.423 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X106.775 Y79.134 E0.01665 F1200.000 
+G1 X106.367 Y78.845 E0.01665 F1800.000 
+G1 X105.959 Y78.556 E0.01665 F2400.000 
+G1 F3000.0 ; restore
+G1 X100.681 Y74.824 E0.21526 
+G1 X102.679 Y70.000 E0.17386
+G1 X105.858 Y65.858 E0.17386
+G1 X110.000 Y62.679 E0.17386
+G1 X114.824 Y60.681 E0.17386
+G1 X118.556 Y65.959 E0.21526 
+G1 X118.845 Y66.367 E0.01665 F2400.000 
+G1 X119.134 Y66.775 E0.01665 F1800.000 
+G1 X119.423 Y67.184 E0.01665 F1200.000 
+G1 X120.000 Y68.000 E0.03330 F1200.000 
+G1 X120.577 Y67.184 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X120.866 Y66.775 E0.01665 F1200.000 
+G1 X121.155 Y66.367 E0.01665 F1800.000 
+G1 X121.444 Y65.959 E0.01665 F2400.000 
+G1 F3000.0 ; restore
+G1 X125.176 Y60.681 E0.21526 
+G1 X130.000 Y62.679 E0.17386
+G1 X134.142 Y65.858 E0.17386
+G1 X137.321 Y70.000 E0.17386
+G1 X139.319 Y74.824 E0.17386
+G1 X133.796 Y78.730 E0.22525 
+G1 X133.388 Y79.018 E0.01665 F2400.000 
+G1 X132.980 Y79.307 E0.01665 F1800.000 
+G1 X132.572 Y79.596 E0.01665 F1200.000 
+G1 X132.000 Y80.000 E0.02331 
+G1 E-.8 F2100
+;TYPE:Inner wall
+;WIDTH:0.45
+G1 X131.700 Y80.000 F1200.000 
+G1 E0.80000 F1200.000 
+G1 F1200.000 
+G1 X132.516 Y80.577 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X132.925 Y80.866 E0.01665 F1200.000 
+G1 X133.333 Y81.155 E0.01665 F1800.000 
+G1 X133.741 Y81.444 E0.01665 F2400.000 
+G1 X134.149 Y81.732 E0.01665 F3000.000 
+G1 X134.558 Y82.021 E0.01665 F3600.000 
+G1 X134.966 Y82.310 E0.01665 F4200.000 
+G1 X135.374 Y82.598 E0.01665 F4800.000 
+G1 X135.782 Y82.887 E0.01665 F5400.000 
+G1 F6000.0 ; restore
+G1 X138.836 Y85.047 E0.12455 
+G1 X136.887 Y89.750 E0.16951
+G1 X133.789 Y93.789 E0.16951
+G1 X129.750 Y96.887 E0.16951
+G1 X125.047 Y98.836 E0.16951
+G1 X122.887 Y95.782 E0.12455 
+G1 X122.598 Y95.374 E0.01665 F5400.000 
+G1 X122.310 Y94.966 E0.01665 F4800.000 
+G1 X122.021 Y94.558 E0.01665 F4200.000 
+G1 X121.732 Y94.149 E0.01665 F3600.000 
+G1 X121.444 Y93.741 E0.01665 F3000.000 
+G1 X121.155 Y93.333 E0.01665 F2400.000 
+G1 X120.866 Y92.925 E0.01665 F1800.000 
+G1 X120.577 Y92.516 E0.01665 F1200.000 
+G1 X120.000 Y91.700 E0.03330 F1200.000 
+G1 X119.423 Y92.516 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X119.134 Y92.925 E0.01665 F1200.000 
+G1 X118.845 Y93.333 E0.01665 F1800.000 
+G1 X118.556 Y93.741 E0.01665 F2400.000 
+G1 X118.268 Y94.149 E0.01665 F3000.000 
+G1 X117.979 Y94.558 E0.01665 F3600.000 
+G1 X117.690 Y94.966 E0.01665 F4200.000 
+G1 X117.402 Y95.374 E0.01665 F4800.000 
+G1 X117.113 Y95.782 E0.01665 F5400.000 
+G1 F6000.0 ; restore
+G1 X114.953 Y98.836 E0.12455 
+G1 X110.250 Y96.887 E0.16951
+G1 X106.211 Y93.789 E0.16951
+G1 X103.113 Y89.750 E0.16951
+G1 X101.164 Y85.047 E0.16951
+G1 X104.218 Y82.887 E0.12455 
+G1 X104.626 Y82.598 E0.01665 F5400.000 
+G1 X105.034 Y82.310 E0.01665 F4800.000 
+G1 X105.442 Y82.021 E0.01665 F4200.000 
+G1 X105.851 Y81.732 E0.01665 F3600.000 
+G1 X106.259 Y81.444 E0.01665 F3000.000 
+G1 X106.667 Y81.155 E0.01665 F2400.000 
+G1 X107.075 Y80.866 E0.01665 F1800.000 
+G1 X107.484 Y80.577 E0.01665 F1200.000 
+G1 X108.300 Y80.000 E0.03330 F1200.000 
+G1 X107.484 Y79.423 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X107.075 Y79.134 E0.01665 F1200.000 
+G1 X106.667 Y78.845 E0.01665 F1800.000 
+G1 X106.259 Y78.556 E0.01665 F2400.000 
+G1 X105.851 Y78.268 E0.01665 F3000.000 
+G1 X105.442 Y77.979 E0.01665 F3600.000 
+G1 X105.034 Y77.690 E0.01665 F4200.000 
+G1 X104.626 Y77.402 E0.01665 F4800.000 
+G1 X104.218 Y77.113 E0.01665 F5400.000 
+G1 F6000.0 ; restore
+G1 X101.164 Y74.953 E0.12455 
+G1 X103.113 Y70.250 E0.16951
+G1 X106.211 Y66.211 E0.16951
+G1 X110.250 Y63.113 E0.16951
+G1 X114.953 Y61.164 E0.16951
+G1 X117.113 Y64.218 E0.12455 
+G1 X117.402 Y64.626 E0.01665 F5400.000 
+G1 X117.690 Y65.034 E0.01665 F4800.000 
+G1 X117.979 Y65.442 E0.01665 F4200.000 
+G1 X118.268 Y65.851 E0.01665 F3600.000 
+G1 X118.556 Y66.259 E0.01665 F3000.000 
+G1 X118.845 Y66.667 E0.01665 F2400.000 
+G1 X119.134 Y67.075 E0.01665 F1800.000 
+G1 X119.423 Y67.484 E0.01665 F1200.000 
+G1 X120.000 Y68.300 E0.03330 F1200.000 
+G1 X120.577 Y67.484 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X120.866 Y67.075 E0.01665 F1200.000 
+G1 X121.155 Y66.667 E0.01665 F1800.000 
+G1 X121.444 Y66.259 E0.01665 F2400.000 
+G1 X121.732 Y65.851 E0.01665 F3000.000 
+G1 X122.021 Y65.442 E0.01665 F3600.000 
+G1 X122.310 Y65.034 E0.01665 F4200.000 
+G1 X122.598 Y64.626 E0.01665 F4800.000 
+G1 X122.887 Y64.218 E0.01665 F5400.000 
+G1 F6000.0 ; restore
+G1 X125.047 Y61.164 E0.12455 
+G1 X129.750 Y63.113 E0.16951
+G1 X133.789 Y66.211 E0.16951
+G1 X136.887 Y70.250 E0.16951
+G1 X138.836 Y74.953 E0.16951
+G1 X131.700 Y80.000 E0.29104
+G1 E-.8 F2100
+;TYPE:Sparse infill
+;WIDTH:0.45
+G1 X110.000 Y70.000 F12000
+G1 E.8 F2100
+G1 F9000
+G1 X110.000 Y70.000 E0.66600
+G1 Y71.700 E0.05661
+G1 X130.000 Y71.700 E0.66600
+G1 Y73.400 E0.05661
+G1 X110.000 Y73.400 E0.66600
+G1 Y75.100 E0.05661
+G1 X130.000 Y75.100 E0.66600
+G1 Y76.800 E0.05661
+G1 X110.000 Y76.800 E0.66600
+G1 Y78.500 E0.05661
+G1 X130.000 Y78.500 E0.66600
+G1 Y80.200 E0.05661
+G1 X110.000 Y80.200 E0.66600
+G1 Y81.900 E0.05661
+G1 X130.000 Y81.900 E0.66600
+G1 Y83.600 E0.05661
+G1 X110.000 Y83.600 E0.66600
+G1 Y85.300 E0.05661
+G1 X130.000 Y85.300 E0.66600
+G1 Y87.000 E0.05661
+G1 X110.000 Y87.000 E0.66600
+G1 Y88.700 E0.05661
+G1 X130.000 Y88.700 E0.66600
+G1 Y90.400 E0.05661
+; some comment
+
+G1 E-.8 F2100
+;TYPE:Gap infill
+G1 X10 Y10 F12000
+G1 X11.5 Y10.2 E.01 F3000
+;LAYER_CHANGE
+;Z:0.4
+;HEIGHT:0.2
+G1 E-.8 F2100
+G1 Z0.400 F720
+;TYPE:Outer wall
+;WIDTH:0.45
+G1 X62.000 Y50.000 F12000
+G1 E.8 F2100
+G1 F3000
+G1 X69.319 Y55.176 E0.29851
+G1 X67.321 Y60.000 E0.17386
+G1 X64.142 Y64.142 E0.17386
+G1 X60.000 Y67.321 E0.17386
+G1 X55.176 Y69.319 E0.17386
+G1 X51.444 Y64.041 E0.21526 
+G1 X51.155 Y63.633 E0.01665 F2400.000 
+G1 X50.866 Y63.225 E0.01665 F1800.000 
+G1 X50.577 Y62.816 E0.01665 F1200.000 
+G1 X50.000 Y62.000 E0.03330 F1200.000 
+G1 X49.423 Y62.816 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X49.134 Y63.225 E0.01665 F1200.000 
+G1 X48.845 Y63.633 E0.01665 F1800.000 
+G1 X48.556 Y64.041 E0.01665 F2400.000 
+G1 F3000.0 ; restore
+G1 X44.824 Y69.319 E0.21526 
+G1 X40.000 Y67.321 E0.17386
+G1 X35.858 Y64.142 E0.17386
+G1 X32.679 Y60.000 E0.17386
+G1 X30.681 Y55.176 E0.17386
+G1 X35.959 Y51.444 E0.21526 
+G1 X36.367 Y51.155 E0.01665 F2400.000 
+G1 X36.775 Y50.866 E0.01665 F1800.000 
+G1 X37.184 Y50.577 E0.01665 F1200.000 
+G1 X38.000 Y50.000 E0.03330 F1200.000 
+G1 X37.184 Y49.423 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X36.775 Y49.134 E0.01665 F1200.000 
+G1 X36.367 Y48.845 E0.01665 F1800.000 
+G1 X35.959 Y48.556 E0.01665 F2400.000 
+G1 F3000.0 ; restore
+G1 X30.681 Y44.824 E0.21526 
+G1 X32.679 Y40.000 E0.17386
+G1 X35.858 Y35.858 E0.17386
+G1 X40.000 Y32.679 E0.17386
+G1 X44.824 Y30.681 E0.17386
+G1 X48.556 Y35.959 E0.21526 
+G1 X48.845 Y36.367 E0.01665 F2400.000 
+G1 X49.134 Y36.775 E0.01665 F1800.000 
+G1 X49.423 Y37.184 E0.01665 F1200.000 
+G1 X50.000 Y38.000 E0.03330 F1200.000 
+G1 X50.577 Y37.184 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X50.866 Y36.775 E0.01665 F1200.000 
+G1 X51.155 Y36.367 E0.01665 F1800.000 
+G1 X51.444 Y35.959 E0.01665 F2400.000 
+G1 F3000.0 ; restore
+G1 X55.176 Y30.681 E0.21526 
+G1 X60.000 Y32.679 E0.17386
+G1 X64.142 Y35.858 E0.17386
+G1 X67.321 Y40.000 E0.17386
+G1 X69.319 Y44.824 E0.17386
+G1 X63.796 Y48.730 E0.22525 
+G1 X63.388 Y49.018 E0.01665 F2400.000 
+G1 X62.980 Y49.307 E0.01665 F1800.000 
+G1 X62.572 Y49.596 E0.01665 F1200.000 
+G1 X62.000 Y50.000 E0.02331 
+G1 E-.8 F2100
+;TYPE:Inner wall
+;WIDTH:0.45
+G1 X61.700 Y50.000 F1200.000 
+G1 E0.80000 F1200.000 
+G1 F1200.000 
+G1 X62.516 Y50.577 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X62.925 Y50.866 E0.01665 F1200.000 
+G1 X63.333 Y51.155 E0.01665 F1800.000 
+G1 X63.741 Y51.444 E0.01665 F2400.000 
+G1 X64.149 Y51.732 E0.01665 F3000.000 
+G1 X64.558 Y52.021 E0.01665 F3600.000 
+G1 X64.966 Y52.310 E0.01665 F4200.000 
+G1 X65.374 Y52.598 E0.01665 F4800.000 
+G1 X65.782 Y52.887 E0.01665 F5400.000 
+G1 F6000.0 ; restore
+G1 X68.836 Y55.047 E0.12455 
+G1 X66.887 Y59.750 E0.16951
+G1 X63.789 Y63.789 E0.16951
+G1 X59.750 Y66.887 E0.16951
+G1 X55.047 Y68.836 E0.16951
+G1 X52.887 Y65.782 E0.12455 
+G1 X52.598 Y65.374 E0.01665 F5400.000 
+G1 X52.310 Y64.966 E0.01665 F4800.000 
+G1 X52.021 Y64.558 E0.01665 F4200.000 
+G1 X51.732 Y64.149 E0.01665 F3600.000 
+G1 X51.444 Y63.741 E0.01665 F3000.000 
+G1 X51.155 Y63.333 E0.01665 F2400.000 
+G1 X50.866 Y62.925 E0.01665 F1800.000 
+G1 X50.577 Y62.516 E0.01665 F1200.000 
+G1 X50.000 Y61.700 E0.03330 F1200.000 
+G1 X49.423 Y62.516 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X49.134 Y62.925 E0.01665 F1200.000 
+G1 X48.845 Y63.333 E0.01665 F1800.000 
+G1 X48.556 Y63.741 E0.01665 F2400.000 
+G1 X48.268 Y64.149 E0.01665 F3000.000 
+G1 X47.979 Y64.558 E0.01665 F3600.000 
+G1 X47.690 Y64.966 E0.01665 F4200.000 
+G1 X47.402 Y65.374 E0.01665 F4800.000 
+G1 X47.113 Y65.782 E0.01665 F5400.000 
+G1 F6000.0 ; restore
+G1 X44.953 Y68.836 E0.12455 
+G1 X40.250 Y66.887 E0.16951
+G1 X36.211 Y63.789 E0.16951
+G1 X33.113 Y59.750 E0.16951
+G1 X31.164 Y55.047 E0.16951
+G1 X34.218 Y52.887 E0.12455 
+G1 X34.626 Y52.598 E0.01665 F5400.000 
+G1 X35.034 Y52.310 E0.01665 F4800.000 
+G1 X35.442 Y52.021 E0.01665 F4200.000 
+G1 X35.851 Y51.732 E0.01665 F3600.000 
+G1 X36.259 Y51.444 E0.01665 F3000.000 
+G1 X36.667 Y51.155 E0.01665 F2400.000 
+G1 X37.075 Y50.866 E0.01665 F1800.000 
+G1 X37.484 Y50.577 E0.01665 F1200.000 
+G1 X38.300 Y50.000 E0.03330 F1200.000 
+G1 X37.484 Y49.423 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X37.075 Y49.134 E0.01665 F1200.000 
+G1 X36.667 Y48.845 E0.01665 F1800.000 
+G1 X36.259 Y48.556 E0.01665 F2400.000 
+G1 X35.851 Y48.268 E0.01665 F3000.000 
+G1 X35.442 Y47.979 E0.01665 F3600.000 
+G1 X35.034 Y47.690 E0.01665 F4200.000 
+G1 X34.626 Y47.402 E0.01665 F4800.000 
+G1 X34.218 Y47.113 E0.01665 F5400.000 
+G1 F6000.0 ; restore
+G1 X31.164 Y44.953 E0.12455 
+G1 X33.113 Y40.250 E0.16951
+G1 X36.211 Y36.211 E0.16951
+G1 X40.250 Y33.113 E0.16951
+G1 X44.953 Y31.164 E0.16951
+G1 X47.113 Y34.218 E0.12455 
+G1 X47.402 Y34.626 E0.01665 F5400.000 
+G1 X47.690 Y35.034 E0.01665 F4800.000 
+G1 X47.979 Y35.442 E0.01665 F4200.000 
+G1 X48.268 Y35.851 E0.01665 F3600.000 
+G1 X48.556 Y36.259 E0.01665 F3000.000 
+G1 X48.845 Y36.667 E0.01665 F2400.000 
+G1 X49.134 Y37.075 E0.01665 F1800.000 
+G1 X49.423 Y37.484 E0.01665 F1200.000 
+G1 X50.000 Y38.300 E0.03330 F1200.000 
+G1 X50.577 Y37.484 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X50.866 Y37.075 E0.01665 F1200.000 
+G1 X51.155 Y36.667 E0.01665 F1800.000 
+G1 X51.444 Y36.259 E0.01665 F2400.000 
+G1 X51.732 Y35.851 E0.01665 F3000.000 
+G1 X52.021 Y35.442 E0.01665 F3600.000 
+G1 X52.310 Y35.034 E0.01665 F4200.000 
+G1 X52.598 Y34.626 E0.01665 F4800.000 
+G1 X52.887 Y34.218 E0.01665 F5400.000 
+G1 F6000.0 ; restore
+G1 X55.047 Y31.164 E0.12455 
+G1 X59.750 Y33.113 E0.16951
+G1 X63.789 Y36.211 E0.16951
+G1 X66.887 Y40.250 E0.16951
+G1 X68.836 Y44.953 E0.16951
+G1 X61.700 Y50.000 E0.29104
+G1 E-.8 F2100
+;TYPE:Sparse infill
+;WIDTH:0.45
+G1 X40.000 Y40.000 F12000
+G1 E.8 F2100
+G1 F9000
+G1 X40.000 Y40.000 E0.66600
+G1 Y41.700 E0.05661
+G1 X60.000 Y41.700 E0.66600
+G1 Y43.400 E0.05661
+G1 X40.000 Y43.400 E0.66600
+G1 Y45.100 E0.05661
+G1 X60.000 Y45.100 E0.66600
+G1 Y46.800 E0.05661
+G1 X40.000 Y46.800 E0.66600
+G1 Y48.500 E0.05661
+G1 X60.000 Y48.500 E0.66600
+G1 Y50.200 E0.05661
+G1 X40.000 Y50.200 E0.66600
+G1 Y51.900 E0.05661
+G1 X60.000 Y51.900 E0.66600
+G1 Y53.600 E0.05661
+G1 X40.000 Y53.600 E0.66600
+G1 Y55.300 E0.05661
+G1 X60.000 Y55.300 E0.66600
+G1 Y57.000 E0.05661
+G1 X40.000 Y57.000 E0.66600
+G1 Y58.700 E0.05661
+G1 X60.000 Y58.700 E0.66600
+G1 Y60.400 E0.05661
+; some comment
+
+G1 E-.8 F2100
+;TYPE:Outer wall
+;WIDTH:0.45
+G1 X132.000 Y80.000 F12000
+G1 E.8 F2100
+G1 F3000
+G1 X139.319 Y85.176 E0.29851
+G1 X137.321 Y90.000 E0.17386
+G1 X134.142 Y94.142 E0.17386
+G1 X130.000 Y97.321 E0.17386
+G1 X125.176 Y99.319 E0.17386
+G1 X121.444 Y94.041 E0.21526 
+G1 X121.155 Y93.633 E0.01665 F2400.000 
+G1 X120.866 Y93.225 E0.01665 F1800.000 
+G1 X120.577 Y92.816 E0.01665 F1200.000 
+G1 X120.000 Y92.000 E0.03330 F1200.000 
+G1 X119.423 Y92.816 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X119.134 Y93.225 E0.01665 F1200.000 
+G1 X118.845 Y93.633 E0.01665 F1800.000 
+G1 X118.556 Y94.041 E0.01665 F2400.000 
+G1 F3000.0 ; restore
+G1 X114.824 Y99.319 E0.21526 
+G1 X110.000 Y97.321 E0.17386
+G1 X105.858 Y94.142 E0.17386
+G1 X102.679 Y90.000 E0.17386
+G1 X100.681 Y85.176 E0.17386
+G1 X105.959 Y81.444 E0.21526 
+G1 X106.367 Y81.155 E0.01665 F2400.000 
+G1 X106.775 Y80.866 E0.01665 F1800.000 
+G1 X107.184 Y80.577 E0.01665 F1200.000 
+G1 X108.000 Y80.000 E0.03330 F1200.000 
+G1 X107.184 Y79.423 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X106.775 Y79.134 E0.01665 F1200.000 
+G1 X106.367 Y78.845 E0.01665 F1800.000 
+G1 X105.959 Y78.556 E0.01665 F2400.000 
+G1 F3000.0 ; restore
+G1 X100.681 Y74.824 E0.21526 
+G1 X102.679 Y70.000 E0.17386
+G1 X105.858 Y65.858 E0.17386
+G1 X110.000 Y62.679 E0.17386
+G1 X114.824 Y60.681 E0.17386
+G1 X118.556 Y65.959 E0.21526 
+G1 X118.845 Y66.367 E0.01665 F2400.000 
+G1 X119.134 Y66.775 E0.01665 F1800.000 
+G1 X119.423 Y67.184 E0.01665 F1200.000 
+G1 X120.000 Y68.000 E0.03330 F1200.000 
+G1 X120.577 Y67.184 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X120.866 Y66.775 E0.01665 F1200.000 
+G1 X121.155 Y66.367 E0.01665 F1800.000 
+G1 X121.444 Y65.959 E0.01665 F2400.000 
+G1 F3000.0 ; restore
+G1 X125.176 Y60.681 E0.21526 
+G1 X130.000 Y62.679 E0.17386
+G1 X134.142 Y65.858 E0.17386
+G1 X137.321 Y70.000 E0.17386
+G1 X139.319 Y74.824 E0.17386
+G1 X133.796 Y78.730 E0.22525 
+G1 X133.388 Y79.018 E0.01665 F2400.000 
+G1 X132.980 Y79.307 E0.01665 F1800.000 
+G1 X132.572 Y79.596 E0.01665 F1200.000 
+G1 X132.000 Y80.000 E0.02331 
+G1 E-.8 F2100
+;TYPE:Inner wall
+;WIDTH:0.45
+G1 X131.700 Y80.000 F1200.000 
+G1 E0.80000 F1200.000 
+G1 F1200.000 
+G1 X132.516 Y80.577 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X132.925 Y80.866 E0.01665 F1200.000 
+G1 X133.333 Y81.155 E0.01665 F1800.000 
+G1 X133.741 Y81.444 E0.01665 F2400.000 
+G1 X134.149 Y81.732 E0.01665 F3000.000 
+G1 X134.558 Y82.021 E0.01665 F3600.000 
+G1 X134.966 Y82.310 E0.01665 F4200.000 
+G1 X135.374 Y82.598 E0.01665 F4800.000 
+G1 X135.782 Y82.887 E0.01665 F5400.000 
+G1 F6000.0 ; restore
+G1 X138.836 Y85.047 E0.12455 
+G1 X136.887 Y89.750 E0.16951
+G1 X133.789 Y93.789 E0.16951
+G1 X129.750 Y96.887 E0.16951
+G1 X125.047 Y98.836 E0.16951
+G1 X122.887 Y95.782 E0.12455 
+G1 X122.598 Y95.374 E0.01665 F5400.000 
+G1 X122.310 Y94.966 E0.01665 F4800.000 
+G1 X122.021 Y94.558 E0.01665 F4200.000 
+G1 X121.732 Y94.149 E0.01665 F3600.000 
+G1 X121.444 Y93.741 E0.01665 F3000.000 
+G1 X121.155 Y93.333 E0.01665 F2400.000 
+G1 X120.866 Y92.925 E0.01665 F1800.000 
+G1 X120.577 Y92.516 E0.01665 F1200.000 
+G1 X120.000 Y91.700 E0.03330 F1200.000 
+G1 X119.423 Y92.516 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X119.134 Y92.925 E0.01665 F1200.000 
+G1 X118.845 Y93.333 E0.01665 F1800.000 
+G1 X118.556 Y93.741 E0.01665 F2400.000 
+G1 X118.268 Y94.149 E0.01665 F3000.000 
+G1 X117.979 Y94.558 E0.01665 F3600.000 
+G1 X117.690 Y94.966 E0.01665 F4200.000 
+G1 X117.402 Y95.374 E0.01665 F4800.000 
+G1 X117.113 Y95.782 E0.01665 F5400.000 
+G1 F6000.0 ; restore
+G1 X114.953 Y98.836 E0.12455 
+G1 X110.250 Y96.887 E0.16951
+G1 X106.211 Y93.789 E0.16951
+G1 X103.113 Y89.750 E0.16951
+G1 X101.164 Y85.047 E0.16951
+G1 X104.218 Y82.887 E0.12455 
+G1 X104.626 Y82.598 E0.01665 F5400.000 
+G1 X105.034 Y82.310 E0.01665 F4800.000 
+G1 X105.442 Y82.021 E0.01665 F4200.000 
+G1 X105.851 Y81.732 E0.01665 F3600.000 
+G1 X106.259 Y81.444 E0.01665 F3000.000 
+G1 X106.667 Y81.155 E0.01665 F2400.000 
+G1 X107.075 Y80.866 E0.01665 F1800.000 
+G1 X107.484 Y80.577 E0.01665 F1200.000 
+G1 X108.300 Y80.000 E0.03330 F1200.000 
+G1 X107.484 Y79.423 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X107.075 Y79.134 E0.01665 F1200.000 
+G1 X106.667 Y78.845 E0.01665 F1800.000 
+G1 X106.259 Y78.556 E0.01665 F2400.000 
+G1 X105.851 Y78.268 E0.01665 F3000.000 
+G1 X105.442 Y77.979 E0.01665 F3600.000 
+G1 X105.034 Y77.690 E0.01665 F4200.000 
+G1 X104.626 Y77.402 E0.01665 F4800.000 
+G1 X104.218 Y77.113 E0.01665 F5400.000 
+G1 F6000.0 ; restore
+G1 X101.164 Y74.953 E0.12455 
+G1 X103.113 Y70.250 E0.16951
+G1 X106.211 Y66.211 E0.16951
+G1 X110.250 Y63.113 E0.16951
+G1 X114.953 Y61.164 E0.16951
+G1 X117.113 Y64.218 E0.12455 
+G1 X117.402 Y64.626 E0.01665 F5400.000 
+G1 X117.690 Y65.034 E0.01665 F4800.000 
+G1 X117.979 Y65.442 E0.01665 F4200.000 
+G1 X118.268 Y65.851 E0.01665 F3600.000 
+G1 X118.556 Y66.259 E0.01665 F3000.000 
+G1 X118.845 Y66.667 E0.01665 F2400.000 
+G1 X119.134 Y67.075 E0.01665 F1800.000 
+G1 X119.423 Y67.484 E0.01665 F1200.000 
+G1 X120.000 Y68.300 E0.03330 F1200.000 
+G1 X120.577 Y67.484 E0.03330 F1200.000 
+G1 F1200.000 ; restore
+G1 X120.866 Y67.075 E0.01665 F1200.000 
+G1 X121.155 Y66.667 E0.01665 F1800.000 
+G1 X121.444 Y66.259 E0.01665 F2400.000 
+G1 X121.732 Y65.851 E0.01665 F3000.000 
+G1 X122.021 Y65.442 E0.01665 F3600.000 
+G1 X122.310 Y65.034 E0.01665 F4200.000 
+G1 X122.598 Y64.626 E0.01665 F4800.000 
+G1 X122.887 Y64.218 E0.01665 F5400.000 
+G1 F6000.0 ; restore
+G1 X125.047 Y61.164 E0.12455 
+G1 X129.750 Y63.113 E0.16951
+G1 X133.789 Y66.211 E0.16951
+G1 X136.887 Y70.250 E0.16951
+G1 X138.836 Y74.953 E0.16951
+G1 X131.700 Y80.000 E0.29104
+G1 E-.8 F2100
+;TYPE:Sparse infill
+;WIDTH:0.45
+G1 X110.000 Y70.000 F12000
+G1 E.8 F2100
+G1 F9000
+G1 X110.000 Y70.000 E0.66600
+G1 Y71.700 E0.05661
+G1 X130.000 Y71.700 E0.66600
+G1 Y73.400 E0.05661
+G1 X110.000 Y73.400 E0.66600
+G1 Y75.100 E0.05661
+G1 X130.000 Y75.100 E0.66600
+G1 Y76.800 E0.05661
+G1 X110.000 Y76.800 E0.66600
+G1 Y78.500 E0.05661
+G1 X130.000 Y78.500 E0.66600
+G1 Y80.200 E0.05661
+G1 X110.000 Y80.200 E0.66600
+G1 Y81.900 E0.05661
+G1 X130.000 Y81.900 E0.66600
+G1 Y83.600 E0.05661
+G1 X110.000 Y83.600 E0.66600
+G1 Y85.300 E0.05661
+G1 X130.000 Y85.300 E0.66600
+G1 Y87.000 E0.05661
+G1 X110.000 Y87.000 E0.66600
+G1 Y88.700 E0.05661
+G1 X130.000 Y88.700 E0.66600
+G1 Y90.400 E0.05661
+; some comment
+
+G1 E-.8 F2100
+;TYPE:Gap infill
+G1 X10 Y10 F12000
+G1 X11.5 Y10.2 E.01 F3000
+M107
+; EXECUTABLE_BLOCK_END
\ No newline at end of file
@@ -0,0 +1,3831 @@
+; HEADER_BLOCK_START
+; generated by synthetic
+; HEADER_BLOCK_END
+
+M104 S210 ; set temp
+G28
+G90
+M83
+G1 F1200
+;LAYER_CHANGE
+;Z:0.2
+;HEIGHT:0.2
+G1 E-.8 F2100
+G1 Z0.200 F720
+;TYPE:Outer wall
+;WIDTH:0.45
+G1 X62.000 Y50.000 F12000
+G1 E.8 F2100
+G1 F3000
+G1 X67.472 Y53.870 E0.22319 
+G1 X67.777 Y54.085 E0.01243 F2991.992 
+G1 X68.069 Y54.292 E0.01193 F2946.992 
+G1 X68.338 Y54.482 E0.01096 F2811.992 
+G1 X68.576 Y54.650 E0.00969 F2598.992 
+G1 X68.780 Y54.795 E0.00832 F2352.992 
+G1 X68.951 Y54.915 E0.00696 F2106.992 
+G1 X69.088 Y55.012 E0.00559 F1860.992 
+G1 X69.191 Y55.086 E0.00423 F1614.992 
+G1 X69.262 Y55.135 E0.00286 F1368.992 
+G1 X69.301 Y55.163 E0.00159 F1122.992 
+G1 X69.316 Y55.174 E0.00062 F909.992 
+G1 X69.319 Y55.176 E0.00012 F774.992 
+G1 X69.318 Y55.179 E0.00012 F774.992 
+G1 X69.310 Y55.197 E0.00062 F909.992 
+G1 X69.292 Y55.241 E0.00159 F1122.992 
+G1 X69.259 Y55.320 E0.00286 F1368.992 
+G1 X69.211 Y55.438 E0.00423 F1614.992 
+G1 X69.146 Y55.593 E0.00559 F1860.992 
+G1 X69.066 Y55.786 E0.00696 F2106.992 
+G1 X68.971 Y56.017 E0.00832 F2352.992 
+G1 X68.859 Y56.286 E0.00969 F2598.992 
+G1 X68.733 Y56.590 E0.01096 F2811.992 
+G1 X68.596 Y56.921 E0.01193 F2946.992 
+G1 X68.453 Y57.266 E0.01243 F2991.992 
+G1 X67.321 Y60.000 E0.09854 F3000.000 
+G1 X64.142 Y64.142 E0.17386
+G1 X60.000 Y67.321 E0.17386
+G1 X57.266 Y68.453 E0.09854 
+G1 X56.921 Y68.596 E0.01243 F2991.992 
+G1 X56.590 Y68.733 E0.01193 F2946.992 
+G1 X56.286 Y68.859 E0.01096 F2811.992 
+G1 X56.017 Y68.971 E0.00969 F2598.992 
+G1 X55.786 Y69.066 E0.00832 F2352.992 
+G1 X55.593 Y69.146 E0.00696 F2106.992 
+G1 X55.438 Y69.211 E0.00559 F1860.992 
+G1 X55.320 Y69.259 E0.00423 F1614.992 
+G1 X55.241 Y69.292 E0.00286 F1368.992 
+G1 X55.197 Y69.310 E0.00159 F1122.992 
+G1 X55.179 Y69.318 E0.00062 F909.992 
+G1 X55.176 Y69.319 E0.00012 F774.992 
+G1 X55.174 Y69.316 E0.00012 F774.992 
+G1 X55.163 Y69.301 E0.00062 F909.992 
+G1 X55.135 Y69.262 E0.00159 F1122.992 
+G1 X55.086 Y69.191 E0.00286 F1368.992 
+G1 X55.012 Y69.088 E0.00423 F1614.992 
+G1 X54.915 Y68.951 E0.00559 F1860.992 
+G1 X54.795 Y68.780 E0.00696 F2106.992 
+G1 X54.650 Y68.576 E0.00832 F2352.992 
+G1 X54.482 Y68.338 E0.00969 F2598.992 
+G1 X54.292 Y68.069 E0.01096 F2811.992 
+G1 X54.085 Y67.777 E0.01193 F2946.992 
+G1 X53.870 Y67.472 E0.01243 F2991.992 
+G1 X51.455 Y64.057 E0.13927 F3000.000 
+G1 X51.215 Y63.718 E0.01386 F2971.376 
+G1 X50.983 Y63.390 E0.01336 F2926.376 
+G1 X50.769 Y63.087 E0.01236 F2791.376 
+G1 X50.579 Y62.818 E0.01096 F2566.376 
+G1 X50.416 Y62.588 E0.00939 F2287.376 
+G1 X50.281 Y62.397 E0.00779 F1999.376 
+G1 X50.173 Y62.245 E0.00619 F1711.376 
+G1 X50.094 Y62.132 E0.00460 F1423.376 
+G1 X50.041 Y62.058 E0.00302 F1135.376 
+G1 X50.013 Y62.018 E0.00162 F856.376 
+G1 X50.002 Y62.003 E0.00062 F631.376 
+G1 X50.000 Y62.000 E0.00012 F496.376 
+G1 X49.998 Y62.003 E0.00012 F496.376 
+G1 X49.987 Y62.018 E0.00062 F631.376 
+G1 X49.959 Y62.058 E0.00162 F856.376 
+G1 X49.906 Y62.132 E0.00302 F1135.376 
+G1 X49.827 Y62.245 E0.00460 F1423.376 
+G1 X49.719 Y62.397 E0.00619 F1711.376 
+G1 X49.584 Y62.588 E0.00779 F1999.376 
+G1 X49.421 Y62.818 E0.00939 F2287.376 
+G1 X49.231 Y63.087 E0.01096 F2566.376 
+G1 X49.017 Y63.390 E0.01236 F2791.376 
+G1 X48.785 Y63.718 E0.01336 F2926.376 
+G1 X48.545 Y64.057 E0.01386 F2971.376 
+G1 X46.130 Y67.472 E0.13927 F3000.000 
+G1 X45.915 Y67.777 E0.01243 F2991.992 
+G1 X45.708 Y68.069 E0.01193 F2946.992 
+G1 X45.518 Y68.338 E0.01096 F2811.992 
+G1 X45.350 Y68.576 E0.00969 F2598.992 
+G1 X45.205 Y68.780 E0.00832 F2352.992 
+G1 X45.085 Y68.951 E0.00696 F2106.992 
+G1 X44.988 Y69.088 E0.00559 F1860.992 
+G1 X44.914 Y69.191 E0.00423 F1614.992 
+G1 X44.865 Y69.262 E0.00286 F1368.992 
+G1 X44.837 Y69.301 E0.00159 F1122.992 
+G1 X44.826 Y69.316 E0.00062 F909.992 
+G1 X44.824 Y69.319 E0.00012 F774.992 
+G1 X44.821 Y69.318 E0.00012 F774.992 
+G1 X44.803 Y69.310 E0.00062 F909.992 
+G1 X44.759 Y69.292 E0.00159 F1122.992 
+G1 X44.680 Y69.259 E0.00286 F1368.992 
+G1 X44.562 Y69.211 E0.00423 F1614.992 
+G1 X44.407 Y69.146 E0.00559 F1860.992 
+G1 X44.214 Y69.066 E0.00696 F2106.992 
+G1 X43.983 Y68.971 E0.00832 F2352.992 
+G1 X43.714 Y68.859 E0.00969 F2598.992 
+G1 X43.410 Y68.733 E0.01096 F2811.992 
+G1 X43.079 Y68.596 E0.01193 F2946.992 
+G1 X42.734 Y68.453 E0.01243 F2991.992 
+G1 X40.000 Y67.321 E0.09854 F3000.000 
+G1 X35.858 Y64.142 E0.17386
+G1 X32.679 Y60.000 E0.17386
+G1 X31.547 Y57.266 E0.09854 
+G1 X31.404 Y56.921 E0.01243 F2991.992 
+G1 X31.267 Y56.590 E0.01193 F2946.992 
+G1 X31.141 Y56.286 E0.01096 F2811.992 
+G1 X31.029 Y56.017 E0.00969 F2598.992 
+G1 X30.934 Y55.786 E0.00832 F2352.992 
+G1 X30.854 Y55.593 E0.00696 F2106.992 
+G1 X30.789 Y55.438 E0.00559 F1860.992 
+G1 X30.741 Y55.320 E0.00423 F1614.992 
+G1 X30.708 Y55.241 E0.00286 F1368.992 
+G1 X30.690 Y55.197 E0.00159 F1122.992 
+G1 X30.682 Y55.179 E0.00062 F909.992 
+G1 X30.681 Y55.176 E0.00012 F774.992 
+G1 X30.684 Y55.174 E0.00012 F774.992 
+G1 X30.699 Y55.163 E0.00062 F909.992 
+G1 X30.738 Y55.135 E0.00159 F1122.992 
+G1 X30.809 Y55.086 E0.00286 F1368.992 
+G1 X30.912 Y55.012 E0.00423 F1614.992 
+G1 X31.049 Y54.915 E0.00559 F1860.992 
+G1 X31.220 Y54.795 E0.00696 F2106.992 
+G1 X31.424 Y54.650 E0.00832 F2352.992 
+G1 X31.662 Y54.482 E0.00969 F2598.992 
+G1 X31.931 Y54.292 E0.01096 F2811.992 
+G1 X32.223 Y54.085 E0.01193 F2946.992 
+G1 X32.528 Y53.870 E0.01243 F2991.992 
+G1 X35.943 Y51.455 E0.13927 F3000.000 
+G1 X36.282 Y51.215 E0.01386 F2971.376 
+G1 X36.610 Y50.983 E0.01336 F2926.376 
+G1 X36.913 Y50.769 E0.01236 F2791.376 
+G1 X37.182 Y50.579 E0.01096 F2566.376 
+G1 X37.412 Y50.416 E0.00939 F2287.376 
+G1 X37.603 Y50.281 E0.00779 F1999.376 
+G1 X37.755 Y50.173 E0.00619 F1711.376 
+G1 X37.868 Y50.094 E0.00460 F1423.376 
+G1 X37.942 Y50.041 E0.00302 F1135.376 
+G1 X37.982 Y50.013 E0.00162 F856.376 
+G1 X37.997 Y50.002 E0.00062 F631.376 
+G1 X38.000 Y50.000 E0.00012 F496.376 
+G1 X37.997 Y49.998 E0.00012 F496.376 
+G1 X37.982 Y49.987 E0.00062 F631.376 
+G1 X37.942 Y49.959 E0.00162 F856.376 
+G1 X37.868 Y49.906 E0.00302 F1135.376 
+G1 X37.755 Y49.827 E0.00460 F1423.376 
+G1 X37.603 Y49.719 E0.00619 F1711.376 
+G1 X37.412 Y49.584 E0.00779 F1999.376 
+G1 X37.182 Y49.421 E0.00939 F2287.376 
+G1 X36.913 Y49.231 E0.01096 F2566.376 
+G1 X36.610 Y49.017 E0.01236 F2791.376 
+G1 X36.282 Y48.785 E0.01336 F2926.376 
+G1 X35.943 Y48.545 E0.01386 F2971.376 
+G1 X32.528 Y46.130 E0.13927 F3000.000 
+G1 X32.223 Y45.915 E0.01243 F2991.992 
+G1 X31.931 Y45.708 E0.01193 F2946.992 
+G1 X31.662 Y45.518 E0.01096 F2811.992 
+G1 X31.424 Y45.350 E0.00969 F2598.992 
+G1 X31.220 Y45.205 E0.00832 F2352.992 
+G1 X31.049 Y45.085 E0.00696 F2106.992 
+G1 X30.912 Y44.988 E0.00559 F1860.992 
+G1 X30.809 Y44.914 E0.00423 F1614.992 
+G1 X30.738 Y44.865 E0.00286 F1368.992 
+G1 X30.699 Y44.837 E0.00159 F1122.992 
+G1 X30.684 Y44.826 E0.00062 F909.992 
+G1 X30.681 Y44.824 E0.00012 F774.992 
+G1 X30.682 Y44.821 E0.00012 F774.992 
+G1 X30.690 Y44.803 E0.00062 F909.992 
+G1 X30.708 Y44.759 E0.00159 F1122.992 
+G1 X30.741 Y44.680 E0.00286 F1368.992 
+G1 X30.789 Y44.562 E0.00423 F1614.992 
+G1 X30.854 Y44.407 E0.00559 F1860.992 
+G1 X30.934 Y44.214 E0.00696 F2106.992 
+G1 X31.029 Y43.983 E0.00832 F2352.992 
+G1 X31.141 Y43.714 E0.00969 F2598.992 
+G1 X31.267 Y43.410 E0.01096 F2811.992 
+G1 X31.404 Y43.079 E0.01193 F2946.992 
+G1 X31.547 Y42.734 E0.01243 F2991.992 
+G1 X32.679 Y40.000 E0.09854 F3000.000 
+G1 X35.858 Y35.858 E0.17386
+G1 X40.000 Y32.679 E0.17386
+G1 X42.734 Y31.547 E0.09854 
+G1 X43.079 Y31.404 E0.01243 F2991.992 
+G1 X43.410 Y31.267 E0.01193 F2946.992 
+G1 X43.714 Y31.141 E0.01096 F2811.992 
+G1 X43.983 Y31.029 E0.00969 F2598.992 
+G1 X44.214 Y30.934 E0.00832 F2352.992 
+G1 X44.407 Y30.854 E0.00696 F2106.992 
+G1 X44.562 Y30.789 E0.00559 F1860.992 
+G1 X44.680 Y30.741 E0.00423 F1614.992 
+G1 X44.759 Y30.708 E0.00286 F1368.992 
+G1 X44.803 Y30.690 E0.00159 F1122.992 
+G1 X44.821 Y30.682 E0.00062 F909.992 
+G1 X44.824 Y30.681 E0.00012 F774.992 
+G1 X44.826 Y30.684 E0.00012 F774.992 
+G1 X44.837 Y30.699 E0.00062 F909.992 
+G1 X44.865 Y30.738 E0.00159 F1122.992 
+G1 X44.914 Y30.809 E0.00286 F1368.992 
+G1 X44.988 Y30.912 E0.00423 F1614.992 
+G1 X45.085 Y31.049 E0.00559 F1860.992 
+G1 X45.205 Y31.220 E0.00696 F2106.992 
+G1 X45.350 Y31.424 E0.00832 F2352.992 
+G1 X45.518 Y31.662 E0.00969 F2598.992 
+G1 X45.708 Y31.931 E0.01096 F2811.992 
+G1 X45.915 Y32.223 E0.01193 F2946.992 
+G1 X46.130 Y32.528 E0.01243 F2991.992 
+G1 X48.545 Y35.943 E0.13927 F3000.000 
+G1 X48.785 Y36.282 E0.01386 F2971.376 
+G1 X49.017 Y36.610 E0.01336 F2926.376 
+G1 X49.231 Y36.913 E0.01236 F2791.376 
+G1 X49.421 Y37.182 E0.01096 F2566.376 
+G1 X49.584 Y37.412 E0.00939 F2287.376 
+G1 X49.719 Y37.603 E0.00779 F1999.376 
+G1 X49.827 Y37.755 E0.00619 F1711.376 
+G1 X49.906 Y37.868 E0.00460 F1423.376 
+G1 X49.959 Y37.942 E0.00302 F1135.376 
+G1 X49.987 Y37.982 E0.00162 F856.376 
+G1 X49.998 Y37.997 E0.00062 F631.376 
+G1 X50.000 Y38.000 E0.00012 F496.376 
+G1 X50.002 Y37.997 E0.00012 F496.376 
+G1 X50.013 Y37.982 E0.00062 F631.376 
+G1 X50.041 Y37.942 E0.00162 F856.376 
+G1 X50.094 Y37.868 E0.00302 F1135.376 
+G1 X50.173 Y37.755 E0.00460 F1423.376 
+G1 X50.281 Y37.603 E0.00619 F1711.376 
+G1 X50.416 Y37.412 E0.00779 F1999.376 
+G1 X50.579 Y37.182 E0.00939 F2287.376 
+G1 X50.769 Y36.913 E0.01096 F2566.376 
+G1 X50.983 Y36.610 E0.01236 F2791.376 
+G1 X51.215 Y36.282 E0.01336 F2926.376 
+G1 X51.455 Y35.943 E0.01386 F2971.376 
+G1 X53.870 Y32.528 E0.13927 F3000.000 
+G1 X54.085 Y32.223 E0.01243 F2991.992 
+G1 X54.292 Y31.931 E0.01193 F2946.992 
+G1 X54.482 Y31.662 E0.01096 F2811.992 
+G1 X54.650 Y31.424 E0.00969 F2598.992 
+G1 X54.795 Y31.220 E0.00832 F2352.992 
+G1 X54.915 Y31.049 E0.00696 F2106.992 
+G1 X55.012 Y30.912 E0.00559 F1860.992 
+G1 X55.086 Y30.809 E0.00423 F1614.992 
+G1 X55.135 Y30.738 E0.00286 F1368.992 
+G1 X55.163 Y30.699 E0.00159 F1122.992 
+G1 X55.174 Y30.684 E0.00062 F909.992 
+G1 X55.176 Y30.681 E0.00012 F774.992 
+G1 X55.179 Y30.682 E0.00012 F774.992 
+G1 X55.197 Y30.690 E0.00062 F909.992 
+G1 X55.241 Y30.708 E0.00159 F1122.992 
+G1 X55.320 Y30.741 E0.00286 F1368.992 
+G1 X55.438 Y30.789 E0.00423 F1614.992 
+G1 X55.593 Y30.854 E0.00559 F1860.992 
+G1 X55.786 Y30.934 E0.00696 F2106.992 
+G1 X56.017 Y31.029 E0.00832 F2352.992 
+G1 X56.286 Y31.141 E0.00969 F2598.992 
+G1 X56.590 Y31.267 E0.01096 F2811.992 
+G1 X56.921 Y31.404 E0.01193 F2946.992 
+G1 X57.266 Y31.547 E0.01243 F2991.992 
+G1 X60.000 Y32.679 E0.09854 F3000.000 
+G1 X64.142 Y35.858 E0.17386
+G1 X67.321 Y40.000 E0.17386
+G1 X68.453 Y42.734 E0.09854 
+G1 X68.596 Y43.079 E0.01243 F2991.992 
+G1 X68.733 Y43.410 E0.01193 F2946.992 
+G1 X68.859 Y43.714 E0.01096 F2811.992 
+G1 X68.971 Y43.983 E0.00969 F2598.992 
+G1 X69.066 Y44.214 E0.00832 F2352.992 
+G1 X69.146 Y44.407 E0.00696 F2106.992 
+G1 X69.211 Y44.562 E0.00559 F1860.992 
+G1 X69.259 Y44.680 E0.00423 F1614.992 
+G1 X69.292 Y44.759 E0.00286 F1368.992 
+G1 X69.310 Y44.803 E0.00159 F1122.992 
+G1 X69.318 Y44.821 E0.00062 F909.992 
+G1 X69.319 Y44.824 E0.00012 F774.992 
+G1 X69.316 Y44.826 E0.00012 F774.992 
+G1 X69.301 Y44.837 E0.00062 F909.992 
+G1 X69.262 Y44.865 E0.00159 F1122.992 
+G1 X69.191 Y44.914 E0.00286 F1368.992 
+G1 X69.088 Y44.988 E0.00423 F1614.992 
+G1 X68.951 Y45.085 E0.00559 F1860.992 
+G1 X68.780 Y45.205 E0.00696 F2106.992 
+G1 X68.576 Y45.350 E0.00832 F2352.992 
+G1 X68.338 Y45.518 E0.00969 F2598.992 
+G1 X68.069 Y45.708 E0.01096 F2811.992 
+G1 X67.777 Y45.915 E0.01193 F2946.992 
+G1 X67.472 Y46.130 E0.01243 F2991.992 
+G1 X62.808 Y49.428 E0.19022 F3000.000 
+G1 X62.462 Y49.673 E0.01411 F3000.000 
+G1 X62.447 Y49.684 E0.00062 F2459.578 
+G1 X62.260 Y49.816 E0.00762 F2459.578 
+G1 X62.202 Y49.857 E0.00237 F2459.578 
+G1 X62.135 Y49.905 E0.00275 F1874.578 
+G1 X62.058 Y49.959 E0.00312 F1874.578 
+G1 X62.018 Y49.987 E0.00162 F1874.578 
+G1 X62.015 Y49.989 E0.00012 F1874.578 
+G1 X62.003 Y49.998 E0.00050 F1919.062 
+G1 X62.000 Y50.000 E0.00012 F3000.000 
+G1 E-.8 F2100
+;TYPE:Inner wall
+;WIDTH:0.45
+G1 X61.996 Y50.000 F1379.578 
+G1 X61.865 Y50.000 F1379.578 
+G1 X61.771 Y50.000 F974.578 
+G1 X61.722 Y50.000 F659.578 
+G1 X61.704 Y50.000 F434.578 
+G1 X61.700 Y50.000 F299.578 
+G1 E0.80000 F299.578 
+G1 F299.578 
+G1 X61.703 Y50.002 E0.00012 F299.578 
+G1 X61.718 Y50.013 E0.00062 F434.578 
+G1 X61.758 Y50.041 E0.00162 F659.578 
+G1 X61.835 Y50.095 E0.00312 F974.578 
+G1 X61.960 Y50.184 E0.00512 F1379.578 
+G1 X62.147 Y50.316 E0.00762 F1874.578 
+G1 X62.407 Y50.500 E0.01061 F2459.578 
+G1 X62.753 Y50.745 E0.01411 F3134.578 
+G1 X63.191 Y51.055 E0.01786 F3809.578 
+G1 X63.715 Y51.425 E0.02135 F4394.578 
+G1 X64.312 Y51.847 E0.02435 F4889.578 
+G1 X64.508 Y51.986 E0.00799 F5294.578 
+G1 X64.970 Y52.313 E0.01886 F5294.578 
+G1 X65.186 Y52.466 E0.00882 F5609.578 
+G1 X65.677 Y52.813 E0.02002 F5604.883 
+G1 X65.828 Y52.920 E0.00616 F5604.883 
+G1 X66.421 Y53.339 E0.02418 F5289.883 
+G1 X66.953 Y53.715 E0.02169 F4884.883 
+G1 X67.190 Y53.883 E0.00965 F4401.883 
+G1 X67.417 Y54.044 E0.00930 F4401.883 
+G1 X67.812 Y54.323 E0.01608 F3885.883 
+G1 X67.970 Y54.435 E0.00646 F3369.883 
+G1 X68.136 Y54.552 E0.00676 F3369.883 
+G1 X68.390 Y54.731 E0.01036 F2853.883 
+G1 X68.576 Y54.863 E0.00758 F2337.883 
+G1 X68.701 Y54.952 E0.00512 F1854.883 
+G1 X68.778 Y55.006 E0.00312 F1449.883 
+G1 X68.818 Y55.034 E0.00162 F1134.883 
+G1 X68.833 Y55.045 E0.00062 F909.883 
+G1 X68.836 Y55.047 E0.00012 F774.883 
+G1 X68.835 Y55.050 E0.00012 F774.883 
+G1 X68.827 Y55.068 E0.00062 F909.883 
+G1 X68.809 Y55.113 E0.00162 F1134.883 
+G1 X68.773 Y55.199 E0.00312 F1449.883 
+G1 X68.714 Y55.341 E0.00512 F1854.883 
+G1 X68.627 Y55.552 E0.00758 F2337.883 
+G1 X68.508 Y55.839 E0.01036 F2853.883 
+G1 X68.356 Y56.206 E0.01322 F3369.883 
+G1 X68.171 Y56.652 E0.01608 F3885.883 
+G1 X67.953 Y57.178 E0.01895 F4401.883 
+G1 X67.703 Y57.780 E0.02172 F4884.883 
+G1 X67.425 Y58.451 E0.02418 F5289.883 
+G1 X67.246 Y58.884 E0.01559 F5604.883 
+G1 X67.148 Y59.121 E0.00855 F5604.883 
+G1 X67.124 Y59.178 E0.00204 F5593.891 
+G1 X67.065 Y59.322 E0.00519 F5593.891 
+G1 X66.998 Y59.482 E0.00579 F5335.891 
+G1 X66.948 Y59.603 E0.00436 F5077.891 
+G1 X66.914 Y59.685 E0.00293 F4819.891 
+G1 X66.896 Y59.729 E0.00161 F4561.891 
+G1 X66.888 Y59.747 E0.00062 F4342.891 
+G1 X66.887 Y59.750 E0.00012 F4207.891 
+G1 X66.885 Y59.753 E0.00012 F4207.891 
+G1 X66.873 Y59.768 E0.00062 F4342.891 
+G1 X66.844 Y59.806 E0.00161 F4561.891 
+G1 X66.790 Y59.876 E0.00293 F4819.891 
+G1 X66.758 Y59.918 E0.00176 F5077.891 
+G1 X66.711 Y59.980 E0.00260 F5077.891 
+G1 X66.605 Y60.118 E0.00579 F5335.891 
+G1 X66.473 Y60.290 E0.00723 F5593.891 
+G1 X66.316 Y60.494 E0.00855 F5812.891 
+G1 X66.234 Y60.601 E0.00451 F5947.891 
+G1 X66.142 Y60.721 E0.00502 F5947.891 
+G1 X65.959 Y60.960 E0.01003 F5992.891 
+G1 X65.701 Y61.297 E0.01412 F6000.000 
+G1 X64.717 Y62.579 E0.05382 F6000.000 
+G1 X64.534 Y62.818 E0.01003 F5980.898 
+G1 X64.360 Y63.045 E0.00953 F5935.898 
+G1 X64.203 Y63.249 E0.00855 F5800.898 
+G1 X64.071 Y63.421 E0.00723 F5581.898 
+G1 X63.965 Y63.559 E0.00579 F5323.898 
+G1 X63.886 Y63.663 E0.00436 F5065.898 
+G1 X63.832 Y63.733 E0.00293 F4807.898 
+G1 X63.803 Y63.771 E0.00161 F4549.898 
+G1 X63.791 Y63.786 E0.00062 F4330.898 
+G1 X63.789 Y63.789 E0.00012 F4195.898 
+G1 X63.786 Y63.791 E0.00012 F4195.898 
+G1 X63.771 Y63.803 E0.00062 F4330.898 
+G1 X63.733 Y63.832 E0.00161 F4549.898 
+G1 X63.663 Y63.886 E0.00293 F4807.898 
+G1 X63.559 Y63.965 E0.00436 F5065.898 
+G1 X63.421 Y64.071 E0.00579 F5323.898 
+G1 X63.249 Y64.203 E0.00723 F5581.898 
+G1 X63.045 Y64.360 E0.00855 F5800.898 
+G1 X62.818 Y64.534 E0.00953 F5935.898 
+G1 X62.579 Y64.717 E0.01003 F5980.898 
+G1 X60.960 Y65.959 E0.06794 F6000.000 
+G1 X60.721 Y66.142 E0.01003 F5992.891 
+G1 X60.494 Y66.316 E0.00953 F5947.891 
+G1 X60.290 Y66.473 E0.00855 F5812.891 
+G1 X60.118 Y66.605 E0.00723 F5593.891 
+G1 X59.980 Y66.711 E0.00579 F5335.891 
+G1 X59.876 Y66.790 E0.00436 F5077.891 
+G1 X59.806 Y66.844 E0.00293 F4819.891 
+G1 X59.768 Y66.873 E0.00161 F4561.891 
+G1 X59.753 Y66.885 E0.00062 F4342.891 
+G1 X59.750 Y66.887 E0.00012 F4207.891 
+G1 X59.747 Y66.888 E0.00012 F4207.891 
+G1 X59.729 Y66.896 E0.00062 F4342.891 
+G1 X59.685 Y66.914 E0.00161 F4561.891 
+G1 X59.603 Y66.948 E0.00293 F4819.891 
+G1 X59.482 Y66.998 E0.00436 F5077.891 
+G1 X59.322 Y67.065 E0.00579 F5335.891 
+G1 X59.178 Y67.124 E0.00519 F5593.891 
+G1 X59.121 Y67.148 E0.00204 F5593.891 
+G1 X58.884 Y67.246 E0.00855 F5604.883 
+G1 X58.619 Y67.356 E0.00953 F5604.883 
+G1 X58.451 Y67.425 E0.00606 F5604.883 
+G1 X58.341 Y67.471 E0.00397 F5289.883 
+G1 X57.780 Y67.703 E0.02021 F5289.883 
+G1 X57.178 Y67.953 E0.02172 F4884.883 
+G1 X56.652 Y68.171 E0.01895 F4401.883 
+G1 X56.206 Y68.356 E0.01608 F3885.883 
+G1 X55.839 Y68.508 E0.01322 F3369.883 
+G1 X55.552 Y68.627 E0.01036 F2853.883 
+G1 X55.341 Y68.714 E0.00758 F2337.883 
+G1 X55.199 Y68.773 E0.00512 F1854.883 
+G1 X55.113 Y68.809 E0.00312 F1449.883 
+G1 X55.068 Y68.827 E0.00162 F1134.883 
+G1 X55.050 Y68.835 E0.00062 F909.883 
+G1 X55.047 Y68.836 E0.00012 F774.883 
+G1 X55.045 Y68.833 E0.00012 F774.883 
+G1 X55.034 Y68.818 E0.00062 F909.883 
+G1 X55.006 Y68.778 E0.00162 F1134.883 
+G1 X54.952 Y68.701 E0.00312 F1449.883 
+G1 X54.863 Y68.576 E0.00512 F1854.883 
+G1 X54.731 Y68.390 E0.00758 F2337.883 
+G1 X54.552 Y68.136 E0.01036 F2853.883 
+G1 X54.323 Y67.812 E0.01322 F3369.883 
+G1 X54.044 Y67.417 E0.01608 F3885.883 
+G1 X53.715 Y66.953 E0.01895 F4401.883 
+G1 X53.339 Y66.420 E0.02172 F4884.883 
+G1 X53.193 Y66.215 E0.00836 F5289.883 
+G1 X52.919 Y65.827 E0.01582 F5289.883 
+G1 X52.692 Y65.506 E0.01312 F5604.883 
+G1 X52.465 Y65.186 E0.01306 F5554.405 
+G1 X52.216 Y64.833 E0.01439 F5554.405 
+G1 X51.985 Y64.507 E0.01329 F5239.405 
+G1 X51.774 Y64.209 E0.01216 F5239.405 
+G1 X51.488 Y63.804 E0.01652 F4834.405 
+G1 X51.376 Y63.646 E0.00643 F4834.405 
+G1 X51.029 Y63.155 E0.02003 F4339.405 
+G1 X50.982 Y63.088 E0.00272 F3781.405 
+G1 X50.736 Y62.741 E0.01417 F3781.405 
+G1 X50.499 Y62.405 E0.01369 F3205.405 
+G1 X50.316 Y62.147 E0.01054 F2629.405 
+G1 X50.184 Y61.960 E0.00762 F2071.405 
+G1 X50.095 Y61.835 E0.00512 F1576.405 
+G1 X50.041 Y61.758 E0.00312 F1171.405 
+G1 X50.013 Y61.718 E0.00162 F856.405 
+G1 X50.002 Y61.703 E0.00062 F631.405 
+G1 X50.000 Y61.700 E0.00012 F496.405 
+G1 X49.998 Y61.703 E0.00012 F496.405 
+G1 X49.987 Y61.718 E0.00062 F631.405 
+G1 X49.959 Y61.758 E0.00162 F856.405 
+G1 X49.905 Y61.835 E0.00312 F1171.405 
+G1 X49.816 Y61.960 E0.00512 F1576.405 
+G1 X49.684 Y62.147 E0.00762 F2071.405 
+G1 X49.501 Y62.405 E0.01054 F2629.405 
+G1 X49.264 Y62.741 E0.01369 F3205.405 
+G1 X48.971 Y63.155 E0.01688 F3781.405 
+G1 X48.624 Y63.646 E0.02003 F4339.405 
+G1 X48.226 Y64.209 E0.02295 F4834.405 
+G1 X47.784 Y64.833 E0.02545 F5239.405 
+G1 X47.535 Y65.186 E0.01439 F5554.405 
+G1 X47.308 Y65.506 E0.01306 F5554.405 
+G1 X47.081 Y65.827 E0.01312 F5604.883 
+G1 X46.807 Y66.215 E0.01582 F5289.883 
+G1 X46.661 Y66.420 E0.00836 F5289.883 
+G1 X46.287 Y66.949 E0.02158 F4884.883 
+G1 X46.285 Y66.953 E0.00014 F4884.883 
+G1 X45.956 Y67.417 E0.01895 F4401.883 
+G1 X45.759 Y67.696 E0.01136 F3885.883 
+G1 X45.677 Y67.812 E0.00473 F3885.883 
+G1 X45.448 Y68.136 E0.01322 F3369.883 
+G1 X45.269 Y68.390 E0.01036 F2853.883 
+G1 X45.137 Y68.576 E0.00758 F2337.883 
+G1 X45.048 Y68.701 E0.00512 F1854.883 
+G1 X44.994 Y68.778 E0.00312 F1449.883 
+G1 X44.966 Y68.818 E0.00162 F1134.883 
+G1 X44.955 Y68.833 E0.00062 F909.883 
+G1 X44.953 Y68.836 E0.00012 F774.883 
+G1 X44.950 Y68.835 E0.00012 F774.883 
+G1 X44.932 Y68.827 E0.00062 F909.883 
+G1 X44.887 Y68.809 E0.00162 F1134.883 
+G1 X44.801 Y68.773 E0.00312 F1449.883 
+G1 X44.659 Y68.714 E0.00512 F1854.883 
+G1 X44.448 Y68.627 E0.00758 F2337.883 
+G1 X44.161 Y68.508 E0.01036 F2853.883 
+G1 X43.794 Y68.356 E0.01322 F3369.883 
+G1 X43.348 Y68.171 E0.01608 F3885.883 
+G1 X42.822 Y67.953 E0.01895 F4401.883 
+G1 X42.220 Y67.703 E0.02172 F4884.883 
+G1 X41.549 Y67.425 E0.02418 F5289.883 
+G1 X41.116 Y67.246 E0.01559 F5604.883 
+G1 X40.879 Y67.148 E0.00855 F5604.883 
+G1 X40.822 Y67.124 E0.00204 F5593.891 
+G1 X40.678 Y67.065 E0.00519 F5593.891 
+G1 X40.518 Y66.998 E0.00579 F5335.891 
+G1 X40.397 Y66.948 E0.00436 F5077.891 
+G1 X40.315 Y66.914 E0.00293 F4819.891 
+G1 X40.271 Y66.896 E0.00161 F4561.891 
+G1 X40.253 Y66.888 E0.00062 F4342.891 
+G1 X40.250 Y66.887 E0.00012 F4207.891 
+G1 X40.247 Y66.885 E0.00012 F4207.891 
+G1 X40.232 Y66.873 E0.00062 F4342.891 
+G1 X40.194 Y66.844 E0.00161 F4561.891 
+G1 X40.124 Y66.790 E0.00293 F4819.891 
+G1 X40.082 Y66.758 E0.00176 F5077.891 
+G1 X40.020 Y66.711 E0.00260 F5077.891 
+G1 X39.882 Y66.605 E0.00579 F5335.891 
+G1 X39.710 Y66.473 E0.00723 F5593.891 
+G1 X39.506 Y66.316 E0.00855 F5812.891 
+G1 X39.399 Y66.234 E0.00451 F5947.891 
+G1 X39.279 Y66.142 E0.00502 F5947.891 
+G1 X39.040 Y65.959 E0.01003 F5992.891 
+G1 X38.703 Y65.701 E0.01412 F6000.000 
+G1 X37.421 Y64.717 E0.05382 F6000.000 
+G1 X37.182 Y64.534 E0.01003 F5980.898 
+G1 X36.955 Y64.360 E0.00953 F5935.898 
+G1 X36.751 Y64.203 E0.00855 F5800.898 
+G1 X36.579 Y64.071 E0.00723 F5581.898 
+G1 X36.441 Y63.965 E0.00579 F5323.898 
+G1 X36.337 Y63.886 E0.00436 F5065.898 
+G1 X36.267 Y63.832 E0.00293 F4807.898 
+G1 X36.229 Y63.803 E0.00161 F4549.898 
+G1 X36.214 Y63.791 E0.00062 F4330.898 
+G1 X36.211 Y63.789 E0.00012 F4195.898 
+G1 X36.209 Y63.786 E0.00012 F4195.898 
+G1 X36.197 Y63.771 E0.00062 F4330.898 
+G1 X36.168 Y63.733 E0.00161 F4549.898 
+G1 X36.114 Y63.663 E0.00293 F4807.898 
+G1 X36.035 Y63.559 E0.00436 F5065.898 
+G1 X35.929 Y63.421 E0.00579 F5323.898 
+G1 X35.797 Y63.249 E0.00723 F5581.898 
+G1 X35.640 Y63.045 E0.00855 F5800.898 
+G1 X35.466 Y62.818 E0.00953 F5935.898 
+G1 X35.283 Y62.579 E0.01003 F5980.898 
+G1 X34.041 Y60.960 E0.06794 F6000.000 
+G1 X33.858 Y60.721 E0.01003 F5992.891 
+G1 X33.684 Y60.494 E0.00953 F5947.891 
+G1 X33.527 Y60.290 E0.00855 F5812.891 
+G1 X33.395 Y60.118 E0.00723 F5593.891 
+G1 X33.289 Y59.980 E0.00579 F5335.891 
+G1 X33.210 Y59.876 E0.00436 F5077.891 
+G1 X33.156 Y59.806 E0.00293 F4819.891 
+G1 X33.127 Y59.768 E0.00161 F4561.891 
+G1 X33.115 Y59.753 E0.00062 F4342.891 
+G1 X33.113 Y59.750 E0.00012 F4207.891 
+G1 X33.112 Y59.747 E0.00012 F4207.891 
+G1 X33.104 Y59.729 E0.00062 F4342.891 
+G1 X33.086 Y59.685 E0.00161 F4561.891 
+G1 X33.052 Y59.603 E0.00293 F4819.891 
+G1 X33.002 Y59.482 E0.00436 F5077.891 
+G1 X32.935 Y59.322 E0.00579 F5335.891 
+G1 X32.876 Y59.178 E0.00519 F5593.891 
+G1 X32.852 Y59.121 E0.00204 F5593.891 
+G1 X32.754 Y58.884 E0.00855 F5604.883 
+G1 X32.644 Y58.619 E0.00953 F5604.883 
+G1 X32.575 Y58.451 E0.00606 F5604.883 
+G1 X32.529 Y58.341 E0.00397 F5289.883 
+G1 X32.297 Y57.780 E0.02021 F5289.883 
+G1 X32.047 Y57.178 E0.02172 F4884.883 
+G1 X31.829 Y56.652 E0.01895 F4401.883 
+G1 X31.644 Y56.206 E0.01608 F3885.883 
+G1 X31.492 Y55.839 E0.01322 F3369.883 
+G1 X31.373 Y55.552 E0.01036 F2853.883 
+G1 X31.286 Y55.341 E0.00758 F2337.883 
+G1 X31.227 Y55.199 E0.00512 F1854.883 
+G1 X31.191 Y55.113 E0.00312 F1449.883 
+G1 X31.173 Y55.068 E0.00162 F1134.883 
+G1 X31.165 Y55.050 E0.00062 F909.883 
+G1 X31.164 Y55.047 E0.00012 F774.883 
+G1 X31.167 Y55.045 E0.00012 F774.883 
+G1 X31.182 Y55.034 E0.00062 F909.883 
+G1 X31.222 Y55.006 E0.00162 F1134.883 
+G1 X31.299 Y54.952 E0.00312 F1449.883 
+G1 X31.424 Y54.863 E0.00512 F1854.883 
+G1 X31.610 Y54.731 E0.00758 F2337.883 
+G1 X31.864 Y54.552 E0.01036 F2853.883 
+G1 X32.188 Y54.323 E0.01322 F3369.883 
+G1 X32.583 Y54.044 E0.01608 F3885.883 
+G1 X33.047 Y53.715 E0.01895 F4401.883 
+G1 X33.580 Y53.339 E0.02172 F4884.883 
+G1 X33.785 Y53.193 E0.00836 F5289.883 
+G1 X34.173 Y52.919 E0.01582 F5289.883 
+G1 X34.494 Y52.692 E0.01312 F5604.883 
+G1 X34.814 Y52.465 E0.01306 F5554.405 
+G1 X35.167 Y52.216 E0.01439 F5554.405 
+G1 X35.493 Y51.985 E0.01329 F5239.405 
+G1 X35.791 Y51.774 E0.01216 F5239.405 
+G1 X36.196 Y51.488 E0.01652 F4834.405 
+G1 X36.354 Y51.376 E0.00643 F4834.405 
+G1 X36.845 Y51.029 E0.02003 F4339.405 
+G1 X36.912 Y50.982 E0.00272 F3781.405 
+G1 X37.259 Y50.736 E0.01417 F3781.405 
+G1 X37.595 Y50.499 E0.01369 F3205.405 
+G1 X37.853 Y50.316 E0.01054 F2629.405 
+G1 X38.040 Y50.184 E0.00762 F2071.405 
+G1 X38.165 Y50.095 E0.00512 F1576.405 
+G1 X38.242 Y50.041 E0.00312 F1171.405 
+G1 X38.282 Y50.013 E0.00162 F856.405 
+G1 X38.297 Y50.002 E0.00062 F631.405 
+G1 X38.300 Y50.000 E0.00012 F496.405 
+G1 X38.297 Y49.998 E0.00012 F496.405 
+G1 X38.282 Y49.987 E0.00062 F631.405 
+G1 X38.242 Y49.959 E0.00162 F856.405 
+G1 X38.165 Y49.905 E0.00312 F1171.405 
+G1 X38.040 Y49.816 E0.00512 F1576.405 
+G1 X37.853 Y49.684 E0.00762 F2071.405 
+G1 X37.595 Y49.501 E0.01054 F2629.405 
+G1 X37.259 Y49.264 E0.01369 F3205.405 
+G1 X36.845 Y48.971 E0.01688 F3781.405 
+G1 X36.354 Y48.624 E0.02003 F4339.405 
+G1 X35.791 Y48.226 E0.02295 F4834.405 
+G1 X35.167 Y47.784 E0.02545 F5239.405 
+G1 X34.814 Y47.535 E0.01439 F5554.405 
+G1 X34.494 Y47.308 E0.01306 F5554.405 
+G1 X34.173 Y47.081 E0.01312 F5604.883 
+G1 X33.785 Y46.807 E0.01582 F5289.883 
+G1 X33.580 Y46.661 E0.00836 F5289.883 
+G1 X33.051 Y46.287 E0.02158 F4884.883 
+G1 X33.047 Y46.285 E0.00014 F4884.883 
+G1 X32.583 Y45.956 E0.01895 F4401.883 
+G1 X32.304 Y45.759 E0.01136 F3885.883 
+G1 X32.188 Y45.677 E0.00473 F3885.883 
+G1 X31.864 Y45.448 E0.01322 F3369.883 
+G1 X31.610 Y45.269 E0.01036 F2853.883 
+G1 X31.424 Y45.137 E0.00758 F2337.883 
+G1 X31.299 Y45.048 E0.00512 F1854.883 
+G1 X31.222 Y44.994 E0.00312 F1449.883 
+G1 X31.182 Y44.966 E0.00162 F1134.883 
+G1 X31.167 Y44.955 E0.00062 F909.883 
+G1 X31.164 Y44.953 E0.00012 F774.883 
+G1 X31.165 Y44.950 E0.00012 F774.883 
+G1 X31.173 Y44.932 E0.00062 F909.883 
+G1 X31.191 Y44.887 E0.00162 F1134.883 
+G1 X31.227 Y44.801 E0.00312 F1449.883 
+G1 X31.286 Y44.659 E0.00512 F1854.883 
+G1 X31.373 Y44.448 E0.00758 F2337.883 
+G1 X31.492 Y44.161 E0.01036 F2853.883 
+G1 X31.644 Y43.794 E0.01322 F3369.883 
+G1 X31.829 Y43.348 E0.01608 F3885.883 
+G1 X32.047 Y42.822 E0.01895 F4401.883 
+G1 X32.297 Y42.220 E0.02172 F4884.883 
+G1 X32.575 Y41.549 E0.02418 F5289.883 
+G1 X32.754 Y41.116 E0.01559 F5604.883 
+G1 X32.852 Y40.879 E0.00855 F5604.883 
+G1 X32.876 Y40.822 E0.00204 F5593.891 
+G1 X32.935 Y40.678 E0.00519 F5593.891 
+G1 X33.002 Y40.518 E0.00579 F5335.891 
+G1 X33.052 Y40.397 E0.00436 F5077.891 
+G1 X33.086 Y40.315 E0.00293 F4819.891 
+G1 X33.104 Y40.271 E0.00161 F4561.891 
+G1 X33.112 Y40.253 E0.00062 F4342.891 
+G1 X33.113 Y40.250 E0.00012 F4207.891 
+G1 X33.115 Y40.247 E0.00012 F4207.891 
+G1 X33.127 Y40.232 E0.00062 F4342.891 
+G1 X33.156 Y40.194 E0.00161 F4561.891 
+G1 X33.210 Y40.124 E0.00293 F4819.891 
+G1 X33.242 Y40.082 E0.00176 F5077.891 
+G1 X33.289 Y40.020 E0.00260 F5077.891 
+G1 X33.395 Y39.882 E0.00579 F5335.891 
+G1 X33.527 Y39.710 E0.00723 F5593.891 
+G1 X33.684 Y39.506 E0.00855 F5812.891 
+G1 X33.766 Y39.399 E0.00451 F5947.891 
+G1 X33.858 Y39.279 E0.00502 F5947.891 
+G1 X34.041 Y39.040 E0.01003 F5992.891 
+G1 X34.299 Y38.703 E0.01412 F6000.000 
+G1 X35.283 Y37.421 E0.05382 F6000.000 
+G1 X35.466 Y37.182 E0.01003 F5980.898 
+G1 X35.640 Y36.955 E0.00953 F5935.898 
+G1 X35.797 Y36.751 E0.00855 F5800.898 
+G1 X35.929 Y36.579 E0.00723 F5581.898 
+G1 X36.035 Y36.441 E0.00579 F5323.898 
+G1 X36.114 Y36.337 E0.00436 F5065.898 
+G1 X36.168 Y36.267 E0.00293 F4807.898 
+G1 X36.197 Y36.229 E0.00161 F4549.898 
+G1 X36.209 Y36.214 E0.00062 F4330.898 
+G1 X36.211 Y36.211 E0.00012 F4195.898 
+G1 X36.214 Y36.209 E0.00012 F4195.898 
+G1 X36.229 Y36.197 E0.00062 F4330.898 
+G1 X36.267 Y36.168 E0.00161 F4549.898 
+G1 X36.337 Y36.114 E0.00293 F4807.898 
+G1 X36.441 Y36.035 E0.00436 F5065.898 
+G1 X36.579 Y35.929 E0.00579 F5323.898 
+G1 X36.751 Y35.797 E0.00723 F5581.898 
+G1 X36.955 Y35.640 E0.00855 F5800.898 
+G1 X37.182 Y35.466 E0.00953 F5935.898 
+G1 X37.421 Y35.283 E0.01003 F5980.898 
+G1 X39.040 Y34.041 E0.06794 F6000.000 
+G1 X39.279 Y33.858 E0.01003 F5992.891 
+G1 X39.506 Y33.684 E0.00953 F5947.891 
+G1 X39.710 Y33.527 E0.00855 F5812.891 
+G1 X39.882 Y33.395 E0.00723 F5593.891 
+G1 X40.020 Y33.289 E0.00579 F5335.891 
+G1 X40.124 Y33.210 E0.00436 F5077.891 
+G1 X40.194 Y33.156 E0.00293 F4819.891 
+G1 X40.232 Y33.127 E0.00161 F4561.891 
+G1 X40.247 Y33.115 E0.00062 F4342.891 
+G1 X40.250 Y33.113 E0.00012 F4207.891 
+G1 X40.253 Y33.112 E0.00012 F4207.891 
+G1 X40.271 Y33.104 E0.00062 F4342.891 
+G1 X40.315 Y33.086 E0.00161 F4561.891 
+G1 X40.397 Y33.052 E0.00293 F4819.891 
+G1 X40.518 Y33.002 E0.00436 F5077.891 
+G1 X40.678 Y32.935 E0.00579 F5335.891 
+G1 X40.822 Y32.876 E0.00519 F5593.891 
+G1 X40.879 Y32.852 E0.00204 F5593.891 
+G1 X41.116 Y32.754 E0.00855 F5604.883 
+G1 X41.381 Y32.644 E0.00953 F5604.883 
+G1 X41.549 Y32.575 E0.00606 F5604.883 
+G1 X41.659 Y32.529 E0.00397 F5289.883 
+G1 X42.220 Y32.297 E0.02021 F5289.883 
+G1 X42.822 Y32.047 E0.02172 F4884.883 
+G1 X43.348 Y31.829 E0.01895 F4401.883 
+G1 X43.794 Y31.644 E0.01608 F3885.883 
+G1 X44.161 Y31.492 E0.01322 F3369.883 
+G1 X44.448 Y31.373 E0.01036 F2853.883 
+G1 X44.659 Y31.286 E0.00758 F2337.883 
+G1 X44.801 Y31.227 E0.00512 F1854.883 
+G1 X44.887 Y31.191 E0.00312 F1449.883 
+G1 X44.932 Y31.173 E0.00162 F1134.883 
+G1 X44.950 Y31.165 E0.00062 F909.883 
+G1 X44.953 Y31.164 E0.00012 F774.883 
+G1 X44.955 Y31.167 E0.00012 F774.883 
+G1 X44.966 Y31.182 E0.00062 F909.883 
+G1 X44.994 Y31.222 E0.00162 F1134.883 
+G1 X45.048 Y31.299 E0.00312 F1449.883 
+G1 X45.137 Y31.424 E0.00512 F1854.883 
+G1 X45.269 Y31.610 E0.00758 F2337.883 
+G1 X45.448 Y31.864 E0.01036 F2853.883 
+G1 X45.677 Y32.188 E0.01322 F3369.883 
+G1 X45.956 Y32.583 E0.01608 F3885.883 
+G1 X46.285 Y33.047 E0.01895 F4401.883 
+G1 X46.661 Y33.580 E0.02172 F4884.883 
+G1 X46.807 Y33.785 E0.00836 F5289.883 
+G1 X47.081 Y34.173 E0.01582 F5289.883 
+G1 X47.308 Y34.494 E0.01312 F5604.883 
+G1 X47.535 Y34.814 E0.01306 F5554.405 
+G1 X47.784 Y35.167 E0.01439 F5554.405 
+G1 X48.015 Y35.493 E0.01329 F5239.405 
+G1 X48.226 Y35.791 E0.01216 F5239.405 
+G1 X48.512 Y36.196 E0.01652 F4834.405 
+G1 X48.624 Y36.354 E0.00643 F4834.405 
+G1 X48.971 Y36.845 E0.02003 F4339.405 
+G1 X49.018 Y36.912 E0.00272 F3781.405 
+G1 X49.264 Y37.259 E0.01417 F3781.405 
+G1 X49.501 Y37.595 E0.01369 F3205.405 
+G1 X49.684 Y37.853 E0.01054 F2629.405 
+G1 X49.816 Y38.040 E0.00762 F2071.405 
+G1 X49.905 Y38.165 E0.00512 F1576.405 
+G1 X49.959 Y38.242 E0.00312 F1171.405 
+G1 X49.987 Y38.282 E0.00162 F856.405 
+G1 X49.998 Y38.297 E0.00062 F631.405 
+G1 X50.000 Y38.300 E0.00012 F496.405 
+G1 X50.002 Y38.297 E0.00012 F496.405 
+G1 X50.013 Y38.282 E0.00062 F631.405 
+G1 X50.041 Y38.242 E0.00162 F856.405 
+G1 X50.095 Y38.165 E0.00312 F1171.405 
+G1 X50.184 Y38.040 E0.00512 F1576.405 
+G1 X50.316 Y37.853 E0.00762 F2071.405 
+G1 X50.499 Y37.595 E0.01054 F2629.405 
+G1 X50.736 Y37.259 E0.01369 F3205.405 
+G1 X51.029 Y36.845 E0.01688 F3781.405 
+G1 X51.376 Y36.354 E0.02003 F4339.405 
+G1 X51.774 Y35.791 E0.02295 F4834.405 
+G1 X52.216 Y35.167 E0.02545 F5239.405 
+G1 X52.465 Y34.814 E0.01439 F5554.405 
+G1 X52.692 Y34.494 E0.01306 F5554.405 
+G1 X52.919 Y34.173 E0.01312 F5604.883 
+G1 X53.193 Y33.785 E0.01582 F5289.883 
+G1 X53.339 Y33.580 E0.00836 F5289.883 
+G1 X53.713 Y33.051 E0.02158 F4884.883 
+G1 X53.715 Y33.047 E0.00014 F4884.883 
+G1 X54.044 Y32.583 E0.01895 F4401.883 
+G1 X54.241 Y32.304 E0.01136 F3885.883 
+G1 X54.323 Y32.188 E0.00473 F3885.883 
+G1 X54.552 Y31.864 E0.01322 F3369.883 
+G1 X54.731 Y31.610 E0.01036 F2853.883 
+G1 X54.863 Y31.424 E0.00758 F2337.883 
+G1 X54.952 Y31.299 E0.00512 F1854.883 
+G1 X55.006 Y31.222 E0.00312 F1449.883 
+G1 X55.034 Y31.182 E0.00162 F1134.883 
+G1 X55.045 Y31.167 E0.00062 F909.883 
+G1 X55.047 Y31.164 E0.00012 F774.883 
+G1 X55.050 Y31.165 E0.00012 F774.883 
+G1 X55.068 Y31.173 E0.00062 F909.883 
+G1 X55.113 Y31.191 E0.00162 F1134.883 
+G1 X55.199 Y31.227 E0.00312 F1449.883 
+G1 X55.341 Y31.286 E0.00512 F1854.883 
+G1 X55.552 Y31.373 E0.00758 F2337.883 
+G1 X55.839 Y31.492 E0.01036 F2853.883 
+G1 X56.206 Y31.644 E0.01322 F3369.883 
+G1 X56.652 Y31.829 E0.01608 F3885.883 
+G1 X57.178 Y32.047 E0.01895 F4401.883 
+G1 X57.780 Y32.297 E0.02172 F4884.883 
+G1 X58.451 Y32.575 E0.02418 F5289.883 
+G1 X58.884 Y32.754 E0.01559 F5604.883 
+G1 X59.121 Y32.852 E0.00855 F5604.883 
+G1 X59.178 Y32.876 E0.00204 F5593.891 
+G1 X59.322 Y32.935 E0.00519 F5593.891 
+G1 X59.482 Y33.002 E0.00579 F5335.891 
+G1 X59.603 Y33.052 E0.00436 F5077.891 
+G1 X59.685 Y33.086 E0.00293 F4819.891 
+G1 X59.729 Y33.104 E0.00161 F4561.891 
+G1 X59.747 Y33.112 E0.00062 F4342.891 
+G1 X59.750 Y33.113 E0.00012 F4207.891 
+G1 X59.753 Y33.115 E0.00012 F4207.891 
+G1 X59.768 Y33.127 E0.00062 F4342.891 
+G1 X59.806 Y33.156 E0.00161 F4561.891 
+G1 X59.876 Y33.210 E0.00293 F4819.891 
+G1 X59.918 Y33.242 E0.00176 F5077.891 
+G1 X59.980 Y33.289 E0.00260 F5077.891 
+G1 X60.118 Y33.395 E0.00579 F5335.891 
+G1 X60.290 Y33.527 E0.00723 F5593.891 
+G1 X60.494 Y33.684 E0.00855 F5812.891 
+G1 X60.601 Y33.766 E0.00451 F5947.891 
+G1 X60.721 Y33.858 E0.00502 F5947.891 
+G1 X60.960 Y34.041 E0.01003 F5992.891 
+G1 X61.297 Y34.299 E0.01412 F6000.000 
+G1 X62.579 Y35.283 E0.05382 F6000.000 
+G1 X62.818 Y35.466 E0.01003 F5980.898 
+G1 X63.045 Y35.640 E0.00953 F5935.898 
+G1 X63.249 Y35.797 E0.00855 F5800.898 
+G1 X63.421 Y35.929 E0.00723 F5581.898 
+G1 X63.559 Y36.035 E0.00579 F5323.898 
+G1 X63.663 Y36.114 E0.00436 F5065.898 
+G1 X63.733 Y36.168 E0.00293 F4807.898 
+G1 X63.771 Y36.197 E0.00161 F4549.898 
+G1 X63.786 Y36.209 E0.00062 F4330.898 
+G1 X63.789 Y36.211 E0.00012 F4195.898 
+G1 X63.791 Y36.214 E0.00012 F4195.898 
+G1 X63.803 Y36.229 E0.00062 F4330.898 
+G1 X63.832 Y36.267 E0.00161 F4549.898 
+G1 X63.886 Y36.337 E0.00293 F4807.898 
+G1 X63.965 Y36.441 E0.00436 F5065.898 
+G1 X64.071 Y36.579 E0.00579 F5323.898 
+G1 X64.203 Y36.751 E0.00723 F5581.898 
+G1 X64.360 Y36.955 E0.00855 F5800.898 
+G1 X64.534 Y37.182 E0.00953 F5935.898 
+G1 X64.717 Y37.421 E0.01003 F5980.898 
+G1 X65.959 Y39.040 E0.06794 F6000.000 
+G1 X66.142 Y39.279 E0.01003 F5992.891 
+G1 X66.316 Y39.506 E0.00953 F5947.891 
+G1 X66.473 Y39.710 E0.00855 F5812.891 
+G1 X66.605 Y39.882 E0.00723 F5593.891 
+G1 X66.711 Y40.020 E0.00579 F5335.891 
+G1 X66.790 Y40.124 E0.00436 F5077.891 
+G1 X66.844 Y40.194 E0.00293 F4819.891 
+G1 X66.873 Y40.232 E0.00161 F4561.891 
+G1 X66.885 Y40.247 E0.00062 F4342.891 
+G1 X66.887 Y40.250 E0.00012 F4207.891 
+G1 X66.888 Y40.253 E0.00012 F4207.891 
+G1 X66.896 Y40.271 E0.00062 F4342.891 
+G1 X66.914 Y40.315 E0.00161 F4561.891 
+G1 X66.948 Y40.397 E0.00293 F4819.891 
+G1 X66.998 Y40.518 E0.00436 F5077.891 
+G1 X67.065 Y40.678 E0.00579 F5335.891 
+G1 X67.124 Y40.822 E0.00519 F5593.891 
+G1 X67.148 Y40.879 E0.00204 F5593.891 
+G1 X67.246 Y41.116 E0.00855 F5604.883 
+G1 X67.356 Y41.381 E0.00953 F5604.883 
+G1 X67.425 Y41.549 E0.00606 F5604.883 
+G1 X67.471 Y41.659 E0.00397 F5289.883 
+G1 X67.703 Y42.220 E0.02021 F5289.883 
+G1 X67.953 Y42.822 E0.02172 F4884.883 
+G1 X68.171 Y43.348 E0.01895 F4401.883 
+G1 X68.356 Y43.794 E0.01608 F3885.883 
+G1 X68.508 Y44.161 E0.01322 F3369.883 
+G1 X68.627 Y44.448 E0.01036 F2853.883 
+G1 X68.714 Y44.659 E0.00758 F2337.883 
+G1 X68.773 Y44.801 E0.00512 F1854.883 
+G1 X68.809 Y44.887 E0.00312 F1449.883 
+G1 X68.827 Y44.932 E0.00162 F1134.883 
+G1 X68.835 Y44.950 E0.00062 F909.883 
+G1 X68.836 Y44.953 E0.00012 F774.883 
+G1 X68.833 Y44.955 E0.00012 F774.883 
+G1 X68.818 Y44.966 E0.00062 F909.883 
+G1 X68.778 Y44.994 E0.00162 F1134.883 
+G1 X68.701 Y45.048 E0.00312 F1449.883 
+G1 X68.576 Y45.137 E0.00512 F1854.883 
+G1 X68.390 Y45.269 E0.00758 F2337.883 
+G1 X68.136 Y45.448 E0.01036 F2853.883 
+G1 X67.812 Y45.677 E0.01322 F3369.883 
+G1 X67.417 Y45.956 E0.01608 F3885.883 
+G1 X66.953 Y46.285 E0.01895 F4401.883 
+G1 X66.420 Y46.661 E0.02172 F4884.883 
+G1 X65.827 Y47.081 E0.02418 F5289.883 
+G1 X65.186 Y47.535 E0.02618 F5604.883 
+G1 X64.507 Y48.015 E0.02768 F5829.883 
+G1 X63.804 Y48.512 E0.02868 F5964.883 
+G1 X63.088 Y49.018 E0.02918 F6009.883 
+G1 X61.700 Y50.000 E0.05662 F6000.000 
+G1 E-.8 F2100
+;TYPE:Sparse infill
+;WIDTH:0.45
+G1 X40.000 Y40.000 F12000
+G1 E.8 F2100
+G1 F9000
+G1 X40.000 Y40.000 E0.66600
+G1 Y41.700 E0.05661
+G1 X60.000 Y41.700 E0.66600
+G1 Y43.400 E0.05661
+G1 X40.000 Y43.400 E0.66600
+G1 Y45.100 E0.05661
+G1 X60.000 Y45.100 E0.66600
+G1 Y46.800 E0.05661
+G1 X40.000 Y46.800 E0.66600
+G1 Y48.500 E0.05661
+G1 X60.000 Y48.500 E0.66600
+G1 Y50.200 E0.05661
+G1 X40.000 Y50.200 E0.66600
+G1 Y51.900 E0.05661
+G1 X60.000 Y51.900 E0.66600
+G1 Y53.600 E0.05661
+G1 X40.000 Y53.600 E0.66600
+G1 Y55.300 E0.05661
+G1 X60.000 Y55.300 E0.66600
+G1 Y57.000 E0.05661
+G1 X40.000 Y57.000 E0.66600
+G1 Y58.700 E0.05661
+G1 X52.948 Y58.700 E0.43115 
+G1 X54.279 Y58.700 E0.04436 F9093.433 
+G1 X55.497 Y58.700 E0.04056 F8409.433 
+G1 X56.601 Y58.700 E0.03676 F7725.433 
+G1 X57.591 Y58.700 E0.03297 F7041.433 
+G1 X58.468 Y58.700 E0.02917 F6357.433 
+G1 X59.230 Y58.700 E0.02537 F5673.433 
+G1 X59.877 Y58.700 E0.02158 F4989.433 
+G1 X60.000 Y58.700 E0.00408 F4305.433 
+G1 X60.000 Y59.111 E0.01370 F4305.433 
+G1 X60.000 Y59.534 E0.01406 F3621.433 
+G1 X60.000 Y59.852 E0.01061 F2964.433 
+G1 X60.000 Y60.081 E0.00762 F2379.433 
+G1 X60.000 Y60.235 E0.00512 F1884.433 
+G1 X60.000 Y60.329 E0.00312 F1479.433 
+G1 X60.000 Y60.377 E0.00162 F1164.433 
+G1 X60.000 Y60.396 E0.00062 F939.433 
+G1 Y60.400 E0.00012 
+; some comment
+
+G1 E-.8 F2100
+;TYPE:Outer wall
+;WIDTH:0.45
+G1 X60.004 Y60.401 F804.433 
+G1 X132.000 Y80.000 F12000.000 
+G1 E.8 F2100
+G1 F3000
+G1 X137.472 Y83.870 E0.22319 
+G1 X137.777 Y84.085 E0.01243 F2991.992 
+G1 X138.069 Y84.292 E0.01193 F2946.992 
+G1 X138.338 Y84.482 E0.01096 F2811.992 
+G1 X138.576 Y84.650 E0.00969 F2598.992 
+G1 X138.780 Y84.795 E0.00832 F2352.992 
+G1 X138.951 Y84.915 E0.00696 F2106.992 
+G1 X139.088 Y85.012 E0.00559 F1860.992 
+G1 X139.191 Y85.086 E0.00423 F1614.992 
+G1 X139.262 Y85.135 E0.00286 F1368.992 
+G1 X139.301 Y85.163 E0.00159 F1122.992 
+G1 X139.316 Y85.174 E0.00062 F909.992 
+G1 X139.319 Y85.176 E0.00012 F774.992 
+G1 X139.318 Y85.179 E0.00012 F774.992 
+G1 X139.310 Y85.197 E0.00062 F909.992 
+G1 X139.292 Y85.241 E0.00159 F1122.992 
+G1 X139.259 Y85.320 E0.00286 F1368.992 
+G1 X139.211 Y85.438 E0.00423 F1614.992 
+G1 X139.146 Y85.593 E0.00559 F1860.992 
+G1 X139.066 Y85.786 E0.00696 F2106.992 
+G1 X138.971 Y86.017 E0.00832 F2352.992 
+G1 X138.859 Y86.286 E0.00969 F2598.992 
+G1 X138.733 Y86.590 E0.01096 F2811.992 
+G1 X138.596 Y86.921 E0.01193 F2946.992 
+G1 X138.453 Y87.266 E0.01243 F2991.992 
+G1 X137.321 Y90.000 E0.09854 F3000.000 
+G1 X134.142 Y94.142 E0.17386
+G1 X130.000 Y97.321 E0.17386
+G1 X127.266 Y98.453 E0.09854 
+G1 X126.921 Y98.596 E0.01243 F2991.992 
+G1 X126.590 Y98.733 E0.01193 F2946.992 
+G1 X126.286 Y98.859 E0.01096 F2811.992 
+G1 X126.017 Y98.971 E0.00969 F2598.992 
+G1 X125.786 Y99.066 E0.00832 F2352.992 
+G1 X125.593 Y99.146 E0.00696 F2106.992 
+G1 X125.438 Y99.211 E0.00559 F1860.992 
+G1 X125.320 Y99.259 E0.00423 F1614.992 
+G1 X125.241 Y99.292 E0.00286 F1368.992 
+G1 X125.197 Y99.310 E0.00159 F1122.992 
+G1 X125.179 Y99.318 E0.00062 F909.992 
+G1 X125.176 Y99.319 E0.00012 F774.992 
+G1 X125.174 Y99.316 E0.00012 F774.992 
+G1 X125.163 Y99.301 E0.00062 F909.992 
+G1 X125.135 Y99.262 E0.00159 F1122.992 
+G1 X125.086 Y99.191 E0.00286 F1368.992 
+G1 X125.012 Y99.088 E0.00423 F1614.992 
+G1 X124.915 Y98.951 E0.00559 F1860.992 
+G1 X124.795 Y98.780 E0.00696 F2106.992 
+G1 X124.650 Y98.576 E0.00832 F2352.992 
+G1 X124.482 Y98.338 E0.00969 F2598.992 
+G1 X124.292 Y98.069 E0.01096 F2811.992 
+G1 X124.085 Y97.777 E0.01193 F2946.992 
+G1 X123.870 Y97.472 E0.01243 F2991.992 
+G1 X121.455 Y94.057 E0.13927 F3000.000 
+G1 X121.215 Y93.718 E0.01386 F2971.376 
+G1 X120.983 Y93.390 E0.01336 F2926.376 
+G1 X120.769 Y93.087 E0.01236 F2791.376 
+G1 X120.579 Y92.818 E0.01096 F2566.376 
+G1 X120.416 Y92.588 E0.00939 F2287.376 
+G1 X120.281 Y92.397 E0.00779 F1999.376 
+G1 X120.173 Y92.245 E0.00619 F1711.376 
+G1 X120.094 Y92.132 E0.00460 F1423.376 
+G1 X120.041 Y92.058 E0.00302 F1135.376 
+G1 X120.013 Y92.018 E0.00162 F856.376 
+G1 X120.002 Y92.003 E0.00062 F631.376 
+G1 X120.000 Y92.000 E0.00012 F496.376 
+G1 X119.998 Y92.003 E0.00012 F496.376 
+G1 X119.987 Y92.018 E0.00062 F631.376 
+G1 X119.959 Y92.058 E0.00162 F856.376 
+G1 X119.906 Y92.132 E0.00302 F1135.376 
+G1 X119.827 Y92.245 E0.00460 F1423.376 
+G1 X119.719 Y92.397 E0.00619 F1711.376 
+G1 X119.584 Y92.588 E0.00779 F1999.376 
+G1 X119.421 Y92.818 E0.00939 F2287.376 
+G1 X119.231 Y93.087 E0.01096 F2566.376 
+G1 X119.017 Y93.390 E0.01236 F2791.376 
+G1 X118.785 Y93.718 E0.01336 F2926.376 
+G1 X118.545 Y94.057 E0.01386 F2971.376 
+G1 X116.130 Y97.472 E0.13927 F3000.000 
+G1 X115.915 Y97.777 E0.01243 F2991.992 
+G1 X115.708 Y98.069 E0.01193 F2946.992 
+G1 X115.518 Y98.338 E0.01096 F2811.992 
+G1 X115.350 Y98.576 E0.00969 F2598.992 
+G1 X115.205 Y98.780 E0.00832 F2352.992 
+G1 X115.085 Y98.951 E0.00696 F2106.992 
+G1 X114.988 Y99.088 E0.00559 F1860.992 
+G1 X114.914 Y99.191 E0.00423 F1614.992 
+G1 X114.865 Y99.262 E0.00286 F1368.992 
+G1 X114.837 Y99.301 E0.00159 F1122.992 
+G1 X114.826 Y99.316 E0.00062 F909.992 
+G1 X114.824 Y99.319 E0.00012 F774.992 
+G1 X114.821 Y99.318 E0.00012 F774.992 
+G1 X114.803 Y99.310 E0.00062 F909.992 
+G1 X114.759 Y99.292 E0.00159 F1122.992 
+G1 X114.680 Y99.259 E0.00286 F1368.992 
+G1 X114.562 Y99.211 E0.00423 F1614.992 
+G1 X114.407 Y99.146 E0.00559 F1860.992 
+G1 X114.214 Y99.066 E0.00696 F2106.992 
+G1 X113.983 Y98.971 E0.00832 F2352.992 
+G1 X113.714 Y98.859 E0.00969 F2598.992 
+G1 X113.410 Y98.733 E0.01096 F2811.992 
+G1 X113.079 Y98.596 E0.01193 F2946.992 
+G1 X112.734 Y98.453 E0.01243 F2991.992 
+G1 X110.000 Y97.321 E0.09854 F3000.000 
+G1 X105.858 Y94.142 E0.17386
+G1 X102.679 Y90.000 E0.17386
+G1 X101.547 Y87.266 E0.09854 
+G1 X101.404 Y86.921 E0.01243 F2991.992 
+G1 X101.267 Y86.590 E0.01193 F2946.992 
+G1 X101.141 Y86.286 E0.01096 F2811.992 
+G1 X101.029 Y86.017 E0.00969 F2598.992 
+G1 X100.934 Y85.786 E0.00832 F2352.992 
+G1 X100.854 Y85.593 E0.00696 F2106.992 
+G1 X100.789 Y85.438 E0.00559 F1860.992 
+G1 X100.741 Y85.320 E0.00423 F1614.992 
+G1 X100.708 Y85.241 E0.00286 F1368.992 
+G1 X100.690 Y85.197 E0.00159 F1122.992 
+G1 X100.682 Y85.179 E0.00062 F909.992 
+G1 X100.681 Y85.176 E0.00012 F774.992 
+G1 X100.684 Y85.174 E0.00012 F774.992 
+G1 X100.699 Y85.163 E0.00062 F909.992 
+G1 X100.738 Y85.135 E0.00159 F1122.992 
+G1 X100.809 Y85.086 E0.00286 F1368.992 
+G1 X100.912 Y85.012 E0.00423 F1614.992 
+G1 X101.049 Y84.915 E0.00559 F1860.992 
+G1 X101.220 Y84.795 E0.00696 F2106.992 
+G1 X101.424 Y84.650 E0.00832 F2352.992 
+G1 X101.662 Y84.482 E0.00969 F2598.992 
+G1 X101.931 Y84.292 E0.01096 F2811.992 
+G1 X102.223 Y84.085 E0.01193 F2946.992 
+G1 X102.528 Y83.870 E0.01243 F2991.992 
+G1 X105.943 Y81.455 E0.13927 F3000.000 
+G1 X106.282 Y81.215 E0.01386 F2971.376 
+G1 X106.610 Y80.983 E0.01336 F2926.376 
+G1 X106.913 Y80.769 E0.01236 F2791.376 
+G1 X107.182 Y80.579 E0.01096 F2566.376 
+G1 X107.412 Y80.416 E0.00939 F2287.376 
+G1 X107.603 Y80.281 E0.00779 F1999.376 
+G1 X107.755 Y80.173 E0.00619 F1711.376 
+G1 X107.868 Y80.094 E0.00460 F1423.376 
+G1 X107.942 Y80.041 E0.00302 F1135.376 
+G1 X107.982 Y80.013 E0.00162 F856.376 
+G1 X107.997 Y80.002 E0.00062 F631.376 
+G1 X108.000 Y80.000 E0.00012 F496.376 
+G1 X107.997 Y79.998 E0.00012 F496.376 
+G1 X107.982 Y79.987 E0.00062 F631.376 
+G1 X107.942 Y79.959 E0.00162 F856.376 
+G1 X107.868 Y79.906 E0.00302 F1135.376 
+G1 X107.755 Y79.827 E0.00460 F1423.376 
+G1 X107.603 Y79.719 E0.00619 F1711.376 
+G1 X107.412 Y79.584 E0.00779 F1999.376 
+G1 X107.182 Y79.421 E0.00939 F2287.376 
+G1 X106.913 Y79.231 E0.01096 F2566.376 
+G1 X106.610 Y79.017 E0.01236 F2791.376 
+G1 X106.282 Y78.785 E0.01336 F2926.376 
+G1 X105.943 Y78.545 E0.01386 F2971.376 
+G1 X102.528 Y76.130 E0.13927 F3000.000 
+G1 X102.223 Y75.915 E0.01243 F2991.992 
+G1 X101.931 Y75.708 E0.01193 F2946.992 
+G1 X101.662 Y75.518 E0.01096 F2811.992 
+G1 X101.424 Y75.350 E0.00969 F2598.992 
+G1 X101.220 Y75.205 E0.00832 F2352.992 
+G1 X101.049 Y75.085 E0.00696 F2106.992 
+G1 X100.912 Y74.988 E0.00559 F1860.992 
+G1 X100.809 Y74.914 E0.00423 F1614.992 
+G1 X100.738 Y74.865 E0.00286 F1368.992 
+G1 X100.699 Y74.837 E0.00159 F1122.992 
+G1 X100.684 Y74.826 E0.00062 F909.992 
+G1 X100.681 Y74.824 E0.00012 F774.992 
+G1 X100.682 Y74.821 E0.00012 F774.992 
+G1 X100.690 Y74.803 E0.00062 F909.992 
+G1 X100.708 Y74.759 E0.00159 F1122.992 
+G1 X100.741 Y74.680 E0.00286 F1368.992 
+G1 X100.789 Y74.562 E0.00423 F1614.992 
+G1 X100.854 Y74.407 E0.00559 F1860.992 
+G1 X100.934 Y74.214 E0.00696 F2106.992 
+G1 X101.029 Y73.983 E0.00832 F2352.992 
+G1 X101.141 Y73.714 E0.00969 F2598.992 
+G1 X101.267 Y73.410 E0.01096 F2811.992 
+G1 X101.404 Y73.079 E0.01193 F2946.992 
+G1 X101.547 Y72.734 E0.01243 F2991.992 
+G1 X102.679 Y70.000 E0.09854 F3000.000 
+G1 X105.858 Y65.858 E0.17386
+G1 X110.000 Y62.679 E0.17386
+G1 X112.734 Y61.547 E0.09854 
+G1 X113.079 Y61.404 E0.01243 F2991.992 
+G1 X113.410 Y61.267 E0.01193 F2946.992 
+G1 X113.714 Y61.141 E0.01096 F2811.992 
+G1 X113.983 Y61.029 E0.00969 F2598.992 
+G1 X114.214 Y60.934 E0.00832 F2352.992 
+G1 X114.407 Y60.854 E0.00696 F2106.992 
+G1 X114.562 Y60.789 E0.00559 F1860.992 
+G1 X114.680 Y60.741 E0.00423 F1614.992 
+G1 X114.759 Y60.708 E0.00286 F1368.992 
+G1 X114.803 Y60.690 E0.00159 F1122.992 
+G1 X114.821 Y60.682 E0.00062 F909.992 
+G1 X114.824 Y60.681 E0.00012 F774.992 
+G1 X114.826 Y60.684 E0.00012 F774.992 
+G1 X114.837 Y60.699 E0.00062 F909.992 
+G1 X114.865 Y60.738 E0.00159 F1122.992 
+G1 X114.914 Y60.809 E0.00286 F1368.992 
+G1 X114.988 Y60.912 E0.00423 F1614.992 
+G1 X115.085 Y61.049 E0.00559 F1860.992 
+G1 X115.205 Y61.220 E0.00696 F2106.992 
+G1 X115.350 Y61.424 E0.00832 F2352.992 
+G1 X115.518 Y61.662 E0.00969 F2598.992 
+G1 X115.708 Y61.931 E0.01096 F2811.992 
+G1 X115.915 Y62.223 E0.01193 F2946.992 
+G1 X116.130 Y62.528 E0.01243 F2991.992 
+G1 X118.545 Y65.943 E0.13927 F3000.000 
+G1 X118.785 Y66.282 E0.01386 F2971.376 
+G1 X119.017 Y66.610 E0.01336 F2926.376 
+G1 X119.231 Y66.913 E0.01236 F2791.376 
+G1 X119.421 Y67.182 E0.01096 F2566.376 
+G1 X119.584 Y67.412 E0.00939 F2287.376 
+G1 X119.719 Y67.603 E0.00779 F1999.376 
+G1 X119.827 Y67.755 E0.00619 F1711.376 
+G1 X119.906 Y67.868 E0.00460 F1423.376 
+G1 X119.959 Y67.942 E0.00302 F1135.376 
+G1 X119.987 Y67.982 E0.00162 F856.376 
+G1 X119.998 Y67.997 E0.00062 F631.376 
+G1 X120.000 Y68.000 E0.00012 F496.376 
+G1 X120.002 Y67.997 E0.00012 F496.376 
+G1 X120.013 Y67.982 E0.00062 F631.376 
+G1 X120.041 Y67.942 E0.00162 F856.376 
+G1 X120.094 Y67.868 E0.00302 F1135.376 
+G1 X120.173 Y67.755 E0.00460 F1423.376 
+G1 X120.281 Y67.603 E0.00619 F1711.376 
+G1 X120.416 Y67.412 E0.00779 F1999.376 
+G1 X120.579 Y67.182 E0.00939 F2287.376 
+G1 X120.769 Y66.913 E0.01096 F2566.376 
+G1 X120.983 Y66.610 E0.01236 F2791.376 
+G1 X121.215 Y66.282 E0.01336 F2926.376 
+G1 X121.455 Y65.943 E0.01386 F2971.376 
+G1 X123.870 Y62.528 E0.13927 F3000.000 
+G1 X124.085 Y62.223 E0.01243 F2991.992 
+G1 X124.292 Y61.931 E0.01193 F2946.992 
+G1 X124.482 Y61.662 E0.01096 F2811.992 
+G1 X124.650 Y61.424 E0.00969 F2598.992 
+G1 X124.795 Y61.220 E0.00832 F2352.992 
+G1 X124.915 Y61.049 E0.00696 F2106.992 
+G1 X125.012 Y60.912 E0.00559 F1860.992 
+G1 X125.086 Y60.809 E0.00423 F1614.992 
+G1 X125.135 Y60.738 E0.00286 F1368.992 
+G1 X125.163 Y60.699 E0.00159 F1122.992 
+G1 X125.174 Y60.684 E0.00062 F909.992 
+G1 X125.176 Y60.681 E0.00012 F774.992 
+G1 X125.179 Y60.682 E0.00012 F774.992 
+G1 X125.197 Y60.690 E0.00062 F909.992 
+G1 X125.241 Y60.708 E0.00159 F1122.992 
+G1 X125.320 Y60.741 E0.00286 F1368.992 
+G1 X125.438 Y60.789 E0.00423 F1614.992 
+G1 X125.593 Y60.854 E0.00559 F1860.992 
+G1 X125.786 Y60.934 E0.00696 F2106.992 
+G1 X126.017 Y61.029 E0.00832 F2352.992 
+G1 X126.286 Y61.141 E0.00969 F2598.992 
+G1 X126.590 Y61.267 E0.01096 F2811.992 
+G1 X126.921 Y61.404 E0.01193 F2946.992 
+G1 X127.266 Y61.547 E0.01243 F2991.992 
+G1 X130.000 Y62.679 E0.09854 F3000.000 
+G1 X134.142 Y65.858 E0.17386
+G1 X137.321 Y70.000 E0.17386
+G1 X138.453 Y72.734 E0.09854 
+G1 X138.596 Y73.079 E0.01243 F2991.992 
+G1 X138.733 Y73.410 E0.01193 F2946.992 
+G1 X138.859 Y73.714 E0.01096 F2811.992 
+G1 X138.971 Y73.983 E0.00969 F2598.992 
+G1 X139.066 Y74.214 E0.00832 F2352.992 
+G1 X139.146 Y74.407 E0.00696 F2106.992 
+G1 X139.211 Y74.562 E0.00559 F1860.992 
+G1 X139.259 Y74.680 E0.00423 F1614.992 
+G1 X139.292 Y74.759 E0.00286 F1368.992 
+G1 X139.310 Y74.803 E0.00159 F1122.992 
+G1 X139.318 Y74.821 E0.00062 F909.992 
+G1 X139.319 Y74.824 E0.00012 F774.992 
+G1 X139.316 Y74.826 E0.00012 F774.992 
+G1 X139.301 Y74.837 E0.00062 F909.992 
+G1 X139.262 Y74.865 E0.00159 F1122.992 
+G1 X139.191 Y74.914 E0.00286 F1368.992 
+G1 X139.088 Y74.988 E0.00423 F1614.992 
+G1 X138.951 Y75.085 E0.00559 F1860.992 
+G1 X138.780 Y75.205 E0.00696 F2106.992 
+G1 X138.576 Y75.350 E0.00832 F2352.992 
+G1 X138.338 Y75.518 E0.00969 F2598.992 
+G1 X138.069 Y75.708 E0.01096 F2811.992 
+G1 X137.777 Y75.915 E0.01193 F2946.992 
+G1 X137.472 Y76.130 E0.01243 F2991.992 
+G1 X132.808 Y79.428 E0.19022 F3000.000 
+G1 X132.462 Y79.673 E0.01411 F3000.000 
+G1 X132.447 Y79.684 E0.00062 F2459.578 
+G1 X132.260 Y79.816 E0.00762 F2459.578 
+G1 X132.202 Y79.857 E0.00237 F2459.578 
+G1 X132.135 Y79.905 E0.00275 F1874.578 
+G1 X132.058 Y79.959 E0.00312 F1874.578 
+G1 X132.018 Y79.987 E0.00162 F1874.578 
+G1 X132.015 Y79.989 E0.00012 F1874.578 
+G1 X132.003 Y79.998 E0.00050 F1919.062 
+G1 X132.000 Y80.000 E0.00012 F3000.000 
+G1 E-.8 F2100
+;TYPE:Inner wall
+;WIDTH:0.45
+G1 X131.996 Y80.000 F1379.578 
+G1 X131.865 Y80.000 F1379.578 
+G1 X131.771 Y80.000 F974.578 
+G1 X131.722 Y80.000 F659.578 
+G1 X131.704 Y80.000 F434.578 
+G1 X131.700 Y80.000 F299.578 
+G1 E0.80000 F299.578 
+G1 F299.578 
+G1 X131.703 Y80.002 E0.00012 F299.578 
+G1 X131.718 Y80.013 E0.00062 F434.578 
+G1 X131.758 Y80.041 E0.00162 F659.578 
+G1 X131.835 Y80.095 E0.00312 F974.578 
+G1 X131.960 Y80.184 E0.00512 F1379.578 
+G1 X132.147 Y80.316 E0.00762 F1874.578 
+G1 X132.407 Y80.500 E0.01061 F2459.578 
+G1 X132.753 Y80.745 E0.01411 F3134.578 
+G1 X133.191 Y81.055 E0.01786 F3809.578 
+G1 X133.715 Y81.425 E0.02135 F4394.578 
+G1 X134.312 Y81.847 E0.02435 F4889.578 
+G1 X134.508 Y81.986 E0.00799 F5294.578 
+G1 X134.970 Y82.313 E0.01886 F5294.578 
+G1 X135.186 Y82.466 E0.00882 F5609.578 
+G1 X135.677 Y82.813 E0.02002 F5604.883 
+G1 X135.828 Y82.920 E0.00616 F5604.883 
+G1 X136.421 Y83.339 E0.02418 F5289.883 
+G1 X136.953 Y83.715 E0.02169 F4884.883 
+G1 X137.190 Y83.883 E0.00965 F4401.883 
+G1 X137.417 Y84.044 E0.00930 F4401.883 
+G1 X137.812 Y84.323 E0.01608 F3885.883 
+G1 X137.970 Y84.435 E0.00646 F3369.883 
+G1 X138.136 Y84.552 E0.00676 F3369.883 
+G1 X138.390 Y84.731 E0.01036 F2853.883 
+G1 X138.576 Y84.863 E0.00758 F2337.883 
+G1 X138.701 Y84.952 E0.00512 F1854.883 
+G1 X138.778 Y85.006 E0.00312 F1449.883 
+G1 X138.818 Y85.034 E0.00162 F1134.883 
+G1 X138.833 Y85.045 E0.00062 F909.883 
+G1 X138.836 Y85.047 E0.00012 F774.883 
+G1 X138.835 Y85.050 E0.00012 F774.883 
+G1 X138.827 Y85.068 E0.00062 F909.883 
+G1 X138.809 Y85.113 E0.00162 F1134.883 
+G1 X138.773 Y85.199 E0.00312 F1449.883 
+G1 X138.714 Y85.341 E0.00512 F1854.883 
+G1 X138.627 Y85.552 E0.00758 F2337.883 
+G1 X138.508 Y85.839 E0.01036 F2853.883 
+G1 X138.356 Y86.206 E0.01322 F3369.883 
+G1 X138.171 Y86.652 E0.01608 F3885.883 
+G1 X137.953 Y87.178 E0.01895 F4401.883 
+G1 X137.703 Y87.780 E0.02172 F4884.883 
+G1 X137.425 Y88.451 E0.02418 F5289.883 
+G1 X137.246 Y88.884 E0.01559 F5604.883 
+G1 X137.148 Y89.121 E0.00855 F5604.883 
+G1 X137.124 Y89.178 E0.00204 F5593.891 
+G1 X137.065 Y89.322 E0.00519 F5593.891 
+G1 X136.998 Y89.482 E0.00579 F5335.891 
+G1 X136.948 Y89.603 E0.00436 F5077.891 
+G1 X136.914 Y89.685 E0.00293 F4819.891 
+G1 X136.896 Y89.729 E0.00161 F4561.891 
+G1 X136.888 Y89.747 E0.00062 F4342.891 
+G1 X136.887 Y89.750 E0.00012 F4207.891 
+G1 X136.885 Y89.753 E0.00012 F4207.891 
+G1 X136.873 Y89.768 E0.00062 F4342.891 
+G1 X136.844 Y89.806 E0.00161 F4561.891 
+G1 X136.790 Y89.876 E0.00293 F4819.891 
+G1 X136.758 Y89.918 E0.00176 F5077.891 
+G1 X136.711 Y89.980 E0.00260 F5077.891 
+G1 X136.605 Y90.118 E0.00579 F5335.891 
+G1 X136.473 Y90.290 E0.00723 F5593.891 
+G1 X136.316 Y90.494 E0.00855 F5812.891 
+G1 X136.234 Y90.601 E0.00451 F5947.891 
+G1 X136.142 Y90.721 E0.00502 F5947.891 
+G1 X135.959 Y90.960 E0.01003 F5992.891 
+G1 X135.701 Y91.297 E0.01412 F6000.000 
+G1 X134.717 Y92.579 E0.05382 F6000.000 
+G1 X134.534 Y92.818 E0.01003 F5980.898 
+G1 X134.360 Y93.045 E0.00953 F5935.898 
+G1 X134.203 Y93.249 E0.00855 F5800.898 
+G1 X134.071 Y93.421 E0.00723 F5581.898 
+G1 X133.965 Y93.559 E0.00579 F5323.898 
+G1 X133.886 Y93.663 E0.00436 F5065.898 
+G1 X133.832 Y93.733 E0.00293 F4807.898 
+G1 X133.803 Y93.771 E0.00161 F4549.898 
+G1 X133.791 Y93.786 E0.00062 F4330.898 
+G1 X133.789 Y93.789 E0.00012 F4195.898 
+G1 X133.786 Y93.791 E0.00012 F4195.898 
+G1 X133.771 Y93.803 E0.00062 F4330.898 
+G1 X133.733 Y93.832 E0.00161 F4549.898 
+G1 X133.663 Y93.886 E0.00293 F4807.898 
+G1 X133.559 Y93.965 E0.00436 F5065.898 
+G1 X133.421 Y94.071 E0.00579 F5323.898 
+G1 X133.249 Y94.203 E0.00723 F5581.898 
+G1 X133.045 Y94.360 E0.00855 F5800.898 
+G1 X132.818 Y94.534 E0.00953 F5935.898 
+G1 X132.579 Y94.717 E0.01003 F5980.898 
+G1 X130.960 Y95.959 E0.06794 F6000.000 
+G1 X130.721 Y96.142 E0.01003 F5992.891 
+G1 X130.494 Y96.316 E0.00953 F5947.891 
+G1 X130.290 Y96.473 E0.00855 F5812.891 
+G1 X130.118 Y96.605 E0.00723 F5593.891 
+G1 X129.980 Y96.711 E0.00579 F5335.891 
+G1 X129.876 Y96.790 E0.00436 F5077.891 
+G1 X129.806 Y96.844 E0.00293 F4819.891 
+G1 X129.768 Y96.873 E0.00161 F4561.891 
+G1 X129.753 Y96.885 E0.00062 F4342.891 
+G1 X129.750 Y96.887 E0.00012 F4207.891 
+G1 X129.747 Y96.888 E0.00012 F4207.891 
+G1 X129.729 Y96.896 E0.00062 F4342.891 
+G1 X129.685 Y96.914 E0.00161 F4561.891 
+G1 X129.603 Y96.948 E0.00293 F4819.891 
+G1 X129.482 Y96.998 E0.00436 F5077.891 
+G1 X129.322 Y97.065 E0.00579 F5335.891 
+G1 X129.178 Y97.124 E0.00519 F5593.891 
+G1 X129.121 Y97.148 E0.00204 F5593.891 
+G1 X128.884 Y97.246 E0.00855 F5604.883 
+G1 X128.619 Y97.356 E0.00953 F5604.883 
+G1 X128.451 Y97.425 E0.00606 F5604.883 
+G1 X128.341 Y97.471 E0.00397 F5289.883 
+G1 X127.780 Y97.703 E0.02021 F5289.883 
+G1 X127.178 Y97.953 E0.02172 F4884.883 
+G1 X126.652 Y98.171 E0.01895 F4401.883 
+G1 X126.206 Y98.356 E0.01608 F3885.883 
+G1 X125.839 Y98.508 E0.01322 F3369.883 
+G1 X125.552 Y98.627 E0.01036 F2853.883 
+G1 X125.341 Y98.714 E0.00758 F2337.883 
+G1 X125.199 Y98.773 E0.00512 F1854.883 
+G1 X125.113 Y98.809 E0.00312 F1449.883 
+G1 X125.068 Y98.827 E0.00162 F1134.883 
+G1 X125.050 Y98.835 E0.00062 F909.883 
+G1 X125.047 Y98.836 E0.00012 F774.883 
+G1 X125.045 Y98.833 E0.00012 F774.883 
+G1 X125.034 Y98.818 E0.00062 F909.883 
+G1 X125.006 Y98.778 E0.00162 F1134.883 
+G1 X124.952 Y98.701 E0.00312 F1449.883 
+G1 X124.863 Y98.576 E0.00512 F1854.883 
+G1 X124.731 Y98.390 E0.00758 F2337.883 
+G1 X124.552 Y98.136 E0.01036 F2853.883 
+G1 X124.323 Y97.812 E0.01322 F3369.883 
+G1 X124.044 Y97.417 E0.01608 F3885.883 
+G1 X123.715 Y96.953 E0.01895 F4401.883 
+G1 X123.339 Y96.420 E0.02172 F4884.883 
+G1 X123.193 Y96.215 E0.00836 F5289.883 
+G1 X122.919 Y95.827 E0.01582 F5289.883 
+G1 X122.692 Y95.506 E0.01312 F5604.883 
+G1 X122.465 Y95.186 E0.01306 F5554.405 
+G1 X122.216 Y94.833 E0.01439 F5554.405 
+G1 X121.985 Y94.507 E0.01329 F5239.405 
+G1 X121.774 Y94.209 E0.01216 F5239.405 
+G1 X121.488 Y93.804 E0.01652 F4834.405 
+G1 X121.376 Y93.646 E0.00643 F4834.405 
+G1 X121.029 Y93.155 E0.02003 F4339.405 
+G1 X120.982 Y93.088 E0.00272 F3781.405 
+G1 X120.736 Y92.741 E0.01417 F3781.405 
+G1 X120.499 Y92.405 E0.01369 F3205.405 
+G1 X120.316 Y92.147 E0.01054 F2629.405 
+G1 X120.184 Y91.960 E0.00762 F2071.405 
+G1 X120.095 Y91.835 E0.00512 F1576.405 
+G1 X120.041 Y91.758 E0.00312 F1171.405 
+G1 X120.013 Y91.718 E0.00162 F856.405 
+G1 X120.002 Y91.703 E0.00062 F631.405 
+G1 X120.000 Y91.700 E0.00012 F496.405 
+G1 X119.998 Y91.703 E0.00012 F496.405 
+G1 X119.987 Y91.718 E0.00062 F631.405 
+G1 X119.959 Y91.758 E0.00162 F856.405 
+G1 X119.905 Y91.835 E0.00312 F1171.405 
+G1 X119.816 Y91.960 E0.00512 F1576.405 
+G1 X119.684 Y92.147 E0.00762 F2071.405 
+G1 X119.501 Y92.405 E0.01054 F2629.405 
+G1 X119.264 Y92.741 E0.01369 F3205.405 
+G1 X118.971 Y93.155 E0.01688 F3781.405 
+G1 X118.624 Y93.646 E0.02003 F4339.405 
+G1 X118.226 Y94.209 E0.02295 F4834.405 
+G1 X117.784 Y94.833 E0.02545 F5239.405 
+G1 X117.535 Y95.186 E0.01439 F5554.405 
+G1 X117.308 Y95.506 E0.01306 F5554.405 
+G1 X117.081 Y95.827 E0.01312 F5604.883 
+G1 X116.807 Y96.215 E0.01582 F5289.883 
+G1 X116.661 Y96.420 E0.00836 F5289.883 
+G1 X116.287 Y96.949 E0.02158 F4884.883 
+G1 X116.285 Y96.953 E0.00014 F4884.883 
+G1 X115.956 Y97.417 E0.01895 F4401.883 
+G1 X115.759 Y97.696 E0.01136 F3885.883 
+G1 X115.677 Y97.812 E0.00473 F3885.883 
+G1 X115.448 Y98.136 E0.01322 F3369.883 
+G1 X115.269 Y98.390 E0.01036 F2853.883 
+G1 X115.137 Y98.576 E0.00758 F2337.883 
+G1 X115.048 Y98.701 E0.00512 F1854.883 
+G1 X114.994 Y98.778 E0.00312 F1449.883 
+G1 X114.966 Y98.818 E0.00162 F1134.883 
+G1 X114.955 Y98.833 E0.00062 F909.883 
+G1 X114.953 Y98.836 E0.00012 F774.883 
+G1 X114.950 Y98.835 E0.00012 F774.883 
+G1 X114.932 Y98.827 E0.00062 F909.883 
+G1 X114.887 Y98.809 E0.00162 F1134.883 
+G1 X114.801 Y98.773 E0.00312 F1449.883 
+G1 X114.659 Y98.714 E0.00512 F1854.883 
+G1 X114.448 Y98.627 E0.00758 F2337.883 
+G1 X114.161 Y98.508 E0.01036 F2853.883 
+G1 X113.794 Y98.356 E0.01322 F3369.883 
+G1 X113.348 Y98.171 E0.01608 F3885.883 
+G1 X112.822 Y97.953 E0.01895 F4401.883 
+G1 X112.220 Y97.703 E0.02172 F4884.883 
+G1 X111.549 Y97.425 E0.02418 F5289.883 
+G1 X111.116 Y97.246 E0.01559 F5604.883 
+G1 X110.879 Y97.148 E0.00855 F5604.883 
+G1 X110.822 Y97.124 E0.00204 F5593.891 
+G1 X110.678 Y97.065 E0.00519 F5593.891 
+G1 X110.518 Y96.998 E0.00579 F5335.891 
+G1 X110.397 Y96.948 E0.00436 F5077.891 
+G1 X110.315 Y96.914 E0.00293 F4819.891 
+G1 X110.271 Y96.896 E0.00161 F4561.891 
+G1 X110.253 Y96.888 E0.00062 F4342.891 
+G1 X110.250 Y96.887 E0.00012 F4207.891 
+G1 X110.247 Y96.885 E0.00012 F4207.891 
+G1 X110.232 Y96.873 E0.00062 F4342.891 
+G1 X110.194 Y96.844 E0.00161 F4561.891 
+G1 X110.124 Y96.790 E0.00293 F4819.891 
+G1 X110.082 Y96.758 E0.00176 F5077.891 
+G1 X110.020 Y96.711 E0.00260 F5077.891 
+G1 X109.882 Y96.605 E0.00579 F5335.891 
+G1 X109.710 Y96.473 E0.00723 F5593.891 
+G1 X109.506 Y96.316 E0.00855 F5812.891 
+G1 X109.399 Y96.234 E0.00451 F5947.891 
+G1 X109.279 Y96.142 E0.00502 F5947.891 
+G1 X109.040 Y95.959 E0.01003 F5992.891 
+G1 X108.703 Y95.701 E0.01412 F6000.000 
+G1 X107.421 Y94.717 E0.05382 F6000.000 
+G1 X107.182 Y94.534 E0.01003 F5980.898 
+G1 X106.955 Y94.360 E0.00953 F5935.898 
+G1 X106.751 Y94.203 E0.00855 F5800.898 
+G1 X106.579 Y94.071 E0.00723 F5581.898 
+G1 X106.441 Y93.965 E0.00579 F5323.898 
+G1 X106.337 Y93.886 E0.00436 F5065.898 
+G1 X106.267 Y93.832 E0.00293 F4807.898 
+G1 X106.229 Y93.803 E0.00161 F4549.898 
+G1 X106.214 Y93.791 E0.00062 F4330.898 
+G1 X106.211 Y93.789 E0.00012 F4195.898 
+G1 X106.209 Y93.786 E0.00012 F4195.898 
+G1 X106.197 Y93.771 E0.00062 F4330.898 
+G1 X106.168 Y93.733 E0.00161 F4549.898 
+G1 X106.114 Y93.663 E0.00293 F4807.898 
+G1 X106.035 Y93.559 E0.00436 F5065.898 
+G1 X105.929 Y93.421 E0.00579 F5323.898 
+G1 X105.797 Y93.249 E0.00723 F5581.898 
+G1 X105.640 Y93.045 E0.00855 F5800.898 
+G1 X105.466 Y92.818 E0.00953 F5935.898 
+G1 X105.283 Y92.579 E0.01003 F5980.898 
+G1 X104.041 Y90.960 E0.06794 F6000.000 
+G1 X103.858 Y90.721 E0.01003 F5992.891 
+G1 X103.684 Y90.494 E0.00953 F5947.891 
+G1 X103.527 Y90.290 E0.00855 F5812.891 
+G1 X103.395 Y90.118 E0.00723 F5593.891 
+G1 X103.289 Y89.980 E0.00579 F5335.891 
+G1 X103.210 Y89.876 E0.00436 F5077.891 
+G1 X103.156 Y89.806 E0.00293 F4819.891 
+G1 X103.127 Y89.768 E0.00161 F4561.891 
+G1 X103.115 Y89.753 E0.00062 F4342.891 
+G1 X103.113 Y89.750 E0.00012 F4207.891 
+G1 X103.112 Y89.747 E0.00012 F4207.891 
+G1 X103.104 Y89.729 E0.00062 F4342.891 
+G1 X103.086 Y89.685 E0.00161 F4561.891 
+G1 X103.052 Y89.603 E0.00293 F4819.891 
+G1 X103.002 Y89.482 E0.00436 F5077.891 
+G1 X102.935 Y89.322 E0.00579 F5335.891 
+G1 X102.876 Y89.178 E0.00519 F5593.891 
+G1 X102.852 Y89.121 E0.00204 F5593.891 
+G1 X102.754 Y88.884 E0.00855 F5604.883 
+G1 X102.644 Y88.619 E0.00953 F5604.883 
+G1 X102.575 Y88.451 E0.00606 F5604.883 
+G1 X102.529 Y88.341 E0.00397 F5289.883 
+G1 X102.297 Y87.780 E0.02021 F5289.883 
+G1 X102.047 Y87.178 E0.02172 F4884.883 
+G1 X101.829 Y86.652 E0.01895 F4401.883 
+G1 X101.644 Y86.206 E0.01608 F3885.883 
+G1 X101.492 Y85.839 E0.01322 F3369.883 
+G1 X101.373 Y85.552 E0.01036 F2853.883 
+G1 X101.286 Y85.341 E0.00758 F2337.883 
+G1 X101.227 Y85.199 E0.00512 F1854.883 
+G1 X101.191 Y85.113 E0.00312 F1449.883 
+G1 X101.173 Y85.068 E0.00162 F1134.883 
+G1 X101.165 Y85.050 E0.00062 F909.883 
+G1 X101.164 Y85.047 E0.00012 F774.883 
+G1 X101.167 Y85.045 E0.00012 F774.883 
+G1 X101.182 Y85.034 E0.00062 F909.883 
+G1 X101.222 Y85.006 E0.00162 F1134.883 
+G1 X101.299 Y84.952 E0.00312 F1449.883 
+G1 X101.424 Y84.863 E0.00512 F1854.883 
+G1 X101.610 Y84.731 E0.00758 F2337.883 
+G1 X101.864 Y84.552 E0.01036 F2853.883 
+G1 X102.188 Y84.323 E0.01322 F3369.883 
+G1 X102.583 Y84.044 E0.01608 F3885.883 
+G1 X103.047 Y83.715 E0.01895 F4401.883 
+G1 X103.580 Y83.339 E0.02172 F4884.883 
+G1 X103.785 Y83.193 E0.00836 F5289.883 
+G1 X104.173 Y82.919 E0.01582 F5289.883 
+G1 X104.494 Y82.692 E0.01312 F5604.883 
+G1 X104.814 Y82.465 E0.01306 F5554.405 
+G1 X105.167 Y82.216 E0.01439 F5554.405 
+G1 X105.493 Y81.985 E0.01329 F5239.405 
+G1 X105.791 Y81.774 E0.01216 F5239.405 
+G1 X106.196 Y81.488 E0.01652 F4834.405 
+G1 X106.354 Y81.376 E0.00643 F4834.405 
+G1 X106.845 Y81.029 E0.02003 F4339.405 
+G1 X106.912 Y80.982 E0.00272 F3781.405 
+G1 X107.259 Y80.736 E0.01417 F3781.405 
+G1 X107.595 Y80.499 E0.01369 F3205.405 
+G1 X107.853 Y80.316 E0.01054 F2629.405 
+G1 X108.040 Y80.184 E0.00762 F2071.405 
+G1 X108.165 Y80.095 E0.00512 F1576.405 
+G1 X108.242 Y80.041 E0.00312 F1171.405 
+G1 X108.282 Y80.013 E0.00162 F856.405 
+G1 X108.297 Y80.002 E0.00062 F631.405 
+G1 X108.300 Y80.000 E0.00012 F496.405 
+G1 X108.297 Y79.998 E0.00012 F496.405 
+G1 X108.282 Y79.987 E0.00062 F631.405 
+G1 X108.242 Y79.959 E0.00162 F856.405 
+G1 X108.165 Y79.905 E0.00312 F1171.405 
+G1 X108.040 Y79.816 E0.00512 F1576.405 
+G1 X107.853 Y79.684 E0.00762 F2071.405 
+G1 X107.595 Y79.501 E0.01054 F2629.405 
+G1 X107.259 Y79.264 E0.01369 F3205.405 
+G1 X106.845 Y78.971 E0.01688 F3781.405 
+G1 X106.354 Y78.624 E0.02003 F4339.405 
+G1 X105.791 Y78.226 E0.02295 F4834.405 
+G1 X105.167 Y77.784 E0.02545 F5239.405 
+G1 X104.814 Y77.535 E0.01439 F5554.405 
+G1 X104.494 Y77.308 E0.01306 F5554.405 
+G1 X104.173 Y77.081 E0.01312 F5604.883 
+G1 X103.785 Y76.807 E0.01582 F5289.883 
+G1 X103.580 Y76.661 E0.00836 F5289.883 
+G1 X103.051 Y76.287 E0.02158 F4884.883 
+G1 X103.047 Y76.285 E0.00014 F4884.883 
+G1 X102.583 Y75.956 E0.01895 F4401.883 
+G1 X102.304 Y75.759 E0.01136 F3885.883 
+G1 X102.188 Y75.677 E0.00473 F3885.883 
+G1 X101.864 Y75.448 E0.01322 F3369.883 
+G1 X101.610 Y75.269 E0.01036 F2853.883 
+G1 X101.424 Y75.137 E0.00758 F2337.883 
+G1 X101.299 Y75.048 E0.00512 F1854.883 
+G1 X101.222 Y74.994 E0.00312 F1449.883 
+G1 X101.182 Y74.966 E0.00162 F1134.883 
+G1 X101.167 Y74.955 E0.00062 F909.883 
+G1 X101.164 Y74.953 E0.00012 F774.883 
+G1 X101.165 Y74.950 E0.00012 F774.883 
+G1 X101.173 Y74.932 E0.00062 F909.883 
+G1 X101.191 Y74.887 E0.00162 F1134.883 
+G1 X101.227 Y74.801 E0.00312 F1449.883 
+G1 X101.286 Y74.659 E0.00512 F1854.883 
+G1 X101.373 Y74.448 E0.00758 F2337.883 
+G1 X101.492 Y74.161 E0.01036 F2853.883 
+G1 X101.644 Y73.794 E0.01322 F3369.883 
+G1 X101.829 Y73.348 E0.01608 F3885.883 
+G1 X102.047 Y72.822 E0.01895 F4401.883 
+G1 X102.297 Y72.220 E0.02172 F4884.883 
+G1 X102.575 Y71.549 E0.02418 F5289.883 
+G1 X102.754 Y71.116 E0.01559 F5604.883 
+G1 X102.852 Y70.879 E0.00855 F5604.883 
+G1 X102.876 Y70.822 E0.00204 F5593.891 
+G1 X102.935 Y70.678 E0.00519 F5593.891 
+G1 X103.002 Y70.518 E0.00579 F5335.891 
+G1 X103.052 Y70.397 E0.00436 F5077.891 
+G1 X103.086 Y70.315 E0.00293 F4819.891 
+G1 X103.104 Y70.271 E0.00161 F4561.891 
+G1 X103.112 Y70.253 E0.00062 F4342.891 
+G1 X103.113 Y70.250 E0.00012 F4207.891 
+G1 X103.115 Y70.247 E0.00012 F4207.891 
+G1 X103.127 Y70.232 E0.00062 F4342.891 
+G1 X103.156 Y70.194 E0.00161 F4561.891 
+G1 X103.210 Y70.124 E0.00293 F4819.891 
+G1 X103.242 Y70.082 E0.00176 F5077.891 
+G1 X103.289 Y70.020 E0.00260 F5077.891 
+G1 X103.395 Y69.882 E0.00579 F5335.891 
+G1 X103.527 Y69.710 E0.00723 F5593.891 
+G1 X103.684 Y69.506 E0.00855 F5812.891 
+G1 X103.766 Y69.399 E0.00451 F5947.891 
+G1 X103.858 Y69.279 E0.00502 F5947.891 
+G1 X104.041 Y69.040 E0.01003 F5992.891 
+G1 X104.299 Y68.703 E0.01412 F6000.000 
+G1 X105.283 Y67.421 E0.05382 F6000.000 
+G1 X105.466 Y67.182 E0.01003 F5980.898 
+G1 X105.640 Y66.955 E0.00953 F5935.898 
+G1 X105.797 Y66.751 E0.00855 F5800.898 
+G1 X105.929 Y66.579 E0.00723 F5581.898 
+G1 X106.035 Y66.441 E0.00579 F5323.898 
+G1 X106.114 Y66.337 E0.00436 F5065.898 
+G1 X106.168 Y66.267 E0.00293 F4807.898 
+G1 X106.197 Y66.229 E0.00161 F4549.898 
+G1 X106.209 Y66.214 E0.00062 F4330.898 
+G1 X106.211 Y66.211 E0.00012 F4195.898 
+G1 X106.214 Y66.209 E0.00012 F4195.898 
+G1 X106.229 Y66.197 E0.00062 F4330.898 
+G1 X106.267 Y66.168 E0.00161 F4549.898 
+G1 X106.337 Y66.114 E0.00293 F4807.898 
+G1 X106.441 Y66.035 E0.00436 F5065.898 
+G1 X106.579 Y65.929 E0.00579 F5323.898 
+G1 X106.751 Y65.797 E0.00723 F5581.898 
+G1 X106.955 Y65.640 E0.00855 F5800.898 
+G1 X107.182 Y65.466 E0.00953 F5935.898 
+G1 X107.421 Y65.283 E0.01003 F5980.898 
+G1 X109.040 Y64.041 E0.06794 F6000.000 
+G1 X109.279 Y63.858 E0.01003 F5992.891 
+G1 X109.506 Y63.684 E0.00953 F5947.891 
+G1 X109.710 Y63.527 E0.00855 F5812.891 
+G1 X109.882 Y63.395 E0.00723 F5593.891 
+G1 X110.020 Y63.289 E0.00579 F5335.891 
+G1 X110.124 Y63.210 E0.00436 F5077.891 
+G1 X110.194 Y63.156 E0.00293 F4819.891 
+G1 X110.232 Y63.127 E0.00161 F4561.891 
+G1 X110.247 Y63.115 E0.00062 F4342.891 
+G1 X110.250 Y63.113 E0.00012 F4207.891 
+G1 X110.253 Y63.112 E0.00012 F4207.891 
+G1 X110.271 Y63.104 E0.00062 F4342.891 
+G1 X110.315 Y63.086 E0.00161 F4561.891 
+G1 X110.397 Y63.052 E0.00293 F4819.891 
+G1 X110.518 Y63.002 E0.00436 F5077.891 
+G1 X110.678 Y62.935 E0.00579 F5335.891 
+G1 X110.822 Y62.876 E0.00519 F5593.891 
+G1 X110.879 Y62.852 E0.00204 F5593.891 
+G1 X111.116 Y62.754 E0.00855 F5604.883 
+G1 X111.381 Y62.644 E0.00953 F5604.883 
+G1 X111.549 Y62.575 E0.00606 F5604.883 
+G1 X111.659 Y62.529 E0.00397 F5289.883 
+G1 X112.220 Y62.297 E0.02021 F5289.883 
+G1 X112.822 Y62.047 E0.02172 F4884.883 
+G1 X113.348 Y61.829 E0.01895 F4401.883 
+G1 X113.794 Y61.644 E0.01608 F3885.883 
+G1 X114.161 Y61.492 E0.01322 F3369.883 
+G1 X114.448 Y61.373 E0.01036 F2853.883 
+G1 X114.659 Y61.286 E0.00758 F2337.883 
+G1 X114.801 Y61.227 E0.00512 F1854.883 
+G1 X114.887 Y61.191 E0.00312 F1449.883 
+G1 X114.932 Y61.173 E0.00162 F1134.883 
+G1 X114.950 Y61.165 E0.00062 F909.883 
+G1 X114.953 Y61.164 E0.00012 F774.883 
+G1 X114.955 Y61.167 E0.00012 F774.883 
+G1 X114.966 Y61.182 E0.00062 F909.883 
+G1 X114.994 Y61.222 E0.00162 F1134.883 
+G1 X115.048 Y61.299 E0.00312 F1449.883 
+G1 X115.137 Y61.424 E0.00512 F1854.883 
+G1 X115.269 Y61.610 E0.00758 F2337.883 
+G1 X115.448 Y61.864 E0.01036 F2853.883 
+G1 X115.677 Y62.188 E0.01322 F3369.883 
+G1 X115.956 Y62.583 E0.01608 F3885.883 
+G1 X116.285 Y63.047 E0.01895 F4401.883 
+G1 X116.661 Y63.580 E0.02172 F4884.883 
+G1 X116.807 Y63.785 E0.00836 F5289.883 
+G1 X117.081 Y64.173 E0.01582 F5289.883 
+G1 X117.308 Y64.494 E0.01312 F5604.883 
+G1 X117.535 Y64.814 E0.01306 F5554.405 
+G1 X117.784 Y65.167 E0.01439 F5554.405 
+G1 X118.015 Y65.493 E0.01329 F5239.405 
+G1 X118.226 Y65.791 E0.01216 F5239.405 
+G1 X118.512 Y66.196 E0.01652 F4834.405 
+G1 X118.624 Y66.354 E0.00643 F4834.405 
+G1 X118.971 Y66.845 E0.02003 F4339.405 
+G1 X119.018 Y66.912 E0.00272 F3781.405 
+G1 X119.264 Y67.259 E0.01417 F3781.405 
+G1 X119.501 Y67.595 E0.01369 F3205.405 
+G1 X119.684 Y67.853 E0.01054 F2629.405 
+G1 X119.816 Y68.040 E0.00762 F2071.405 
+G1 X119.905 Y68.165 E0.00512 F1576.405 
+G1 X119.959 Y68.242 E0.00312 F1171.405 
+G1 X119.987 Y68.282 E0.00162 F856.405 
+G1 X119.998 Y68.297 E0.00062 F631.405 
+G1 X120.000 Y68.300 E0.00012 F496.405 
+G1 X120.002 Y68.297 E0.00012 F496.405 
+G1 X120.013 Y68.282 E0.00062 F631.405 
+G1 X120.041 Y68.242 E0.00162 F856.405 
+G1 X120.095 Y68.165 E0.00312 F1171.405 
+G1 X120.184 Y68.040 E0.00512 F1576.405 
+G1 X120.316 Y67.853 E0.00762 F2071.405 
+G1 X120.499 Y67.595 E0.01054 F2629.405 
+G1 X120.736 Y67.259 E0.01369 F3205.405 
+G1 X121.029 Y66.845 E0.01688 F3781.405 
+G1 X121.376 Y66.354 E0.02003 F4339.405 
+G1 X121.774 Y65.791 E0.02295 F4834.405 
+G1 X122.216 Y65.167 E0.02545 F5239.405 
+G1 X122.465 Y64.814 E0.01439 F5554.405 
+G1 X122.692 Y64.494 E0.01306 F5554.405 
+G1 X122.919 Y64.173 E0.01312 F5604.883 
+G1 X123.193 Y63.785 E0.01582 F5289.883 
+G1 X123.339 Y63.580 E0.00836 F5289.883 
+G1 X123.713 Y63.051 E0.02158 F4884.883 
+G1 X123.715 Y63.047 E0.00014 F4884.883 
+G1 X124.044 Y62.583 E0.01895 F4401.883 
+G1 X124.241 Y62.304 E0.01136 F3885.883 
+G1 X124.323 Y62.188 E0.00473 F3885.883 
+G1 X124.552 Y61.864 E0.01322 F3369.883 
+G1 X124.731 Y61.610 E0.01036 F2853.883 
+G1 X124.863 Y61.424 E0.00758 F2337.883 
+G1 X124.952 Y61.299 E0.00512 F1854.883 
+G1 X125.006 Y61.222 E0.00312 F1449.883 
+G1 X125.034 Y61.182 E0.00162 F1134.883 
+G1 X125.045 Y61.167 E0.00062 F909.883 
+G1 X125.047 Y61.164 E0.00012 F774.883 
+G1 X125.050 Y61.165 E0.00012 F774.883 
+G1 X125.068 Y61.173 E0.00062 F909.883 
+G1 X125.113 Y61.191 E0.00162 F1134.883 
+G1 X125.199 Y61.227 E0.00312 F1449.883 
+G1 X125.341 Y61.286 E0.00512 F1854.883 
+G1 X125.552 Y61.373 E0.00758 F2337.883 
+G1 X125.839 Y61.492 E0.01036 F2853.883 
+G1 X126.206 Y61.644 E0.01322 F3369.883 
+G1 X126.652 Y61.829 E0.01608 F3885.883 
+G1 X127.178 Y62.047 E0.01895 F4401.883 
+G1 X127.780 Y62.297 E0.02172 F4884.883 
+G1 X128.451 Y62.575 E0.02418 F5289.883 
+G1 X128.884 Y62.754 E0.01559 F5604.883 
+G1 X129.121 Y62.852 E0.00855 F5604.883 
+G1 X129.178 Y62.876 E0.00204 F5593.891 
+G1 X129.322 Y62.935 E0.00519 F5593.891 
+G1 X129.482 Y63.002 E0.00579 F5335.891 
+G1 X129.603 Y63.052 E0.00436 F5077.891 
+G1 X129.685 Y63.086 E0.00293 F4819.891 
+G1 X129.729 Y63.104 E0.00161 F4561.891 
+G1 X129.747 Y63.112 E0.00062 F4342.891 
+G1 X129.750 Y63.113 E0.00012 F4207.891 
+G1 X129.753 Y63.115 E0.00012 F4207.891 
+G1 X129.768 Y63.127 E0.00062 F4342.891 
+G1 X129.806 Y63.156 E0.00161 F4561.891 
+G1 X129.876 Y63.210 E0.00293 F4819.891 
+G1 X129.918 Y63.242 E0.00176 F5077.891 
+G1 X129.980 Y63.289 E0.00260 F5077.891 
+G1 X130.118 Y63.395 E0.00579 F5335.891 
+G1 X130.290 Y63.527 E0.00723 F5593.891 
+G1 X130.494 Y63.684 E0.00855 F5812.891 
+G1 X130.601 Y63.766 E0.00451 F5947.891 
+G1 X130.721 Y63.858 E0.00502 F5947.891 
+G1 X130.960 Y64.041 E0.01003 F5992.891 
+G1 X131.297 Y64.299 E0.01412 F6000.000 
+G1 X132.579 Y65.283 E0.05382 F6000.000 
+G1 X132.818 Y65.466 E0.01003 F5980.898 
+G1 X133.045 Y65.640 E0.00953 F5935.898 
+G1 X133.249 Y65.797 E0.00855 F5800.898 
+G1 X133.421 Y65.929 E0.00723 F5581.898 
+G1 X133.559 Y66.035 E0.00579 F5323.898 
+G1 X133.663 Y66.114 E0.00436 F5065.898 
+G1 X133.733 Y66.168 E0.00293 F4807.898 
+G1 X133.771 Y66.197 E0.00161 F4549.898 
+G1 X133.786 Y66.209 E0.00062 F4330.898 
+G1 X133.789 Y66.211 E0.00012 F4195.898 
+G1 X133.791 Y66.214 E0.00012 F4195.898 
+G1 X133.803 Y66.229 E0.00062 F4330.898 
+G1 X133.832 Y66.267 E0.00161 F4549.898 
+G1 X133.886 Y66.337 E0.00293 F4807.898 
+G1 X133.965 Y66.441 E0.00436 F5065.898 
+G1 X134.071 Y66.579 E0.00579 F5323.898 
+G1 X134.203 Y66.751 E0.00723 F5581.898 
+G1 X134.360 Y66.955 E0.00855 F5800.898 
+G1 X134.534 Y67.182 E0.00953 F5935.898 
+G1 X134.717 Y67.421 E0.01003 F5980.898 
+G1 X135.959 Y69.040 E0.06794 F6000.000 
+G1 X136.142 Y69.279 E0.01003 F5992.891 
+G1 X136.316 Y69.506 E0.00953 F5947.891 
+G1 X136.473 Y69.710 E0.00855 F5812.891 
+G1 X136.605 Y69.882 E0.00723 F5593.891 
+G1 X136.711 Y70.020 E0.00579 F5335.891 
+G1 X136.790 Y70.124 E0.00436 F5077.891 
+G1 X136.844 Y70.194 E0.00293 F4819.891 
+G1 X136.873 Y70.232 E0.00161 F4561.891 
+G1 X136.885 Y70.247 E0.00062 F4342.891 
+G1 X136.887 Y70.250 E0.00012 F4207.891 
+G1 X136.888 Y70.253 E0.00012 F4207.891 
+G1 X136.896 Y70.271 E0.00062 F4342.891 
+G1 X136.914 Y70.315 E0.00161 F4561.891 
+G1 X136.948 Y70.397 E0.00293 F4819.891 
+G1 X136.998 Y70.518 E0.00436 F5077.891 
+G1 X137.065 Y70.678 E0.00579 F5335.891 
+G1 X137.124 Y70.822 E0.00519 F5593.891 
+G1 X137.148 Y70.879 E0.00204 F5593.891 
+G1 X137.246 Y71.116 E0.00855 F5604.883 
+G1 X137.356 Y71.381 E0.00953 F5604.883 
+G1 X137.425 Y71.549 E0.00606 F5604.883 
+G1 X137.471 Y71.659 E0.00397 F5289.883 
+G1 X137.703 Y72.220 E0.02021 F5289.883 
+G1 X137.953 Y72.822 E0.02172 F4884.883 
+G1 X138.171 Y73.348 E0.01895 F4401.883 
+G1 X138.356 Y73.794 E0.01608 F3885.883 
+G1 X138.508 Y74.161 E0.01322 F3369.883 
+G1 X138.627 Y74.448 E0.01036 F2853.883 
+G1 X138.714 Y74.659 E0.00758 F2337.883 
+G1 X138.773 Y74.801 E0.00512 F1854.883 
+G1 X138.809 Y74.887 E0.00312 F1449.883 
+G1 X138.827 Y74.932 E0.00162 F1134.883 
+G1 X138.835 Y74.950 E0.00062 F909.883 
+G1 X138.836 Y74.953 E0.00012 F774.883 
+G1 X138.833 Y74.955 E0.00012 F774.883 
+G1 X138.818 Y74.966 E0.00062 F909.883 
+G1 X138.778 Y74.994 E0.00162 F1134.883 
+G1 X138.701 Y75.048 E0.00312 F1449.883 
+G1 X138.576 Y75.137 E0.00512 F1854.883 
+G1 X138.390 Y75.269 E0.00758 F2337.883 
+G1 X138.136 Y75.448 E0.01036 F2853.883 
+G1 X137.812 Y75.677 E0.01322 F3369.883 
+G1 X137.417 Y75.956 E0.01608 F3885.883 
+G1 X136.953 Y76.285 E0.01895 F4401.883 
+G1 X136.420 Y76.661 E0.02172 F4884.883 
+G1 X135.827 Y77.081 E0.02418 F5289.883 
+G1 X135.186 Y77.535 E0.02618 F5604.883 
+G1 X134.507 Y78.015 E0.02768 F5829.883 
+G1 X133.804 Y78.512 E0.02868 F5964.883 
+G1 X133.088 Y79.018 E0.02918 F6009.883 
+G1 X131.700 Y80.000 E0.05662 F6000.000 
+G1 E-.8 F2100
+;TYPE:Sparse infill
+;WIDTH:0.45
+G1 X110.000 Y70.000 F12000
+G1 E.8 F2100
+G1 F9000
+G1 X110.000 Y70.000 E0.66600
+G1 Y71.700 E0.05661
+G1 X130.000 Y71.700 E0.66600
+G1 Y73.400 E0.05661
+G1 X110.000 Y73.400 E0.66600
+G1 Y75.100 E0.05661
+G1 X130.000 Y75.100 E0.66600
+G1 Y76.800 E0.05661
+G1 X110.000 Y76.800 E0.66600
+G1 Y78.500 E0.05661
+G1 X130.000 Y78.500 E0.66600
+G1 Y80.200 E0.05661
+G1 X110.000 Y80.200 E0.66600
+G1 Y81.900 E0.05661
+G1 X130.000 Y81.900 E0.66600
+G1 Y83.600 E0.05661
+G1 X110.000 Y83.600 E0.66600
+G1 Y85.300 E0.05661
+G1 X130.000 Y85.300 E0.66600
+G1 Y87.000 E0.05661
+G1 X110.000 Y87.000 E0.66600
+G1 Y88.700 E0.05661
+G1 X130.000 Y88.700 E0.66600
+G1 Y90.400 E0.05661
+; some comment
+
+G1 E-.8 F2100
+;TYPE:Gap infill
+G1 X10 Y10 F12000
+G1 X11.184 Y10.158 E0.00789 F3000.000 
+G1 X11.336 Y10.178 E0.00102 F3000.000 
+G1 X11.429 Y10.191 E0.00062 F2731.259 
+G1 X11.478 Y10.197 E0.00032 F2416.259 
+G1 X11.496 Y10.200 E0.00012 F2191.259 
+G1 X11.500 Y10.200 E0.00002 F3000.000 
+;LAYER_CHANGE
+;Z:0.4
+;HEIGHT:0.2
+G1 E-.8 F2100
+G1 Z0.400 F720
+;TYPE:Outer wall
+;WIDTH:0.45
+G1 X11.503 Y10.202 F2056.259 
+G1 X62.000 Y50.000 F12000.000 
+G1 E.8 F2100
+G1 F3000
+G1 X67.472 Y53.870 E0.22319 
+G1 X67.777 Y54.085 E0.01243 F2991.992 
+G1 X68.069 Y54.292 E0.01193 F2946.992 
+G1 X68.338 Y54.482 E0.01096 F2811.992 
+G1 X68.576 Y54.650 E0.00969 F2598.992 
+G1 X68.780 Y54.795 E0.00832 F2352.992 
+G1 X68.951 Y54.915 E0.00696 F2106.992 
+G1 X69.088 Y55.012 E0.00559 F1860.992 
+G1 X69.191 Y55.086 E0.00423 F1614.992 
+G1 X69.262 Y55.135 E0.00286 F1368.992 
+G1 X69.301 Y55.163 E0.00159 F1122.992 
+G1 X69.316 Y55.174 E0.00062 F909.992 
+G1 X69.319 Y55.176 E0.00012 F774.992 
+G1 X69.318 Y55.179 E0.00012 F774.992 
+G1 X69.310 Y55.197 E0.00062 F909.992 
+G1 X69.292 Y55.241 E0.00159 F1122.992 
+G1 X69.259 Y55.320 E0.00286 F1368.992 
+G1 X69.211 Y55.438 E0.00423 F1614.992 
+G1 X69.146 Y55.593 E0.00559 F1860.992 
+G1 X69.066 Y55.786 E0.00696 F2106.992 
+G1 X68.971 Y56.017 E0.00832 F2352.992 
+G1 X68.859 Y56.286 E0.00969 F2598.992 
+G1 X68.733 Y56.590 E0.01096 F2811.992 
+G1 X68.596 Y56.921 E0.01193 F2946.992 
+G1 X68.453 Y57.266 E0.01243 F2991.992 
+G1 X67.321 Y60.000 E0.09854 F3000.000 
+G1 X64.142 Y64.142 E0.17386
+G1 X60.000 Y67.321 E0.17386
+G1 X57.266 Y68.453 E0.09854 
+G1 X56.921 Y68.596 E0.01243 F2991.992 
+G1 X56.590 Y68.733 E0.01193 F2946.992 
+G1 X56.286 Y68.859 E0.01096 F2811.992 
+G1 X56.017 Y68.971 E0.00969 F2598.992 
+G1 X55.786 Y69.066 E0.00832 F2352.992 
+G1 X55.593 Y69.146 E0.00696 F2106.992 
+G1 X55.438 Y69.211 E0.00559 F1860.992 
+G1 X55.320 Y69.259 E0.00423 F1614.992 
+G1 X55.241 Y69.292 E0.00286 F1368.992 
+G1 X55.197 Y69.310 E0.00159 F1122.992 
+G1 X55.179 Y69.318 E0.00062 F909.992 
+G1 X55.176 Y69.319 E0.00012 F774.992 
+G1 X55.174 Y69.316 E0.00012 F774.992 
+G1 X55.163 Y69.301 E0.00062 F909.992 
+G1 X55.135 Y69.262 E0.00159 F1122.992 
+G1 X55.086 Y69.191 E0.00286 F1368.992 
+G1 X55.012 Y69.088 E0.00423 F1614.992 
+G1 X54.915 Y68.951 E0.00559 F1860.992 
+G1 X54.795 Y68.780 E0.00696 F2106.992 
+G1 X54.650 Y68.576 E0.00832 F2352.992 
+G1 X54.482 Y68.338 E0.00969 F2598.992 
+G1 X54.292 Y68.069 E0.01096 F2811.992 
+G1 X54.085 Y67.777 E0.01193 F2946.992 
+G1 X53.870 Y67.472 E0.01243 F2991.992 
+G1 X51.455 Y64.057 E0.13927 F3000.000 
+G1 X51.215 Y63.718 E0.01386 F2971.376 
+G1 X50.983 Y63.390 E0.01336 F2926.376 
+G1 X50.769 Y63.087 E0.01236 F2791.376 
+G1 X50.579 Y62.818 E0.01096 F2566.376 
+G1 X50.416 Y62.588 E0.00939 F2287.376 
+G1 X50.281 Y62.397 E0.00779 F1999.376 
+G1 X50.173 Y62.245 E0.00619 F1711.376 
+G1 X50.094 Y62.132 E0.00460 F1423.376 
+G1 X50.041 Y62.058 E0.00302 F1135.376 
+G1 X50.013 Y62.018 E0.00162 F856.376 
+G1 X50.002 Y62.003 E0.00062 F631.376 
+G1 X50.000 Y62.000 E0.00012 F496.376 
+G1 X49.998 Y62.003 E0.00012 F496.376 
+G1 X49.987 Y62.018 E0.00062 F631.376 
+G1 X49.959 Y62.058 E0.00162 F856.376 
+G1 X49.906 Y62.132 E0.00302 F1135.376 
+G1 X49.827 Y62.245 E0.00460 F1423.376 
+G1 X49.719 Y62.397 E0.00619 F1711.376 
+G1 X49.584 Y62.588 E0.00779 F1999.376 
+G1 X49.421 Y62.818 E0.00939 F2287.376 
+G1 X49.231 Y63.087 E0.01096 F2566.376 
+G1 X49.017 Y63.390 E0.01236 F2791.376 
+G1 X48.785 Y63.718 E0.01336 F2926.376 
+G1 X48.545 Y64.057 E0.01386 F2971.376 
+G1 X46.130 Y67.472 E0.13927 F3000.000 
+G1 X45.915 Y67.777 E0.01243 F2991.992 
+G1 X45.708 Y68.069 E0.01193 F2946.992 
+G1 X45.518 Y68.338 E0.01096 F2811.992 
+G1 X45.350 Y68.576 E0.00969 F2598.992 
+G1 X45.205 Y68.780 E0.00832 F2352.992 
+G1 X45.085 Y68.951 E0.00696 F2106.992 
+G1 X44.988 Y69.088 E0.00559 F1860.992 
+G1 X44.914 Y69.191 E0.00423 F1614.992 
+G1 X44.865 Y69.262 E0.00286 F1368.992 
+G1 X44.837 Y69.301 E0.00159 F1122.992 
+G1 X44.826 Y69.316 E0.00062 F909.992 
+G1 X44.824 Y69.319 E0.00012 F774.992 
+G1 X44.821 Y69.318 E0.00012 F774.992 
+G1 X44.803 Y69.310 E0.00062 F909.992 
+G1 X44.759 Y69.292 E0.00159 F1122.992 
+G1 X44.680 Y69.259 E0.00286 F1368.992 
+G1 X44.562 Y69.211 E0.00423 F1614.992 
+G1 X44.407 Y69.146 E0.00559 F1860.992 
+G1 X44.214 Y69.066 E0.00696 F2106.992 
+G1 X43.983 Y68.971 E0.00832 F2352.992 
+G1 X43.714 Y68.859 E0.00969 F2598.992 
+G1 X43.410 Y68.733 E0.01096 F2811.992 
+G1 X43.079 Y68.596 E0.01193 F2946.992 
+G1 X42.734 Y68.453 E0.01243 F2991.992 
+G1 X40.000 Y67.321 E0.09854 F3000.000 
+G1 X35.858 Y64.142 E0.17386
+G1 X32.679 Y60.000 E0.17386
+G1 X31.547 Y57.266 E0.09854 
+G1 X31.404 Y56.921 E0.01243 F2991.992 
+G1 X31.267 Y56.590 E0.01193 F2946.992 
+G1 X31.141 Y56.286 E0.01096 F2811.992 
+G1 X31.029 Y56.017 E0.00969 F2598.992 
+G1 X30.934 Y55.786 E0.00832 F2352.992 
+G1 X30.854 Y55.593 E0.00696 F2106.992 
+G1 X30.789 Y55.438 E0.00559 F1860.992 
+G1 X30.741 Y55.320 E0.00423 F1614.992 
+G1 X30.708 Y55.241 E0.00286 F1368.992 
+G1 X30.690 Y55.197 E0.00159 F1122.992 
+G1 X30.682 Y55.179 E0.00062 F909.992 
+G1 X30.681 Y55.176 E0.00012 F774.992 
+G1 X30.684 Y55.174 E0.00012 F774.992 
+G1 X30.699 Y55.163 E0.00062 F909.992 
+G1 X30.738 Y55.135 E0.00159 F1122.992 
+G1 X30.809 Y55.086 E0.00286 F1368.992 
+G1 X30.912 Y55.012 E0.00423 F1614.992 
+G1 X31.049 Y54.915 E0.00559 F1860.992 
+G1 X31.220 Y54.795 E0.00696 F2106.992 
+G1 X31.424 Y54.650 E0.00832 F2352.992 
+G1 X31.662 Y54.482 E0.00969 F2598.992 
+G1 X31.931 Y54.292 E0.01096 F2811.992 
+G1 X32.223 Y54.085 E0.01193 F2946.992 
+G1 X32.528 Y53.870 E0.01243 F2991.992 
+G1 X35.943 Y51.455 E0.13927 F3000.000 
+G1 X36.282 Y51.215 E0.01386 F2971.376 
+G1 X36.610 Y50.983 E0.01336 F2926.376 
+G1 X36.913 Y50.769 E0.01236 F2791.376 
+G1 X37.182 Y50.579 E0.01096 F2566.376 
+G1 X37.412 Y50.416 E0.00939 F2287.376 
+G1 X37.603 Y50.281 E0.00779 F1999.376 
+G1 X37.755 Y50.173 E0.00619 F1711.376 
+G1 X37.868 Y50.094 E0.00460 F1423.376 
+G1 X37.942 Y50.041 E0.00302 F1135.376 
+G1 X37.982 Y50.013 E0.00162 F856.376 
+G1 X37.997 Y50.002 E0.00062 F631.376 
+G1 X38.000 Y50.000 E0.00012 F496.376 
+G1 X37.997 Y49.998 E0.00012 F496.376 
+G1 X37.982 Y49.987 E0.00062 F631.376 
+G1 X37.942 Y49.959 E0.00162 F856.376 
+G1 X37.868 Y49.906 E0.00302 F1135.376 
+G1 X37.755 Y49.827 E0.00460 F1423.376 
+G1 X37.603 Y49.719 E0.00619 F1711.376 
+G1 X37.412 Y49.584 E0.00779 F1999.376 
+G1 X37.182 Y49.421 E0.00939 F2287.376 
+G1 X36.913 Y49.231 E0.01096 F2566.376 
+G1 X36.610 Y49.017 E0.01236 F2791.376 
+G1 X36.282 Y48.785 E0.01336 F2926.376 
+G1 X35.943 Y48.545 E0.01386 F2971.376 
+G1 X32.528 Y46.130 E0.13927 F3000.000 
+G1 X32.223 Y45.915 E0.01243 F2991.992 
+G1 X31.931 Y45.708 E0.01193 F2946.992 
+G1 X31.662 Y45.518 E0.01096 F2811.992 
+G1 X31.424 Y45.350 E0.00969 F2598.992 
+G1 X31.220 Y45.205 E0.00832 F2352.992 
+G1 X31.049 Y45.085 E0.00696 F2106.992 
+G1 X30.912 Y44.988 E0.00559 F1860.992 
+G1 X30.809 Y44.914 E0.00423 F1614.992 
+G1 X30.738 Y44.865 E0.00286 F1368.992 
+G1 X30.699 Y44.837 E0.00159 F1122.992 
+G1 X30.684 Y44.826 E0.00062 F909.992 
+G1 X30.681 Y44.824 E0.00012 F774.992 
+G1 X30.682 Y44.821 E0.00012 F774.992 
+G1 X30.690 Y44.803 E0.00062 F909.992 
+G1 X30.708 Y44.759 E0.00159 F1122.992 
+G1 X30.741 Y44.680 E0.00286 F1368.992 
+G1 X30.789 Y44.562 E0.00423 F1614.992 
+G1 X30.854 Y44.407 E0.00559 F1860.992 
+G1 X30.934 Y44.214 E0.00696 F2106.992 
+G1 X31.029 Y43.983 E0.00832 F2352.992 
+G1 X31.141 Y43.714 E0.00969 F2598.992 
+G1 X31.267 Y43.410 E0.01096 F2811.992 
+G1 X31.404 Y43.079 E0.01193 F2946.992 
+G1 X31.547 Y42.734 E0.01243 F2991.992 
+G1 X32.679 Y40.000 E0.09854 F3000.000 
+G1 X35.858 Y35.858 E0.17386
+G1 X40.000 Y32.679 E0.17386
+G1 X42.734 Y31.547 E0.09854 
+G1 X43.079 Y31.404 E0.01243 F2991.992 
+G1 X43.410 Y31.267 E0.01193 F2946.992 
+G1 X43.714 Y31.141 E0.01096 F2811.992 
+G1 X43.983 Y31.029 E0.00969 F2598.992 
+G1 X44.214 Y30.934 E0.00832 F2352.992 
+G1 X44.407 Y30.854 E0.00696 F2106.992 
+G1 X44.562 Y30.789 E0.00559 F1860.992 
+G1 X44.680 Y30.741 E0.00423 F1614.992 
+G1 X44.759 Y30.708 E0.00286 F1368.992 
+G1 X44.803 Y30.690 E0.00159 F1122.992 
+G1 X44.821 Y30.682 E0.00062 F909.992 
+G1 X44.824 Y30.681 E0.00012 F774.992 
+G1 X44.826 Y30.684 E0.00012 F774.992 
+G1 X44.837 Y30.699 E0.00062 F909.992 
+G1 X44.865 Y30.738 E0.00159 F1122.992 
+G1 X44.914 Y30.809 E0.00286 F1368.992 
+G1 X44.988 Y30.912 E0.00423 F1614.992 
+G1 X45.085 Y31.049 E0.00559 F1860.992 
+G1 X45.205 Y31.220 E0.00696 F2106.992 
+G1 X45.350 Y31.424 E0.00832 F2352.992 
+G1 X45.518 Y31.662 E0.00969 F2598.992 
+G1 X45.708 Y31.931 E0.01096 F2811.992 
+G1 X45.915 Y32.223 E0.01193 F2946.992 
+G1 X46.130 Y32.528 E0.01243 F2991.992 
+G1 X48.545 Y35.943 E0.13927 F3000.000 
+G1 X48.785 Y36.282 E0.01386 F2971.376 
+G1 X49.017 Y36.610 E0.01336 F2926.376 
+G1 X49.231 Y36.913 E0.01236 F2791.376 
+G1 X49.421 Y37.182 E0.01096 F2566.376 
+G1 X49.584 Y37.412 E0.00939 F2287.376 
+G1 X49.719 Y37.603 E0.00779 F1999.376 
+G1 X49.827 Y37.755 E0.00619 F1711.376 
+G1 X49.906 Y37.868 E0.00460 F1423.376 
+G1 X49.959 Y37.942 E0.00302 F1135.376 
+G1 X49.987 Y37.982 E0.00162 F856.376 
+G1 X49.998 Y37.997 E0.00062 F631.376 
+G1 X50.000 Y38.000 E0.00012 F496.376 
+G1 X50.002 Y37.997 E0.00012 F496.376 
+G1 X50.013 Y37.982 E0.00062 F631.376 
+G1 X50.041 Y37.942 E0.00162 F856.376 
+G1 X50.094 Y37.868 E0.00302 F1135.376 
+G1 X50.173 Y37.755 E0.00460 F1423.376 
+G1 X50.281 Y37.603 E0.00619 F1711.376 
+G1 X50.416 Y37.412 E0.00779 F1999.376 
+G1 X50.579 Y37.182 E0.00939 F2287.376 
+G1 X50.769 Y36.913 E0.01096 F2566.376 
+G1 X50.983 Y36.610 E0.01236 F2791.376 
+G1 X51.215 Y36.282 E0.01336 F2926.376 
+G1 X51.455 Y35.943 E0.01386 F2971.376 
+G1 X53.870 Y32.528 E0.13927 F3000.000 
+G1 X54.085 Y32.223 E0.01243 F2991.992 
+G1 X54.292 Y31.931 E0.01193 F2946.992 
+G1 X54.482 Y31.662 E0.01096 F2811.992 
+G1 X54.650 Y31.424 E0.00969 F2598.992 
+G1 X54.795 Y31.220 E0.00832 F2352.992 
+G1 X54.915 Y31.049 E0.00696 F2106.992 
+G1 X55.012 Y30.912 E0.00559 F1860.992 
+G1 X55.086 Y30.809 E0.00423 F1614.992 
+G1 X55.135 Y30.738 E0.00286 F1368.992 
+G1 X55.163 Y30.699 E0.00159 F1122.992 
+G1 X55.174 Y30.684 E0.00062 F909.992 
+G1 X55.176 Y30.681 E0.00012 F774.992 
+G1 X55.179 Y30.682 E0.00012 F774.992 
+G1 X55.197 Y30.690 E0.00062 F909.992 
+G1 X55.241 Y30.708 E0.00159 F1122.992 
+G1 X55.320 Y30.741 E0.00286 F1368.992 
+G1 X55.438 Y30.789 E0.00423 F1614.992 
+G1 X55.593 Y30.854 E0.00559 F1860.992 
+G1 X55.786 Y30.934 E0.00696 F2106.992 
+G1 X56.017 Y31.029 E0.00832 F2352.992 
+G1 X56.286 Y31.141 E0.00969 F2598.992 
+G1 X56.590 Y31.267 E0.01096 F2811.992 
+G1 X56.921 Y31.404 E0.01193 F2946.992 
+G1 X57.266 Y31.547 E0.01243 F2991.992 
+G1 X60.000 Y32.679 E0.09854 F3000.000 
+G1 X64.142 Y35.858 E0.17386
+G1 X67.321 Y40.000 E0.17386
+G1 X68.453 Y42.734 E0.09854 
+G1 X68.596 Y43.079 E0.01243 F2991.992 
+G1 X68.733 Y43.410 E0.01193 F2946.992 
+G1 X68.859 Y43.714 E0.01096 F2811.992 
+G1 X68.971 Y43.983 E0.00969 F2598.992 
+G1 X69.066 Y44.214 E0.00832 F2352.992 
+G1 X69.146 Y44.407 E0.00696 F2106.992 
+G1 X69.211 Y44.562 E0.00559 F1860.992 
+G1 X69.259 Y44.680 E0.00423 F1614.992 
+G1 X69.292 Y44.759 E0.00286 F1368.992 
+G1 X69.310 Y44.803 E0.00159 F1122.992 
+G1 X69.318 Y44.821 E0.00062 F909.992 
+G1 X69.319 Y44.824 E0.00012 F774.992 
+G1 X69.316 Y44.826 E0.00012 F774.992 
+G1 X69.301 Y44.837 E0.00062 F909.992 
+G1 X69.262 Y44.865 E0.00159 F1122.992 
+G1 X69.191 Y44.914 E0.00286 F1368.992 
+G1 X69.088 Y44.988 E0.00423 F1614.992 
+G1 X68.951 Y45.085 E0.00559 F1860.992 
+G1 X68.780 Y45.205 E0.00696 F2106.992 
+G1 X68.576 Y45.350 E0.00832 F2352.992 
+G1 X68.338 Y45.518 E0.00969 F2598.992 
+G1 X68.069 Y45.708 E0.01096 F2811.992 
+G1 X67.777 Y45.915 E0.01193 F2946.992 
+G1 X67.472 Y46.130 E0.01243 F2991.992 
+G1 X62.808 Y49.428 E0.19022 F3000.000 
+G1 X62.462 Y49.673 E0.01411 F3000.000 
+G1 X62.447 Y49.684 E0.00062 F2459.578 
+G1 X62.260 Y49.816 E0.00762 F2459.578 
+G1 X62.202 Y49.857 E0.00237 F2459.578 
+G1 X62.135 Y49.905 E0.00275 F1874.578 
+G1 X62.058 Y49.959 E0.00312 F1874.578 
+G1 X62.018 Y49.987 E0.00162 F1874.578 
+G1 X62.015 Y49.989 E0.00012 F1874.578 
+G1 X62.003 Y49.998 E0.00050 F1919.062 
+G1 X62.000 Y50.000 E0.00012 F3000.000 
+G1 E-.8 F2100
+;TYPE:Inner wall
+;WIDTH:0.45
+G1 X61.996 Y50.000 F1379.578 
+G1 X61.865 Y50.000 F1379.578 
+G1 X61.771 Y50.000 F974.578 
+G1 X61.722 Y50.000 F659.578 
+G1 X61.704 Y50.000 F434.578 
+G1 X61.700 Y50.000 F299.578 
+G1 E0.80000 F299.578 
+G1 F299.578 
+G1 X61.703 Y50.002 E0.00012 F299.578 
+G1 X61.718 Y50.013 E0.00062 F434.578 
+G1 X61.758 Y50.041 E0.00162 F659.578 
+G1 X61.835 Y50.095 E0.00312 F974.578 
+G1 X61.960 Y50.184 E0.00512 F1379.578 
+G1 X62.147 Y50.316 E0.00762 F1874.578 
+G1 X62.407 Y50.500 E0.01061 F2459.578 
+G1 X62.753 Y50.745 E0.01411 F3134.578 
+G1 X63.191 Y51.055 E0.01786 F3809.578 
+G1 X63.715 Y51.425 E0.02135 F4394.578 
+G1 X64.312 Y51.847 E0.02435 F4889.578 
+G1 X64.508 Y51.986 E0.00799 F5294.578 
+G1 X64.970 Y52.313 E0.01886 F5294.578 
+G1 X65.186 Y52.466 E0.00882 F5609.578 
+G1 X65.677 Y52.813 E0.02002 F5604.883 
+G1 X65.828 Y52.920 E0.00616 F5604.883 
+G1 X66.421 Y53.339 E0.02418 F5289.883 
+G1 X66.953 Y53.715 E0.02169 F4884.883 
+G1 X67.190 Y53.883 E0.00965 F4401.883 
+G1 X67.417 Y54.044 E0.00930 F4401.883 
+G1 X67.812 Y54.323 E0.01608 F3885.883 
+G1 X67.970 Y54.435 E0.00646 F3369.883 
+G1 X68.136 Y54.552 E0.00676 F3369.883 
+G1 X68.390 Y54.731 E0.01036 F2853.883 
+G1 X68.576 Y54.863 E0.00758 F2337.883 
+G1 X68.701 Y54.952 E0.00512 F1854.883 
+G1 X68.778 Y55.006 E0.00312 F1449.883 
+G1 X68.818 Y55.034 E0.00162 F1134.883 
+G1 X68.833 Y55.045 E0.00062 F909.883 
+G1 X68.836 Y55.047 E0.00012 F774.883 
+G1 X68.835 Y55.050 E0.00012 F774.883 
+G1 X68.827 Y55.068 E0.00062 F909.883 
+G1 X68.809 Y55.113 E0.00162 F1134.883 
+G1 X68.773 Y55.199 E0.00312 F1449.883 
+G1 X68.714 Y55.341 E0.00512 F1854.883 
+G1 X68.627 Y55.552 E0.00758 F2337.883 
+G1 X68.508 Y55.839 E0.01036 F2853.883 
+G1 X68.356 Y56.206 E0.01322 F3369.883 
+G1 X68.171 Y56.652 E0.01608 F3885.883 
+G1 X67.953 Y57.178 E0.01895 F4401.883 
+G1 X67.703 Y57.780 E0.02172 F4884.883 
+G1 X67.425 Y58.451 E0.02418 F5289.883 
+G1 X67.246 Y58.884 E0.01559 F5604.883 
+G1 X67.148 Y59.121 E0.00855 F5604.883 
+G1 X67.124 Y59.178 E0.00204 F5593.891 
+G1 X67.065 Y59.322 E0.00519 F5593.891 
+G1 X66.998 Y59.482 E0.00579 F5335.891 
+G1 X66.948 Y59.603 E0.00436 F5077.891 
+G1 X66.914 Y59.685 E0.00293 F4819.891 
+G1 X66.896 Y59.729 E0.00161 F4561.891 
+G1 X66.888 Y59.747 E0.00062 F4342.891 
+G1 X66.887 Y59.750 E0.00012 F4207.891 
+G1 X66.885 Y59.753 E0.00012 F4207.891 
+G1 X66.873 Y59.768 E0.00062 F4342.891 
+G1 X66.844 Y59.806 E0.00161 F4561.891 
+G1 X66.790 Y59.876 E0.00293 F4819.891 
+G1 X66.758 Y59.918 E0.00176 F5077.891 
+G1 X66.711 Y59.980 E0.00260 F5077.891 
+G1 X66.605 Y60.118 E0.00579 F5335.891 
+G1 X66.473 Y60.290 E0.00723 F5593.891 
+G1 X66.316 Y60.494 E0.00855 F5812.891 
+G1 X66.234 Y60.601 E0.00451 F5947.891 
+G1 X66.142 Y60.721 E0.00502 F5947.891 
+G1 X65.959 Y60.960 E0.01003 F5992.891 
+G1 X65.701 Y61.297 E0.01412 F6000.000 
+G1 X64.717 Y62.579 E0.05382 F6000.000 
+G1 X64.534 Y62.818 E0.01003 F5980.898 
+G1 X64.360 Y63.045 E0.00953 F5935.898 
+G1 X64.203 Y63.249 E0.00855 F5800.898 
+G1 X64.071 Y63.421 E0.00723 F5581.898 
+G1 X63.965 Y63.559 E0.00579 F5323.898 
+G1 X63.886 Y63.663 E0.00436 F5065.898 
+G1 X63.832 Y63.733 E0.00293 F4807.898 
+G1 X63.803 Y63.771 E0.00161 F4549.898 
+G1 X63.791 Y63.786 E0.00062 F4330.898 
+G1 X63.789 Y63.789 E0.00012 F4195.898 
+G1 X63.786 Y63.791 E0.00012 F4195.898 
+G1 X63.771 Y63.803 E0.00062 F4330.898 
+G1 X63.733 Y63.832 E0.00161 F4549.898 
+G1 X63.663 Y63.886 E0.00293 F4807.898 
+G1 X63.559 Y63.965 E0.00436 F5065.898 
+G1 X63.421 Y64.071 E0.00579 F5323.898 
+G1 X63.249 Y64.203 E0.00723 F5581.898 
+G1 X63.045 Y64.360 E0.00855 F5800.898 
+G1 X62.818 Y64.534 E0.00953 F5935.898 
+G1 X62.579 Y64.717 E0.01003 F5980.898 
+G1 X60.960 Y65.959 E0.06794 F6000.000 
+G1 X60.721 Y66.142 E0.01003 F5992.891 
+G1 X60.494 Y66.316 E0.00953 F5947.891 
+G1 X60.290 Y66.473 E0.00855 F5812.891 
+G1 X60.118 Y66.605 E0.00723 F5593.891 
+G1 X59.980 Y66.711 E0.00579 F5335.891 
+G1 X59.876 Y66.790 E0.00436 F5077.891 
+G1 X59.806 Y66.844 E0.00293 F4819.891 
+G1 X59.768 Y66.873 E0.00161 F4561.891 
+G1 X59.753 Y66.885 E0.00062 F4342.891 
+G1 X59.750 Y66.887 E0.00012 F4207.891 
+G1 X59.747 Y66.888 E0.00012 F4207.891 
+G1 X59.729 Y66.896 E0.00062 F4342.891 
+G1 X59.685 Y66.914 E0.00161 F4561.891 
+G1 X59.603 Y66.948 E0.00293 F4819.891 
+G1 X59.482 Y66.998 E0.00436 F5077.891 
+G1 X59.322 Y67.065 E0.00579 F5335.891 
+G1 X59.178 Y67.124 E0.00519 F5593.891 
+G1 X59.121 Y67.148 E0.00204 F5593.891 
+G1 X58.884 Y67.246 E0.00855 F5604.883 
+G1 X58.619 Y67.356 E0.00953 F5604.883 
+G1 X58.451 Y67.425 E0.00606 F5604.883 
+G1 X58.341 Y67.471 E0.00397 F5289.883 
+G1 X57.780 Y67.703 E0.02021 F5289.883 
+G1 X57.178 Y67.953 E0.02172 F4884.883 
+G1 X56.652 Y68.171 E0.01895 F4401.883 
+G1 X56.206 Y68.356 E0.01608 F3885.883 
+G1 X55.839 Y68.508 E0.01322 F3369.883 
+G1 X55.552 Y68.627 E0.01036 F2853.883 
+G1 X55.341 Y68.714 E0.00758 F2337.883 
+G1 X55.199 Y68.773 E0.00512 F1854.883 
+G1 X55.113 Y68.809 E0.00312 F1449.883 
+G1 X55.068 Y68.827 E0.00162 F1134.883 
+G1 X55.050 Y68.835 E0.00062 F909.883 
+G1 X55.047 Y68.836 E0.00012 F774.883 
+G1 X55.045 Y68.833 E0.00012 F774.883 
+G1 X55.034 Y68.818 E0.00062 F909.883 
+G1 X55.006 Y68.778 E0.00162 F1134.883 
+G1 X54.952 Y68.701 E0.00312 F1449.883 
+G1 X54.863 Y68.576 E0.00512 F1854.883 
+G1 X54.731 Y68.390 E0.00758 F2337.883 
+G1 X54.552 Y68.136 E0.01036 F2853.883 
+G1 X54.323 Y67.812 E0.01322 F3369.883 
+G1 X54.044 Y67.417 E0.01608 F3885.883 
+G1 X53.715 Y66.953 E0.01895 F4401.883 
+G1 X53.339 Y66.420 E0.02172 F4884.883 
+G1 X53.193 Y66.215 E0.00836 F5289.883 
+G1 X52.919 Y65.827 E0.01582 F5289.883 
+G1 X52.692 Y65.506 E0.01312 F5604.883 
+G1 X52.465 Y65.186 E0.01306 F5554.405 
+G1 X52.216 Y64.833 E0.01439 F5554.405 
+G1 X51.985 Y64.507 E0.01329 F5239.405 
+G1 X51.774 Y64.209 E0.01216 F5239.405 
+G1 X51.488 Y63.804 E0.01652 F4834.405 
+G1 X51.376 Y63.646 E0.00643 F4834.405 
+G1 X51.029 Y63.155 E0.02003 F4339.405 
+G1 X50.982 Y63.088 E0.00272 F3781.405 
+G1 X50.736 Y62.741 E0.01417 F3781.405 
+G1 X50.499 Y62.405 E0.01369 F3205.405 
+G1 X50.316 Y62.147 E0.01054 F2629.405 
+G1 X50.184 Y61.960 E0.00762 F2071.405 
+G1 X50.095 Y61.835 E0.00512 F1576.405 
+G1 X50.041 Y61.758 E0.00312 F1171.405 
+G1 X50.013 Y61.718 E0.00162 F856.405 
+G1 X50.002 Y61.703 E0.00062 F631.405 
+G1 X50.000 Y61.700 E0.00012 F496.405 
+G1 X49.998 Y61.703 E0.00012 F496.405 
+G1 X49.987 Y61.718 E0.00062 F631.405 
+G1 X49.959 Y61.758 E0.00162 F856.405 
+G1 X49.905 Y61.835 E0.00312 F1171.405 
+G1 X49.816 Y61.960 E0.00512 F1576.405 
+G1 X49.684 Y62.147 E0.00762 F2071.405 
+G1 X49.501 Y62.405 E0.01054 F2629.405 
+G1 X49.264 Y62.741 E0.01369 F3205.405 
+G1 X48.971 Y63.155 E0.01688 F3781.405 
+G1 X48.624 Y63.646 E0.02003 F4339.405 
+G1 X48.226 Y64.209 E0.02295 F4834.405 
+G1 X47.784 Y64.833 E0.02545 F5239.405 
+G1 X47.535 Y65.186 E0.01439 F5554.405 
+G1 X47.308 Y65.506 E0.01306 F5554.405 
+G1 X47.081 Y65.827 E0.01312 F5604.883 
+G1 X46.807 Y66.215 E0.01582 F5289.883 
+G1 X46.661 Y66.420 E0.00836 F5289.883 
+G1 X46.287 Y66.949 E0.02158 F4884.883 
+G1 X46.285 Y66.953 E0.00014 F4884.883 
+G1 X45.956 Y67.417 E0.01895 F4401.883 
+G1 X45.759 Y67.696 E0.01136 F3885.883 
+G1 X45.677 Y67.812 E0.00473 F3885.883 
+G1 X45.448 Y68.136 E0.01322 F3369.883 
+G1 X45.269 Y68.390 E0.01036 F2853.883 
+G1 X45.137 Y68.576 E0.00758 F2337.883 
+G1 X45.048 Y68.701 E0.00512 F1854.883 
+G1 X44.994 Y68.778 E0.00312 F1449.883 
+G1 X44.966 Y68.818 E0.00162 F1134.883 
+G1 X44.955 Y68.833 E0.00062 F909.883 
+G1 X44.953 Y68.836 E0.00012 F774.883 
+G1 X44.950 Y68.835 E0.00012 F774.883 
+G1 X44.932 Y68.827 E0.00062 F909.883 
+G1 X44.887 Y68.809 E0.00162 F1134.883 
+G1 X44.801 Y68.773 E0.00312 F1449.883 
+G1 X44.659 Y68.714 E0.00512 F1854.883 
+G1 X44.448 Y68.627 E0.00758 F2337.883 
+G1 X44.161 Y68.508 E0.01036 F2853.883 
+G1 X43.794 Y68.356 E0.01322 F3369.883 
+G1 X43.348 Y68.171 E0.01608 F3885.883 
+G1 X42.822 Y67.953 E0.01895 F4401.883 
+G1 X42.220 Y67.703 E0.02172 F4884.883 
+G1 X41.549 Y67.425 E0.02418 F5289.883 
+G1 X41.116 Y67.246 E0.01559 F5604.883 
+G1 X40.879 Y67.148 E0.00855 F5604.883 
+G1 X40.822 Y67.124 E0.00204 F5593.891 
+G1 X40.678 Y67.065 E0.00519 F5593.891 
+G1 X40.518 Y66.998 E0.00579 F5335.891 
+G1 X40.397 Y66.948 E0.00436 F5077.891 
+G1 X40.315 Y66.914 E0.00293 F4819.891 
+G1 X40.271 Y66.896 E0.00161 F4561.891 
+G1 X40.253 Y66.888 E0.00062 F4342.891 
+G1 X40.250 Y66.887 E0.00012 F4207.891 
+G1 X40.247 Y66.885 E0.00012 F4207.891 
+G1 X40.232 Y66.873 E0.00062 F4342.891 
+G1 X40.194 Y66.844 E0.00161 F4561.891 
+G1 X40.124 Y66.790 E0.00293 F4819.891 
+G1 X40.082 Y66.758 E0.00176 F5077.891 
+G1 X40.020 Y66.711 E0.00260 F5077.891 
+G1 X39.882 Y66.605 E0.00579 F5335.891 
+G1 X39.710 Y66.473 E0.00723 F5593.891 
+G1 X39.506 Y66.316 E0.00855 F5812.891 
+G1 X39.399 Y66.234 E0.00451 F5947.891 
+G1 X39.279 Y66.142 E0.00502 F5947.891 
+G1 X39.040 Y65.959 E0.01003 F5992.891 
+G1 X38.703 Y65.701 E0.01412 F6000.000 
+G1 X37.421 Y64.717 E0.05382 F6000.000 
+G1 X37.182 Y64.534 E0.01003 F5980.898 
+G1 X36.955 Y64.360 E0.00953 F5935.898 
+G1 X36.751 Y64.203 E0.00855 F5800.898 
+G1 X36.579 Y64.071 E0.00723 F5581.898 
+G1 X36.441 Y63.965 E0.00579 F5323.898 
+G1 X36.337 Y63.886 E0.00436 F5065.898 
+G1 X36.267 Y63.832 E0.00293 F4807.898 
+G1 X36.229 Y63.803 E0.00161 F4549.898 
+G1 X36.214 Y63.791 E0.00062 F4330.898 
+G1 X36.211 Y63.789 E0.00012 F4195.898 
+G1 X36.209 Y63.786 E0.00012 F4195.898 
+G1 X36.197 Y63.771 E0.00062 F4330.898 
+G1 X36.168 Y63.733 E0.00161 F4549.898 
+G1 X36.114 Y63.663 E0.00293 F4807.898 
+G1 X36.035 Y63.559 E0.00436 F5065.898 
+G1 X35.929 Y63.421 E0.00579 F5323.898 
+G1 X35.797 Y63.249 E0.00723 F5581.898 
+G1 X35.640 Y63.045 E0.00855 F5800.898 
+G1 X35.466 Y62.818 E0.00953 F5935.898 
+G1 X35.283 Y62.579 E0.01003 F5980.898 
+G1 X34.041 Y60.960 E0.06794 F6000.000 
+G1 X33.858 Y60.721 E0.01003 F5992.891 
+G1 X33.684 Y60.494 E0.00953 F5947.891 
+G1 X33.527 Y60.290 E0.00855 F5812.891 
+G1 X33.395 Y60.118 E0.00723 F5593.891 
+G1 X33.289 Y59.980 E0.00579 F5335.891 
+G1 X33.210 Y59.876 E0.00436 F5077.891 
+G1 X33.156 Y59.806 E0.00293 F4819.891 
+G1 X33.127 Y59.768 E0.00161 F4561.891 
+G1 X33.115 Y59.753 E0.00062 F4342.891 
+G1 X33.113 Y59.750 E0.00012 F4207.891 
+G1 X33.112 Y59.747 E0.00012 F4207.891 
+G1 X33.104 Y59.729 E0.00062 F4342.891 
+G1 X33.086 Y59.685 E0.00161 F4561.891 
+G1 X33.052 Y59.603 E0.00293 F4819.891 
+G1 X33.002 Y59.482 E0.00436 F5077.891 
+G1 X32.935 Y59.322 E0.00579 F5335.891 
+G1 X32.876 Y59.178 E0.00519 F5593.891 
+G1 X32.852 Y59.121 E0.00204 F5593.891 
+G1 X32.754 Y58.884 E0.00855 F5604.883 
+G1 X32.644 Y58.619 E0.00953 F5604.883 
+G1 X32.575 Y58.451 E0.00606 F5604.883 
+G1 X32.529 Y58.341 E0.00397 F5289.883 
+G1 X32.297 Y57.780 E0.02021 F5289.883 
+G1 X32.047 Y57.178 E0.02172 F4884.883 
+G1 X31.829 Y56.652 E0.01895 F4401.883 
+G1 X31.644 Y56.206 E0.01608 F3885.883 
+G1 X31.492 Y55.839 E0.01322 F3369.883 
+G1 X31.373 Y55.552 E0.01036 F2853.883 
+G1 X31.286 Y55.341 E0.00758 F2337.883 
+G1 X31.227 Y55.199 E0.00512 F1854.883 
+G1 X31.191 Y55.113 E0.00312 F1449.883 
+G1 X31.173 Y55.068 E0.00162 F1134.883 
+G1 X31.165 Y55.050 E0.00062 F909.883 
+G1 X31.164 Y55.047 E0.00012 F774.883 
+G1 X31.167 Y55.045 E0.00012 F774.883 
+G1 X31.182 Y55.034 E0.00062 F909.883 
+G1 X31.222 Y55.006 E0.00162 F1134.883 
+G1 X31.299 Y54.952 E0.00312 F1449.883 
+G1 X31.424 Y54.863 E0.00512 F1854.883 
+G1 X31.610 Y54.731 E0.00758 F2337.883 
+G1 X31.864 Y54.552 E0.01036 F2853.883 
+G1 X32.188 Y54.323 E0.01322 F3369.883 
+G1 X32.583 Y54.044 E0.01608 F3885.883 
+G1 X33.047 Y53.715 E0.01895 F4401.883 
+G1 X33.580 Y53.339 E0.02172 F4884.883 
+G1 X33.785 Y53.193 E0.00836 F5289.883 
+G1 X34.173 Y52.919 E0.01582 F5289.883 
+G1 X34.494 Y52.692 E0.01312 F5604.883 
+G1 X34.814 Y52.465 E0.01306 F5554.405 
+G1 X35.167 Y52.216 E0.01439 F5554.405 
+G1 X35.493 Y51.985 E0.01329 F5239.405 
+G1 X35.791 Y51.774 E0.01216 F5239.405 
+G1 X36.196 Y51.488 E0.01652 F4834.405 
+G1 X36.354 Y51.376 E0.00643 F4834.405 
+G1 X36.845 Y51.029 E0.02003 F4339.405 
+G1 X36.912 Y50.982 E0.00272 F3781.405 
+G1 X37.259 Y50.736 E0.01417 F3781.405 
+G1 X37.595 Y50.499 E0.01369 F3205.405 
+G1 X37.853 Y50.316 E0.01054 F2629.405 
+G1 X38.040 Y50.184 E0.00762 F2071.405 
+G1 X38.165 Y50.095 E0.00512 F1576.405 
+G1 X38.242 Y50.041 E0.00312 F1171.405 
+G1 X38.282 Y50.013 E0.00162 F856.405 
+G1 X38.297 Y50.002 E0.00062 F631.405 
+G1 X38.300 Y50.000 E0.00012 F496.405 
+G1 X38.297 Y49.998 E0.00012 F496.405 
+G1 X38.282 Y49.987 E0.00062 F631.405 
+G1 X38.242 Y49.959 E0.00162 F856.405 
+G1 X38.165 Y49.905 E0.00312 F1171.405 
+G1 X38.040 Y49.816 E0.00512 F1576.405 
+G1 X37.853 Y49.684 E0.00762 F2071.405 
+G1 X37.595 Y49.501 E0.01054 F2629.405 
+G1 X37.259 Y49.264 E0.01369 F3205.405 
+G1 X36.845 Y48.971 E0.01688 F3781.405 
+G1 X36.354 Y48.624 E0.02003 F4339.405 
+G1 X35.791 Y48.226 E0.02295 F4834.405 
+G1 X35.167 Y47.784 E0.02545 F5239.405 
+G1 X34.814 Y47.535 E0.01439 F5554.405 
+G1 X34.494 Y47.308 E0.01306 F5554.405 
+G1 X34.173 Y47.081 E0.01312 F5604.883 
+G1 X33.785 Y46.807 E0.01582 F5289.883 
+G1 X33.580 Y46.661 E0.00836 F5289.883 
+G1 X33.051 Y46.287 E0.02158 F4884.883 
+G1 X33.047 Y46.285 E0.00014 F4884.883 
+G1 X32.583 Y45.956 E0.01895 F4401.883 
+G1 X32.304 Y45.759 E0.01136 F3885.883 
+G1 X32.188 Y45.677 E0.00473 F3885.883 
+G1 X31.864 Y45.448 E0.01322 F3369.883 
+G1 X31.610 Y45.269 E0.01036 F2853.883 
+G1 X31.424 Y45.137 E0.00758 F2337.883 
+G1 X31.299 Y45.048 E0.00512 F1854.883 
+G1 X31.222 Y44.994 E0.00312 F1449.883 
+G1 X31.182 Y44.966 E0.00162 F1134.883 
+G1 X31.167 Y44.955 E0.00062 F909.883 
+G1 X31.164 Y44.953 E0.00012 F774.883 
+G1 X31.165 Y44.950 E0.00012 F774.883 
+G1 X31.173 Y44.932 E0.00062 F909.883 
+G1 X31.191 Y44.887 E0.00162 F1134.883 
+G1 X31.227 Y44.801 E0.00312 F1449.883 
+G1 X31.286 Y44.659 E0.00512 F1854.883 
+G1 X31.373 Y44.448 E0.00758 F2337.883 
+G1 X31.492 Y44.161 E0.01036 F2853.883 
+G1 X31.644 Y43.794 E0.01322 F3369.883 
+G1 X31.829 Y43.348 E0.01608 F3885.883 
+G1 X32.047 Y42.822 E0.01895 F4401.883 
+G1 X32.297 Y42.220 E0.02172 F4884.883 
+G1 X32.575 Y41.549 E0.02418 F5289.883 
+G1 X32.754 Y41.116 E0.01559 F5604.883 
+G1 X32.852 Y40.879 E0.00855 F5604.883 
+G1 X32.876 Y40.822 E0.00204 F5593.891 
+G1 X32.935 Y40.678 E0.00519 F5593.891 
+G1 X33.002 Y40.518 E0.00579 F5335.891 
+G1 X33.052 Y40.397 E0.00436 F5077.891 
+G1 X33.086 Y40.315 E0.00293 F4819.891 
+G1 X33.104 Y40.271 E0.00161 F4561.891 
+G1 X33.112 Y40.253 E0.00062 F4342.891 
+G1 X33.113 Y40.250 E0.00012 F4207.891 
+G1 X33.115 Y40.247 E0.00012 F4207.891 
+G1 X33.127 Y40.232 E0.00062 F4342.891 
+G1 X33.156 Y40.194 E0.00161 F4561.891 
+G1 X33.210 Y40.124 E0.00293 F4819.891 
+G1 X33.242 Y40.082 E0.00176 F5077.891 
+G1 X33.289 Y40.020 E0.00260 F5077.891 
+G1 X33.395 Y39.882 E0.00579 F5335.891 
+G1 X33.527 Y39.710 E0.00723 F5593.891 
+G1 X33.684 Y39.506 E0.00855 F5812.891 
+G1 X33.766 Y39.399 E0.00451 F5947.891 
+G1 X33.858 Y39.279 E0.00502 F5947.891 
+G1 X34.041 Y39.040 E0.01003 F5992.891 
+G1 X34.299 Y38.703 E0.01412 F6000.000 
+G1 X35.283 Y37.421 E0.05382 F6000.000 
+G1 X35.466 Y37.182 E0.01003 F5980.898 
+G1 X35.640 Y36.955 E0.00953 F5935.898 
+G1 X35.797 Y36.751 E0.00855 F5800.898 
+G1 X35.929 Y36.579 E0.00723 F5581.898 
+G1 X36.035 Y36.441 E0.00579 F5323.898 
+G1 X36.114 Y36.337 E0.00436 F5065.898 
+G1 X36.168 Y36.267 E0.00293 F4807.898 
+G1 X36.197 Y36.229 E0.00161 F4549.898 
+G1 X36.209 Y36.214 E0.00062 F4330.898 
+G1 X36.211 Y36.211 E0.00012 F4195.898 
+G1 X36.214 Y36.209 E0.00012 F4195.898 
+G1 X36.229 Y36.197 E0.00062 F4330.898 
+G1 X36.267 Y36.168 E0.00161 F4549.898 
+G1 X36.337 Y36.114 E0.00293 F4807.898 
+G1 X36.441 Y36.035 E0.00436 F5065.898 
+G1 X36.579 Y35.929 E0.00579 F5323.898 
+G1 X36.751 Y35.797 E0.00723 F5581.898 
+G1 X36.955 Y35.640 E0.00855 F5800.898 
+G1 X37.182 Y35.466 E0.00953 F5935.898 
+G1 X37.421 Y35.283 E0.01003 F5980.898 
+G1 X39.040 Y34.041 E0.06794 F6000.000 
+G1 X39.279 Y33.858 E0.01003 F5992.891 
+G1 X39.506 Y33.684 E0.00953 F5947.891 
+G1 X39.710 Y33.527 E0.00855 F5812.891 
+G1 X39.882 Y33.395 E0.00723 F5593.891 
+G1 X40.020 Y33.289 E0.00579 F5335.891 
+G1 X40.124 Y33.210 E0.00436 F5077.891 
+G1 X40.194 Y33.156 E0.00293 F4819.891 
+G1 X40.232 Y33.127 E0.00161 F4561.891 
+G1 X40.247 Y33.115 E0.00062 F4342.891 
+G1 X40.250 Y33.113 E0.00012 F4207.891 
+G1 X40.253 Y33.112 E0.00012 F4207.891 
+G1 X40.271 Y33.104 E0.00062 F4342.891 
+G1 X40.315 Y33.086 E0.00161 F4561.891 
+G1 X40.397 Y33.052 E0.00293 F4819.891 
+G1 X40.518 Y33.002 E0.00436 F5077.891 
+G1 X40.678 Y32.935 E0.00579 F5335.891 
+G1 X40.822 Y32.876 E0.00519 F5593.891 
+G1 X40.879 Y32.852 E0.00204 F5593.891 
+G1 X41.116 Y32.754 E0.00855 F5604.883 
+G1 X41.381 Y32.644 E0.00953 F5604.883 
+G1 X41.549 Y32.575 E0.00606 F5604.883 
+G1 X41.659 Y32.529 E0.00397 F5289.883 
+G1 X42.220 Y32.297 E0.02021 F5289.883 
+G1 X42.822 Y32.047 E0.02172 F4884.883 
+G1 X43.348 Y31.829 E0.01895 F4401.883 
+G1 X43.794 Y31.644 E0.01608 F3885.883 
+G1 X44.161 Y31.492 E0.01322 F3369.883 
+G1 X44.448 Y31.373 E0.01036 F2853.883 
+G1 X44.659 Y31.286 E0.00758 F2337.883 
+G1 X44.801 Y31.227 E0.00512 F1854.883 
+G1 X44.887 Y31.191 E0.00312 F1449.883 
+G1 X44.932 Y31.173 E0.00162 F1134.883 
+G1 X44.950 Y31.165 E0.00062 F909.883 
+G1 X44.953 Y31.164 E0.00012 F774.883 
+G1 X44.955 Y31.167 E0.00012 F774.883 
+G1 X44.966 Y31.182 E0.00062 F909.883 
+G1 X44.994 Y31.222 E0.00162 F1134.883 
+G1 X45.048 Y31.299 E0.00312 F1449.883 
+G1 X45.137 Y31.424 E0.00512 F1854.883 
+G1 X45.269 Y31.610 E0.00758 F2337.883 
+G1 X45.448 Y31.864 E0.01036 F2853.883 
+G1 X45.677 Y32.188 E0.01322 F3369.883 
+G1 X45.956 Y32.583 E0.01608 F3885.883 
+G1 X46.285 Y33.047 E0.01895 F4401.883 
+G1 X46.661 Y33.580 E0.02172 F4884.883 
+G1 X46.807 Y33.785 E0.00836 F5289.883 
+G1 X47.081 Y34.173 E0.01582 F5289.883 
+G1 X47.308 Y34.494 E0.01312 F5604.883 
+G1 X47.535 Y34.814 E0.01306 F5554.405 
+G1 X47.784 Y35.167 E0.01439 F5554.405 
+G1 X48.015 Y35.493 E0.01329 F5239.405 
+G1 X48.226 Y35.791 E0.01216 F5239.405 
+G1 X48.512 Y36.196 E0.01652 F4834.405 
+G1 X48.624 Y36.354 E0.00643 F4834.405 
+G1 X48.971 Y36.845 E0.02003 F4339.405 
+G1 X49.018 Y36.912 E0.00272 F3781.405 
+G1 X49.264 Y37.259 E0.01417 F3781.405 
+G1 X49.501 Y37.595 E0.01369 F3205.405 
+G1 X49.684 Y37.853 E0.01054 F2629.405 
+G1 X49.816 Y38.040 E0.00762 F2071.405 
+G1 X49.905 Y38.165 E0.00512 F1576.405 
+G1 X49.959 Y38.242 E0.00312 F1171.405 
+G1 X49.987 Y38.282 E0.00162 F856.405 
+G1 X49.998 Y38.297 E0.00062 F631.405 
+G1 X50.000 Y38.300 E0.00012 F496.405 
+G1 X50.002 Y38.297 E0.00012 F496.405 
+G1 X50.013 Y38.282 E0.00062 F631.405 
+G1 X50.041 Y38.242 E0.00162 F856.405 
+G1 X50.095 Y38.165 E0.00312 F1171.405 
+G1 X50.184 Y38.040 E0.00512 F1576.405 
+G1 X50.316 Y37.853 E0.00762 F2071.405 
+G1 X50.499 Y37.595 E0.01054 F2629.405 
+G1 X50.736 Y37.259 E0.01369 F3205.405 
+G1 X51.029 Y36.845 E0.01688 F3781.405 
+G1 X51.376 Y36.354 E0.02003 F4339.405 
+G1 X51.774 Y35.791 E0.02295 F4834.405 
+G1 X52.216 Y35.167 E0.02545 F5239.405 
+G1 X52.465 Y34.814 E0.01439 F5554.405 
+G1 X52.692 Y34.494 E0.01306 F5554.405 
+G1 X52.919 Y34.173 E0.01312 F5604.883 
+G1 X53.193 Y33.785 E0.01582 F5289.883 
+G1 X53.339 Y33.580 E0.00836 F5289.883 
+G1 X53.713 Y33.051 E0.02158 F4884.883 
+G1 X53.715 Y33.047 E0.00014 F4884.883 
+G1 X54.044 Y32.583 E0.01895 F4401.883 
+G1 X54.241 Y32.304 E0.01136 F3885.883 
+G1 X54.323 Y32.188 E0.00473 F3885.883 
+G1 X54.552 Y31.864 E0.01322 F3369.883 
+G1 X54.731 Y31.610 E0.01036 F2853.883 
+G1 X54.863 Y31.424 E0.00758 F2337.883 
+G1 X54.952 Y31.299 E0.00512 F1854.883 
+G1 X55.006 Y31.222 E0.00312 F1449.883 
+G1 X55.034 Y31.182 E0.00162 F1134.883 
+G1 X55.045 Y31.167 E0.00062 F909.883 
+G1 X55.047 Y31.164 E0.00012 F774.883 
+G1 X55.050 Y31.165 E0.00012 F774.883 
+G1 X55.068 Y31.173 E0.00062 F909.883 
+G1 X55.113 Y31.191 E0.00162 F1134.883 
+G1 X55.199 Y31.227 E0.00312 F1449.883 
+G1 X55.341 Y31.286 E0.00512 F1854.883 
+G1 X55.552 Y31.373 E0.00758 F2337.883 
+G1 X55.839 Y31.492 E0.01036 F2853.883 
+G1 X56.206 Y31.644 E0.01322 F3369.883 
+G1 X56.652 Y31.829 E0.01608 F3885.883 
+G1 X57.178 Y32.047 E0.01895 F4401.883 
+G1 X57.780 Y32.297 E0.02172 F4884.883 
+G1 X58.451 Y32.575 E0.02418 F5289.883 
+G1 X58.884 Y32.754 E0.01559 F5604.883 
+G1 X59.121 Y32.852 E0.00855 F5604.883 
+G1 X59.178 Y32.876 E0.00204 F5593.891 
+G1 X59.322 Y32.935 E0.00519 F5593.891 
+G1 X59.482 Y33.002 E0.00579 F5335.891 
+G1 X59.603 Y33.052 E0.00436 F5077.891 
+G1 X59.685 Y33.086 E0.00293 F4819.891 
+G1 X59.729 Y33.104 E0.00161 F4561.891 
+G1 X59.747 Y33.112 E0.00062 F4342.891 
+G1 X59.750 Y33.113 E0.00012 F4207.891 
+G1 X59.753 Y33.115 E0.00012 F4207.891 
+G1 X59.768 Y33.127 E0.00062 F4342.891 
+G1 X59.806 Y33.156 E0.00161 F4561.891 
+G1 X59.876 Y33.210 E0.00293 F4819.891 
+G1 X59.918 Y33.242 E0.00176 F5077.891 
+G1 X59.980 Y33.289 E0.00260 F5077.891 
+G1 X60.118 Y33.395 E0.00579 F5335.891 
+G1 X60.290 Y33.527 E0.00723 F5593.891 
+G1 X60.494 Y33.684 E0.00855 F5812.891 
+G1 X60.601 Y33.766 E0.00451 F5947.891 
+G1 X60.721 Y33.858 E0.00502 F5947.891 
+G1 X60.960 Y34.041 E0.01003 F5992.891 
+G1 X61.297 Y34.299 E0.01412 F6000.000 
+G1 X62.579 Y35.283 E0.05382 F6000.000 
+G1 X62.818 Y35.466 E0.01003 F5980.898 
+G1 X63.045 Y35.640 E0.00953 F5935.898 
+G1 X63.249 Y35.797 E0.00855 F5800.898 
+G1 X63.421 Y35.929 E0.00723 F5581.898 
+G1 X63.559 Y36.035 E0.00579 F5323.898 
+G1 X63.663 Y36.114 E0.00436 F5065.898 
+G1 X63.733 Y36.168 E0.00293 F4807.898 
+G1 X63.771 Y36.197 E0.00161 F4549.898 
+G1 X63.786 Y36.209 E0.00062 F4330.898 
+G1 X63.789 Y36.211 E0.00012 F4195.898 
+G1 X63.791 Y36.214 E0.00012 F4195.898 
+G1 X63.803 Y36.229 E0.00062 F4330.898 
+G1 X63.832 Y36.267 E0.00161 F4549.898 
+G1 X63.886 Y36.337 E0.00293 F4807.898 
+G1 X63.965 Y36.441 E0.00436 F5065.898 
+G1 X64.071 Y36.579 E0.00579 F5323.898 
+G1 X64.203 Y36.751 E0.00723 F5581.898 
+G1 X64.360 Y36.955 E0.00855 F5800.898 
+G1 X64.534 Y37.182 E0.00953 F5935.898 
+G1 X64.717 Y37.421 E0.01003 F5980.898 
+G1 X65.959 Y39.040 E0.06794 F6000.000 
+G1 X66.142 Y39.279 E0.01003 F5992.891 
+G1 X66.316 Y39.506 E0.00953 F5947.891 
+G1 X66.473 Y39.710 E0.00855 F5812.891 
+G1 X66.605 Y39.882 E0.00723 F5593.891 
+G1 X66.711 Y40.020 E0.00579 F5335.891 
+G1 X66.790 Y40.124 E0.00436 F5077.891 
+G1 X66.844 Y40.194 E0.00293 F4819.891 
+G1 X66.873 Y40.232 E0.00161 F4561.891 
+G1 X66.885 Y40.247 E0.00062 F4342.891 
+G1 X66.887 Y40.250 E0.00012 F4207.891 
+G1 X66.888 Y40.253 E0.00012 F4207.891 
+G1 X66.896 Y40.271 E0.00062 F4342.891 
+G1 X66.914 Y40.315 E0.00161 F4561.891 
+G1 X66.948 Y40.397 E0.00293 F4819.891 
+G1 X66.998 Y40.518 E0.00436 F5077.891 
+G1 X67.065 Y40.678 E0.00579 F5335.891 
+G1 X67.124 Y40.822 E0.00519 F5593.891 
+G1 X67.148 Y40.879 E0.00204 F5593.891 
+G1 X67.246 Y41.116 E0.00855 F5604.883 
+G1 X67.356 Y41.381 E0.00953 F5604.883 
+G1 X67.425 Y41.549 E0.00606 F5604.883 
+G1 X67.471 Y41.659 E0.00397 F5289.883 
+G1 X67.703 Y42.220 E0.02021 F5289.883 
+G1 X67.953 Y42.822 E0.02172 F4884.883 
+G1 X68.171 Y43.348 E0.01895 F4401.883 
+G1 X68.356 Y43.794 E0.01608 F3885.883 
+G1 X68.508 Y44.161 E0.01322 F3369.883 
+G1 X68.627 Y44.448 E0.01036 F2853.883 
+G1 X68.714 Y44.659 E0.00758 F2337.883 
+G1 X68.773 Y44.801 E0.00512 F1854.883 
+G1 X68.809 Y44.887 E0.00312 F1449.883 
+G1 X68.827 Y44.932 E0.00162 F1134.883 
+G1 X68.835 Y44.950 E0.00062 F909.883 
+G1 X68.836 Y44.953 E0.00012 F774.883 
+G1 X68.833 Y44.955 E0.00012 F774.883 
+G1 X68.818 Y44.966 E0.00062 F909.883 
+G1 X68.778 Y44.994 E0.00162 F1134.883 
+G1 X68.701 Y45.048 E0.00312 F1449.883 
+G1 X68.576 Y45.137 E0.00512 F1854.883 
+G1 X68.390 Y45.269 E0.00758 F2337.883 
+G1 X68.136 Y45.448 E0.01036 F2853.883 
+G1 X67.812 Y45.677 E0.01322 F3369.883 
+G1 X67.417 Y45.956 E0.01608 F3885.883 
+G1 X66.953 Y46.285 E0.01895 F4401.883 
+G1 X66.420 Y46.661 E0.02172 F4884.883 
+G1 X65.827 Y47.081 E0.02418 F5289.883 
+G1 X65.186 Y47.535 E0.02618 F5604.883 
+G1 X64.507 Y48.015 E0.02768 F5829.883 
+G1 X63.804 Y48.512 E0.02868 F5964.883 
+G1 X63.088 Y49.018 E0.02918 F6009.883 
+G1 X61.700 Y50.000 E0.05662 F6000.000 
+G1 E-.8 F2100
+;TYPE:Sparse infill
+;WIDTH:0.45
+G1 X40.000 Y40.000 F12000
+G1 E.8 F2100
+G1 F9000
+G1 X40.000 Y40.000 E0.66600
+G1 Y41.700 E0.05661
+G1 X60.000 Y41.700 E0.66600
+G1 Y43.400 E0.05661
+G1 X40.000 Y43.400 E0.66600
+G1 Y45.100 E0.05661
+G1 X60.000 Y45.100 E0.66600
+G1 Y46.800 E0.05661
+G1 X40.000 Y46.800 E0.66600
+G1 Y48.500 E0.05661
+G1 X60.000 Y48.500 E0.66600
+G1 Y50.200 E0.05661
+G1 X40.000 Y50.200 E0.66600
+G1 Y51.900 E0.05661
+G1 X60.000 Y51.900 E0.66600
+G1 Y53.600 E0.05661
+G1 X40.000 Y53.600 E0.66600
+G1 Y55.300 E0.05661
+G1 X60.000 Y55.300 E0.66600
+G1 Y57.000 E0.05661
+G1 X40.000 Y57.000 E0.66600
+G1 Y58.700 E0.05661
+G1 X52.948 Y58.700 E0.43115 
+G1 X54.279 Y58.700 E0.04436 F9093.433 
+G1 X55.497 Y58.700 E0.04056 F8409.433 
+G1 X56.601 Y58.700 E0.03676 F7725.433 
+G1 X57.591 Y58.700 E0.03297 F7041.433 
+G1 X58.468 Y58.700 E0.02917 F6357.433 
+G1 X59.230 Y58.700 E0.02537 F5673.433 
+G1 X59.877 Y58.700 E0.02158 F4989.433 
+G1 X60.000 Y58.700 E0.00408 F4305.433 
+G1 X60.000 Y59.111 E0.01370 F4305.433 
+G1 X60.000 Y59.534 E0.01406 F3621.433 
+G1 X60.000 Y59.852 E0.01061 F2964.433 
+G1 X60.000 Y60.081 E0.00762 F2379.433 
+G1 X60.000 Y60.235 E0.00512 F1884.433 
+G1 X60.000 Y60.329 E0.00312 F1479.433 
+G1 X60.000 Y60.377 E0.00162 F1164.433 
+G1 X60.000 Y60.396 E0.00062 F939.433 
+G1 Y60.400 E0.00012 
+; some comment
+
+G1 E-.8 F2100
+;TYPE:Outer wall
+;WIDTH:0.45
+G1 X60.004 Y60.401 F804.433 
+G1 X132.000 Y80.000 F12000.000 
+G1 E.8 F2100
+G1 F3000
+G1 X137.472 Y83.870 E0.22319 
+G1 X137.777 Y84.085 E0.01243 F2991.992 
+G1 X138.069 Y84.292 E0.01193 F2946.992 
+G1 X138.338 Y84.482 E0.01096 F2811.992 
+G1 X138.576 Y84.650 E0.00969 F2598.992 
+G1 X138.780 Y84.795 E0.00832 F2352.992 
+G1 X138.951 Y84.915 E0.00696 F2106.992 
+G1 X139.088 Y85.012 E0.00559 F1860.992 
+G1 X139.191 Y85.086 E0.00423 F1614.992 
+G1 X139.262 Y85.135 E0.00286 F1368.992 
+G1 X139.301 Y85.163 E0.00159 F1122.992 
+G1 X139.316 Y85.174 E0.00062 F909.992 
+G1 X139.319 Y85.176 E0.00012 F774.992 
+G1 X139.318 Y85.179 E0.00012 F774.992 
+G1 X139.310 Y85.197 E0.00062 F909.992 
+G1 X139.292 Y85.241 E0.00159 F1122.992 
+G1 X139.259 Y85.320 E0.00286 F1368.992 
+G1 X139.211 Y85.438 E0.00423 F1614.992 
+G1 X139.146 Y85.593 E0.00559 F1860.992 
+G1 X139.066 Y85.786 E0.00696 F2106.992 
+G1 X138.971 Y86.017 E0.00832 F2352.992 
+G1 X138.859 Y86.286 E0.00969 F2598.992 
+G1 X138.733 Y86.590 E0.01096 F2811.992 
+G1 X138.596 Y86.921 E0.01193 F2946.992 
+G1 X138.453 Y87.266 E0.01243 F2991.992 
+G1 X137.321 Y90.000 E0.09854 F3000.000 
+G1 X134.142 Y94.142 E0.17386
+G1 X130.000 Y97.321 E0.17386
+G1 X127.266 Y98.453 E0.09854 
+G1 X126.921 Y98.596 E0.01243 F2991.992 
+G1 X126.590 Y98.733 E0.01193 F2946.992 
+G1 X126.286 Y98.859 E0.01096 F2811.992 
+G1 X126.017 Y98.971 E0.00969 F2598.992 
+G1 X125.786 Y99.066 E0.00832 F2352.992 
+G1 X125.593 Y99.146 E0.00696 F2106.992 
+G1 X125.438 Y99.211 E0.00559 F1860.992 
+G1 X125.320 Y99.259 E0.00423 F1614.992 
+G1 X125.241 Y99.292 E0.00286 F1368.992 
+G1 X125.197 Y99.310 E0.00159 F1122.992 
+G1 X125.179 Y99.318 E0.00062 F909.992 
+G1 X125.176 Y99.319 E0.00012 F774.992 
+G1 X125.174 Y99.316 E0.00012 F774.992 
+G1 X125.163 Y99.301 E0.00062 F909.992 
+G1 X125.135 Y99.262 E0.00159 F1122.992 
+G1 X125.086 Y99.191 E0.00286 F1368.992 
+G1 X125.012 Y99.088 E0.00423 F1614.992 
+G1 X124.915 Y98.951 E0.00559 F1860.992 
+G1 X124.795 Y98.780 E0.00696 F2106.992 
+G1 X124.650 Y98.576 E0.00832 F2352.992 
+G1 X124.482 Y98.338 E0.00969 F2598.992 
+G1 X124.292 Y98.069 E0.01096 F2811.992 
+G1 X124.085 Y97.777 E0.01193 F2946.992 
+G1 X123.870 Y97.472 E0.01243 F2991.992 
+G1 X121.455 Y94.057 E0.13927 F3000.000 
+G1 X121.215 Y93.718 E0.01386 F2971.376 
+G1 X120.983 Y93.390 E0.01336 F2926.376 
+G1 X120.769 Y93.087 E0.01236 F2791.376 
+G1 X120.579 Y92.818 E0.01096 F2566.376 
+G1 X120.416 Y92.588 E0.00939 F2287.376 
+G1 X120.281 Y92.397 E0.00779 F1999.376 
+G1 X120.173 Y92.245 E0.00619 F1711.376 
+G1 X120.094 Y92.132 E0.00460 F1423.376 
+G1 X120.041 Y92.058 E0.00302 F1135.376 
+G1 X120.013 Y92.018 E0.00162 F856.376 
+G1 X120.002 Y92.003 E0.00062 F631.376 
+G1 X120.000 Y92.000 E0.00012 F496.376 
+G1 X119.998 Y92.003 E0.00012 F496.376 
+G1 X119.987 Y92.018 E0.00062 F631.376 
+G1 X119.959 Y92.058 E0.00162 F856.376 
+G1 X119.906 Y92.132 E0.00302 F1135.376 
+G1 X119.827 Y92.245 E0.00460 F1423.376 
+G1 X119.719 Y92.397 E0.00619 F1711.376 
+G1 X119.584 Y92.588 E0.00779 F1999.376 
+G1 X119.421 Y92.818 E0.00939 F2287.376 
+G1 X119.231 Y93.087 E0.01096 F2566.376 
+G1 X119.017 Y93.390 E0.01236 F2791.376 
+G1 X118.785 Y93.718 E0.01336 F2926.376 
+G1 X118.545 Y94.057 E0.01386 F2971.376 
+G1 X116.130 Y97.472 E0.13927 F3000.000 
+G1 X115.915 Y97.777 E0.01243 F2991.992 
+G1 X115.708 Y98.069 E0.01193 F2946.992 
+G1 X115.518 Y98.338 E0.01096 F2811.992 
+G1 X115.350 Y98.576 E0.00969 F2598.992 
+G1 X115.205 Y98.780 E0.00832 F2352.992 
+G1 X115.085 Y98.951 E0.00696 F2106.992 
+G1 X114.988 Y99.088 E0.00559 F1860.992 
+G1 X114.914 Y99.191 E0.00423 F1614.992 
+G1 X114.865 Y99.262 E0.00286 F1368.992 
+G1 X114.837 Y99.301 E0.00159 F1122.992 
+G1 X114.826 Y99.316 E0.00062 F909.992 
+G1 X114.824 Y99.319 E0.00012 F774.992 
+G1 X114.821 Y99.318 E0.00012 F774.992 
+G1 X114.803 Y99.310 E0.00062 F909.992 
+G1 X114.759 Y99.292 E0.00159 F1122.992 
+G1 X114.680 Y99.259 E0.00286 F1368.992 
+G1 X114.562 Y99.211 E0.00423 F1614.992 
+G1 X114.407 Y99.146 E0.00559 F1860.992 
+G1 X114.214 Y99.066 E0.00696 F2106.992 
+G1 X113.983 Y98.971 E0.00832 F2352.992 
+G1 X113.714 Y98.859 E0.00969 F2598.992 
+G1 X113.410 Y98.733 E0.01096 F2811.992 
+G1 X113.079 Y98.596 E0.01193 F2946.992 
+G1 X112.734 Y98.453 E0.01243 F2991.992 
+G1 X110.000 Y97.321 E0.09854 F3000.000 
+G1 X105.858 Y94.142 E0.17386
+G1 X102.679 Y90.000 E0.17386
+G1 X101.547 Y87.266 E0.09854 
+G1 X101.404 Y86.921 E0.01243 F2991.992 
+G1 X101.267 Y86.590 E0.01193 F2946.992 
+G1 X101.141 Y86.286 E0.01096 F2811.992 
+G1 X101.029 Y86.017 E0.00969 F2598.992 
+G1 X100.934 Y85.786 E0.00832 F2352.992 
+G1 X100.854 Y85.593 E0.00696 F2106.992 
+G1 X100.789 Y85.438 E0.00559 F1860.992 
+G1 X100.741 Y85.320 E0.00423 F1614.992 
+G1 X100.708 Y85.241 E0.00286 F1368.992 
+G1 X100.690 Y85.197 E0.00159 F1122.992 
+G1 X100.682 Y85.179 E0.00062 F909.992 
+G1 X100.681 Y85.176 E0.00012 F774.992 
+G1 X100.684 Y85.174 E0.00012 F774.992 
+G1 X100.699 Y85.163 E0.00062 F909.992 
+G1 X100.738 Y85.135 E0.00159 F1122.992 
+G1 X100.809 Y85.086 E0.00286 F1368.992 
+G1 X100.912 Y85.012 E0.00423 F1614.992 
+G1 X101.049 Y84.915 E0.00559 F1860.992 
+G1 X101.220 Y84.795 E0.00696 F2106.992 
+G1 X101.424 Y84.650 E0.00832 F2352.992 
+G1 X101.662 Y84.482 E0.00969 F2598.992 
+G1 X101.931 Y84.292 E0.01096 F2811.992 
+G1 X102.223 Y84.085 E0.01193 F2946.992 
+G1 X102.528 Y83.870 E0.01243 F2991.992 
+G1 X105.943 Y81.455 E0.13927 F3000.000 
+G1 X106.282 Y81.215 E0.01386 F2971.376 
+G1 X106.610 Y80.983 E0.01336 F2926.376 
+G1 X106.913 Y80.769 E0.01236 F2791.376 
+G1 X107.182 Y80.579 E0.01096 F2566.376 
+G1 X107.412 Y80.416 E0.00939 F2287.376 
+G1 X107.603 Y80.281 E0.00779 F1999.376 
+G1 X107.755 Y80.173 E0.00619 F1711.376 
+G1 X107.868 Y80.094 E0.00460 F1423.376 
+G1 X107.942 Y80.041 E0.00302 F1135.376 
+G1 X107.982 Y80.013 E0.00162 F856.376 
+G1 X107.997 Y80.002 E0.00062 F631.376 
+G1 X108.000 Y80.000 E0.00012 F496.376 
+G1 X107.997 Y79.998 E0.00012 F496.376 
+G1 X107.982 Y79.987 E0.00062 F631.376 
+G1 X107.942 Y79.959 E0.00162 F856.376 
+G1 X107.868 Y79.906 E0.00302 F1135.376 
+G1 X107.755 Y79.827 E0.00460 F1423.376 
+G1 X107.603 Y79.719 E0.00619 F1711.376 
+G1 X107.412 Y79.584 E0.00779 F1999.376 
+G1 X107.182 Y79.421 E0.00939 F2287.376 
+G1 X106.913 Y79.231 E0.01096 F2566.376 
+G1 X106.610 Y79.017 E0.01236 F2791.376 
+G1 X106.282 Y78.785 E0.01336 F2926.376 
+G1 X105.943 Y78.545 E0.01386 F2971.376 
+G1 X102.528 Y76.130 E0.13927 F3000.000 
+G1 X102.223 Y75.915 E0.01243 F2991.992 
+G1 X101.931 Y75.708 E0.01193 F2946.992 
+G1 X101.662 Y75.518 E0.01096 F2811.992 
+G1 X101.424 Y75.350 E0.00969 F2598.992 
+G1 X101.220 Y75.205 E0.00832 F2352.992 
+G1 X101.049 Y75.085 E0.00696 F2106.992 
+G1 X100.912 Y74.988 E0.00559 F1860.992 
+G1 X100.809 Y74.914 E0.00423 F1614.992 
+G1 X100.738 Y74.865 E0.00286 F1368.992 
+G1 X100.699 Y74.837 E0.00159 F1122.992 
+G1 X100.684 Y74.826 E0.00062 F909.992 
+G1 X100.681 Y74.824 E0.00012 F774.992 
+G1 X100.682 Y74.821 E0.00012 F774.992 
+G1 X100.690 Y74.803 E0.00062 F909.992 
+G1 X100.708 Y74.759 E0.00159 F1122.992 
+G1 X100.741 Y74.680 E0.00286 F1368.992 
+G1 X100.789 Y74.562 E0.00423 F1614.992 
+G1 X100.854 Y74.407 E0.00559 F1860.992 
+G1 X100.934 Y74.214 E0.00696 F2106.992 
+G1 X101.029 Y73.983 E0.00832 F2352.992 
+G1 X101.141 Y73.714 E0.00969 F2598.992 
+G1 X101.267 Y73.410 E0.01096 F2811.992 
+G1 X101.404 Y73.079 E0.01193 F2946.992 
+G1 X101.547 Y72.734 E0.01243 F2991.992 
+G1 X102.679 Y70.000 E0.09854 F3000.000 
+G1 X105.858 Y65.858 E0.17386
+G1 X110.000 Y62.679 E0.17386
+G1 X112.734 Y61.547 E0.09854 
+G1 X113.079 Y61.404 E0.01243 F2991.992 
+G1 X113.410 Y61.267 E0.01193 F2946.992 
+G1 X113.714 Y61.141 E0.01096 F2811.992 
+G1 X113.983 Y61.029 E0.00969 F2598.992 
+G1 X114.214 Y60.934 E0.00832 F2352.992 
+G1 X114.407 Y60.854 E0.00696 F2106.992 
+G1 X114.562 Y60.789 E0.00559 F1860.992 
+G1 X114.680 Y60.741 E0.00423 F1614.992 
+G1 X114.759 Y60.708 E0.00286 F1368.992 
+G1 X114.803 Y60.690 E0.00159 F1122.992 
+G1 X114.821 Y60.682 E0.00062 F909.992 
+G1 X114.824 Y60.681 E0.00012 F774.992 
+G1 X114.826 Y60.684 E0.00012 F774.992 
+G1 X114.837 Y60.699 E0.00062 F909.992 
+G1 X114.865 Y60.738 E0.00159 F1122.992 
+G1 X114.914 Y60.809 E0.00286 F1368.992 
+G1 X114.988 Y60.912 E0.00423 F1614.992 
+G1 X115.085 Y61.049 E0.00559 F1860.992 
+G1 X115.205 Y61.220 E0.00696 F2106.992 
+G1 X115.350 Y61.424 E0.00832 F2352.992 
+G1 X115.518 Y61.662 E0.00969 F2598.992 
+G1 X115.708 Y61.931 E0.01096 F2811.992 
+G1 X115.915 Y62.223 E0.01193 F2946.992 
+G1 X116.130 Y62.528 E0.01243 F2991.992 
+G1 X118.545 Y65.943 E0.13927 F3000.000 
+G1 X118.785 Y66.282 E0.01386 F2971.376 
+G1 X119.017 Y66.610 E0.01336 F2926.376 
+G1 X119.231 Y66.913 E0.01236 F2791.376 
+G1 X119.421 Y67.182 E0.01096 F2566.376 
+G1 X119.584 Y67.412 E0.00939 F2287.376 
+G1 X119.719 Y67.603 E0.00779 F1999.376 
+G1 X119.827 Y67.755 E0.00619 F1711.376 
+G1 X119.906 Y67.868 E0.00460 F1423.376 
+G1 X119.959 Y67.942 E0.00302 F1135.376 
+G1 X119.987 Y67.982 E0.00162 F856.376 
+G1 X119.998 Y67.997 E0.00062 F631.376 
+G1 X120.000 Y68.000 E0.00012 F496.376 
+G1 X120.002 Y67.997 E0.00012 F496.376 
+G1 X120.013 Y67.982 E0.00062 F631.376 
+G1 X120.041 Y67.942 E0.00162 F856.376 
+G1 X120.094 Y67.868 E0.00302 F1135.376 
+G1 X120.173 Y67.755 E0.00460 F1423.376 
+G1 X120.281 Y67.603 E0.00619 F1711.376 
+G1 X120.416 Y67.412 E0.00779 F1999.376 
+G1 X120.579 Y67.182 E0.00939 F2287.376 
+G1 X120.769 Y66.913 E0.01096 F2566.376 
+G1 X120.983 Y66.610 E0.01236 F2791.376 
+G1 X121.215 Y66.282 E0.01336 F2926.376 
+G1 X121.455 Y65.943 E0.01386 F2971.376 
+G1 X123.870 Y62.528 E0.13927 F3000.000 
+G1 X124.085 Y62.223 E0.01243 F2991.992 
+G1 X124.292 Y61.931 E0.01193 F2946.992 
+G1 X124.482 Y61.662 E0.01096 F2811.992 
+G1 X124.650 Y61.424 E0.00969 F2598.992 
+G1 X124.795 Y61.220 E0.00832 F2352.992 
+G1 X124.915 Y61.049 E0.00696 F2106.992 
+G1 X125.012 Y60.912 E0.00559 F1860.992 
+G1 X125.086 Y60.809 E0.00423 F1614.992 
+G1 X125.135 Y60.738 E0.00286 F1368.992 
+G1 X125.163 Y60.699 E0.00159 F1122.992 
+G1 X125.174 Y60.684 E0.00062 F909.992 
+G1 X125.176 Y60.681 E0.00012 F774.992 
+G1 X125.179 Y60.682 E0.00012 F774.992 
+G1 X125.197 Y60.690 E0.00062 F909.992 
+G1 X125.241 Y60.708 E0.00159 F1122.992 
+G1 X125.320 Y60.741 E0.00286 F1368.992 
+G1 X125.438 Y60.789 E0.00423 F1614.992 
+G1 X125.593 Y60.854 E0.00559 F1860.992 
+G1 X125.786 Y60.934 E0.00696 F2106.992 
+G1 X126.017 Y61.029 E0.00832 F2352.992 
+G1 X126.286 Y61.141 E0.00969 F2598.992 
+G1 X126.590 Y61.267 E0.01096 F2811.992 
+G1 X126.921 Y61.404 E0.01193 F2946.992 
+G1 X127.266 Y61.547 E0.01243 F2991.992 
+G1 X130.000 Y62.679 E0.09854 F3000.000 
+G1 X134.142 Y65.858 E0.17386
+G1 X137.321 Y70.000 E0.17386
+G1 X138.453 Y72.734 E0.09854 
+G1 X138.596 Y73.079 E0.01243 F2991.992 
+G1 X138.733 Y73.410 E0.01193 F2946.992 
+G1 X138.859 Y73.714 E0.01096 F2811.992 
+G1 X138.971 Y73.983 E0.00969 F2598.992 
+G1 X139.066 Y74.214 E0.00832 F2352.992 
+G1 X139.146 Y74.407 E0.00696 F2106.992 
+G1 X139.211 Y74.562 E0.00559 F1860.992 
+G1 X139.259 Y74.680 E0.00423 F1614.992 
+G1 X139.292 Y74.759 E0.00286 F1368.992 
+G1 X139.310 Y74.803 E0.00159 F1122.992 
+G1 X139.318 Y74.821 E0.00062 F909.992 
+G1 X139.319 Y74.824 E0.00012 F774.992 
+G1 X139.316 Y74.826 E0.00012 F774.992 
+G1 X139.301 Y74.837 E0.00062 F909.992 
+G1 X139.262 Y74.865 E0.00159 F1122.992 
+G1 X139.191 Y74.914 E0.00286 F1368.992 
+G1 X139.088 Y74.988 E0.00423 F1614.992 
+G1 X138.951 Y75.085 E0.00559 F1860.992 
+G1 X138.780 Y75.205 E0.00696 F2106.992 
+G1 X138.576 Y75.350 E0.00832 F2352.992 
+G1 X138.338 Y75.518 E0.00969 F2598.992 
+G1 X138.069 Y75.708 E0.01096 F2811.992 
+G1 X137.777 Y75.915 E0.01193 F2946.992 
+G1 X137.472 Y76.130 E0.01243 F2991.992 
+G1 X132.808 Y79.428 E0.19022 F3000.000 
+G1 X132.462 Y79.673 E0.01411 F3000.000 
+G1 X132.447 Y79.684 E0.00062 F2459.578 
+G1 X132.260 Y79.816 E0.00762 F2459.578 
+G1 X132.202 Y79.857 E0.00237 F2459.578 
+G1 X132.135 Y79.905 E0.00275 F1874.578 
+G1 X132.058 Y79.959 E0.00312 F1874.578 
+G1 X132.018 Y79.987 E0.00162 F1874.578 
+G1 X132.015 Y79.989 E0.00012 F1874.578 
+G1 X132.003 Y79.998 E0.00050 F1919.062 
+G1 X132.000 Y80.000 E0.00012 F3000.000 
+G1 E-.8 F2100
+;TYPE:Inner wall
+;WIDTH:0.45
+G1 X131.996 Y80.000 F1379.578 
+G1 X131.865 Y80.000 F1379.578 
+G1 X131.771 Y80.000 F974.578 
+G1 X131.722 Y80.000 F659.578 
+G1 X131.704 Y80.000 F434.578 
+G1 X131.700 Y80.000 F299.578 
+G1 E0.80000 F299.578 
+G1 F299.578 
+G1 X131.703 Y80.002 E0.00012 F299.578 
+G1 X131.718 Y80.013 E0.00062 F434.578 
+G1 X131.758 Y80.041 E0.00162 F659.578 
+G1 X131.835 Y80.095 E0.00312 F974.578 
+G1 X131.960 Y80.184 E0.00512 F1379.578 
+G1 X132.147 Y80.316 E0.00762 F1874.578 
+G1 X132.407 Y80.500 E0.01061 F2459.578 
+G1 X132.753 Y80.745 E0.01411 F3134.578 
+G1 X133.191 Y81.055 E0.01786 F3809.578 
+G1 X133.715 Y81.425 E0.02135 F4394.578 
+G1 X134.312 Y81.847 E0.02435 F4889.578 
+G1 X134.508 Y81.986 E0.00799 F5294.578 
+G1 X134.970 Y82.313 E0.01886 F5294.578 
+G1 X135.186 Y82.466 E0.00882 F5609.578 
+G1 X135.677 Y82.813 E0.02002 F5604.883 
+G1 X135.828 Y82.920 E0.00616 F5604.883 
+G1 X136.421 Y83.339 E0.02418 F5289.883 
+G1 X136.953 Y83.715 E0.02169 F4884.883 
+G1 X137.190 Y83.883 E0.00965 F4401.883 
+G1 X137.417 Y84.044 E0.00930 F4401.883 
+G1 X137.812 Y84.323 E0.01608 F3885.883 
+G1 X137.970 Y84.435 E0.00646 F3369.883 
+G1 X138.136 Y84.552 E0.00676 F3369.883 
+G1 X138.390 Y84.731 E0.01036 F2853.883 
+G1 X138.576 Y84.863 E0.00758 F2337.883 
+G1 X138.701 Y84.952 E0.00512 F1854.883 
+G1 X138.778 Y85.006 E0.00312 F1449.883 
+G1 X138.818 Y85.034 E0.00162 F1134.883 
+G1 X138.833 Y85.045 E0.00062 F909.883 
+G1 X138.836 Y85.047 E0.00012 F774.883 
+G1 X138.835 Y85.050 E0.00012 F774.883 
+G1 X138.827 Y85.068 E0.00062 F909.883 
+G1 X138.809 Y85.113 E0.00162 F1134.883 
+G1 X138.773 Y85.199 E0.00312 F1449.883 
+G1 X138.714 Y85.341 E0.00512 F1854.883 
+G1 X138.627 Y85.552 E0.00758 F2337.883 
+G1 X138.508 Y85.839 E0.01036 F2853.883 
+G1 X138.356 Y86.206 E0.01322 F3369.883 
+G1 X138.171 Y86.652 E0.01608 F3885.883 
+G1 X137.953 Y87.178 E0.01895 F4401.883 
+G1 X137.703 Y87.780 E0.02172 F4884.883 
+G1 X137.425 Y88.451 E0.02418 F5289.883 
+G1 X137.246 Y88.884 E0.01559 F5604.883 
+G1 X137.148 Y89.121 E0.00855 F5604.883 
+G1 X137.124 Y89.178 E0.00204 F5593.891 
+G1 X137.065 Y89.322 E0.00519 F5593.891 
+G1 X136.998 Y89.482 E0.00579 F5335.891 
+G1 X136.948 Y89.603 E0.00436 F5077.891 
+G1 X136.914 Y89.685 E0.00293 F4819.891 
+G1 X136.896 Y89.729 E0.00161 F4561.891 
+G1 X136.888 Y89.747 E0.00062 F4342.891 
+G1 X136.887 Y89.750 E0.00012 F4207.891 
+G1 X136.885 Y89.753 E0.00012 F4207.891 
+G1 X136.873 Y89.768 E0.00062 F4342.891 
+G1 X136.844 Y89.806 E0.00161 F4561.891 
+G1 X136.790 Y89.876 E0.00293 F4819.891 
+G1 X136.758 Y89.918 E0.00176 F5077.891 
+G1 X136.711 Y89.980 E0.00260 F5077.891 
+G1 X136.605 Y90.118 E0.00579 F5335.891 
+G1 X136.473 Y90.290 E0.00723 F5593.891 
+G1 X136.316 Y90.494 E0.00855 F5812.891 
+G1 X136.234 Y90.601 E0.00451 F5947.891 
+G1 X136.142 Y90.721 E0.00502 F5947.891 
+G1 X135.959 Y90.960 E0.01003 F5992.891 
+G1 X135.701 Y91.297 E0.01412 F6000.000 
+G1 X134.717 Y92.579 E0.05382 F6000.000 
+G1 X134.534 Y92.818 E0.01003 F5980.898 
+G1 X134.360 Y93.045 E0.00953 F5935.898 
+G1 X134.203 Y93.249 E0.00855 F5800.898 
+G1 X134.071 Y93.421 E0.00723 F5581.898 
+G1 X133.965 Y93.559 E0.00579 F5323.898 
+G1 X133.886 Y93.663 E0.00436 F5065.898 
+G1 X133.832 Y93.733 E0.00293 F4807.898 
+G1 X133.803 Y93.771 E0.00161 F4549.898 
+G1 X133.791 Y93.786 E0.00062 F4330.898 
+G1 X133.789 Y93.789 E0.00012 F4195.898 
+G1 X133.786 Y93.791 E0.00012 F4195.898 
+G1 X133.771 Y93.803 E0.00062 F4330.898 
+G1 X133.733 Y93.832 E0.00161 F4549.898 
+G1 X133.663 Y93.886 E0.00293 F4807.898 
+G1 X133.559 Y93.965 E0.00436 F5065.898 
+G1 X133.421 Y94.071 E0.00579 F5323.898 
+G1 X133.249 Y94.203 E0.00723 F5581.898 
+G1 X133.045 Y94.360 E0.00855 F5800.898 
+G1 X132.818 Y94.534 E0.00953 F5935.898 
+G1 X132.579 Y94.717 E0.01003 F5980.898 
+G1 X130.960 Y95.959 E0.06794 F6000.000 
+G1 X130.721 Y96.142 E0.01003 F5992.891 
+G1 X130.494 Y96.316 E0.00953 F5947.891 
+G1 X130.290 Y96.473 E0.00855 F5812.891 
+G1 X130.118 Y96.605 E0.00723 F5593.891 
+G1 X129.980 Y96.711 E0.00579 F5335.891 
+G1 X129.876 Y96.790 E0.00436 F5077.891 
+G1 X129.806 Y96.844 E0.00293 F4819.891 
+G1 X129.768 Y96.873 E0.00161 F4561.891 
+G1 X129.753 Y96.885 E0.00062 F4342.891 
+G1 X129.750 Y96.887 E0.00012 F4207.891 
+G1 X129.747 Y96.888 E0.00012 F4207.891 
+G1 X129.729 Y96.896 E0.00062 F4342.891 
+G1 X129.685 Y96.914 E0.00161 F4561.891 
+G1 X129.603 Y96.948 E0.00293 F4819.891 
+G1 X129.482 Y96.998 E0.00436 F5077.891 
+G1 X129.322 Y97.065 E0.00579 F5335.891 
+G1 X129.178 Y97.124 E0.00519 F5593.891 
+G1 X129.121 Y97.148 E0.00204 F5593.891 
+G1 X128.884 Y97.246 E0.00855 F5604.883 
+G1 X128.619 Y97.356 E0.00953 F5604.883 
+G1 X128.451 Y97.425 E0.00606 F5604.883 
+G1 X128.341 Y97.471 E0.00397 F5289.883 
+G1 X127.780 Y97.703 E0.02021 F5289.883 
+G1 X127.178 Y97.953 E0.02172 F4884.883 
+G1 X126.652 Y98.171 E0.01895 F4401.883 
+G1 X126.206 Y98.356 E0.01608 F3885.883 
+G1 X125.839 Y98.508 E0.01322 F3369.883 
+G1 X125.552 Y98.627 E0.01036 F2853.883 
+G1 X125.341 Y98.714 E0.00758 F2337.883 
+G1 X125.199 Y98.773 E0.00512 F1854.883 
+G1 X125.113 Y98.809 E0.00312 F1449.883 
+G1 X125.068 Y98.827 E0.00162 F1134.883 
+G1 X125.050 Y98.835 E0.00062 F909.883 
+G1 X125.047 Y98.836 E0.00012 F774.883 
+G1 X125.045 Y98.833 E0.00012 F774.883 
+G1 X125.034 Y98.818 E0.00062 F909.883 
+G1 X125.006 Y98.778 E0.00162 F1134.883 
+G1 X124.952 Y98.701 E0.00312 F1449.883 
+G1 X124.863 Y98.576 E0.00512 F1854.883 
+G1 X124.731 Y98.390 E0.00758 F2337.883 
+G1 X124.552 Y98.136 E0.01036 F2853.883 
+G1 X124.323 Y97.812 E0.01322 F3369.883 
+G1 X124.044 Y97.417 E0.01608 F3885.883 
+G1 X123.715 Y96.953 E0.01895 F4401.883 
+G1 X123.339 Y96.420 E0.02172 F4884.883 
+G1 X123.193 Y96.215 E0.00836 F5289.883 
+G1 X122.919 Y95.827 E0.01582 F5289.883 
+G1 X122.692 Y95.506 E0.01312 F5604.883 
+G1 X122.465 Y95.186 E0.01306 F5554.405 
+G1 X122.216 Y94.833 E0.01439 F5554.405 
+G1 X121.985 Y94.507 E0.01329 F5239.405 
+G1 X121.774 Y94.209 E0.01216 F5239.405 
+G1 X121.488 Y93.804 E0.01652 F4834.405 
+G1 X121.376 Y93.646 E0.00643 F4834.405 
+G1 X121.029 Y93.155 E0.02003 F4339.405 
+G1 X120.982 Y93.088 E0.00272 F3781.405 
+G1 X120.736 Y92.741 E0.01417 F3781.405 
+G1 X120.499 Y92.405 E0.01369 F3205.405 
+G1 X120.316 Y92.147 E0.01054 F2629.405 
+G1 X120.184 Y91.960 E0.00762 F2071.405 
+G1 X120.095 Y91.835 E0.00512 F1576.405 
+G1 X120.041 Y91.758 E0.00312 F1171.405 
+G1 X120.013 Y91.718 E0.00162 F856.405 
+G1 X120.002 Y91.703 E0.00062 F631.405 
+G1 X120.000 Y91.700 E0.00012 F496.405 
+G1 X119.998 Y91.703 E0.00012 F496.405 
+G1 X119.987 Y91.718 E0.00062 F631.405 
+G1 X119.959 Y91.758 E0.00162 F856.405 
+G1 X119.905 Y91.835 E0.00312 F1171.405 
+G1 X119.816 Y91.960 E0.00512 F1576.405 
+G1 X119.684 Y92.147 E0.00762 F2071.405 
+G1 X119.501 Y92.405 E0.01054 F2629.405 
+G1 X119.264 Y92.741 E0.01369 F3205.405 
+G1 X118.971 Y93.155 E0.01688 F3781.405 
+G1 X118.624 Y93.646 E0.02003 F4339.405 
+G1 X118.226 Y94.209 E0.02295 F4834.405 
+G1 X117.784 Y94.833 E0.02545 F5239.405 
+G1 X117.535 Y95.186 E0.01439 F5554.405 
+G1 X117.308 Y95.506 E0.01306 F5554.405 
+G1 X117.081 Y95.827 E0.01312 F5604.883 
+G1 X116.807 Y96.215 E0.01582 F5289.883 
+G1 X116.661 Y96.420 E0.00836 F5289.883 
+G1 X116.287 Y96.949 E0.02158 F4884.883 
+G1 X116.285 Y96.953 E0.00014 F4884.883 
+G1 X115.956 Y97.417 E0.01895 F4401.883 
+G1 X115.759 Y97.696 E0.01136 F3885.883 
+G1 X115.677 Y97.812 E0.00473 F3885.883 
+G1 X115.448 Y98.136 E0.01322 F3369.883 
+G1 X115.269 Y98.390 E0.01036 F2853.883 
+G1 X115.137 Y98.576 E0.00758 F2337.883 
+G1 X115.048 Y98.701 E0.00512 F1854.883 
+G1 X114.994 Y98.778 E0.00312 F1449.883 
+G1 X114.966 Y98.818 E0.00162 F1134.883 
+G1 X114.955 Y98.833 E0.00062 F909.883 
+G1 X114.953 Y98.836 E0.00012 F774.883 
+G1 X114.950 Y98.835 E0.00012 F774.883 
+G1 X114.932 Y98.827 E0.00062 F909.883 
+G1 X114.887 Y98.809 E0.00162 F1134.883 
+G1 X114.801 Y98.773 E0.00312 F1449.883 
+G1 X114.659 Y98.714 E0.00512 F1854.883 
+G1 X114.448 Y98.627 E0.00758 F2337.883 
+G1 X114.161 Y98.508 E0.01036 F2853.883 
+G1 X113.794 Y98.356 E0.01322 F3369.883 
+G1 X113.348 Y98.171 E0.01608 F3885.883 
+G1 X112.822 Y97.953 E0.01895 F4401.883 
+G1 X112.220 Y97.703 E0.02172 F4884.883 
+G1 X111.549 Y97.425 E0.02418 F5289.883 
+G1 X111.116 Y97.246 E0.01559 F5604.883 
+G1 X110.879 Y97.148 E0.00855 F5604.883 
+G1 X110.822 Y97.124 E0.00204 F5593.891 
+G1 X110.678 Y97.065 E0.00519 F5593.891 
+G1 X110.518 Y96.998 E0.00579 F5335.891 
+G1 X110.397 Y96.948 E0.00436 F5077.891 
+G1 X110.315 Y96.914 E0.00293 F4819.891 
+G1 X110.271 Y96.896 E0.00161 F4561.891 
+G1 X110.253 Y96.888 E0.00062 F4342.891 
+G1 X110.250 Y96.887 E0.00012 F4207.891 
+G1 X110.247 Y96.885 E0.00012 F4207.891 
+G1 X110.232 Y96.873 E0.00062 F4342.891 
+G1 X110.194 Y96.844 E0.00161 F4561.891 
+G1 X110.124 Y96.790 E0.00293 F4819.891 
+G1 X110.082 Y96.758 E0.00176 F5077.891 
+G1 X110.020 Y96.711 E0.00260 F5077.891 
+G1 X109.882 Y96.605 E0.00579 F5335.891 
+G1 X109.710 Y96.473 E0.00723 F5593.891 
+G1 X109.506 Y96.316 E0.00855 F5812.891 
+G1 X109.399 Y96.234 E0.00451 F5947.891 
+G1 X109.279 Y96.142 E0.00502 F5947.891 
+G1 X109.040 Y95.959 E0.01003 F5992.891 
+G1 X108.703 Y95.701 E0.01412 F6000.000 
+G1 X107.421 Y94.717 E0.05382 F6000.000 
+G1 X107.182 Y94.534 E0.01003 F5980.898 
+G1 X106.955 Y94.360 E0.00953 F5935.898 
+G1 X106.751 Y94.203 E0.00855 F5800.898 
+G1 X106.579 Y94.071 E0.00723 F5581.898 
+G1 X106.441 Y93.965 E0.00579 F5323.898 
+G1 X106.337 Y93.886 E0.00436 F5065.898 
+G1 X106.267 Y93.832 E0.00293 F4807.898 
+G1 X106.229 Y93.803 E0.00161 F4549.898 
+G1 X106.214 Y93.791 E0.00062 F4330.898 
+G1 X106.211 Y93.789 E0.00012 F4195.898 
+G1 X106.209 Y93.786 E0.00012 F4195.898 
+G1 X106.197 Y93.771 E0.00062 F4330.898 
+G1 X106.168 Y93.733 E0.00161 F4549.898 
+G1 X106.114 Y93.663 E0.00293 F4807.898 
+G1 X106.035 Y93.559 E0.00436 F5065.898 
+G1 X105.929 Y93.421 E0.00579 F5323.898 
+G1 X105.797 Y93.249 E0.00723 F5581.898 
+G1 X105.640 Y93.045 E0.00855 F5800.898 
+G1 X105.466 Y92.818 E0.00953 F5935.898 
+G1 X105.283 Y92.579 E0.01003 F5980.898 
+G1 X104.041 Y90.960 E0.06794 F6000.000 
+G1 X103.858 Y90.721 E0.01003 F5992.891 
+G1 X103.684 Y90.494 E0.00953 F5947.891 
+G1 X103.527 Y90.290 E0.00855 F5812.891 
+G1 X103.395 Y90.118 E0.00723 F5593.891 
+G1 X103.289 Y89.980 E0.00579 F5335.891 
+G1 X103.210 Y89.876 E0.00436 F5077.891 
+G1 X103.156 Y89.806 E0.00293 F4819.891 
+G1 X103.127 Y89.768 E0.00161 F4561.891 
+G1 X103.115 Y89.753 E0.00062 F4342.891 
+G1 X103.113 Y89.750 E0.00012 F4207.891 
+G1 X103.112 Y89.747 E0.00012 F4207.891 
+G1 X103.104 Y89.729 E0.00062 F4342.891 
+G1 X103.086 Y89.685 E0.00161 F4561.891 
+G1 X103.052 Y89.603 E0.00293 F4819.891 
+G1 X103.002 Y89.482 E0.00436 F5077.891 
+G1 X102.935 Y89.322 E0.00579 F5335.891 
+G1 X102.876 Y89.178 E0.00519 F5593.891 
+G1 X102.852 Y89.121 E0.00204 F5593.891 
+G1 X102.754 Y88.884 E0.00855 F5604.883 
+G1 X102.644 Y88.619 E0.00953 F5604.883 
+G1 X102.575 Y88.451 E0.00606 F5604.883 
+G1 X102.529 Y88.341 E0.00397 F5289.883 
+G1 X102.297 Y87.780 E0.02021 F5289.883 
+G1 X102.047 Y87.178 E0.02172 F4884.883 
+G1 X101.829 Y86.652 E0.01895 F4401.883 
+G1 X101.644 Y86.206 E0.01608 F3885.883 
+G1 X101.492 Y85.839 E0.01322 F3369.883 
+G1 X101.373 Y85.552 E0.01036 F2853.883 
+G1 X101.286 Y85.341 E0.00758 F2337.883 
+G1 X101.227 Y85.199 E0.00512 F1854.883 
+G1 X101.191 Y85.113 E0.00312 F1449.883 
+G1 X101.173 Y85.068 E0.00162 F1134.883 
+G1 X101.165 Y85.050 E0.00062 F909.883 
+G1 X101.164 Y85.047 E0.00012 F774.883 
+G1 X101.167 Y85.045 E0.00012 F774.883 
+G1 X101.182 Y85.034 E0.00062 F909.883 
+G1 X101.222 Y85.006 E0.00162 F1134.883 
+G1 X101.299 Y84.952 E0.00312 F1449.883 
+G1 X101.424 Y84.863 E0.00512 F1854.883 
+G1 X101.610 Y84.731 E0.00758 F2337.883 
+G1 X101.864 Y84.552 E0.01036 F2853.883 
+G1 X102.188 Y84.323 E0.01322 F3369.883 
+G1 X102.583 Y84.044 E0.01608 F3885.883 
+G1 X103.047 Y83.715 E0.01895 F4401.883 
+G1 X103.580 Y83.339 E0.02172 F4884.883 
+G1 X103.785 Y83.193 E0.00836 F5289.883 
+G1 X104.173 Y82.919 E0.01582 F5289.883 
+G1 X104.494 Y82.692 E0.01312 F5604.883 
+G1 X104.814 Y82.465 E0.01306 F5554.405 
+G1 X105.167 Y82.216 E0.01439 F5554.405 
+G1 X105.493 Y81.985 E0.01329 F5239.405 
+G1 X105.791 Y81.774 E0.01216 F5239.405 
+G1 X106.196 Y81.488 E0.01652 F4834.405 
+G1 X106.354 Y81.376 E0.00643 F4834.405 
+G1 X106.845 Y81.029 E0.02003 F4339.405 
+G1 X106.912 Y80.982 E0.00272 F3781.405 
+G1 X107.259 Y80.736 E0.01417 F3781.405 
+G1 X107.595 Y80.499 E0.01369 F3205.405 
+G1 X107.853 Y80.316 E0.01054 F2629.405 
+G1 X108.040 Y80.184 E0.00762 F2071.405 
+G1 X108.165 Y80.095 E0.00512 F1576.405 
+G1 X108.242 Y80.041 E0.00312 F1171.405 
+G1 X108.282 Y80.013 E0.00162 F856.405 
+G1 X108.297 Y80.002 E0.00062 F631.405 
+G1 X108.300 Y80.000 E0.00012 F496.405 
+G1 X108.297 Y79.998 E0.00012 F496.405 
+G1 X108.282 Y79.987 E0.00062 F631.405 
+G1 X108.242 Y79.959 E0.00162 F856.405 
+G1 X108.165 Y79.905 E0.00312 F1171.405 
+G1 X108.040 Y79.816 E0.00512 F1576.405 
+G1 X107.853 Y79.684 E0.00762 F2071.405 
+G1 X107.595 Y79.501 E0.01054 F2629.405 
+G1 X107.259 Y79.264 E0.01369 F3205.405 
+G1 X106.845 Y78.971 E0.01688 F3781.405 
+G1 X106.354 Y78.624 E0.02003 F4339.405 
+G1 X105.791 Y78.226 E0.02295 F4834.405 
+G1 X105.167 Y77.784 E0.02545 F5239.405 
+G1 X104.814 Y77.535 E0.01439 F5554.405 
+G1 X104.494 Y77.308 E0.01306 F5554.405 
+G1 X104.173 Y77.081 E0.01312 F5604.883 
+G1 X103.785 Y76.807 E0.01582 F5289.883 
+G1 X103.580 Y76.661 E0.00836 F5289.883 
+G1 X103.051 Y76.287 E0.02158 F4884.883 
+G1 X103.047 Y76.285 E0.00014 F4884.883 
+G1 X102.583 Y75.956 E0.01895 F4401.883 
+G1 X102.304 Y75.759 E0.01136 F3885.883 
+G1 X102.188 Y75.677 E0.00473 F3885.883 
+G1 X101.864 Y75.448 E0.01322 F3369.883 
+G1 X101.610 Y75.269 E0.01036 F2853.883 
+G1 X101.424 Y75.137 E0.00758 F2337.883 
+G1 X101.299 Y75.048 E0.00512 F1854.883 
+G1 X101.222 Y74.994 E0.00312 F1449.883 
+G1 X101.182 Y74.966 E0.00162 F1134.883 
+G1 X101.167 Y74.955 E0.00062 F909.883 
+G1 X101.164 Y74.953 E0.00012 F774.883 
+G1 X101.165 Y74.950 E0.00012 F774.883 
+G1 X101.173 Y74.932 E0.00062 F909.883 
+G1 X101.191 Y74.887 E0.00162 F1134.883 
+G1 X101.227 Y74.801 E0.00312 F1449.883 
+G1 X101.286 Y74.659 E0.00512 F1854.883 
+G1 X101.373 Y74.448 E0.00758 F2337.883 
+G1 X101.492 Y74.161 E0.01036 F2853.883 
+G1 X101.644 Y73.794 E0.01322 F3369.883 
+G1 X101.829 Y73.348 E0.01608 F3885.883 
+G1 X102.047 Y72.822 E0.01895 F4401.883 
+G1 X102.297 Y72.220 E0.02172 F4884.883 
+G1 X102.575 Y71.549 E0.02418 F5289.883 
+G1 X102.754 Y71.116 E0.01559 F5604.883 
+G1 X102.852 Y70.879 E0.00855 F5604.883 
+G1 X102.876 Y70.822 E0.00204 F5593.891 
+G1 X102.935 Y70.678 E0.00519 F5593.891 
+G1 X103.002 Y70.518 E0.00579 F5335.891 
+G1 X103.052 Y70.397 E0.00436 F5077.891 
+G1 X103.086 Y70.315 E0.00293 F4819.891 
+G1 X103.104 Y70.271 E0.00161 F4561.891 
+G1 X103.112 Y70.253 E0.00062 F4342.891 
+G1 X103.113 Y70.250 E0.00012 F4207.891 
+G1 X103.115 Y70.247 E0.00012 F4207.891 
+G1 X103.127 Y70.232 E0.00062 F4342.891 
+G1 X103.156 Y70.194 E0.00161 F4561.891 
+G1 X103.210 Y70.124 E0.00293 F4819.891 
+G1 X103.242 Y70.082 E0.00176 F5077.891 
+G1 X103.289 Y70.020 E0.00260 F5077.891 
+G1 X103.395 Y69.882 E0.00579 F5335.891 
+G1 X103.527 Y69.710 E0.00723 F5593.891 
+G1 X103.684 Y69.506 E0.00855 F5812.891 
+G1 X103.766 Y69.399 E0.00451 F5947.891 
+G1 X103.858 Y69.279 E0.00502 F5947.891 
+G1 X104.041 Y69.040 E0.01003 F5992.891 
+G1 X104.299 Y68.703 E0.01412 F6000.000 
+G1 X105.283 Y67.421 E0.05382 F6000.000 
+G1 X105.466 Y67.182 E0.01003 F5980.898 
+G1 X105.640 Y66.955 E0.00953 F5935.898 
+G1 X105.797 Y66.751 E0.00855 F5800.898 
+G1 X105.929 Y66.579 E0.00723 F5581.898 
+G1 X106.035 Y66.441 E0.00579 F5323.898 
+G1 X106.114 Y66.337 E0.00436 F5065.898 
+G1 X106.168 Y66.267 E0.00293 F4807.898 
+G1 X106.197 Y66.229 E0.00161 F4549.898 
+G1 X106.209 Y66.214 E0.00062 F4330.898 
+G1 X106.211 Y66.211 E0.00012 F4195.898 
+G1 X106.214 Y66.209 E0.00012 F4195.898 
+G1 X106.229 Y66.197 E0.00062 F4330.898 
+G1 X106.267 Y66.168 E0.00161 F4549.898 
+G1 X106.337 Y66.114 E0.00293 F4807.898 
+G1 X106.441 Y66.035 E0.00436 F5065.898 
+G1 X106.579 Y65.929 E0.00579 F5323.898 
+G1 X106.751 Y65.797 E0.00723 F5581.898 
+G1 X106.955 Y65.640 E0.00855 F5800.898 
+G1 X107.182 Y65.466 E0.00953 F5935.898 
+G1 X107.421 Y65.283 E0.01003 F5980.898 
+G1 X109.040 Y64.041 E0.06794 F6000.000 
+G1 X109.279 Y63.858 E0.01003 F5992.891 
+G1 X109.506 Y63.684 E0.00953 F5947.891 
+G1 X109.710 Y63.527 E0.00855 F5812.891 
+G1 X109.882 Y63.395 E0.00723 F5593.891 
+G1 X110.020 Y63.289 E0.00579 F5335.891 
+G1 X110.124 Y63.210 E0.00436 F5077.891 
+G1 X110.194 Y63.156 E0.00293 F4819.891 
+G1 X110.232 Y63.127 E0.00161 F4561.891 
+G1 X110.247 Y63.115 E0.00062 F4342.891 
+G1 X110.250 Y63.113 E0.00012 F4207.891 
+G1 X110.253 Y63.112 E0.00012 F4207.891 
+G1 X110.271 Y63.104 E0.00062 F4342.891 
+G1 X110.315 Y63.086 E0.00161 F4561.891 
+G1 X110.397 Y63.052 E0.00293 F4819.891 
+G1 X110.518 Y63.002 E0.00436 F5077.891 
+G1 X110.678 Y62.935 E0.00579 F5335.891 
+G1 X110.822 Y62.876 E0.00519 F5593.891 
+G1 X110.879 Y62.852 E0.00204 F5593.891 
+G1 X111.116 Y62.754 E0.00855 F5604.883 
+G1 X111.381 Y62.644 E0.00953 F5604.883 
+G1 X111.549 Y62.575 E0.00606 F5604.883 
+G1 X111.659 Y62.529 E0.00397 F5289.883 
+G1 X112.220 Y62.297 E0.02021 F5289.883 
+G1 X112.822 Y62.047 E0.02172 F4884.883 
+G1 X113.348 Y61.829 E0.01895 F4401.883 
+G1 X113.794 Y61.644 E0.01608 F3885.883 
+G1 X114.161 Y61.492 E0.01322 F3369.883 
+G1 X114.448 Y61.373 E0.01036 F2853.883 
+G1 X114.659 Y61.286 E0.00758 F2337.883 
+G1 X114.801 Y61.227 E0.00512 F1854.883 
+G1 X114.887 Y61.191 E0.00312 F1449.883 
+G1 X114.932 Y61.173 E0.00162 F1134.883 
+G1 X114.950 Y61.165 E0.00062 F909.883 
+G1 X114.953 Y61.164 E0.00012 F774.883 
+G1 X114.955 Y61.167 E0.00012 F774.883 
+G1 X114.966 Y61.182 E0.00062 F909.883 
+G1 X114.994 Y61.222 E0.00162 F1134.883 
+G1 X115.048 Y61.299 E0.00312 F1449.883 
+G1 X115.137 Y61.424 E0.00512 F1854.883 
+G1 X115.269 Y61.610 E0.00758 F2337.883 
+G1 X115.448 Y61.864 E0.01036 F2853.883 
+G1 X115.677 Y62.188 E0.01322 F3369.883 
+G1 X115.956 Y62.583 E0.01608 F3885.883 
+G1 X116.285 Y63.047 E0.01895 F4401.883 
+G1 X116.661 Y63.580 E0.02172 F4884.883 
+G1 X116.807 Y63.785 E0.00836 F5289.883 
+G1 X117.081 Y64.173 E0.01582 F5289.883 
+G1 X117.308 Y64.494 E0.01312 F5604.883 
+G1 X117.535 Y64.814 E0.01306 F5554.405 
+G1 X117.784 Y65.167 E0.01439 F5554.405 
+G1 X118.015 Y65.493 E0.01329 F5239.405 
+G1 X118.226 Y65.791 E0.01216 F5239.405 
+G1 X118.512 Y66.196 E0.01652 F4834.405 
+G1 X118.624 Y66.354 E0.00643 F4834.405 
+G1 X118.971 Y66.845 E0.02003 F4339.405 
+G1 X119.018 Y66.912 E0.00272 F3781.405 
+G1 X119.264 Y67.259 E0.01417 F3781.405 
+G1 X119.501 Y67.595 E0.01369 F3205.405 
+G1 X119.684 Y67.853 E0.01054 F2629.405 
+G1 X119.816 Y68.040 E0.00762 F2071.405 
+G1 X119.905 Y68.165 E0.00512 F1576.405 
+G1 X119.959 Y68.242 E0.00312 F1171.405 
+G1 X119.987 Y68.282 E0.00162 F856.405 
+G1 X119.998 Y68.297 E0.00062 F631.405 
+G1 X120.000 Y68.300 E0.00012 F496.405 
+G1 X120.002 Y68.297 E0.00012 F496.405 
+G1 X120.013 Y68.282 E0.00062 F631.405 
+G1 X120.041 Y68.242 E0.00162 F856.405 
+G1 X120.095 Y68.165 E0.00312 F1171.405 
+G1 X120.184 Y68.040 E0.00512 F1576.405 
+G1 X120.316 Y67.853 E0.00762 F2071.405 
+G1 X120.499 Y67.595 E0.01054 F2629.405 
+G1 X120.736 Y67.259 E0.01369 F3205.405 
+G1 X121.029 Y66.845 E0.01688 F3781.405 
+G1 X121.376 Y66.354 E0.02003 F4339.405 
+G1 X121.774 Y65.791 E0.02295 F4834.405 
+G1 X122.216 Y65.167 E0.02545 F5239.405 
+G1 X122.465 Y64.814 E0.01439 F5554.405 
+G1 X122.692 Y64.494 E0.01306 F5554.405 
+G1 X122.919 Y64.173 E0.01312 F5604.883 
+G1 X123.193 Y63.785 E0.01582 F5289.883 
+G1 X123.339 Y63.580 E0.00836 F5289.883 
+G1 X123.713 Y63.051 E0.02158 F4884.883 
+G1 X123.715 Y63.047 E0.00014 F4884.883 
+G1 X124.044 Y62.583 E0.01895 F4401.883 
+G1 X124.241 Y62.304 E0.01136 F3885.883 
+G1 X124.323 Y62.188 E0.00473 F3885.883 
+G1 X124.552 Y61.864 E0.01322 F3369.883 
+G1 X124.731 Y61.610 E0.01036 F2853.883 
+G1 X124.863 Y61.424 E0.00758 F2337.883 
+G1 X124.952 Y61.299 E0.00512 F1854.883 
+G1 X125.006 Y61.222 E0.00312 F1449.883 
+G1 X125.034 Y61.182 E0.00162 F1134.883 
+G1 X125.045 Y61.167 E0.00062 F909.883 
+G1 X125.047 Y61.164 E0.00012 F774.883 
+G1 X125.050 Y61.165 E0.00012 F774.883 
+G1 X125.068 Y61.173 E0.00062 F909.883 
+G1 X125.113 Y61.191 E0.00162 F1134.883 
+G1 X125.199 Y61.227 E0.00312 F1449.883 
+G1 X125.341 Y61.286 E0.00512 F1854.883 
+G1 X125.552 Y61.373 E0.00758 F2337.883 
+G1 X125.839 Y61.492 E0.01036 F2853.883 
+G1 X126.206 Y61.644 E0.01322 F3369.883 
+G1 X126.652 Y61.829 E0.01608 F3885.883 
+G1 X127.178 Y62.047 E0.01895 F4401.883 
+G1 X127.780 Y62.297 E0.02172 F4884.883 
+G1 X128.451 Y62.575 E0.02418 F5289.883 
+G1 X128.884 Y62.754 E0.01559 F5604.883 
+G1 X129.121 Y62.852 E0.00855 F5604.883 
+G1 X129.178 Y62.876 E0.00204 F5593.891 
+G1 X129.322 Y62.935 E0.00519 F5593.891 
+G1 X129.482 Y63.002 E0.00579 F5335.891 
+G1 X129.603 Y63.052 E0.00436 F5077.891 
+G1 X129.685 Y63.086 E0.00293 F4819.891 
+G1 X129.729 Y63.104 E0.00161 F4561.891 
+G1 X129.747 Y63.112 E0.00062 F4342.891 
+G1 X129.750 Y63.113 E0.00012 F4207.891 
+G1 X129.753 Y63.115 E0.00012 F4207.891 
+G1 X129.768 Y63.127 E0.00062 F4342.891 
+G1 X129.806 Y63.156 E0.00161 F4561.891 
+G1 X129.876 Y63.210 E0.00293 F4819.891 
+G1 X129.918 Y63.242 E0.00176 F5077.891 
+G1 X129.980 Y63.289 E0.00260 F5077.891 
+G1 X130.118 Y63.395 E0.00579 F5335.891 
+G1 X130.290 Y63.527 E0.00723 F5593.891 
+G1 X130.494 Y63.684 E0.00855 F5812.891 
+G1 X130.601 Y63.766 E0.00451 F5947.891 
+G1 X130.721 Y63.858 E0.00502 F5947.891 
+G1 X130.960 Y64.041 E0.01003 F5992.891 
+G1 X131.297 Y64.299 E0.01412 F6000.000 
+G1 X132.579 Y65.283 E0.05382 F6000.000 
+G1 X132.818 Y65.466 E0.01003 F5980.898 
+G1 X133.045 Y65.640 E0.00953 F5935.898 
+G1 X133.249 Y65.797 E0.00855 F5800.898 
+G1 X133.421 Y65.929 E0.00723 F5581.898 
+G1 X133.559 Y66.035 E0.00579 F5323.898 
+G1 X133.663 Y66.114 E0.00436 F5065.898 
+G1 X133.733 Y66.168 E0.00293 F4807.898 
+G1 X133.771 Y66.197 E0.00161 F4549.898 
+G1 X133.786 Y66.209 E0.00062 F4330.898 
+G1 X133.789 Y66.211 E0.00012 F4195.898 
+G1 X133.791 Y66.214 E0.00012 F4195.898 
+G1 X133.803 Y66.229 E0.00062 F4330.898 
+G1 X133.832 Y66.267 E0.00161 F4549.898 
+G1 X133.886 Y66.337 E0.00293 F4807.898 
+G1 X133.965 Y66.441 E0.00436 F5065.898 
+G1 X134.071 Y66.579 E0.00579 F5323.898 
+G1 X134.203 Y66.751 E0.00723 F5581.898 
+G1 X134.360 Y66.955 E0.00855 F5800.898 
+G1 X134.534 Y67.182 E0.00953 F5935.898 
+G1 X134.717 Y67.421 E0.01003 F5980.898 
+G1 X135.959 Y69.040 E0.06794 F6000.000 
+G1 X136.142 Y69.279 E0.01003 F5992.891 
+G1 X136.316 Y69.506 E0.00953 F5947.891 
+G1 X136.473 Y69.710 E0.00855 F5812.891 
+G1 X136.605 Y69.882 E0.00723 F5593.891 
+G1 X136.711 Y70.020 E0.00579 F5335.891 
+G1 X136.790 Y70.124 E0.00436 F5077.891 
+G1 X136.844 Y70.194 E0.00293 F4819.891 
+G1 X136.873 Y70.232 E0.00161 F4561.891 
+G1 X136.885 Y70.247 E0.00062 F4342.891 
+G1 X136.887 Y70.250 E0.00012 F4207.891 
+G1 X136.888 Y70.253 E0.00012 F4207.891 
+G1 X136.896 Y70.271 E0.00062 F4342.891 
+G1 X136.914 Y70.315 E0.00161 F4561.891 
+G1 X136.948 Y70.397 E0.00293 F4819.891 
+G1 X136.998 Y70.518 E0.00436 F5077.891 
+G1 X137.065 Y70.678 E0.00579 F5335.891 
+G1 X137.124 Y70.822 E0.00519 F5593.891 
+G1 X137.148 Y70.879 E0.00204 F5593.891 
+G1 X137.246 Y71.116 E0.00855 F5604.883 
+G1 X137.356 Y71.381 E0.00953 F5604.883 
+G1 X137.425 Y71.549 E0.00606 F5604.883 
+G1 X137.471 Y71.659 E0.00397 F5289.883 
+G1 X137.703 Y72.220 E0.02021 F5289.883 
+G1 X137.953 Y72.822 E0.02172 F4884.883 
+G1 X138.171 Y73.348 E0.01895 F4401.883 
+G1 X138.356 Y73.794 E0.01608 F3885.883 
+G1 X138.508 Y74.161 E0.01322 F3369.883 
+G1 X138.627 Y74.448 E0.01036 F2853.883 
+G1 X138.714 Y74.659 E0.00758 F2337.883 
+G1 X138.773 Y74.801 E0.00512 F1854.883 
+G1 X138.809 Y74.887 E0.00312 F1449.883 
+G1 X138.827 Y74.932 E0.00162 F1134.883 
+G1 X138.835 Y74.950 E0.00062 F909.883 
+G1 X138.836 Y74.953 E0.00012 F774.883 
+G1 X138.833 Y74.955 E0.00012 F774.883 
+G1 X138.818 Y74.966 E0.00062 F909.883 
+G1 X138.778 Y74.994 E0.00162 F1134.883 
+G1 X138.701 Y75.048 E0.00312 F1449.883 
+G1 X138.576 Y75.137 E0.00512 F1854.883 
+G1 X138.390 Y75.269 E0.00758 F2337.883 
+G1 X138.136 Y75.448 E0.01036 F2853.883 
+G1 X137.812 Y75.677 E0.01322 F3369.883 
+G1 X137.417 Y75.956 E0.01608 F3885.883 
+G1 X136.953 Y76.285 E0.01895 F4401.883 
+G1 X136.420 Y76.661 E0.02172 F4884.883 
+G1 X135.827 Y77.081 E0.02418 F5289.883 
+G1 X135.186 Y77.535 E0.02618 F5604.883 
+G1 X134.507 Y78.015 E0.02768 F5829.883 
+G1 X133.804 Y78.512 E0.02868 F5964.883 
+G1 X133.088 Y79.018 E0.02918 F6009.883 
+G1 X131.700 Y80.000 E0.05662 F6000.000 
+G1 E-.8 F2100
+;TYPE:Sparse infill
+;WIDTH:0.45
+G1 X110.000 Y70.000 F12000
+G1 E.8 F2100
+G1 F9000
+G1 X110.000 Y70.000 E0.66600
+G1 Y71.700 E0.05661
+G1 X130.000 Y71.700 E0.66600
+G1 Y73.400 E0.05661
+G1 X110.000 Y73.400 E0.66600
+G1 Y75.100 E0.05661
+G1 X130.000 Y75.100 E0.66600
+G1 Y76.800 E0.05661
+G1 X110.000 Y76.800 E0.66600
+G1 Y78.500 E0.05661
+G1 X130.000 Y78.500 E0.66600
+G1 Y80.200 E0.05661
+G1 X110.000 Y80.200 E0.66600
+G1 Y81.900 E0.05661
+G1 X130.000 Y81.900 E0.66600
+G1 Y83.600 E0.05661
+G1 X110.000 Y83.600 E0.66600
+G1 Y85.300 E0.05661
+G1 X130.000 Y85.300 E0.66600
+G1 Y87.000 E0.05661
+G1 X110.000 Y87.000 E0.66600
+G1 Y88.700 E0.05661
+G1 X130.000 Y88.700 E0.66600
+G1 Y90.400 E0.05661
+; some comment
+
+G1 E-.8 F2100
+;TYPE:Gap infill
+G1 X10 Y10 F12000
+G1 X11.5 Y10.2 E.01 F3000
+M107
+; EXECUTABLE_BLOCK_END
\ No newline at end of file
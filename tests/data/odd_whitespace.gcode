@@ -0,0 +1,36 @@
+; hand written, with odd spacing and moves of every type
+M104 S210   ; set  temp
+G90
+M83
+g1   f1200
+G1	X10.0   Y10.0	F3000 ; tab and  double spaces
+
+;LAYER_CHANGE
+;Z:0.2
+G1 Z0.2
+  G1 F1800 X0 Y0 ;feed first
+G1 E0.5
+G1 E-0.5 F2100
+G1 X0 Y0 E0.1
+;TYPE: Outer wall
+G1 X10 Y0 E0.4
+G1 X10 Y10 E0.4   ;  spaced   comment
+G1 X10.000 Y10.000
+G1 X20 Y10 E.4 ; E without a leading zero
+M204 S5000
+G0 X30 Y30
+G1 X30 Y30 Z0.4
+G1 X40 Y30 E0.4 F
+;TYPE:Inner wall
+G1 X40 Y40 E0.4
+G1
+SET_PRESSURE_ADVANCE ADVANCE=0.04 SMOOTH_TIME=0.02
+G1 X50 Y40 E0.4 ; SET_PRESSURE_ADVANCE is not set here
+G1 X50 Y40 E0.2
+;LAYER_CHANGE
+;Z:0.4
+G1 Z0.4 F720
+;TYPE:  Outer wall  
+G1 X50 Y50 E0.4 F2400
+G1 X60 Y50 E0.4
+G1 X60 Y50 E-0.8
@@ -0,0 +1,395 @@
+; HEADER_BLOCK_START
+; generated by synthetic
+; HEADER_BLOCK_END
+
+M104 S210 ; set temp
+G28
+G90
+M83
+G1 F1200
+;LAYER_CHANGE
+;Z:0.2
+;HEIGHT:0.2
+G1 E-.8 F2100
+G1 Z0.200 F720
+;TYPE:Outer wall
+;WIDTH:0.45
+G1 X62.000 Y50.000 F12000
+G1 E.8 F2100
+G1 F3000
+G1 X69.319 Y55.176 E0.29851
+G1 X67.321 Y60.000 E0.17386
+G1 X64.142 Y64.142 E0.17386
+G1 X60.000 Y67.321 E0.17386
+G1 X55.176 Y69.319 E0.17386
+G1 X50.000 Y62.000 E0.29851
+G1 X44.824 Y69.319 E0.29851
+G1 X40.000 Y67.321 E0.17386
+G1 X35.858 Y64.142 E0.17386
+G1 X32.679 Y60.000 E0.17386
+G1 X30.681 Y55.176 E0.17386
+G1 X38.000 Y50.000 E0.29851
+G1 X30.681 Y44.824 E0.29851
+G1 X32.679 Y40.000 E0.17386
+G1 X35.858 Y35.858 E0.17386
+G1 X40.000 Y32.679 E0.17386
+G1 X44.824 Y30.681 E0.17386
+G1 X50.000 Y38.000 E0.29851
+G1 X55.176 Y30.681 E0.29851
+G1 X60.000 Y32.679 E0.17386
+G1 X64.142 Y35.858 E0.17386
+G1 X67.321 Y40.000 E0.17386
+G1 X69.319 Y44.824 E0.17386
+G1 X62.000 Y50.000 E0.29851
+G1 E-.8 F2100
+;TYPE:Inner wall
+;WIDTH:0.45
+G1 X61.700 Y50.000 F12000
+G1 E.8 F2100
+G1 F6000
+G1 X68.836 Y55.047 E0.29104
+G1 X66.887 Y59.750 E0.16951
+G1 X63.789 Y63.789 E0.16951
+G1 X59.750 Y66.887 E0.16951
+G1 X55.047 Y68.836 E0.16951
+G1 X50.000 Y61.700 E0.29104
+G1 X44.953 Y68.836 E0.29104
+G1 X40.250 Y66.887 E0.16951
+G1 X36.211 Y63.789 E0.16951
+G1 X33.113 Y59.750 E0.16951
+G1 X31.164 Y55.047 E0.16951
+G1 X38.300 Y50.000 E0.29104
+G1 X31.164 Y44.953 E0.29104
+G1 X33.113 Y40.250 E0.16951
+G1 X36.211 Y36.211 E0.16951
+G1 X40.250 Y33.113 E0.16951
+G1 X44.953 Y31.164 E0.16951
+G1 X50.000 Y38.300 E0.29104
+G1 X55.047 Y31.164 E0.29104
+G1 X59.750 Y33.113 E0.16951
+G1 X63.789 Y36.211 E0.16951
+G1 X66.887 Y40.250 E0.16951
+G1 X68.836 Y44.953 E0.16951
+G1 X61.700 Y50.000 E0.29104
+G1 E-.8 F2100
+;TYPE:Sparse infill
+;WIDTH:0.45
+G1 X40.000 Y40.000 F12000
+G1 E.8 F2100
+G1 F9000
+G1 X40.000 Y40.000 E0.66600
+G1 Y41.700 E0.05661
+G1 X60.000 Y41.700 E0.66600
+G1 Y43.400 E0.05661
+G1 X40.000 Y43.400 E0.66600
+G1 Y45.100 E0.05661
+G1 X60.000 Y45.100 E0.66600
+G1 Y46.800 E0.05661
+G1 X40.000 Y46.800 E0.66600
+G1 Y48.500 E0.05661
+G1 X60.000 Y48.500 E0.66600
+G1 Y50.200 E0.05661
+G1 X40.000 Y50.200 E0.66600
+G1 Y51.900 E0.05661
+G1 X60.000 Y51.900 E0.66600
+G1 Y53.600 E0.05661
+G1 X40.000 Y53.600 E0.66600
+G1 Y55.300 E0.05661
+G1 X60.000 Y55.300 E0.66600
+G1 Y57.000 E0.05661
+G1 X40.000 Y57.000 E0.66600
+G1 Y58.700 E0.05661
+G1 X60.000 Y58.700 E0.66600
+G1 Y60.400 E0.05661
+; some comment
+
+G1 E-.8 F2100
+;TYPE:Outer wall
+;WIDTH:0.45
+G1 X132.000 Y80.000 F12000
+G1 E.8 F2100
+G1 F3000
+G1 X139.319 Y85.176 E0.29851
+G1 X137.321 Y90.000 E0.17386
+G1 X134.142 Y94.142 E0.17386
+G1 X130.000 Y97.321 E0.17386
+G1 X125.176 Y99.319 E0.17386
+G1 X120.000 Y92.000 E0.29851
+G1 X114.824 Y99.319 E0.29851
+G1 X110.000 Y97.321 E0.17386
+G1 X105.858 Y94.142 E0.17386
+G1 X102.679 Y90.000 E0.17386
+G1 X100.681 Y85.176 E0.17386
+G1 X108.000 Y80.000 E0.29851
+G1 X100.681 Y74.824 E0.29851
+G1 X102.679 Y70.000 E0.17386
+G1 X105.858 Y65.858 E0.17386
+G1 X110.000 Y62.679 E0.17386
+G1 X114.824 Y60.681 E0.17386
+G1 X120.000 Y68.000 E0.29851
+G1 X125.176 Y60.681 E0.29851
+G1 X130.000 Y62.679 E0.17386
+G1 X134.142 Y65.858 E0.17386
+G1 X137.321 Y70.000 E0.17386
+G1 X139.319 Y74.824 E0.17386
+G1 X132.000 Y80.000 E0.29851
+G1 E-.8 F2100
+;TYPE:Inner wall
+;WIDTH:0.45
+G1 X131.700 Y80.000 F12000
+G1 E.8 F2100
+G1 F6000
+G1 X138.836 Y85.047 E0.29104
+G1 X136.887 Y89.750 E0.16951
+G1 X133.789 Y93.789 E0.16951
+G1 X129.750 Y96.887 E0.16951
+G1 X125.047 Y98.836 E0.16951
+G1 X120.000 Y91.700 E0.29104
+G1 X114.953 Y98.836 E0.29104
+G1 X110.250 Y96.887 E0.16951
+G1 X106.211 Y93.789 E0.16951
+G1 X103.113 Y89.750 E0.16951
+G1 X101.164 Y85.047 E0.16951
+G1 X108.300 Y80.000 E0.29104
+G1 X101.164 Y74.953 E0.29104
+G1 X103.113 Y70.250 E0.16951
+G1 X106.211 Y66.211 E0.16951
+G1 X110.250 Y63.113 E0.16951
+G1 X114.953 Y61.164 E0.16951
+G1 X120.000 Y68.300 E0.29104
+G1 X125.047 Y61.164 E0.29104
+G1 X129.750 Y63.113 E0.16951
+G1 X133.789 Y66.211 E0.16951
+G1 X136.887 Y70.250 E0.16951
+G1 X138.836 Y74.953 E0.16951
+G1 X131.700 Y80.000 E0.29104
+G1 E-.8 F2100
+;TYPE:Sparse infill
+;WIDTH:0.45
+G1 X110.000 Y70.000 F12000
+G1 E.8 F2100
+G1 F9000
+G1 X110.000 Y70.000 E0.66600
+G1 Y71.700 E0.05661
+G1 X130.000 Y71.700 E0.66600
+G1 Y73.400 E0.05661
+G1 X110.000 Y73.400 E0.66600
+G1 Y75.100 E0.05661
+G1 X130.000 Y75.100 E0.66600
+G1 Y76.800 E0.05661
+G1 X110.000 Y76.800 E0.66600
+G1 Y78.500 E0.05661
+G1 X130.000 Y78.500 E0.66600
+G1 Y80.200 E0.05661
+G1 X110.000 Y80.200 E0.66600
+G1 Y81.900 E0.05661
+G1 X130.000 Y81.900 E0.66600
+G1 Y83.600 E0.05661
+G1 X110.000 Y83.600 E0.66600
+G1 Y85.300 E0.05661
+G1 X130.000 Y85.300 E0.66600
+G1 Y87.000 E0.05661
+G1 X110.000 Y87.000 E0.66600
+G1 Y88.700 E0.05661
+G1 X130.000 Y88.700 E0.66600
+G1 Y90.400 E0.05661
+; some comment
+
+G1 E-.8 F2100
+;TYPE:Gap infill
+G1 X10 Y10 F12000
+G1 X11.5 Y10.2 E.01 F3000
+;LAYER_CHANGE
+;Z:0.4
+;HEIGHT:0.2
+G1 E-.8 F2100
+G1 Z0.400 F720
+;TYPE:Outer wall
+;WIDTH:0.45
+G1 X62.000 Y50.000 F12000
+G1 E.8 F2100
+G1 F3000
+G1 X69.319 Y55.176 E0.29851
+G1 X67.321 Y60.000 E0.17386
+G1 X64.142 Y64.142 E0.17386
+G1 X60.000 Y67.321 E0.17386
+G1 X55.176 Y69.319 E0.17386
+G1 X50.000 Y62.000 E0.29851
+G1 X44.824 Y69.319 E0.29851
+G1 X40.000 Y67.321 E0.17386
+G1 X35.858 Y64.142 E0.17386
+G1 X32.679 Y60.000 E0.17386
+G1 X30.681 Y55.176 E0.17386
+G1 X38.000 Y50.000 E0.29851
+G1 X30.681 Y44.824 E0.29851
+G1 X32.679 Y40.000 E0.17386
+G1 X35.858 Y35.858 E0.17386
+G1 X40.000 Y32.679 E0.17386
+G1 X44.824 Y30.681 E0.17386
+G1 X50.000 Y38.000 E0.29851
+G1 X55.176 Y30.681 E0.29851
+G1 X60.000 Y32.679 E0.17386
+G1 X64.142 Y35.858 E0.17386
+G1 X67.321 Y40.000 E0.17386
+G1 X69.319 Y44.824 E0.17386
+G1 X62.000 Y50.000 E0.29851
+G1 E-.8 F2100
+;TYPE:Inner wall
+;WIDTH:0.45
+G1 X61.700 Y50.000 F12000
+G1 E.8 F2100
+G1 F6000
+G1 X68.836 Y55.047 E0.29104
+G1 X66.887 Y59.750 E0.16951
+G1 X63.789 Y63.789 E0.16951
+G1 X59.750 Y66.887 E0.16951
+G1 X55.047 Y68.836 E0.16951
+G1 X50.000 Y61.700 E0.29104
+G1 X44.953 Y68.836 E0.29104
+G1 X40.250 Y66.887 E0.16951
+G1 X36.211 Y63.789 E0.16951
+G1 X33.113 Y59.750 E0.16951
+G1 X31.164 Y55.047 E0.16951
+G1 X38.300 Y50.000 E0.29104
+G1 X31.164 Y44.953 E0.29104
+G1 X33.113 Y40.250 E0.16951
+G1 X36.211 Y36.211 E0.16951
+G1 X40.250 Y33.113 E0.16951
+G1 X44.953 Y31.164 E0.16951
+G1 X50.000 Y38.300 E0.29104
+G1 X55.047 Y31.164 E0.29104
+G1 X59.750 Y33.113 E0.16951
+G1 X63.789 Y36.211 E0.16951
+G1 X66.887 Y40.250 E0.16951
+G1 X68.836 Y44.953 E0.16951
+G1 X61.700 Y50.000 E0.29104
+G1 E-.8 F2100
+;TYPE:Sparse infill
+;WIDTH:0.45
+G1 X40.000 Y40.000 F12000
+G1 E.8 F2100
+G1 F9000
+G1 X40.000 Y40.000 E0.66600
+G1 Y41.700 E0.05661
+G1 X60.000 Y41.700 E0.66600
+G1 Y43.400 E0.05661
+G1 X40.000 Y43.400 E0.66600
+G1 Y45.100 E0.05661
+G1 X60.000 Y45.100 E0.66600
+G1 Y46.800 E0.05661
+G1 X40.000 Y46.800 E0.66600
+G1 Y48.500 E0.05661
+G1 X60.000 Y48.500 E0.66600
+G1 Y50.200 E0.05661
+G1 X40.000 Y50.200 E0.66600
+G1 Y51.900 E0.05661
+G1 X60.000 Y51.900 E0.66600
+G1 Y53.600 E0.05661
+G1 X40.000 Y53.600 E0.66600
+G1 Y55.300 E0.05661
+G1 X60.000 Y55.300 E0.66600
+G1 Y57.000 E0.05661
+G1 X40.000 Y57.000 E0.66600
+G1 Y58.700 E0.05661
+G1 X60.000 Y58.700 E0.66600
+G1 Y60.400 E0.05661
+; some comment
+
+G1 E-.8 F2100
+;TYPE:Outer wall
+;WIDTH:0.45
+G1 X132.000 Y80.000 F12000
+G1 E.8 F2100
+G1 F3000
+G1 X139.319 Y85.176 E0.29851
+G1 X137.321 Y90.000 E0.17386
+G1 X134.142 Y94.142 E0.17386
+G1 X130.000 Y97.321 E0.17386
+G1 X125.176 Y99.319 E0.17386
+G1 X120.000 Y92.000 E0.29851
+G1 X114.824 Y99.319 E0.29851
+G1 X110.000 Y97.321 E0.17386
+G1 X105.858 Y94.142 E0.17386
+G1 X102.679 Y90.000 E0.17386
+G1 X100.681 Y85.176 E0.17386
+G1 X108.000 Y80.000 E0.29851
+G1 X100.681 Y74.824 E0.29851
+G1 X102.679 Y70.000 E0.17386
+G1 X105.858 Y65.858 E0.17386
+G1 X110.000 Y62.679 E0.17386
+G1 X114.824 Y60.681 E0.17386
+G1 X120.000 Y68.000 E0.29851
+G1 X125.176 Y60.681 E0.29851
+G1 X130.000 Y62.679 E0.17386
+G1 X134.142 Y65.858 E0.17386
+G1 X137.321 Y70.000 E0.17386
+G1 X139.319 Y74.824 E0.17386
+G1 X132.000 Y80.000 E0.29851
+G1 E-.8 F2100
+;TYPE:Inner wall
+;WIDTH:0.45
+G1 X131.700 Y80.000 F12000
+G1 E.8 F2100
+G1 F6000
+G1 X138.836 Y85.047 E0.29104
+G1 X136.887 Y89.750 E0.16951
+G1 X133.789 Y93.789 E0.16951
+G1 X129.750 Y96.887 E0.16951
+G1 X125.047 Y98.836 E0.16951
+G1 X120.000 Y91.700 E0.29104
+G1 X114.953 Y98.836 E0.29104
+G1 X110.250 Y96.887 E0.16951
+G1 X106.211 Y93.789 E0.16951
+G1 X103.113 Y89.750 E0.16951
+G1 X101.164 Y85.047 E0.16951
+G1 X108.300 Y80.000 E0.29104
+G1 X101.164 Y74.953 E0.29104
+G1 X103.113 Y70.250 E0.16951
+G1 X106.211 Y66.211 E0.16951
+G1 X110.250 Y63.113 E0.16951
+G1 X114.953 Y61.164 E0.16951
+G1 X120.000 Y68.300 E0.29104
+G1 X125.047 Y61.164 E0.29104
+G1 X129.750 Y63.113 E0.16951
+G1 X133.789 Y66.211 E0.16951
+G1 X136.887 Y70.250 E0.16951
+G1 X138.836 Y74.953 E0.16951
+G1 X131.700 Y80.000 E0.29104
+G1 E-.8 F2100
+;TYPE:Sparse infill
+;WIDTH:0.45
+G1 X110.000 Y70.000 F12000
+G1 E.8 F2100
+G1 F9000
+G1 X110.000 Y70.000 E0.66600
+G1 Y71.700 E0.05661
+G1 X130.000 Y71.700 E0.66600
+G1 Y73.400 E0.05661
+G1 X110.000 Y73.400 E0.66600
+G1 Y75.100 E0.05661
+G1 X130.000 Y75.100 E0.66600
+G1 Y76.800 E0.05661
+G1 X110.000 Y76.800 E0.66600
+G1 Y78.500 E0.05661
+G1 X130.000 Y78.500 E0.66600
+G1 Y80.200 E0.05661
+G1 X110.000 Y80.200 E0.66600
+G1 Y81.900 E0.05661
+G1 X130.000 Y81.900 E0.66600
+G1 Y83.600 E0.05661
+G1 X110.000 Y83.600 E0.66600
+G1 Y85.300 E0.05661
+G1 X130.000 Y85.300 E0.66600
+G1 Y87.000 E0.05661
+G1 X110.000 Y87.000 E0.66600
+G1 Y88.700 E0.05661
+G1 X130.000 Y88.700 E0.66600
+G1 Y90.400 E0.05661
+; some comment
+
+G1 E-.8 F2100
+;TYPE:Gap infill
+G1 X10 Y10 F12000
+G1 X11.5 Y10.2 E.01 F3000
+M107
+; EXECUTABLE_BLOCK_END
@@ -0,0 +1,76 @@
+from pathlib import Path
+from dataclasses import fields
+from importlib import import_module
+
+from gcode_forge import parser, annotator
+from gcode_forge.parser import Annotation, GCodeFile
+
+DATA = Path(__file__).parent / 'data'
+
+# Options of the processors that are checked against tests/data/expected.
+CONFIGS = {
+    'pa_optimize': {
+        'additional_slow_distance_mm': 1.0,
+        'slow_speed_mms': 20,
+        'accel_step_distance_mm': 0.5,
+        'threshold_angle': 100,
+        'min_segment_length_mm': 0.1,
+        'accel_exponent': 1.0,
+        'accel_scale_x': 1.0,
+        'accel_scale_y': 20.0,
+    },
+    'accel_experiment': {
+        'step_distance_mm': 0.5,
+        'acceleration_mmss': 3000.0,
+        'square_corner_velocity_mms': 5.0,
+    },
+    's_curve': {},
+    'lookahead': {
+        'acceleration_mmss': 3000.0,
+        'square_corner_velocity_mms': 5.0,
+        'step_distance_mm': 0.5,
+    },
+}
+
+def load(name: str='two_layers.gcode') -> GCodeFile:
+    '''
+    Parses and annotates a file from the test data.
+    '''
+    gcode = parser.parse((DATA / name).read_text())
+    annotator.annotate(gcode.first_section.first_line)
+    return gcode
+
+def run(processor_name: str, gcode: GCodeFile, options: dict=None) -> str:
+    '''
+    Runs a processor on the given file, with its options from CONFIGS unless given, and returns the
+    output.
+    '''
+    import_module('gcode_forge.processors.' + processor_name).apply(gcode, CONFIGS[processor_name] if options is None else options)
+    return str(gcode)
+
+def file_lines(text: str) -> list:
+    '''
+    Parses the given text and returns all of its lines.
+    '''
+    return [line for section in parser.parse(text).sections() for line in section.lines()]
+
+# Fields of Annotation that describe the move itself, rather than the run of extrusion it is in.
+MOVE_FIELDS = [annotation_field.name for annotation_field in fields(Annotation) if annotation_field.name not in ('run', 'run_start_mm')]
+
+def annotation_values(annotation: Annotation) -> str:
+    '''
+    Gets the fields of an annotation that describe the move in a form that can be compared, with NaN
+    equal to NaN.
+    '''
+    return repr([getattr(annotation, name) for name in MOVE_FIELDS])
+
+def assert_move_links(gcode):
+    '''
+    Checks the links between moves against a scan of every line for moves.
+    '''
+    moves = [line for section in gcode.sections() for line in section.lines() if line.is_move]
+
+    assert list(gcode.move_lines()) == moves
+    for index, move in enumerate(moves):
+        assert move.prev_move is (moves[index - 1] if index else None)
+        assert move.next_move is (moves[index + 1] if index + 1 < len(moves) else None)
@@ -0,0 +1,326 @@
+import numpy as np
+import pytest
+from numpy import clip
+from scipy.integrate import cumulative_trapezoid
+
+from gcode_forge import acceleration
+from gcode_forge.acceleration import SCurveAcceleration
+
+# Largest difference allowed between the arrays of _calc_abs_delta() and the iterative clipping it
+# replaced.
+TOLERANCE = 1e-9
+
+def iterative_calc_abs_delta(profile: SCurveAcceleration, delta_mms: float):
+    '''
+    The previous implementation of AccelerationProfile._calc_abs_delta(), which clips the
+    acceleration down by accel_dy_mmss until the final velocity is under the target.
+    '''
+    ramp_stop_now_velocity = profile.ramp_stop_now_velocity
+    ramp_mmss = profile.ramp_mmss
+    const_accel_mmss = profile.const_accel_mmss
+    dt_s = profile.dt_s
+    accel_dy_mmss = profile.accel_dy_mmss
+
+    if profile.final_velocity_after_ramps >= delta_mms:
+        stop_mask = np.where(ramp_stop_now_velocity >= delta_mms)[0]
+        stop_index = stop_mask[0]
+        accel = np.r_[ramp_mmss[:stop_index], ramp_mmss[stop_index::-1]]
+
+        reached_accel = ramp_mmss[stop_index]
+    else:
+        constant_accel_distance = (delta_mms - ramp_stop_now_velocity[-1]) / const_accel_mmss
+        accel = np.r_[ramp_mmss, np.full(int(constant_accel_distance / dt_s), const_accel_mmss), ramp_mmss[::-1]]
+
+        reached_accel = const_accel_mmss
+
+    while True:
+        velocity = cumulative_trapezoid(accel, dx=dt_s, initial=0)
+        final_velocity = velocity[-1]
+        if final_velocity <= delta_mms:
+            break
+
+        reached_accel -= accel_dy_mmss
+        accel = clip(accel, None, reached_accel)
+
+    position = cumulative_trapezoid(velocity, dx=dt_s, initial=0)
+
+    return accel, velocity, position
+
+# The s_curve processor's profile, and one with a shorter ramp and coarser clipping steps.
+PROFILES = [
+    (0.200, 3000, 0.010, 10.0),
+    (0.050, 8000, 0.005, 50.0),
+]
+
+DELTAS = np.r_[
+    np.linspace(0.001, 400, 101),
+    np.round(np.random.default_rng(0).uniform(0, 300, 50), 3),
+    0.0,
+].tolist()
+
+@pytest.mark.parametrize('profile_args', PROFILES)
+def test_calc_abs_delta_matches_iterative(profile_args):
+    profile = SCurveAcceleration(*profile_args)
+
+    # Also exactly at the velocity reached by the ramps alone, and either side of it.
+    ramps_mms = float(profile.final_velocity_after_ramps)
+    for delta_mms in DELTAS + [ramps_mms, ramps_mms - 0.001, ramps_mms + 0.001]:
+        expected_arrays = iterative_calc_abs_delta(profile, delta_mms)
+        arrays = SCurveAcceleration._calc_abs_delta(profile, delta_mms)
+        for expected_array, array in zip(expected_arrays, arrays):
+            assert array.shape == expected_array.shape, delta_mms
+            np.testing.assert_allclose(array, expected_array, rtol=0, atol=TOLERANCE, err_msg=f'delta {delta_mms}')
+
+TABLE_MAX_DELTA_MMS = 200
+TABLE_RESOLUTION_MMS = 0.05
+
+@pytest.mark.parametrize('profile_args', PROFILES)
+def test_table_matches_calculation(profile_args):
+    profile = SCurveAcceleration(*profile_args)
+    profile.use_table(TABLE_MAX_DELTA_MMS, TABLE_RESOLUTION_MMS)
+    table = profile.table
+
+    # Deltas in the table are exactly as calculated.
+    for index in range(0, len(table.offsets) - 1, 97):
+        for array, expected_array in zip(table.lookup(index * TABLE_RESOLUTION_MMS), profile._calc_abs_delta(index * TABLE_RESOLUTION_MMS)):
+            np.testing.assert_array_equal(array, expected_array)
+
+    # Between them, the ramp ends under the delta, as calculated ramps do, and is no further from the
+    # calculated ramp than those of the deltas either side are. Calculated ramps are not smooth in
+    # the delta, as their acceleration is clipped in steps of accel_dy_mmss.
+    for delta_mms in np.random.default_rng(1).uniform(0, TABLE_MAX_DELTA_MMS, 200).tolist():
+        accel, velocity, position = table.lookup(delta_mms)
+        assert velocity[-1] <= delta_mms
+
+        index = int(delta_mms / TABLE_RESOLUTION_MMS)
+        expected = profile._calc_abs_delta(delta_mms)
+        low = profile._calc_abs_delta(index * TABLE_RESOLUTION_MMS)
+        high = profile._calc_abs_delta((index + 1) * TABLE_RESOLUTION_MMS)
+        if not len(low[0]) == len(high[0]) == len(expected[0]):
+            continue
+
+        for array, expected_array, low_array, high_array in zip((accel, velocity, position), expected, low, high):
+            bound = np.maximum(np.abs(low_array - expected_array), np.abs(high_array - expected_array))
+            assert np.all(np.abs(array - expected_array) <= bound + TOLERANCE)
+
+    # Past the table, deltas are calculated.
+    assert table.lookup(TABLE_MAX_DELTA_MMS + 1) is None
+
+# Smaller table for the tests of saving tables.
+SAVED_TABLE = {'max_delta_mms': 20, 'resolution_mms': 0.5}
+
+def test_table_round_trip(tmp_path, monkeypatch):
+    profile = SCurveAcceleration(*PROFILES[0])
+    profile.use_table(**SAVED_TABLE, directory=tmp_path)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # Loaded rather than built by a profile that is the same.
+    def build_table(*args):
+        raise AssertionError('The table was built rather than loaded.')
+
+    loaded = SCurveAcceleration(*PROFILES[0])
+    monkeypatch.setattr(loaded, 'build_table', build_table)
+    loaded.use_table(**SAVED_TABLE, directory=tmp_path)
+
+    assert loaded.table.resolution_mms == profile.table.resolution_mms
+    assert loaded.table.max_delta_mms == profile.table.max_delta_mms
+    for name in ('offsets', 'accel', 'velocity', 'position'):
+        np.testing.assert_array_equal(getattr(loaded.table, name), getattr(profile.table, name))
+
+def test_damaged_table_is_rebuilt(tmp_path):
+    profile = SCurveAcceleration(*PROFILES[0])
+    profile.use_table(**SAVED_TABLE, directory=tmp_path)
+    path = next(tmp_path.iterdir())
+    path.write_bytes(b'not a table')
+
+    rebuilt = SCurveAcceleration(*PROFILES[0])
+    rebuilt.use_table(**SAVED_TABLE, directory=tmp_path)
+
+    np.testing.assert_array_equal(rebuilt.table.velocity, profile.table.velocity)
+    assert list(tmp_path.iterdir()) == [path]
+    with np.load(path) as data:
+        np.testing.assert_array_equal(data['velocity'], profile.table.velocity)
+
+@pytest.mark.parametrize('changed_args, changed_table', [
+    ((0.100, 3000, 0.010, 10.0), {}),
+    ((0.200, 4000, 0.010, 10.0), {}),
+    ((0.200, 3000, 0.005, 10.0), {}),
+    ((0.200, 3000, 0.010, 5.0), {}),
+    ((0.200, 3000, 0.010, 10.0), {'max_delta_mms': SAVED_TABLE['max_delta_mms'] + 10}),
+    ((0.200, 3000, 0.010, 10.0), {'resolution_mms': SAVED_TABLE['resolution_mms'] * 2}),
+])
+def test_table_key_changes_with_profile(changed_args, changed_table, tmp_path):
+    profile = SCurveAcceleration(*PROFILES[0])
+    profile.use_table(**SAVED_TABLE, directory=tmp_path)
+
+    # Tables of a different profile, range or resolution are not shared.
+    changed = SCurveAcceleration(*changed_args)
+    changed_table = SAVED_TABLE | changed_table
+    assert changed._table_key(**changed_table) != profile._table_key(**SAVED_TABLE)
+
+    changed.use_table(**changed_table, directory=tmp_path)
+    assert len(list(tmp_path.iterdir())) == 2
+    np.testing.assert_array_equal(changed.table.velocity, changed.build_table(**changed_table).velocity)
+
+def test_table_key_changes_with_version(monkeypatch):
+    profile = SCurveAcceleration(*PROFILES[0])
+    key = profile._table_key(**SAVED_TABLE)
+
+    monkeypatch.setattr(acceleration, 'TABLE_FORMAT', acceleration.TABLE_FORMAT + 1)
+    assert profile._table_key(**SAVED_TABLE) != key
+
+@pytest.mark.parametrize('cache_args, table_args', [
+    ({}, None),
+    ({'delta_resolution_mms': None}, None),
+    ({}, SAVED_TABLE),
+    ({'delta_resolution_mms': None}, SAVED_TABLE),
+])
+def test_calc_many_matches_calc(cache_args, table_args):
+    profile = SCurveAcceleration(*PROFILES[0], **cache_args)
+    if table_args is not None:
+        profile.use_table(**table_args)
+
+    # Accelerations and decelerations of many sizes, including none, so the ramps are ragged.
+    rng = np.random.default_rng(2)
+    from_mms = rng.uniform(0, 300, 100)
+    to_mms = rng.uniform(0, 300, 100)
+    to_mms[1::9] = from_mms[1::9] + rng.uniform(-0.6, 0.6, len(to_mms[1::9]))
+    to_mms[2::11] = from_mms[2::11] + 100
+    to_mms[::7] = from_mms[::7]
+
+    accel, velocity, position, offsets = profile.calc_many(from_mms, to_mms)
+
+    assert len(offsets) == len(from_mms) + 1
+    for index, (from_speed, to_speed) in enumerate(zip(from_mms.tolist(), to_mms.tolist())):
+        start, end = offsets[index], offsets[index + 1]
+        expected = profile.calc(from_speed, to_speed)
+        for array, expected_array in zip((accel[start:end], velocity[start:end], position[start:end]), expected):
+            assert array.tobytes() == np.asarray(expected_array, dtype=np.float64).tobytes()
+
+    # Without a change in speed, the ramp is the one sample at the speed.
+    for index in range(0, len(from_mms), 7):
+        assert offsets[index + 1] - offsets[index] == 1
+        assert velocity[offsets[index]] == from_mms[index]
+
+def test_calc_many_of_nothing():
+    accel, velocity, position, offsets = SCurveAcceleration(*PROFILES[0]).calc_many([], [])
+
+    assert len(accel) == len(velocity) == len(position) == 0
+    assert offsets.tolist() == [0]
+
+def test_ramp_cache_evicts_least_recently_used():
+    cache = acceleration.RampCache(max_size=3, resolution_mms=None)
+    calculated = []
+
+    def calculate(delta_mms):
+        calculated.append(delta_mms)
+        return (delta_mms,)
+
+    for delta_mms in (1.0, 2.0, 3.0, 1.0, 4.0):
+        assert cache.get(delta_mms, calculate) == (delta_mms,)
+
+    # 2 was the least recently used when 4 was added, as 1 had been used again.
+    assert calculated == [1.0, 2.0, 3.0, 4.0]
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 4, 1)
+    assert len(cache) == 3
+
+    cache.get(2.0, calculate)
+    cache.get(1.0, calculate)
+    assert calculated == [1.0, 2.0, 3.0, 4.0, 2.0]
+    assert (cache.hits, cache.misses, cache.evictions) == (2, 5, 2)
+    assert cache.hit_rate == 2 / 7
+
+    # 3 was evicted for 2.
+    cache.get(3.0, calculate)
+    assert calculated[-1] == 3.0
+
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses, cache.evictions, cache.hit_rate) == (0, 0, 0, 0.0)
+
+def test_ramp_cache_quantizes_deltas():
+    assert acceleration.RampCache(resolution_mms=1.0).quantize(49.6) == 50.0
+    assert acceleration.RampCache(resolution_mms=0.5).quantize(49.6) == 49.5
+    assert acceleration.RampCache(resolution_mms=None).quantize(49.6) == 49.6
+
+    profile = SCurveAcceleration(*PROFILES[0])
+    accel, velocity, position = profile.calc(100, 150.2)
+
+    # Deltas that round to the same multiple of the resolution share the ramp of that delta.
+    for from_mms, to_mms in ((100, 149.6), (20, 70), (300, 349.9)):
+        other_accel, other_velocity, other_position = profile.calc(from_mms, to_mms)
+        assert other_accel is accel and other_position is position
+        np.testing.assert_allclose(other_velocity - from_mms, velocity - 100, rtol=0, atol=TOLERANCE)
+
+    # Decelerations share them too.
+    other_accel, other_velocity, other_position = profile.calc(150, 100)
+    assert other_accel is accel
+    np.testing.assert_allclose(other_velocity, (velocity - 100)[::-1] + 100, rtol=0, atol=TOLERANCE)
+
+    assert (profile.cache.hits, profile.cache.misses) == (4, 1)
+    assert profile.cache.hit_rate == 0.8
+    np.testing.assert_allclose(velocity - 100, profile._calc_abs_delta(50.0)[1], rtol=0, atol=TOLERANCE)
+
+def ramps():
+    '''
+    Gets ramps of the s_curve processor's profile, accelerating and decelerating by deltas up to
+    past the constant acceleration.
+    '''
+    profile = SCurveAcceleration(*PROFILES[0], delta_resolution_mms=None)
+    for from_mms, to_mms in ((10, 60), (60, 10), (20, 250), (250, 20), (100, 100.4), (5, 400)):
+        _, velocity, position = profile.calc(from_mms, to_mms)
+        yield velocity, position
+
+def kept_indices(position, kept_position) -> list:
+    '''
+    Gets the indices of the kept samples of a ramp, which have distinct positions.
+    '''
+    indices = np.searchsorted(position, kept_position)
+    np.testing.assert_array_equal(position[indices], kept_position)
+    return indices.tolist()
+
+@pytest.mark.parametrize('max_velocity_error_mms', [0.5, 5.0, 30.0])
+def test_resample_ramp_error(max_velocity_error_mms):
+    for velocity, position in ramps():
+        kept_velocity, kept_position = acceleration.resample_ramp(velocity, position, max_velocity_error_mms)
+
+        # The ends are kept.
+        assert (kept_velocity[0], kept_velocity[-1]) == (velocity[0], velocity[-1])
+        assert (kept_position[0], kept_position[-1]) == (position[0], position[-1])
+
+        # Within each segment, the velocity stays within the error of the velocity at its start,
+        # unless the segment is a single step that changes by more on its own.
+        indices = kept_indices(position, kept_position)
+        np.testing.assert_array_equal(kept_velocity, velocity[indices])
+        for start, end in zip(indices[:-1], indices[1:]):
+            if end - start > 1:
+                assert np.abs(velocity[start:end + 1] - velocity[start]).max() <= max_velocity_error_mms
+
+def test_resample_ramp_max_segments():
+    for velocity, position in ramps():
+        for max_segments in (1, 3, 10):
+            kept_velocity, kept_position = acceleration.resample_ramp(velocity, position, 0.5, max_segments)
+
+            assert len(kept_velocity) - 1 <= max(max_segments, 1)
+            assert (kept_velocity[0], kept_velocity[-1]) == (velocity[0], velocity[-1])
+            assert (kept_position[0], kept_position[-1]) == (position[0], position[-1])
+
+            # The error is raised so that the whole change fits in the segments, unless the steps are
+            # too coarse for that, when samples are kept evenly.
+            indices = kept_indices(position, kept_position)
+            max_velocity_error_mms = max(0.5, abs(velocity[-1] - velocity[0]) / max_segments)
+            segment_errors = [
+                np.abs(velocity[start:end + 1] - velocity[start]).max()
+                for start, end in zip(indices[:-1], indices[1:])
+                if end - start > 1
+            ]
+            evenly = np.unique(np.linspace(0, len(velocity) - 1, max_segments + 1).round().astype(np.intp)).tolist()
+            assert indices == evenly or all(error <= max_velocity_error_mms for error in segment_errors)
+
+def test_resample_short_ramp():
+    velocity = np.array([10.0, 40.0])
+    position = np.array([0.0, 0.25])
+
+    kept_velocity, kept_position = acceleration.resample_ramp(velocity, position, 0.5)
+    np.testing.assert_array_equal(kept_velocity, velocity)
+    np.testing.assert_array_equal(kept_position, position)
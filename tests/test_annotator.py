@@ -0,0 +1,93 @@
+import pytest
+
+from gcode_forge import parser, annotator
+from gcode_forge.parser import Line, NO_ANNOTATION
+
+from helpers import load, annotation_values
+
+NAN = float('NaN')
+NAN_POS = (NAN, NAN)
+
+def test_inserted_moves_are_annotated_from_later_lines():
+    gcode = parser.parse('G1 X0 Y0 F600\nG1 X10 Y0 E1\nG1 X20 Y0 E1\n')
+    annotator.annotate(gcode.first_section.first_line)
+
+    last = gcode.first_section.last_line
+    restore = Line('G1 F1200 ; restore')
+    last.section.insert_before(last, restore)
+    annotator.annotate(last, last)
+
+    assert restore.annotation.move_type == 'set_feed'
+    assert restore.annotation.desired_feed_mms == 20
+    assert last.annotation.desired_feed_mms == 20
+    assert last.annotation.start_pos == (10, 0)
+
+# Annotations of the moves in odd_whitespace.gcode, as (start_pos, end_pos, distance_mm, vector,
+# move_type, desired_feed_mms, cos_theta).
+ODD_WHITESPACE_ANNOTATIONS = [
+    # Positions are unknown until X and Y have both been given.
+    (NAN_POS, NAN_POS, NAN, NAN_POS, 'travel', 20.0, NAN),
+    (NAN_POS, (10.0, 10.0), NAN, NAN_POS, 'travel', 50.0, NAN),
+    (None, None, None, None, 'z', 50.0, None),
+    ((10.0, 10.0), (0.0, 0.0), 200**0.5, (-10.0, -10.0), 'travel', 30.0, NAN),
+    (None, None, None, None, 'extrude', 30.0, None),
+    (None, None, None, None, 'retract', 35.0, None),
+    # Extrudes without going anywhere.
+    (None, None, None, None, 'extrude', 35.0, None),
+    ((0.0, 0.0), (10.0, 0.0), 10.0, (10.0, 0.0), 'moving_extrude', 35.0, 0.5**0.5),
+    ((10.0, 0.0), (10.0, 10.0), 10.0, (0.0, 10.0), 'moving_extrude', 35.0, 0.0),
+    (None, None, None, None, 'noop', 35.0, None),
+    # The angle is with the last move that went somewhere.
+    ((10.0, 10.0), (20.0, 10.0), 10.0, (10.0, 0.0), 'moving_extrude', 35.0, 0.0),
+    ((20.0, 10.0), (30.0, 30.0), 500**0.5, (10.0, 20.0), 'travel', 35.0, -0.2**0.5),
+    (None, None, None, None, 'z', 35.0, None),
+    # F without a value leaves the feed rate as it was.
+    ((30.0, 30.0), (40.0, 30.0), 10.0, (10.0, 0.0), 'moving_extrude', 35.0, -0.2**0.5),
+    ((40.0, 30.0), (40.0, 40.0), 10.0, (0.0, 10.0), 'moving_extrude', 35.0, 0.0),
+    (None, None, None, None, 'noop', 35.0, None),
+    ((40.0, 40.0), (50.0, 40.0), 10.0, (10.0, 0.0), 'moving_extrude', 35.0, 0.0),
+    (None, None, None, None, 'extrude', 35.0, None),
+    (None, None, None, None, 'z', 12.0, None),
+    ((50.0, 40.0), (50.0, 50.0), 10.0, (0.0, 10.0), 'moving_extrude', 40.0, 0.0),
+    ((50.0, 50.0), (60.0, 50.0), 10.0, (10.0, 0.0), 'moving_extrude', 40.0, 0.0),
+    (None, None, None, None, 'retract', 40.0, None),
+]
+
+def assert_matches(value, expected):
+    '''
+    Checks a field of an annotation. Numbers only need to be close, but NaN and None have to match.
+    '''
+    if isinstance(expected, tuple):
+        assert isinstance(value, tuple) and len(value) == len(expected)
+        for item, expected_item in zip(value, expected):
+            assert_matches(item, expected_item)
+    elif isinstance(expected, float) and expected == expected:
+        assert value == pytest.approx(expected)
+    else:
+        assert repr(value) == repr(expected)
+
+def test_annotations_of_every_move_type():
+    moves = list(load('odd_whitespace.gcode').move_lines())
+    assert len(moves) == len(ODD_WHITESPACE_ANNOTATIONS)
+
+    for move, expected in zip(moves, ODD_WHITESPACE_ANNOTATIONS):
+        annotation = move.annotation
+        assert_matches(
+            (annotation.start_pos, annotation.end_pos, annotation.distance_mm, annotation.vector, annotation.move_type, annotation.desired_feed_mms, annotation.cos_theta),
+            expected
+        )
+        assert annotation.angle_deg is None and annotation.extrude_mm3 is None
+
+@pytest.mark.parametrize('name', ['odd_whitespace.gcode', 'two_layers.gcode'])
+def test_annotating_from_any_move_matches_whole_file(name):
+    gcode = load(name)
+    expected = [annotation_values(move.annotation) for move in gcode.move_lines()]
+
+    # Annotation restarts from the annotations before the first line it is given.
+    moves = list(gcode.move_lines())
+    for index in range(0, len(moves), 7):
+        for move in moves[index:]:
+            move.annotation = NO_ANNOTATION
+        annotator.annotate(moves[index])
+
+        assert [annotation_values(move.annotation) for move in moves] == expected
@@ -0,0 +1,23 @@
+import numpy as np
+
+from gcode_forge.cache import FileCache, ENTRY_SUFFIX
+
+def test_round_trip(sample, tmp_path):
+    cache = FileCache(tmp_path)
+    cache.store('key', sample)
+    loaded = cache.load('key')
+
+    assert str(loaded) == str(sample)
+    for line, loaded_line in zip(sample.move_lines(), loaded.move_lines()):
+        assert str(loaded_line.annotation) == str(line.annotation)
+
+    # Entries are plain arrays, so they load without unpickling anything.
+    with np.load(next(tmp_path.iterdir()), allow_pickle=False) as data:
+        assert data.files
+
+def test_damaged_entry_is_a_miss(tmp_path):
+    cache = FileCache(tmp_path)
+    (tmp_path / ('key' + ENTRY_SUFFIX)).write_bytes(b'not an entry')
+
+    assert cache.load('key') is None
+    assert not list(tmp_path.iterdir())
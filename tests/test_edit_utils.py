@@ -0,0 +1,185 @@
+import pytest
+
+from gcode_forge import parser, annotator, edit_utils
+from gcode_forge.parser import Line, MOVE_PARAM_PRECISION
+from gcode_forge.edit_utils import EditBatch
+
+from helpers import MOVE_FIELDS, load, run, file_lines, assert_move_links
+
+def assert_close_output(text, expected_text):
+    '''
+    Checks that two outputs have the same lines, with move parameters that differ by at most one in
+    their last printed digit.
+    '''
+    lines = file_lines(text)
+    expected_lines = file_lines(expected_text)
+    assert len(lines) == len(expected_lines)
+
+    for line, expected_line in zip(lines, expected_lines):
+        assert line.code == expected_line.code
+        assert line.comment == expected_line.comment
+        assert list(line.params) == list(expected_line.params)
+
+        for key, expected_value in expected_line.params.items():
+            value = line.params[key]
+            if expected_value is None or key not in MOVE_PARAM_PRECISION:
+                assert value == expected_value
+            else:
+                assert value == pytest.approx(expected_value, abs=1.01 * 10**-MOVE_PARAM_PRECISION[key])
+
+@pytest.mark.parametrize('processor_name, options', [
+    ('pa_optimize', None),
+    ('accel_experiment', None),
+    ('s_curve', None),
+    ('s_curve', {'max_velocity_error_mms': 30.0}),
+])
+def test_run_index_matches_walking(processor_name, options, monkeypatch):
+    # The split functions search the path lengths of extrusion runs, which are prefix sums, where they
+    # used to walk the lines and add up their distances. The sums can differ by float rounding, which
+    # moves cuts that land on a rounding tie by one in the last printed digit.
+    indexed = run(processor_name, load(), options)
+
+    # Without runs, the split functions walk the lines.
+    monkeypatch.setattr(edit_utils, 'extrusion_run', lambda line: None)
+    walked = run(processor_name, load(), options)
+
+    assert_close_output(indexed, walked)
+
+def parse_annotated(text):
+    gcode = parser.parse(text)
+    annotator.annotate(gcode.first_section.first_line)
+    return gcode
+
+# Fields that re-annotation after an edit gives the same values for as annotating the edited file.
+# Desired feed rates are kept through edits rather than taken from F.
+EDITED_FIELDS = [name for name in MOVE_FIELDS if name != 'desired_feed_mms']
+
+def edited_values(gcode) -> list:
+    return [repr([getattr(line.annotation, name) for name in EDITED_FIELDS]) for line in gcode.move_lines()]
+
+def assert_edited(gcode, expected_text):
+    '''
+    Checks that an edited file has the given text, with the links and annotations it would have if
+    it had been parsed from it.
+    '''
+    assert str(gcode) == expected_text
+    assert_move_links(gcode)
+    assert edited_values(gcode) == edited_values(parse_annotated(expected_text))
+
+def test_batch_with_anchor_not_in_file_changes_nothing(sample):
+    moves = list(sample.move_lines())
+    removed = moves[20]
+    removed.section.remove(removed)
+    text = str(sample)
+
+    batch = EditBatch()
+    batch.insert_before(moves[10], Line('G1 X1 Y1'))
+    batch.remove(moves[11])
+    batch.insert_after(removed, Line('M117 not inserted'))
+
+    with pytest.raises(ValueError):
+        batch.apply()
+
+    assert str(sample) == text
+    assert_move_links(sample)
+
+    # Neither are lines that are already in the file inserted.
+    with pytest.raises(ValueError):
+        with EditBatch() as batch:
+            batch.insert_before(moves[10], moves[30])
+
+    assert str(sample) == text
+
+def test_batch_at_ends_of_file():
+    gcode = parse_annotated('G1 X0 Y0 F600\nG1 X10 Y0 E1\nG1 X10 Y10 E1\nG1 X0 Y10 E1')
+    first = gcode.first_section.first_line
+    last = gcode.first_section.last_line
+
+    with EditBatch() as batch:
+        batch.replace(first, Line('G1 X5 Y5 F1200'), Line('M117 start'))
+        batch.remove(last)
+
+    assert_edited(gcode, 'G1 X5 Y5 F1200\nM117 start\nG1 X10 Y0 E1\nG1 X10 Y10 E1')
+
+    with EditBatch() as batch:
+        batch.remove(gcode.first_section.first_line)
+        batch.replace(gcode.first_section.last_line, Line('G1 X0 Y0 E1'))
+
+    assert_edited(gcode, 'M117 start\nG1 X10 Y0 E1\nG1 X0 Y0 E1')
+
+def test_batch_with_adjacent_anchors():
+    gcode = parse_annotated('G1 X0 Y0 F600\nG1 X10 Y0 E1\nG1 X10 Y10 E1\nG1 X0 Y10 E1\nG1 X0 Y0 E1')
+    a, b, c, d, e = gcode.first_section.lines()
+
+    with EditBatch() as batch:
+        batch.insert_after(a, Line('G1 X1 Y0 E0.1'))
+        batch.insert_before(b, Line('M117 before b'))
+        batch.remove(b)
+        batch.replace(c, Line('G1 X10 Y5 E0.5'), Line('G1 X10 Y10 E0.5'))
+        batch.insert_after(c, Line('M117 after c'))
+        batch.insert_before(d, Line('M117 before d'))
+        batch.insert_after(d, Line('G1 X0 Y5 E0.5'))
+        batch.insert_after(d, Line('M117 after d'))
+
+    assert_edited(gcode, '\n'.join([
+        'G1 X0 Y0 F600',
+        'G1 X1 Y0 E0.1',
+        'M117 before b',
+        'G1 X10 Y5 E0.5',
+        'G1 X10 Y10 E0.5',
+        'M117 after c',
+        'M117 before d',
+        'G1 X0 Y10 E1',
+        'G1 X0 Y5 E0.5',
+        'M117 after d',
+        'G1 X0 Y0 E1',
+    ]))
+
+@pytest.fixture
+def reannotated(monkeypatch) -> list:
+    '''
+    Records the ranges that edits re-annotate.
+    '''
+    ranges = []
+    reannotate = edit_utils.reannotate
+
+    def record(first, last=None, needed=None):
+        ranges.append((first, last))
+        reannotate(first, last, needed)
+
+    monkeypatch.setattr(edit_utils, 'reannotate', record)
+    return ranges
+
+def test_batch_reannotates_to_end_without_later_xy(reannotated):
+    # No move after the edit sets Y, so every move after it may have a different start.
+    gcode = parse_annotated('G1 X0 Y0 F600\nG1 X10 Y0 E1\nG1 X20 E1\nG1 E1\nG1 X30 E1\nG1 X40 E1')
+    second = gcode.first_section.first_line.next
+
+    with EditBatch() as batch:
+        batch.insert_after(second, Line('G1 X5 Y5 E1'))
+
+    assert reannotated == [(second, None)]
+    assert_edited(gcode, 'G1 X0 Y0 F600\nG1 X10 Y0 E1\nG1 X5 Y5 E1\nG1 X20 E1\nG1 E1\nG1 X30 E1\nG1 X40 E1')
+
+def test_batch_reannotates_to_after_x_and_y(reannotated):
+    # X and Y are set again by different moves.
+    gcode = parse_annotated('G1 X0 Y0 F600\nG1 X10 Y0 E1\nG1 X20 E1\nG1 E1\nG1 Y10 E1\nG1 X30 E1\nG1 X40 E1')
+    lines = list(gcode.first_section.lines())
+
+    with EditBatch() as batch:
+        batch.insert_after(lines[1], Line('G1 X5 Y5 E1'))
+
+    assert reannotated == [(lines[1], lines[5])]
+    assert_edited(gcode, 'G1 X0 Y0 F600\nG1 X10 Y0 E1\nG1 X5 Y5 E1\nG1 X20 E1\nG1 E1\nG1 Y10 E1\nG1 X30 E1\nG1 X40 E1')
+
+def test_batch_reannotates_to_after_xy(reannotated):
+    gcode = parse_annotated('G1 X0 Y0 F600\nG1 X10 Y0 E1\nG1 X20 E1\nG1 X20 Y10 E1\nG1 X30 Y10 E1\nG1 X40 Y10 E1')
+    lines = list(gcode.first_section.lines())
+
+    with EditBatch() as batch:
+        batch.insert_after(lines[1], Line('G1 X5 Y5 E1'))
+
+    # Up to the move after the first that sets both X and Y, as its corner depends on where that one
+    # starts.
+    assert reannotated == [(lines[1], lines[4])]
+    assert_edited(gcode, 'G1 X0 Y0 F600\nG1 X10 Y0 E1\nG1 X5 Y5 E1\nG1 X20 E1\nG1 X20 Y10 E1\nG1 X30 Y10 E1\nG1 X40 Y10 E1')
@@ -0,0 +1,104 @@
+import pytest
+
+from gcode_forge import annotator, edit_utils, parser
+from gcode_forge.parser import BlockLine
+from gcode_forge.processors import line_type_gcode
+from gcode_forge.processors.line_type_gcode import Template
+
+from helpers import annotation_values, assert_move_links
+
+BLOCK_GCODE = 'M400\nSET_PRESSURE_ADVANCE ADVANCE=0.02 ; outer\n\nM117   outer wall'
+MOVE_GCODE = 'M400\nG1 X5 Y5\nG1 E-0.4'
+
+@pytest.fixture
+def reannotated(monkeypatch) -> list:
+    '''
+    Records the ranges that inserting templates re-annotates.
+    '''
+    ranges = []
+
+    def recorder(reannotate):
+        def record(first, last=None, needed=None):
+            ranges.append((first, last))
+            reannotate(first, last, needed)
+        return record
+
+    monkeypatch.setattr(edit_utils, 'reannotate', recorder(edit_utils.reannotate))
+    monkeypatch.setattr(line_type_gcode, 'reannotate', recorder(line_type_gcode.reannotate))
+    return ranges
+
+def all_annotations(gcode) -> list:
+    return [annotation_values(line.annotation) for line in gcode.move_lines()]
+
+def test_compile_without_moves():
+    template = Template.compile(BLOCK_GCODE)
+
+    assert template.lines is None
+    assert template.text == BLOCK_GCODE
+
+@pytest.mark.parametrize('gcode', [MOVE_GCODE, 'G0 Z1', ''])
+def test_compile_with_moves_or_nothing(gcode):
+    template = Template.compile(gcode)
+
+    assert template.text is None
+    assert [str(line) for line in template.lines] == [str(line) for line in parser.parse(gcode).first_section.lines()]
+
+def test_empty_template_inserts_nothing(sample):
+    expected = str(sample)
+    section = sample.index.sections('outer wall')[0]
+
+    Template.compile('').insert(section)
+
+    assert str(sample) == expected
+
+def test_block_inserted_as_is(sample, reannotated):
+    expected = all_annotations(sample)
+    section = sample.index.sections('outer wall')[0]
+    first_line = section.first_line
+
+    Template.compile(BLOCK_GCODE).insert(section)
+
+    # The block is one line that is written as it was given, before what was first in the section.
+    block = section.first_line
+    assert block.__class__ is BlockLine
+    assert block.next is first_line
+    assert str(block) == BLOCK_GCODE
+    assert str(sample).count(BLOCK_GCODE + '\n' + str(first_line) + '\n') == 1
+
+    # The annotator state carries across the block, so nothing is re-annotated or changed.
+    assert reannotated == []
+    assert all_annotations(sample) == expected
+    annotator.annotate(sample.first_section.first_line)
+    assert all_annotations(sample) == expected
+
+@pytest.mark.parametrize('options', [
+    {'outer wall': BLOCK_GCODE},
+    {'outer wall': MOVE_GCODE, 'inner wall': BLOCK_GCODE},
+    {'outer wall': MOVE_GCODE, 'sparse infill': 'G1 Z0.6\nG1 Z0.4', 'gap infill': ''},
+])
+def test_apply_matches_annotating_output(sample, options):
+    line_type_gcode.apply(sample, options)
+
+    expected_text = str(sample)
+    expected = parser.parse(expected_text)
+    annotator.annotate(expected.first_section.first_line)
+
+    for section_type, gcode in options.items():
+        if gcode:
+            assert expected_text.count('\n' + gcode + '\n') >= len(sample.index.sections(section_type))
+    assert_move_links(sample)
+    assert all_annotations(sample) == all_annotations(expected)
+
+def test_insert_into_empty_section(sample):
+    section = sample.index.sections('outer wall')[0]
+    while section.first_line is not None:
+        section.remove(section.first_line)
+    annotator.annotate(sample.first_section.first_line)
+
+    Template.compile(MOVE_GCODE).insert(section)
+
+    assert [str(line) for line in section.lines()] == MOVE_GCODE.split('\n')
+    expected = parser.parse(str(sample))
+    annotator.annotate(expected.first_section.first_line)
+    assert_move_links(sample)
+    assert all_annotations(sample) == all_annotations(expected)
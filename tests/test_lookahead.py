@@ -0,0 +1,76 @@
+import pytest
+
+from gcode_forge.annotator import extrusion_run
+from gcode_forge.junction import calc_junction_deviation
+from gcode_forge.processors.lookahead import FEED_MMS_EPSILON, move_pieces, plan_run
+
+from helpers import CONFIGS, run
+
+OPTIONS = CONFIGS['lookahead']
+
+def zero_length_moves(gcode) -> int:
+    '''
+    Counts the moves that give X or Y but do not move.
+    '''
+    return sum(
+        1
+        for line in gcode.move_lines()
+        if ('X' in line.params or 'Y' in line.params) and line.annotation.distance_mm is None
+    )
+
+def planned_pieces(gcode) -> list:
+    '''
+    Gets the first move of each run of extrusion with the (length, speed) of each piece its moves
+    are planned to be split into.
+    '''
+    acceleration_mmss = OPTIONS['acceleration_mmss']
+    junction_deviation = calc_junction_deviation(OPTIONS['square_corner_velocity_mms'], acceleration_mmss)
+
+    plans = []
+    line = next(gcode.move_lines(), None)
+    while line is not None:
+        run = extrusion_run(line) if line.annotation.move_type == 'moving_extrude' else None
+        if run is None:
+            line = line.next_move
+            continue
+
+        lines = list(run.lines)
+        distances, desired, speeds = plan_run(lines, OPTIONS, junction_deviation)
+
+        pieces = []
+        for distance_mm, desired_mms, entry_mms, exit_mms in zip(distances.tolist(), desired.tolist(), speeds[:-1].tolist(), speeds[1:].tolist()):
+            pieces += move_pieces(distance_mm, desired_mms, entry_mms, exit_mms, acceleration_mmss, OPTIONS['step_distance_mm'], 0.1)
+
+        plans.append((lines[0], pieces))
+        line = lines[-1].next_move
+
+    return plans
+
+def test_no_zero_length_moves(sample):
+    expected = zero_length_moves(sample)
+    run('lookahead', sample)
+
+    assert zero_length_moves(sample) == expected
+
+def test_feeds_match_plan(sample):
+    plans = planned_pieces(sample)
+    run('lookahead', sample)
+
+    # The feed rate in effect for each move.
+    feeds = {}
+    feed = None
+    for line in sample.move_lines():
+        feed = line.params.get('F', feed)
+        feeds[id(line)] = feed
+
+    for first, pieces in plans:
+        move = first
+        for length_mm, speed_mms in pieces:
+            # Moves in the run that do not extrude, such as those that only set F, are not planned.
+            while move.annotation.move_type != 'moving_extrude':
+                move = move.next_move
+
+            assert move.annotation.distance_mm == pytest.approx(length_mm, abs=1e-6)
+            assert feeds[id(move)] == pytest.approx(speed_mms * 60, abs=FEED_MMS_EPSILON)
+
+            move = move.next_move
@@ -0,0 +1,26 @@
+import pytest
+
+from gcode_forge import __main__ as forge_main
+
+@pytest.fixture
+def big_file(tmp_path):
+    path = tmp_path / 'big.gcode'
+    with path.open('wb') as file:
+        file.truncate(forge_main.MIN_PARALLEL_PARSE_BYTES)
+    return path
+
+def test_parse_workers(big_file, tmp_path, monkeypatch):
+    monkeypatch.setattr(forge_main.os, 'cpu_count', lambda: 8)
+    small_file = tmp_path / 'small.gcode'
+    small_file.write_text('G1 X1')
+
+    assert forge_main.parse_workers(big_file, None) is None
+    assert forge_main.parse_workers(big_file, 4) == 4
+    assert forge_main.parse_workers(big_file, 16) == 7
+    assert forge_main.parse_workers(big_file, 2) is None
+    assert forge_main.parse_workers(small_file, 4) is None
+
+def test_parse_workers_leaves_a_core(big_file, monkeypatch):
+    monkeypatch.setattr(forge_main.os, 'cpu_count', lambda: 3)
+
+    assert forge_main.parse_workers(big_file, 4) is None
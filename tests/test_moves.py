@@ -0,0 +1,46 @@
+import numpy as np
+
+from gcode_forge.parser import Line
+from gcode_forge.edit_utils import split_move
+from gcode_forge.moves import MoveTable
+
+NAN = float('NaN')
+
+def assert_table_matches_lines(gcode):
+    '''
+    Checks the move table of a file against its moves and sections.
+    '''
+    table = gcode.moves()
+    lines = list(gcode.move_lines())
+
+    assert table.lines.tolist() == lines
+    for column, key in ((table.x, 'X'), (table.y, 'Y'), (table.z, 'Z'), (table.e, 'E'), (table.f, 'F')):
+        expected = [line.params.get(key) for line in lines]
+        np.testing.assert_array_equal(column, np.array([NAN if value is None else value for value in expected]))
+
+    offsets = []
+    row = 0
+    for section in gcode.sections():
+        offsets.append(row)
+        row += sum(1 for _ in section.move_lines())
+    np.testing.assert_array_equal(table.section_offsets, offsets)
+
+def test_table_matches_lines_after_edits(sample):
+    assert_table_matches_lines(sample)
+    moves = list(sample.move_lines())
+
+    # Insert, remove and change moves in different sections.
+    moves[10].section.insert_before(moves[10], Line('G1 X1 Y2 Z3 E4 F5'))
+    moves[30].section.remove(moves[30])
+    moves[50].params['F'] = 1234
+    del moves[60].params['E']
+    moves[70].code = 'M117'
+    split_move(moves[90], 0.5 * moves[90].annotation.distance_mm, 0.5 * moves[90].annotation.distance_mm)
+
+    assert_table_matches_lines(sample)
+
+def test_empty_table():
+    table = MoveTable.concatenate([])
+
+    assert len(table) == 0
+    assert table.f.dtype == np.float64
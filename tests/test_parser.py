@@ -0,0 +1,222 @@
+import gc
+import weakref
+
+import pytest
+
+from gcode_forge import parser, annotator
+from gcode_forge.parser import Line
+
+from helpers import DATA, load, annotation_values, assert_move_links
+
+SAMPLE_PATH = DATA / 'two_layers.gcode'
+
+def test_stream_matches_parse():
+    expected = load()
+    expected_sections = list(expected.sections())
+
+    count = 0
+    for section in annotator.annotate_sections(parser.stream(SAMPLE_PATH)):
+        expected_section = expected_sections[count]
+        count += 1
+
+        assert section.section_type == expected_section.section_type
+        assert section.layer == expected_section.layer
+        assert str(section) == str(expected_section)
+        assert [annotation_values(line.annotation) for line in section.move_lines()] == [
+            annotation_values(line.annotation) for line in expected_section.move_lines()
+        ]
+
+    assert count == len(expected_sections)
+
+def test_stream_unlinks_earlier_sections():
+    sections = []
+    for section in annotator.annotate_sections(parser.stream(SAMPLE_PATH)):
+        previous = section.prev
+        if previous is not None:
+            # Only the section before is kept linked, including through its lines and moves.
+            assert previous.prev is None
+            assert previous.first_line is None or previous.first_line.prev is None
+            assert all(move.prev_move is None or move.prev_move.section is previous for move in previous.move_lines())
+
+        sections.append(weakref.ref(section))
+        del section, previous
+
+        # Everything before the previous section can be freed.
+        gc.collect()
+        assert all(ref() is None for ref in sections[:-2])
+
+    assert len(sections) > 3
+
+ODD_WHITESPACE_PATH = DATA / 'odd_whitespace.gcode'
+
+def test_unmodified_lines_are_written_as_is():
+    text = ODD_WHITESPACE_PATH.read_text()
+    gcode = load(ODD_WHITESPACE_PATH.name)
+
+    # Reading the fields of lines parses them without modifying them.
+    for section in gcode.sections():
+        for line in section.lines():
+            line.code, line.comment, dict(line.params)
+
+    assert not any(line.dirty for section in gcode.sections() for line in section.lines())
+
+    # Lines are stripped, but otherwise kept as they are.
+    assert str(gcode) == '\n'.join(line.strip() for line in text.splitlines())
+
+def test_changed_lines_are_written_from_their_fields():
+    gcode = load(ODD_WHITESPACE_PATH.name)
+    lines = {str(line): line for section in gcode.sections() for line in section.lines()}
+
+    move = lines['G1\tX10.0   Y10.0\tF3000 ; tab and  double spaces']
+    move.params['F'] = 600
+    assert move.dirty
+    assert str(move) == 'G1 X10.000 Y10.000 F600.000 ; tab and  double spaces'
+
+    other = lines['M104 S210   ; set  temp']
+    other.params['S'] = 215
+    assert other.dirty
+    assert str(other) == 'M104 S215 ; set  temp'
+
+    # Lines next to them are left as they were.
+    assert not move.next.dirty
+    assert str(move.next) == ''
+
+def test_dump_keeps_mode(sample, tmp_path):
+    path = tmp_path / 'out.gcode'
+    path.write_text('old')
+    path.chmod(0o640)
+
+    sample.dump(path)
+
+    assert path.read_text() == str(sample)
+    assert path.stat().st_mode & 0o777 == 0o640
+
+def test_dump_new_file_gets_umask_mode(sample, tmp_path):
+    path = tmp_path / 'out.gcode'
+    sample.dump(path)
+
+    assert path.stat().st_mode & 0o777 == 0o666 & ~parser._umask()
+
+def test_failed_dump_leaves_file(sample, tmp_path):
+    path = tmp_path / 'out.gcode'
+    path.write_text('old')
+
+    def sections():
+        yield sample.first_section
+        raise RuntimeError('failed')
+
+    with pytest.raises(RuntimeError):
+        parser.dump_sections(sections(), path)
+
+    assert path.read_text() == 'old'
+    assert list(tmp_path.iterdir()) == [path]
+
+def test_section_types_ignore_spacing():
+    gcode = parser.parse(ODD_WHITESPACE_PATH.read_text())
+
+    assert [section.section_type for section in gcode.sections()] == [
+        section.section_type for section in parser.parse_file(ODD_WHITESPACE_PATH).sections()
+    ]
+    assert [section.section_type for section in gcode.sections()].count('outer wall') == 2
+
+@pytest.mark.parametrize('name', ['odd_whitespace.gcode', 'two_layers.gcode'])
+def test_parse_file_keeps_other_sections_raw(name):
+    path = DATA / name
+    expected = parser.parse(path.read_text())
+    gcode = parser.parse_file(path, section_types=['outer wall'])
+
+    assert str(gcode) == str(expected)
+    for section, expected_section in zip(gcode.sections(), expected.sections(), strict=True):
+        assert (section.section_type, section.layer) == (expected_section.section_type, expected_section.layer)
+
+        lines = list(section.lines())
+        if section.section_type in ('outer wall', 'layer_change'):
+            assert [str(line) for line in lines] == [str(line) for line in expected_section.lines()]
+        elif lines:
+            assert len(lines) == 1 and lines[0].__class__ is parser.RawLine
+
+def line_fields(gcode) -> list:
+    '''
+    Gets the text and parsed fields of every line in a file.
+    '''
+    return [
+        (section.section_type, section.layer, line.__class__, str(line), line.code, line.comment, dict(line.params), dict(line.eqparams), line.is_move)
+        for section in gcode.sections()
+        for line in section.lines()
+    ]
+
+@pytest.mark.parametrize('name', ['odd_whitespace.gcode', 'two_layers.gcode'])
+@pytest.mark.parametrize('workers', [2, 3])
+def test_parallel_parse_matches_serial(name, workers):
+    text = (DATA / name).read_text()
+    gcode = parser.parse(text, workers=workers)
+
+    assert str(gcode) == str(parser.parse(text))
+    assert line_fields(gcode) == line_fields(parser.parse(text))
+
+@pytest.mark.parametrize('section_types', [None, ['outer wall']])
+def test_parallel_parse_file_matches_serial(section_types):
+    path = DATA / 'odd_whitespace.gcode'
+    gcode = parser.parse_file(path, section_types=section_types, workers=2)
+    expected = parser.parse_file(path, section_types=section_types)
+
+    assert str(gcode) == str(expected)
+    assert line_fields(gcode) == line_fields(expected)
+
+def test_parse_file_matches_parse():
+    path = DATA / 'odd_whitespace.gcode'
+
+    assert line_fields(parser.parse_file(path)) == line_fields(parser.parse(path.read_text()))
+
+def test_move_links_after_edits():
+    gcode = load(ODD_WHITESPACE_PATH.name)
+    assert_move_links(gcode)
+
+    sections = list(gcode.sections())
+    first_line = sections[0].first_line
+    last_line = sections[-1].last_line
+    non_move = next(line for line in sections[2].lines() if not line.is_move)
+    move = next(sections[3].move_lines())
+
+    # At the ends of the file.
+    sections[0].insert_before(first_line, Line('G1 X1 Y1'))
+    sections[-1].insert_after(last_line, Line('G1 X2 Y2'))
+    assert_move_links(gcode)
+
+    # Next to other lines and moves.
+    sections[2].insert_after(non_move, Line('G1 X3 Y3'))
+    sections[3].insert_before(move, Line('G0 X4 Y4'))
+    sections[3].insert_after(move, Line('M117 not a move'))
+    assert_move_links(gcode)
+
+    # Removing moves, including the first and last in the file.
+    sections[3].remove(move)
+    sections[0].remove(sections[0].first_line)
+    sections[-1].remove(sections[-1].last_line)
+    assert_move_links(gcode)
+
+    # Splicing at the start, middle and end of sections.
+    sections[1].splice(None, [Line('G1 X5 Y5'), Line('M400'), Line('G1 X6 Y6')])
+    sections[2].splice(non_move, [Line('M400'), Line('G1 X7 Y7')])
+    sections[-1].splice(sections[-1].last_line, [Line('G1 X8 Y8')])
+    assert_move_links(gcode)
+
+    # Changing whether lines are moves.
+    non_move.code = 'G1'
+    next(sections[2].move_lines()).code = 'M117'
+    assert_move_links(gcode)
+
+def test_move_links_across_empty_sections():
+    gcode = parser.parse('G1 X1\n;TYPE:Outer wall\n;TYPE:Inner wall\nG1 X2')
+    sections = list(gcode.sections())
+    empty = sections[1]
+    empty.remove(empty.first_line)
+    assert empty.first_line is None
+    assert_move_links(gcode)
+
+    empty.insert_before(None, Line('G1 X3'))
+    assert_move_links(gcode)
+
+    empty.remove(empty.first_line)
+    empty.splice(None, [Line('G1 X4'), Line('G1 X5')])
+    assert_move_links(gcode)
@@ -0,0 +1,8 @@
+import pytest
+
+from helpers import CONFIGS, DATA, run
+
+@pytest.mark.parametrize('processor_name', CONFIGS)
+def test_output_unchanged(processor_name, sample):
+    expected = (DATA / 'expected' / (processor_name + '.gcode')).read_text()
+    assert run(processor_name, sample) == expected
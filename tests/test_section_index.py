@@ -0,0 +1,43 @@
+from gcode_forge.parser import Section
+
+def test_layers(sample):
+    layers = sample.index.layers
+
+    assert [layer.number for layer in layers] == [0, 1]
+    assert [layer.z for layer in layers] == [0.2, 0.4]
+    for layer in layers:
+        assert layer.sections[0].section_type == 'layer_change'
+        assert all(section.layer == layer.number for section in layer.sections)
+
+def test_sections_in_file_order(sample):
+    expected = [section for section in sample.sections() if section.section_type in ('outer wall', 'inner wall')]
+
+    assert sample.index.sections('outer wall', 'inner wall') == expected
+    assert sample.index.sections('inner wall', 'outer wall') == expected
+    assert sample.index.sections('outer wall') == [section for section in expected if section.section_type == 'outer wall']
+
+def test_sections_in_layers(sample):
+    expected = [section for section in sample.sections() if section.section_type in ('outer wall', 'inner wall') and section.layer == 1]
+
+    assert sample.index.sections('outer wall', 'inner wall', layers=[1]) == expected
+    assert sample.index.sections('outer wall', 'inner wall', layers=[1, 0]) == sample.index.sections('outer wall', 'inner wall')
+    assert sample.index.sections('outer wall', layers=range(2, 10)) == []
+    assert sample.index.sections('missing') == []
+
+def test_index_is_a_snapshot(sample):
+    # Replace a section with a new one.
+    removed = sample.index.sections('inner wall')[0]
+    added = Section('inner wall', number=removed.number, layer=removed.layer)
+    added.prev = removed.prev
+    added.next = removed.next
+    removed.prev.next = added
+    removed.next.prev = added
+
+    # Sections added or removed are only seen once the file is re-indexed.
+    assert removed in sample.index.sections('inner wall')
+    assert added not in sample.index.sections('inner wall')
+
+    sample.reindex()
+
+    assert removed not in sample.index.sections('inner wall')
+    assert added in sample.index.sections('inner wall')
@@ -0,0 +1,90 @@
+import numpy as np
+
+from gcode_forge import parser
+from gcode_forge.parser import BlockLine
+from gcode_forge.processors.speed_lut_pa import DEFAULT_LUT_RESOLUTION_MMS, _pa_set_rows, build_lut
+
+from helpers import file_lines, run
+
+OPTIONS = {
+    'speeds': [50, 100, 150, 200, 250],
+    'pa_values': [0.05, 0.04, 0.035, 0.03, 0.028],
+}
+
+LINE_TYPE_PA_OPTIONS = {
+    'default_pa': 0.03,
+    'pa_values': {
+        'outer wall': 0.02,
+        'inner wall': 0.025,
+    },
+}
+
+def effective_pa(text: str) -> list:
+    '''
+    Gets the F of each move that sets it with the PA in effect for it.
+    '''
+    pa = None
+    feeds = []
+    for line in file_lines(text):
+        if line.code == 'SET_PRESSURE_ADVANCE':
+            pa = float(line.eqparams['ADVANCE'])
+        elif line.is_move and line.params.get('F') is not None:
+            feeds.append((line.params['F'], pa))
+
+    return feeds
+
+def lut_pa(feed: float) -> float:
+    '''
+    Gets the PA that the LUT gives for the given F, as written to the file.
+    '''
+    speeds = OPTIONS['speeds']
+    lut = build_lut(speeds, OPTIONS['pa_values'], DEFAULT_LUT_RESOLUTION_MMS)
+    index = int(np.rint((np.clip(feed / 60, speeds[0], speeds[-1]) - speeds[0]) / DEFAULT_LUT_RESOLUTION_MMS))
+    return float(lut[index])
+
+def test_pa_matches_lut(sample):
+    feeds = effective_pa(run('speed_lut_pa', sample, OPTIONS))
+
+    assert feeds
+    assert all(pa == lut_pa(feed) for feed, pa in feeds)
+
+def test_pa_matches_lut_after_line_type_pa(sample):
+    # line_type_pa sets PA at the start of every section, which the LUT has to set again after.
+    run('line_type_pa', sample, LINE_TYPE_PA_OPTIONS)
+    feeds = effective_pa(run('speed_lut_pa', sample, OPTIONS))
+
+    assert feeds
+    assert all(pa == lut_pa(feed) for feed, pa in feeds)
+
+PA_SET_TEXT = '''G1 X0 Y0 F3000
+; SET_PRESSURE_ADVANCE is only mentioned here
+M117 SET_PRESSURE_ADVANCE
+G1 X10 Y0 E0.4 ; SET_PRESSURE_ADVANCE in a comment
+set_pressure_advance advance=0.04
+G1 X10 Y10 E0.4
+SET_PRESSURE_ADVANCE_SMOOTH ADVANCE=0.04
+G1 X0 Y10 E0.4
+  SET_PRESSURE_ADVANCE ADVANCE=0.02 ; indented
+SET_PRESSURE_ADVANCE ADVANCE=0.03
+G1 X0 Y0 E0.4
+'''
+
+def test_pa_set_rows():
+    gcode = parser.parse(PA_SET_TEXT)
+
+    # Only lines that start with the command set PA, and both of the last two are before the same move.
+    assert _pa_set_rows(gcode).tolist() == [2, 4]
+
+    # Lines that are not moves are not parsed to find them.
+    lines = [line for section in gcode.sections() for line in section.lines()]
+    assert all(line._code is parser._UNPARSED for line in lines if not line.is_move)
+
+def test_pa_set_rows_of_blocks_and_modified_lines():
+    gcode = parser.parse(PA_SET_TEXT)
+    lines = list(gcode.first_section.lines())
+
+    gcode.first_section.insert_after(lines[1], BlockLine('M400\nSET_PRESSURE_ADVANCE ADVANCE=0.05'))
+    lines[4].code = 'M117'
+    lines[6].code = 'SET_PRESSURE_ADVANCE'
+
+    assert _pa_set_rows(gcode).tolist() == [1, 3, 4]